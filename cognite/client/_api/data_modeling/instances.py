@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import asyncio
+import dataclasses
+import functools
 import inspect
 import logging
 import random
-from collections import UserList
-from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Sequence
+from collections import UserList, defaultdict, deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, MutableMapping, Sequence
 from datetime import datetime, timedelta, timezone
 from typing import (
     TYPE_CHECKING,
@@ -18,6 +20,7 @@ from typing import (
 )
 
 from cognite.client._api_client import APIClient
+from cognite.client._basic_api_client import FailedRequestHandler
 from cognite.client._constants import DEFAULT_LIMIT_READ
 from cognite.client.data_classes import filters
 from cognite.client.data_classes._base import CogniteResourceList, WriteableCogniteResource
@@ -72,7 +75,22 @@ from cognite.client.data_classes.data_modeling.query import (
 from cognite.client.data_classes.data_modeling.sync import SubscriptionContext, SyncSessionWithCache
 from cognite.client.data_classes.data_modeling.views import View
 from cognite.client.data_classes.filters import _BASIC_FILTERS, Filter, _validate_filter
-from cognite.client.utils._auxiliary import at_least_one_is_not_none, is_unlimited, load_yaml_or_json, unpack_items
+from cognite.client.exceptions import CogniteAPIError, CogniteMultiException
+from cognite.client.utils._auxiliary import (
+    at_least_one_is_not_none,
+    is_positive_int,
+    is_unlimited,
+    load_yaml_or_json,
+    split_into_n_parts,
+    unpack_items,
+)
+from cognite.client.utils._data_modeling import (
+    find_dependent_result_sets,
+    instance_apply_hash,
+    instance_apply_key,
+    is_apply_unchanged,
+    split_key_range,
+)
 from cognite.client.utils._experimental import FeaturePreviewWarning
 from cognite.client.utils._identifier import DataModelingIdentifierSequence
 from cognite.client.utils._retry import Backoff
@@ -213,6 +231,7 @@ class InstancesAPI(APIClient):
         sort: list[InstanceSort | dict] | InstanceSort | dict | None = None,
         filter: Filter | dict[str, Any] | None = None,
         debug: DebugParameters | None = None,
+        partitions: int | None = None,
     ) -> AsyncIterator[Node]: ...
 
     @overload
@@ -227,6 +246,7 @@ class InstancesAPI(APIClient):
         sort: list[InstanceSort | dict] | InstanceSort | dict | None = None,
         filter: Filter | dict[str, Any] | None = None,
         debug: DebugParameters | None = None,
+        partitions: int | None = None,
     ) -> AsyncIterator[Edge]: ...
 
     @overload
@@ -241,6 +261,7 @@ class InstancesAPI(APIClient):
         sort: list[InstanceSort | dict] | InstanceSort | dict | None = None,
         filter: Filter | dict[str, Any] | None = None,
         debug: DebugParameters | None = None,
+        partitions: int | None = None,
     ) -> AsyncIterator[NodeList]: ...
 
     @overload
@@ -255,6 +276,7 @@ class InstancesAPI(APIClient):
         sort: list[InstanceSort | dict] | InstanceSort | dict | None = None,
         filter: Filter | dict[str, Any] | None = None,
         debug: DebugParameters | None = None,
+        partitions: int | None = None,
     ) -> AsyncIterator[EdgeList]: ...
 
     async def __call__(
@@ -268,6 +290,7 @@ class InstancesAPI(APIClient):
         sort: list[InstanceSort | dict] | InstanceSort | dict | None = None,
         filter: Filter | dict[str, Any] | None = None,
         debug: DebugParameters | None = None,
+        partitions: int | None = None,
     ) -> AsyncIterator[Edge | EdgeList | Node | NodeList]:
         """Iterate over nodes or edges.
         Fetches instances as they are iterated over, so you keep a limited number of instances in memory.
@@ -282,12 +305,12 @@ class InstancesAPI(APIClient):
             sort (list[InstanceSort | dict] | InstanceSort | dict | None): Sort(s) to apply to the returned instances. For nontrivial amounts of data, you need to have a backing, cursorable index.
             filter (Filter | dict[str, Any] | None): Advanced filtering of instances.
             debug (DebugParameters | None): Debug settings for profiling and troubleshooting.
+            partitions (int | None): Split the listing into this many disjoint parts (per space when listing multiple spaces, else by external ID ranges), fetched concurrently and yielded in no particular order. The number of concurrent requests is bounded by ``global_config.concurrency_settings.data_modeling.read``. Can not be used with sort, include_typing or debug.
 
         Yields:
             Edge | EdgeList | Node | NodeList: yields Instance one by one if chunk_size is not specified, else NodeList/EdgeList objects.
         """
         self._validate_filter(filter)
-        filter = self._merge_space_into_filter(instance_type, space, filter)
         other_params = self._create_other_params(
             include_typing=include_typing, instance_type=instance_type, sort=sort, sources=sources, debug=debug
         )
@@ -300,6 +323,20 @@ class InstancesAPI(APIClient):
             case _:
                 raise ValueError(f"Invalid instance type: {instance_type}")
 
+        if partitions is not None:
+            self._validate_partitions_params(sort, include_typing, debug)
+            async for chunk in self._list_generator_partitioned(
+                instance_type, partitions, list_cls, resource_cls, chunk_size, limit, space, filter, other_params
+            ):
+                if chunk_size is None:
+                    for item in chunk:
+                        yield item
+                else:
+                    yield chunk
+            return
+
+        filter = self._merge_space_into_filter(instance_type, space, filter)
+
         headers: dict[str, str] | None = None
         settings_forcing_raw_response_loading = []
         if include_typing:
@@ -1007,6 +1044,7 @@ class InstancesAPI(APIClient):
         auto_create_direct_relations: bool = True,
         skip_on_version_conflict: bool = False,
         replace: bool = False,
+        skip_unchanged: bool | MutableMapping[str, str] = False,
     ) -> InstancesApplyResult:
         """`Add or update (upsert) instances <https://api-docs.cognite.com/20230101/tag/Instances/operation/applyNodeAndEdges>`_.
 
@@ -1018,6 +1056,7 @@ class InstancesAPI(APIClient):
             auto_create_direct_relations (bool): Whether to create missing direct relation targets when ingesting.
             skip_on_version_conflict (bool): If existingVersion is specified on any of the nodes/edges in the input, the default behaviour is that the entire ingestion will fail when version conflicts occur. If skipOnVersionConflict is set to true, items with version conflicts will be skipped instead. If no version is specified for nodes/edges, it will do the writing directly.
             replace (bool): How do we behave when a property value exists? Do we replace all matching and existing values with the supplied values (true)? Or should we merge in new values for properties together with the existing values (false)? Note: This setting applies for all nodes or edges specified in the ingestion call.
+            skip_unchanged (bool | MutableMapping[str, str]): Only send the nodes and edges that would change something. If True, the instances are first retrieved (using the views in their sources) and compared. If given a mapping (e.g. a dict, or a ``shelve`` for persistence between runs), it is used as a store of content hashes of previously applied instances, which is compared against (and updated). The hash store assumes nothing else modifies the instances. Skipped instances are reported in the result.
 
         Returns:
             InstancesApplyResult: Created instance(s)
@@ -1134,6 +1173,20 @@ class InstancesAPI(APIClient):
         edges = edges or []
         edges = edges if isinstance(edges, Sequence) else [edges]
 
+        skipped: list[NodeApply | EdgeApply] = []
+        if skip_unchanged is True:
+            skipped = await self._find_unchanged_by_retrieve([*nodes, *edges], replace)
+        elif skip_unchanged is not False:
+            skipped = [
+                inst
+                for inst in (*nodes, *edges)
+                if skip_unchanged.get(instance_apply_key(inst)) == instance_apply_hash(inst, replace)
+            ]
+        if skipped:
+            skipped_ids = {id(inst) for inst in skipped}
+            nodes = [node for node in nodes if id(node) not in skipped_ids]
+            edges = [edge for edge in edges if id(edge) not in skipped_ids]
+
         res = await self._create_multiple(
             items=cast(Sequence[WriteableCogniteResource], (*nodes, *edges)),
             list_cls=_NodeOrEdgeApplyResultList,
@@ -1141,11 +1194,111 @@ class InstancesAPI(APIClient):
             extra_body_fields=other_parameters,
             input_resource_cls=_NodeOrEdgeApplyAdapter,  # type: ignore[arg-type]
         )
+        if not isinstance(skip_unchanged, bool):
+            # Only instances actually written are recorded (e.g. not those skipped on version conflicts):
+            written = {(item.instance_type, item.space, item.external_id) for item in res}
+            for inst in (*nodes, *edges):
+                if (inst.instance_type, inst.space, inst.external_id) in written:
+                    skip_unchanged[instance_apply_key(inst)] = instance_apply_hash(inst, replace)
+
         return InstancesApplyResult(
             nodes=NodeApplyResultList([item for item in res if isinstance(item, NodeApplyResult)]),
             edges=EdgeApplyResultList([item for item in res if isinstance(item, EdgeApplyResult)]),
+            skipped_nodes=[inst.as_id() for inst in skipped if isinstance(inst, NodeApply)],
+            skipped_edges=[inst.as_id() for inst in skipped if isinstance(inst, EdgeApply)],
         )
 
+    async def apply_graph(
+        self,
+        nodes: Sequence[NodeApply] = (),
+        edges: Sequence[EdgeApply] = (),
+        auto_create_direct_relations: bool = True,
+        skip_on_version_conflict: bool = False,
+        replace: bool = False,
+    ) -> InstancesApplyResult:
+        """Add or update (upsert) a large graph of nodes and edges, written in dependency order.
+
+        Nodes are written before the edges starting or ending in them, and before the instances referring to them
+        through direct relations (or as node type). Each batch is sent as soon as everything it depends on has been
+        written, using the full write concurrency, so large graphs can be loaded without auto-creating start- and end
+        nodes. Dependencies on nodes not part of the input are assumed to exist.
+
+        Note:
+            Nodes referring to each other in a cycle can not be ordered; these are written last, with
+            ``auto_create_direct_relations=True``.
+
+        Args:
+            nodes (Sequence[NodeApply]): Nodes to apply.
+            edges (Sequence[EdgeApply]): Edges to apply.
+            auto_create_direct_relations (bool): Whether to create missing direct relation targets when ingesting.
+            skip_on_version_conflict (bool): If existingVersion is specified on any of the nodes/edges in the input, the default behaviour is that the entire ingestion will fail when version conflicts occur. If skipOnVersionConflict is set to true, items with version conflicts will be skipped instead.
+            replace (bool): Whether to replace all matching and existing values with the supplied values (true), or merge in new values for properties together with the existing values (false).
+
+        Returns:
+            InstancesApplyResult: The applied instances.
+
+        Raises:
+            CogniteAPIError: If any batch failed. The error lists the ``successful``, ``failed`` and ``unknown``
+                instances, as well as those ``skipped`` because something they depend on failed.
+
+        Examples:
+
+            Load a graph of pumps and the pipes connecting them:
+
+                >>> from cognite.client import CogniteClient
+                >>> from cognite.client.data_classes.data_modeling import EdgeApply, NodeApply
+                >>> client = CogniteClient()
+                >>> # async_client = AsyncCogniteClient()  # another option
+                >>> pumps = [NodeApply("my-space", f"pump-{i}") for i in range(10_000)]
+                >>> pipes = [
+                ...     EdgeApply(
+                ...         "my-space",
+                ...         f"pipe-{i}",
+                ...         type=("my-space", "pipe"),
+                ...         start_node=("my-space", f"pump-{i}"),
+                ...         end_node=("my-space", f"pump-{i + 1}"),
+                ...     )
+                ...     for i in range(9_999)
+                ... ]
+                >>> res = client.data_modeling.instances.apply_graph(pumps, pipes)
+        """
+        applier = _InstanceGraphApplier(self, nodes, edges)
+        return await applier.apply(
+            auto_create_direct_relations=auto_create_direct_relations,
+            skip_on_version_conflict=skip_on_version_conflict,
+            replace=replace,
+        )
+
+    async def _find_unchanged_by_retrieve(
+        self, instances: Sequence[NodeApply | EdgeApply], replace: bool
+    ) -> list[NodeApply | EdgeApply]:
+        # Instances are retrieved in groups using the same views, so that we fetch exactly what they write:
+        by_views: defaultdict[tuple[ViewId, ...], list[NodeApply | EdgeApply]] = defaultdict(list)
+        for inst in instances:
+            views = [src.source for src in inst.sources or []]
+            if all(isinstance(view, ViewId) and view.version is not None for view in views):
+                by_views[tuple(dict.fromkeys(views))].append(inst)  # type: ignore[arg-type]
+
+        async def find_unchanged(
+            views: tuple[ViewId, ...], group: list[NodeApply | EdgeApply]
+        ) -> list[NodeApply | EdgeApply]:
+            existing = await self.retrieve(
+                nodes=[inst.as_id() for inst in group if isinstance(inst, NodeApply)],
+                edges=[inst.as_id() for inst in group if isinstance(inst, EdgeApply)],
+                sources=list(views) or None,
+            )
+            existing_by_id = {(inst.instance_type, inst.space, inst.external_id): inst for inst in existing.nodes}
+            existing_by_id.update((("edge", inst.space, inst.external_id), inst) for inst in existing.edges)
+            return [
+                inst
+                for inst in group
+                if (current := existing_by_id.get((inst.instance_type, inst.space, inst.external_id))) is not None
+                and is_apply_unchanged(inst, current, replace)
+            ]
+
+        results = await asyncio.gather(*(find_unchanged(views, group) for views, group in by_views.items()))
+        return [inst for unchanged in results for inst in unchanged]
+
     @overload
     async def search(
         self,
@@ -1665,6 +1818,104 @@ class InstancesAPI(APIClient):
         """
         return await self._query_or_sync(query, "query", include_typing=include_typing, debug=debug)
 
+    async def iterate_query(self, query: Query, include_typing: bool = False) -> AsyncIterator[QueryResult]:
+        """`Iterate over all results of a query, following the cursors of every result set <https://api-docs.cognite.com/20230101/tag/Instances/operation/queryContent>`_.
+
+        A single call to ``query`` returns one page per result set. This method keeps fetching, following the
+        cursor of each selected result set until all are exhausted. When a result set is paged, the result sets
+        depending on it (through ``from_`` or set operations) are fetched again for the new page. Requests that do
+        not depend on each other are issued concurrently, and each response is yielded as soon as it arrives, so
+        memory usage stays bounded regardless of the total size of the result.
+
+        Note:
+            A result set may be part of several yielded results, e.g. the instances of a dependent result set are
+            returned once per page of the result set it depends on. Each yielded result only contains the result sets
+            that were (re-)fetched in that request.
+
+        Args:
+            query (Query): Query.
+            include_typing (bool): Should we return property type information as part of the result?
+
+        Yields:
+            QueryResult: The resulting nodes and/or edges, one page at a time.
+
+        Examples:
+
+            Iterate over all pumps and the work orders connected to them:
+
+                >>> from cognite.client import CogniteClient
+                >>> from cognite.client.data_classes.data_modeling.query import (
+                ...     Query,
+                ...     Select,
+                ...     NodeResultSetExpression,
+                ...     EdgeResultSetExpression,
+                ...     SourceSelector,
+                ... )
+                >>> from cognite.client.data_classes.data_modeling.ids import ViewId
+                >>> client = CogniteClient()
+                >>> # async_client = AsyncCogniteClient()  # another option
+                >>> pump_view = ViewId("mySpace", "myPump", "v1")
+                >>> query = Query(
+                ...     with_={
+                ...         "pumps": NodeResultSetExpression(limit=1000),
+                ...         "work_orders": EdgeResultSetExpression(from_="pumps", limit=1000),
+                ...     },
+                ...     select={
+                ...         "pumps": Select([SourceSelector(pump_view, properties=["*"])]),
+                ...         "work_orders": Select(),
+                ...     },
+                ... )
+                >>> for result in client.data_modeling.instances.iterate_query(query):
+                ...     pumps = result.get("pumps", [])
+        """
+        from cognite.client import global_config
+
+        dependents = find_dependent_result_sets(query)
+        ancestors = {name: {other for other, deps in dependents.items() if name in deps} for name in query.with_}
+        max_workers = global_config.concurrency_settings.data_modeling.read
+
+        # Each request is identified by its cursors and the result sets it fetches (and yields):
+        to_fetch: deque[tuple[dict[str, str], set[str]]] = deque()
+        to_fetch.append(({k: v for k, v in query.cursors.items() if v is not None}, set(query.select)))
+        in_flight: dict[asyncio.Task[QueryResult], tuple[dict[str, str], set[str]]] = {}
+        try:
+            while to_fetch or in_flight:
+                while to_fetch and len(in_flight) < max_workers:
+                    cursors, selected = to_fetch.popleft()
+                    paging_query = self._create_paging_query(query, cursors, selected)
+                    task = asyncio.create_task(self._query_or_sync(paging_query, "query", include_typing, None))
+                    in_flight[task] = cursors, selected
+
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    cursors, selected = in_flight.pop(task)
+                    result = task.result()
+                    for name in selected:
+                        if (next_cursor := result[name].cursor) is None:
+                            continue
+                        # Paging 'name' means refetching everything depending on it, with all other result sets
+                        # they depend on kept at the same page as in this request:
+                        next_selected = dependents[name] & set(query.select)
+                        context = set().union(*(ancestors[dep] for dep in next_selected)) - next_selected
+                        next_cursors = {k: v for k, v in cursors.items() if k in context}
+                        to_fetch.append(({**next_cursors, name: next_cursor}, next_selected))
+
+                    yield QueryResult({name: lst for name, lst in result.items() if name in selected})
+        finally:
+            for task in in_flight:
+                task.cancel()
+
+    @staticmethod
+    def _create_paging_query(query: Query, cursors: dict[str, str], selected: set[str]) -> Query:
+        # Cursors can only be passed for selected result sets, so the ones we need to keep at a specific page,
+        # but don't want returned, are selected without any properties:
+        select = {
+            name: select if name in selected else dataclasses.replace(select, sources=[])
+            for name, select in query.select.items()
+            if name in selected or name in cursors
+        }
+        return dataclasses.replace(query, select=select, cursors={name: cursors.get(name) for name in select})
+
     async def sync(
         self, query: QuerySync, include_typing: bool = False, debug: DebugParameters | None = None
     ) -> QueryResult:
@@ -1806,6 +2057,7 @@ class InstancesAPI(APIClient):
         security_category: int,
         backup_every: timedelta | None = timedelta(minutes=15),
         backup_on_exit: bool = False,
+        compact_every: int = 10,
     ) -> SyncSessionWithCache:
         r"""Create a managed sync session with persistent backup to a CDF file.
 
@@ -1843,6 +2095,9 @@ class InstancesAPI(APIClient):
             backup_every (timedelta | None): How often to upload state to CDF during a
                 session (when active). ``None`` uploads only on context-manager exit.
             backup_on_exit (bool): Whether to upload state to CDF on context-manager exit.
+            compact_every (int): After the first full backup, only the instances changed since the previous backup
+                are uploaded, as separate delta files. After this many deltas, a new full backup is written
+                (and the deltas deleted).
 
         Raises:
             ValueError: If ``query`` already has cursors set (cursors are managed internally).
@@ -1850,6 +2105,7 @@ class InstancesAPI(APIClient):
                 explicit ``limit`` set.
             ValueError: If the given ``security_category`` does not exist in this project.
             ValueError: If ``backup_every`` is set to a value smaller than 1 minute.
+            ValueError: If ``compact_every`` is negative.
 
         Returns:
             SyncSessionWithCache: The context manager for managing the sync session.
@@ -1918,6 +2174,8 @@ class InstancesAPI(APIClient):
 
         if backup_every is not None and backup_every < timedelta(minutes=1):
             raise ValueError("'backup_every' must be at least 1 minute to prevent unnecessary file transfers.")
+        if compact_every < 0:
+            raise ValueError(f"'compact_every' must be non-negative, got {compact_every}")
 
         return SyncSessionWithCache(
             self,
@@ -1926,6 +2184,7 @@ class InstancesAPI(APIClient):
             security_category=security_category,
             backup_every=backup_every,
             backup_on_exit=backup_on_exit,
+            compact_every=compact_every,
         )
 
     @overload
@@ -1939,6 +2198,7 @@ class InstancesAPI(APIClient):
         sort: Sequence[InstanceSort | dict] | InstanceSort | dict | None = None,
         filter: Filter | dict[str, Any] | None = None,
         debug: DebugParameters | None = None,
+        partitions: int | None = None,
     ) -> NodeList[Node]: ...
 
     @overload
@@ -1952,6 +2212,7 @@ class InstancesAPI(APIClient):
         sort: Sequence[InstanceSort | dict] | InstanceSort | dict | None = None,
         filter: Filter | dict[str, Any] | None = None,
         debug: DebugParameters | None = None,
+        partitions: int | None = None,
     ) -> EdgeList[Edge]: ...
 
     @overload
@@ -1964,6 +2225,7 @@ class InstancesAPI(APIClient):
         sort: Sequence[InstanceSort | dict] | InstanceSort | dict | None = None,
         filter: Filter | dict[str, Any] | None = None,
         debug: DebugParameters | None = None,
+        partitions: int | None = None,
     ) -> NodeList[T_Node]: ...
 
     @overload
@@ -1976,6 +2238,7 @@ class InstancesAPI(APIClient):
         sort: Sequence[InstanceSort | dict] | InstanceSort | dict | None = None,
         filter: Filter | dict[str, Any] | None = None,
         debug: DebugParameters | None = None,
+        partitions: int | None = None,
     ) -> EdgeList[T_Edge]: ...
 
     async def list(
@@ -1988,6 +2251,7 @@ class InstancesAPI(APIClient):
         sort: Sequence[InstanceSort | dict] | InstanceSort | dict | None = None,
         filter: Filter | dict[str, Any] | None = None,
         debug: DebugParameters | None = None,
+        partitions: int | None = None,
     ) -> NodeList[T_Node] | EdgeList[T_Edge]:
         """`List instances <https://api-docs.cognite.com/20230101/tag/Instances/operation/advancedListInstance>`_.
 
@@ -2000,6 +2264,7 @@ class InstancesAPI(APIClient):
             sort (Sequence[InstanceSort | dict] | InstanceSort | dict | None): How you want the listed instances information ordered.
             filter (Filter | dict[str, Any] | None): Advanced filtering of instances.
             debug (DebugParameters | None): Debug settings for profiling and troubleshooting.
+            partitions (int | None): Retrieve instances in parallel by splitting the listing into this many disjoint parts (per space when listing multiple spaces, else by external ID ranges). The number of concurrent requests is bounded by ``global_config.concurrency_settings.data_modeling.read``, and limit must be set to `None` (or `-1`). Can not be used with sort, include_typing or debug.
 
         Returns:
             NodeList[T_Node] | EdgeList[T_Edge]: List of requested instances
@@ -2045,6 +2310,13 @@ class InstancesAPI(APIClient):
                 >>> my_view = ViewId("mySpace", "myView", "v1")
                 >>> instance_list = client.data_modeling.instances.list(sources=my_view)
 
+            List all nodes with data in a view, fetching disjoint parts of the data concurrently:
+
+                >>> from cognite.client.data_classes.filters import HasData
+                >>> instance_list = client.data_modeling.instances.list(
+                ...     filter=HasData(views=[my_view]), sources=my_view, limit=None, partitions=10
+                ... )
+
             Convert instances to pandas DataFrame with expanded properties (``expand_properties=True``).
             This will add the properties directly as dataframe columns. Specifying ``camel_case=True``
             will convert the basic columns to camel case (e.g. externalId), but leave the property names as-is.
@@ -2070,7 +2342,8 @@ class InstancesAPI(APIClient):
         instance_type_str = self._to_instance_type_str(instance_type)
         if not isinstance(instance_type, str) and issubclass(instance_type, (TypedNode, TypedEdge)):
             sources = self._to_sources(sources, instance_type)
-        filter = self._merge_space_into_filter(instance_type_str, space, filter)
+        if partitions is None:
+            filter = self._merge_space_into_filter(instance_type_str, space, filter)
 
         other_params = self._create_other_params(
             include_typing=include_typing,
@@ -2094,6 +2367,20 @@ class InstancesAPI(APIClient):
         else:
             raise ValueError(f"Invalid instance type: {instance_type}")
 
+        if partitions is not None:
+            self._validate_partitions_params(sort, include_typing, debug)
+            if not is_unlimited(limit):
+                raise ValueError(
+                    "When using partitions, a finite limit can not be used. Pass one of `None`, `-1` or `inf`."
+                )
+            chunks = [
+                chunk
+                async for chunk in self._list_generator_partitioned(
+                    instance_type_str, partitions, list_cls, resource_cls, None, None, space, filter, other_params
+                )
+            ]
+            return list_cls([item for chunk in chunks for item in chunk])
+
         headers: dict[str, str] | None = None
         settings_forcing_raw_response_loading = []
         if include_typing:
@@ -2121,6 +2408,112 @@ class InstancesAPI(APIClient):
     def _validate_filter(self, filter: Filter | dict[str, Any] | None) -> None:
         _validate_filter(filter, _FILTERS_SUPPORTED, type(self).__name__)
 
+    @staticmethod
+    def _validate_partitions_params(
+        sort: Sequence[InstanceSort | dict] | InstanceSort | dict | None,
+        include_typing: bool,
+        debug: DebugParameters | None,
+    ) -> None:
+        if sort is not None:
+            raise ValueError("When using sort, partitions is not supported.")
+        if include_typing or debug:
+            raise ValueError(
+                f"When using partitions, the following settings are not supported: {include_typing=}, {debug=}"
+            )
+
+    async def _create_partition_filters(
+        self,
+        instance_type: Literal["node", "edge"],
+        partitions: int,
+        space: str | SequenceNotStr[str] | None,
+        filter: Filter | dict[str, Any] | None,
+    ) -> list[Filter | dict[str, Any] | None]:
+        # When listing several spaces, these are already disjoint parts:
+        spaces = [space] if isinstance(space, str) else list(space or [])
+        if len(spaces) > 1:
+            return [
+                self._merge_space_into_filter(instance_type, list(part), filter)
+                for part in split_into_n_parts(spaces, n=min(partitions, len(spaces)))
+            ]
+        # ...else we split by external ID, sampling the lowest and highest from the data:
+        filter = self._merge_space_into_filter(instance_type, space, filter)
+        xid_property = [instance_type, "externalId"]
+        lowest, highest = await asyncio.gather(
+            *(
+                self.list(instance_type, filter=filter, limit=1, sort=InstanceSort(xid_property, direction))
+                for direction in ("ascending", "descending")
+            )
+        )
+        if not lowest or not highest:
+            return [filter]
+
+        boundaries = split_key_range(lowest[0].external_id, highest[0].external_id, partitions)
+        ranges = [
+            filters.Range(xid_property, gte=low, lt=high) for low, high in zip([None, *boundaries], [*boundaries, None])
+        ]
+        if filter is None:
+            return list(ranges)
+        filter = Filter.load(filter) if isinstance(filter, dict) else filter
+        return [key_range & filter for key_range in ranges]
+
+    async def _list_generator_partitioned(
+        self,
+        instance_type: Literal["node", "edge"],
+        partitions: int,
+        list_cls: Any,
+        resource_cls: Any,
+        chunk_size: int | None,
+        limit: int | None,
+        space: str | SequenceNotStr[str] | None,
+        filter: Filter | dict[str, Any] | None,
+        other_params: dict[str, Any],
+    ) -> AsyncIterator[Any]:
+        if not is_positive_int(partitions):
+            raise ValueError(f"partitions must be a positive integer, not {partitions!r}")
+        read_iterators = [
+            self._list_generator(
+                list_cls=list_cls,
+                resource_cls=resource_cls,
+                method="POST",
+                chunk_size=chunk_size or self._LIST_LIMIT,
+                limit=None,
+                filter=part.dump(camel_case_property=False) if isinstance(part, Filter) else part,
+                other_params=other_params,
+            )
+            for part in await self._create_partition_filters(instance_type, partitions, space, filter)
+        ]
+        # A bounded queue applies backpressure to the fetching tasks when the consumer can't keep up. Each
+        # task signals that it is done by putting None (or the error it failed with):
+        queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=len(read_iterators))
+
+        async def _fetch_and_enqueue(iterator: AsyncIterator[Any]) -> None:
+            try:
+                async for chunk in iterator:
+                    await queue.put(chunk)
+            except Exception as err:
+                await queue.put(err)
+            else:
+                await queue.put(None)
+
+        producer_tasks = [asyncio.create_task(_fetch_and_enqueue(it)) for it in read_iterators]
+        n_running, n_yielded = len(producer_tasks), 0
+        try:
+            while n_running:
+                if (chunk := await queue.get()) is None:
+                    n_running -= 1
+                elif isinstance(chunk, Exception):
+                    raise chunk
+                elif is_unlimited(limit) or n_yielded + len(chunk) < limit:
+                    n_yielded += len(chunk)
+                    yield chunk
+                else:
+                    yield chunk[: limit - n_yielded]
+                    return
+        finally:
+            for task in producer_tasks:
+                task.cancel()
+            await asyncio.gather(*producer_tasks, return_exceptions=True)
+
     @staticmethod
     def _merge_space_into_filter(
         instance_type: Literal["node", "edge"],
@@ -2148,3 +2541,141 @@ class InstancesAPI(APIClient):
         elif issubclass(instance_type, TypedEdge):
             return "edge"
         raise ValueError(f"Invalid instance type: {instance_type}")
+
+
+class _InstanceGraphApplier:
+    def __init__(self, instances_api: InstancesAPI, nodes: Sequence[NodeApply], edges: Sequence[EdgeApply]) -> None:
+        from cognite.client import global_config
+
+        self.instances_api = instances_api
+        self.create_limit = instances_api._CREATE_LIMIT
+        self.concurrency_limit = global_config.concurrency_settings.data_modeling.write
+        self.instances: list[NodeApply | EdgeApply] = [*nodes, *edges]
+        self.successful: list[NodeApplyResult | EdgeApplyResult] = []
+        self.failed: list[NodeApply | EdgeApply] = []
+        self.unknown: list[NodeApply | EdgeApply] = []
+        self.skipped: list[NodeApply | EdgeApply] = []
+        self.latest_exception: Exception | None = None
+
+        # We track instances by their position in the input. Each node written unblocks the instances depending
+        # on it (only the first node given for an ID counts, in case of duplicates):
+        self._node_position: dict[tuple[str, str], int] = {}
+        for i, node in enumerate(nodes):
+            self._node_position.setdefault((node.space, node.external_id), i)
+        self._dependents: defaultdict[int, list[int]] = defaultdict(list)
+        self._n_blockers = [0] * len(self.instances)
+        for i, inst in enumerate(self.instances):
+            for dependency in self._find_dependencies(inst):
+                if (position := self._node_position.get(dependency)) is not None and position != i:
+                    self._dependents[position].append(i)
+                    self._n_blockers[i] += 1
+
+    @staticmethod
+    def _find_dependencies(instance: NodeApply | EdgeApply) -> set[tuple[str, str]]:
+        dumped = instance.dump(camel_case=True)
+        references = [dumped.get("type"), dumped.get("startNode"), dumped.get("endNode")]
+        for source in dumped.get("sources", []):
+            for value in source["properties"].values():
+                references.extend(value if isinstance(value, list) else [value])
+        return {
+            (ref["space"], ref["externalId"])
+            for ref in references
+            if isinstance(ref, dict) and ref.keys() == {"space", "externalId"}
+        }
+
+    async def apply(
+        self, auto_create_direct_relations: bool, skip_on_version_conflict: bool, replace: bool
+    ) -> InstancesApplyResult:
+        write_fn = functools.partial(self._write, skip_on_version_conflict=skip_on_version_conflict, replace=replace)
+        pending = set(range(len(self.instances)))
+        ready = deque(i for i in sorted(pending) if self._n_blockers[i] == 0)
+        pending.difference_update(ready)
+        in_cycle: set[int] = set()
+        in_flight: dict[asyncio.Task[list[NodeApplyResult | EdgeApplyResult] | None], list[int]] = {}
+
+        while ready or in_flight or pending:
+            if not ready and not in_flight:
+                # Only nodes depending on each other in cycles (and their dependents) remain. We write the nodes,
+                # letting the API create placeholders for direct relation targets not yet written:
+                in_cycle = {i for i in pending if isinstance(self.instances[i], NodeApply)}
+                ready.extend(sorted(in_cycle))
+                pending.difference_update(in_cycle)
+
+            while ready and len(in_flight) < self.concurrency_limit:
+                batch = [ready.popleft() for _ in range(min(len(ready), self.create_limit))]
+                auto_create = auto_create_direct_relations or batch[0] in in_cycle
+                task = asyncio.create_task(write_fn([self.instances[i] for i in batch], auto_create))
+                in_flight[task] = batch
+
+            done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                batch = in_flight.pop(task)
+                if (written := task.result()) is None:
+                    self._skip_all_dependents(batch, pending)
+                    continue
+                self.successful.extend(written)
+                # Newly written nodes are now unblocked as dependencies:
+                for i in batch:
+                    for dependent in self._dependents.pop(i, []):
+                        self._n_blockers[dependent] -= 1
+                        if self._n_blockers[dependent] == 0 and dependent in pending:
+                            pending.remove(dependent)
+                            ready.append(dependent)
+
+        self._raise_if_exception()
+        return InstancesApplyResult(
+            nodes=NodeApplyResultList([item for item in self.successful if isinstance(item, NodeApplyResult)]),
+            edges=EdgeApplyResultList([item for item in self.successful if isinstance(item, EdgeApplyResult)]),
+        )
+
+    async def _write(
+        self,
+        batch: list[NodeApply | EdgeApply],
+        auto_create_direct_relations: bool,
+        skip_on_version_conflict: bool,
+        replace: bool,
+    ) -> list[NodeApplyResult | EdgeApplyResult] | None:
+        try:
+            res = await self.instances_api.apply(
+                nodes=[inst for inst in batch if isinstance(inst, NodeApply)],
+                edges=[inst for inst in batch if isinstance(inst, EdgeApply)],
+                auto_create_direct_relations=auto_create_direct_relations,
+                skip_on_version_conflict=skip_on_version_conflict,
+                replace=replace,
+            )
+            return [*res.nodes, *res.edges]
+        except Exception as err:
+            # The whole batch is a single request, so all instances end up in the same category:
+            bad = self.failed if FailedRequestHandler.classify_error(err) == "failed" else self.unknown
+            bad.extend(batch)
+            self.latest_exception = err
+            return None
+
+    def _skip_all_dependents(self, batch: list[int], pending: set[int]) -> None:
+        to_skip = batch
+        while to_skip:
+            to_skip = [dep for i in to_skip for dep in self._dependents.pop(i, []) if dep in pending]
+            pending.difference_update(to_skip)
+            self.skipped.extend(self.instances[i] for i in to_skip)
+
+    def _raise_if_exception(self) -> None:
+        if self.latest_exception is None:
+            return
+
+        err_message = "One or more errors happened during instance graph apply. Latest error:"
+        if isinstance(self.latest_exception, CogniteAPIError):
+            raise CogniteAPIError(
+                message=f"{err_message} {self.latest_exception.message}",
+                x_request_id=self.latest_exception.x_request_id,
+                code=self.latest_exception.code,
+                cluster=self.instances_api._config.cdf_cluster,
+                project=self.instances_api._config.project,
+                extra=self.latest_exception.extra,
+                successful=self.successful,
+                failed=self.failed,
+                unknown=self.unknown,
+                skipped=self.skipped,
+            )
+        raise CogniteMultiException(
+            successful=self.successful, failed=self.failed, unknown=self.unknown, skipped=self.skipped
+        ) from self.latest_exception
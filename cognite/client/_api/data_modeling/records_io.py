@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import time
+from collections import defaultdict
+from collections.abc import Sequence
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
+from types import TracebackType
+from typing import TYPE_CHECKING
+
+from typing_extensions import Self
+
+from cognite.client._basic_api_client import FailedRequestHandler
+from cognite.client.data_classes.data_modeling.records import RecordsWriterStats, RecordWrite
+from cognite.client.exceptions import CogniteAPIError, CogniteMultiException
+from cognite.client.utils._async_helpers import run_sync
+from cognite.client.utils._auxiliary import split_into_chunks
+from cognite.client.utils._text import copy_doc_from_async
+
+if TYPE_CHECKING:
+    from cognite.client._api.data_modeling.records import RecordsAPI
+
+# Status codes for which a request is split in two and retried, to write the records not causing the failure.
+# A too large request is always split, other rejections only when the error points to specific items:
+_SPLIT_ON_STATUS_CODES = frozenset({400, 413, 422})
+
+
+class RecordsWriter(AbstractContextManager["RecordsWriter"], AbstractAsyncContextManager["RecordsWriter"]):
+    """A long-lived, buffered writer of records, see :py:meth:`~RecordsAPI.create_writer`.
+
+    Records added (from any number of producers) are buffered per stream and written in requests as full as
+    possible, with as many requests in parallel as allowed by the ``records.write`` concurrency setting.
+    A stream is flushed in the background as soon as it holds a full request worth of records, and all streams
+    are flushed when the oldest record has been buffered for ``max_buffer_age`` seconds, and on close.
+
+    Note:
+        Can be used both as a regular and async context manager. Requests failing from e.g. rate limiting
+        are retried like all other requests made by the SDK. Requests that are too large, or rejected because of
+        specific items (e.g. missing or duplicated), are split in two and retried, so that only the records causing
+        the failure fail. Other rejected requests (e.g. writing to a stream that does not exist) fail as a whole.
+        Records that could not be written are raised (as part of a CogniteAPIError) on the next call to add,
+        flush or close.
+
+    Args:
+        records_api (RecordsAPI): The records API to write with.
+        upsert (bool): Whether to upsert (mutable streams only) rather than ingest the records.
+        max_buffer_age (float): The max number of seconds a record is buffered before it is written.
+        max_buffered_records (int): When this many records are buffered or being written, adding more waits for
+            them to be written (backpressure).
+    """
+
+    def __init__(self, records_api: RecordsAPI, upsert: bool, max_buffer_age: float, max_buffered_records: int) -> None:
+        self._records_api = records_api
+        self.upsert = upsert
+        self.max_buffer_age = max_buffer_age
+        self.max_buffered_records = max_buffered_records
+        self._buffers: defaultdict[str, list[RecordWrite]] = defaultdict(list)
+        self._n_buffered = 0
+        self._oldest_added: float | None = None
+        self._started: float | None = None
+        self._stats = RecordsWriterStats()
+        self._background_flusher: asyncio.Task | None = None
+        self._pending_flushes: set[asyncio.Task] = set()
+        self._failed: list[RecordWrite] = []
+        self._unknown: list[RecordWrite] = []
+        self._latest_exception: Exception | None = None
+        self._is_closed = False
+
+    @property
+    def stats(self) -> RecordsWriterStats:
+        """Throughput statistics of the writer (a snapshot)."""
+        elapsed = 0.0 if self._started is None else time.monotonic() - self._started
+        return dataclasses.replace(self._stats, n_buffered_records=self._n_buffered, elapsed_seconds=elapsed)
+
+    async def add_async(self, records: RecordWrite | Sequence[RecordWrite], stream_id: str) -> None:
+        """Add records to be written to a stream.
+
+        Args:
+            records (RecordWrite | Sequence[RecordWrite]): One or more records to write.
+            stream_id (str): External ID of the stream to write to.
+        """
+        self._raise_if_closed_or_failed()
+        items = [records] if isinstance(records, RecordWrite) else list(records)
+        # We validate up front, so that bad input is raised to the producer (and not in the background):
+        if not all(isinstance(item, RecordWrite) for item in items):
+            raise TypeError("Only RecordWrite objects can be added to the records writer")
+        if not items:
+            return
+        if self._background_flusher is None:
+            self._background_flusher = asyncio.create_task(self._flush_periodically())
+
+        buffer = self._buffers[stream_id]
+        buffer.extend(items)
+        self._n_buffered += len(items)
+        self._stats.n_records_added += len(items)
+        if self._oldest_added is None:
+            self._oldest_added = time.monotonic()
+            if self._started is None:
+                self._started = self._oldest_added
+
+        if self._n_buffered >= self.max_buffered_records:
+            await self.flush_async()  # Backpressure: the producer waits for the buffer to be written
+        elif len(buffer) >= self._records_api._CREATE_LIMIT:
+            self._start_background_flush(stream_id)
+
+    async def flush_async(self) -> None:
+        """Write all buffered records now."""
+        self._raise_if_closed_or_failed()
+        await self._flush_all()
+        self._raise_if_closed_or_failed()
+
+    async def close_async(self) -> None:
+        """Write all buffered records, then stop the writer. Adding records after this raises."""
+        if self._is_closed:
+            return
+        self._is_closed = True
+        if self._background_flusher is not None:
+            self._background_flusher.cancel()
+            await asyncio.gather(self._background_flusher, return_exceptions=True)
+        await self._flush_all()
+        self._raise_if_failed()
+
+    @copy_doc_from_async(add_async)
+    def add(self, records: RecordWrite | Sequence[RecordWrite], stream_id: str) -> None:
+        return run_sync(self.add_async(records, stream_id=stream_id))
+
+    @copy_doc_from_async(flush_async)
+    def flush(self) -> None:
+        return run_sync(self.flush_async())
+
+    @copy_doc_from_async(close_async)
+    def close(self) -> None:
+        return run_sync(self.close_async())
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self, exc_type: type[BaseException] | None, exc_val: BaseException | None, exc_tb: TracebackType | None
+    ) -> None:
+        await self.close_async()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_val: BaseException | None, exc_tb: TracebackType | None
+    ) -> None:
+        self.close()
+
+    def _raise_if_closed_or_failed(self) -> None:
+        if self._is_closed:
+            raise RuntimeError("The RecordsWriter has been closed")
+        self._raise_if_failed()
+
+    def _raise_if_failed(self) -> None:
+        if (err := self._latest_exception) is None:
+            return
+        failed, unknown = self._failed, self._unknown
+        self._latest_exception, self._failed, self._unknown = None, [], []
+
+        err_message = "One or more records could not be written by the RecordsWriter. Latest error:"
+        if isinstance(err, CogniteAPIError):
+            raise CogniteAPIError(
+                message=f"{err_message} {err.message}",
+                x_request_id=err.x_request_id,
+                code=err.code,
+                cluster=self._records_api._config.cdf_cluster,
+                project=self._records_api._config.project,
+                extra=err.extra,
+                failed=failed,
+                unknown=unknown,
+            )
+        raise CogniteMultiException(failed=failed, unknown=unknown) from err
+
+    def _take_batches(self, stream_id: str | None = None) -> list[tuple[str, list[RecordWrite]]]:
+        # With a stream given, we only take its full batches, leaving the rest to fill up the next request:
+        limit = self._records_api._CREATE_LIMIT
+        if stream_id is None:
+            to_write, self._buffers = self._buffers, defaultdict(list)
+            self._oldest_added = None
+        else:
+            buffer = self._buffers[stream_id]
+            n_full = len(buffer) - len(buffer) % limit
+            to_write = {stream_id: buffer[:n_full]}
+            del buffer[:n_full]
+        return [(stream, batch) for stream, records in to_write.items() for batch in split_into_chunks(records, limit)]
+
+    async def _write(self, batches: list[tuple[str, list[RecordWrite]]]) -> None:
+        try:
+            await asyncio.gather(*(self._write_batch(stream_id, batch) for stream_id, batch in batches))
+        finally:
+            # Records count as buffered until written, so that producers wait for writes falling behind:
+            self._n_buffered -= sum(len(batch) for _, batch in batches)
+
+    async def _write_batch(self, stream_id: str, records: list[RecordWrite]) -> None:
+        api = self._records_api
+        self._stats.n_requests += 1
+        try:
+            await api._post(
+                url_path=api._records_url(stream_id, "/upsert" if self.upsert else ""),
+                json={"items": [record.dump(camel_case=True) for record in records]},
+                semaphore=api._get_semaphore("write"),
+            )
+        except Exception as err:
+            if len(records) > 1 and self._should_split(err):
+                self._stats.n_requests_split += 1
+                half = len(records) // 2
+                await asyncio.gather(
+                    self._write_batch(stream_id, records[:half]), self._write_batch(stream_id, records[half:])
+                )
+                return
+            self._latest_exception = err
+            bad_records = self._failed if FailedRequestHandler.classify_error(err) == "failed" else self._unknown
+            bad_records.extend(records)
+            self._stats.n_records_failed += len(records)
+        else:
+            self._stats.n_records_written += len(records)
+
+    @staticmethod
+    def _should_split(err: Exception) -> bool:
+        # Splitting a request rejected as a whole (e.g. a bad stream) would just fail once per record:
+        if not isinstance(err, CogniteAPIError) or err.code not in _SPLIT_ON_STATUS_CODES:
+            return False
+        return err.code == 413 or bool(err.missing or err.duplicated)
+
+    async def _flush_all(self) -> None:
+        await self._write(self._take_batches())
+        # Make sure that records being written in the background are written before we return:
+        await asyncio.gather(*self._pending_flushes, return_exceptions=True)
+
+    def _start_background_flush(self, stream_id: str) -> None:
+        # We keep a reference to the task, so that it is not garbage collected before it is done:
+        task = asyncio.create_task(self._write(self._take_batches(stream_id)))
+        self._pending_flushes.add(task)
+        task.add_done_callback(self._pending_flushes.discard)
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            if self._oldest_added is None:
+                wait = self.max_buffer_age
+            else:
+                wait = self._oldest_added + self.max_buffer_age - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+                continue
+            await self._write(self._take_batches())
@@ -55,10 +55,12 @@ from cognite.client.utils._text import convert_all_keys_to_snake_case, to_snake_
 from cognite.client.utils._time import (
     align_start_and_end_for_granularity,
     convert_timezone_to_str,
+    estimate_count_in_time_range,
     granularity_to_ms,
     parse_str_timezone,
     split_granularity_into_quantity_and_normalized_unit,
     split_time_range,
+    split_time_range_by_density,
     time_shift_to_ms,
     timestamp_to_ms,
 )
@@ -893,6 +895,20 @@ class ConcurrentUnlimitedRawTaskOrchestrator(BaseRawTaskOrchestrator, Concurrent
         # average density of points at 1 dp/sec, giving us split-windows no smaller than ~1 day:
         return min(n_workers_per_queries, math.ceil((tot_ms / 1000) / self.query.max_query_limit))
 
+    def _create_uniformly_split_subtasks(self, n_workers_per_queries: int) -> list[BaseDpsFetchSubtask]:
+        if (density_profile := self.query.density_profile) is None:
+            return super()._create_uniformly_split_subtasks(n_workers_per_queries)
+        # With counts known up front, we split into time ranges holding about the same number of datapoints,
+        # and only as many as the datapoints actually need:
+        start = self.query.start_ms if self.eager_mode else self.first_start
+        est_dps = estimate_count_in_time_range(density_profile, start, end := self.query.end_ms)
+        n_periods = max(1, min(n_workers_per_queries, math.ceil(est_dps / self.query.max_query_limit)))
+        boundaries = split_time_range_by_density(start, end, n_periods, density_profile)
+        return [
+            SplittingFetchSubtask(start=start, end=end, subtask_idx=(i,), parent=self)
+            for i, (start, end) in enumerate(pairwise(boundaries), 1)
+        ]
+
 
 class BaseAggTaskOrchestrator(BaseTaskOrchestrator):
     def __init__(self, *, query: DatapointsQuery, use_numpy: bool, **kwargs: Any) -> None:
@@ -0,0 +1,323 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import io
+import sqlite3
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from cognite.client._constants import NUMPY_IS_AVAILABLE
+from cognite.client.data_classes import DatapointsArray, DatapointsArrayList, DatapointsQuery
+from cognite.client.data_classes.data_modeling import NodeId
+from cognite.client.data_classes.datapoint_aggregates import _OBJECT_AGGREGATES_CAMEL
+from cognite.client.utils import _json_extended as _json
+from cognite.client.utils._identifier import Identifier
+from cognite.client.utils._time import granularity_to_ms, timestamp_to_ms
+
+if NUMPY_IS_AVAILABLE:
+    import numpy as np
+
+if TYPE_CHECKING:
+    from cognite.client._api.datapoints import DatapointsAPI
+    from cognite.client.config import ClientConfig
+    from cognite.client.data_classes.datapoints_subscriptions import DatapointsUpdate
+
+# Datapoints this close to 'now' are returned, but not cached, as they are likely to still change
+# (late arriving data, or in the case of aggregates, the most recent intervals not yet being complete):
+SETTLE_TIME_MS = 5 * 60_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS segments (
+    ident TEXT NOT NULL,
+    key TEXT NOT NULL,
+    start INTEGER NOT NULL,
+    end INTEGER NOT NULL,
+    ts_info TEXT NOT NULL,
+    arrays BLOB NOT NULL,
+    objects TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS segments_by_key ON segments (key, start);
+CREATE INDEX IF NOT EXISTS segments_by_ident ON segments (ident, start);
+"""
+
+
+@dataclass
+class _Segment:
+    # Holds all datapoints in [start, end) for a time series (with given query settings):
+    start: int
+    end: int
+    dps: DatapointsArray
+
+    def clip(self, start: int, end: int) -> DatapointsArray:
+        timestamps = self.dps.timestamp.astype("datetime64[ms]").astype(np.int64)
+        lo, hi = np.searchsorted(timestamps, [start, end])
+        return self.dps[lo:hi]
+
+
+class DatapointsCache:
+    """A local, persistent cache of datapoints, stored in a SQLite database.
+
+    Datapoints are stored in segments, each covering a time range of a single time series for one specific
+    combination of query settings (aggregates, granularity, status code handling etc.). When fetching, only the
+    time ranges not already covered by a segment are requested from the API. These are then merged with the
+    cached segments.
+
+    The cache is invalidated on writes made through the SDK (insert and delete) and by datapoint subscription
+    updates passing through the SDK. Writes made elsewhere are not seen until then. Note that a time series is
+    cached per identifier as given by the user, so e.g. an insert using the ID does not invalidate data cached
+    using the external ID (subscription updates carry all identifiers and invalidate all of them).
+
+    Args:
+        path (Path): Path to the SQLite database file. Created if it does not exist.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    @classmethod
+    def from_config(cls, config: ClientConfig) -> DatapointsCache | None:
+        from cognite.client import global_config
+
+        if global_config.datapoints_cache_directory is None:
+            return None
+        directory = Path(global_config.datapoints_cache_directory)
+        return cls(directory / f"{config.cdf_cluster}-{config.project}.sqlite")
+
+    @staticmethod
+    def is_cacheable(query: DatapointsQuery) -> bool:
+        # We only cache queries that return all datapoints in a time range, with a fixed (not calendar) grid:
+        return (
+            query.limit is None
+            and not query.include_outside_points
+            and not query.use_cursors
+            and not _OBJECT_AGGREGATES_CAMEL.intersection(query.aggs_camel_case)
+        )
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with contextlib.closing(sqlite3.connect(self.path)) as conn, conn:
+            conn.executescript(_SCHEMA)
+            yield conn
+
+    async def fetch_all_datapoints_numpy(
+        self, dps_client: DatapointsAPI, queries: list[DatapointsQuery]
+    ) -> DatapointsArrayList:
+        cache_keys = {query: _cache_key(query) for query in queries if self.is_cacheable(query)}
+        cached = await asyncio.to_thread(self._load_segments, cache_keys)
+
+        to_fetch: list[DatapointsQuery] = []
+        gap_queries: dict[DatapointsQuery, list[DatapointsQuery]] = {}
+        for query in queries:
+            if query not in cache_keys:
+                to_fetch.append(query)
+                continue
+            gaps = _find_gaps(query.start_ms, query.end_ms, cached[query])
+            gap_queries[query] = [
+                DatapointsQuery(**{**query.dump(), "start": start, "end": end}) for start, end in gaps
+            ]
+            to_fetch.extend(gap_queries[query])
+
+        dps_client.query_validator(gap for gaps in gap_queries.values() for gap in gaps)
+        fetched = await self._fetch(dps_client, to_fetch)
+
+        settled_until = timestamp_to_ms("now") - SETTLE_TIME_MS
+        results, new_segments = [], []
+        for query in queries:
+            if query not in cache_keys:
+                if query in fetched:
+                    results.append(fetched[query])
+                continue
+            if not all(gap in fetched for gap in gap_queries[query]):
+                continue  # Missing time series, ignored by the user (else we would have raised)
+
+            fresh = [_Segment(gap.start_ms, gap.end_ms, fetched[gap]) for gap in gap_queries[query]]
+            for segment in fresh:
+                if (settled := _settled_part(query, segment, settled_until)) is not None:
+                    new_segments.append((query.identifier, cache_keys[query], settled))
+            results.append(_merge_segments(query, cached[query] + fresh))
+
+        await asyncio.to_thread(self._store_segments, new_segments)
+        return DatapointsArrayList(results).set_client_ref(dps_client._cognite_client)
+
+    @staticmethod
+    async def _fetch(
+        dps_client: DatapointsAPI, queries: list[DatapointsQuery]
+    ) -> dict[DatapointsQuery, DatapointsArray]:
+        if not queries:
+            return {}
+        fetcher = dps_client._select_dps_fetch_strategy(queries)(dps_client, queries)
+        dps_lst = await fetcher.fetch_all_datapoints_numpy()
+        # Missing time series (when ignore_unknown_ids=True) are left out, but the order is kept, so we
+        # match results with queries in order:
+        fetched, dps_iter = {}, iter(dps_lst)
+        dps = next(dps_iter, None)
+        for query in queries:
+            if dps is not None and query.identifier.identifies(dps):
+                fetched[query] = dps
+                dps = next(dps_iter, None)
+        return fetched
+
+    def _load_segments(self, cache_keys: dict[DatapointsQuery, str]) -> dict[DatapointsQuery, list[_Segment]]:
+        if not cache_keys:
+            return {}
+        with self._connect() as conn:
+            return {
+                query: [
+                    _Segment(start, end, _decode_dps(query, *encoded))
+                    for start, end, *encoded in conn.execute(
+                        "SELECT start, end, ts_info, arrays, objects FROM segments "
+                        "WHERE key = ? AND start < ? AND end > ? ORDER BY start",
+                        (key, query.end_ms, query.start_ms),
+                    )
+                ]
+                for query, key in cache_keys.items()
+            }
+
+    def _store_segments(self, segments: list[tuple[Identifier, str, _Segment]]) -> None:
+        if not segments:
+            return
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT INTO segments VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(_ident_key(ident), key, seg.start, seg.end, *_encode_dps(seg.dps)) for ident, key, seg in segments],
+            )
+
+    async def invalidate(self, ranges: Iterable[tuple[Identifier, int, int]]) -> None:
+        """Remove all cached segments overlapping the given (identifier, inclusive start, exclusive end) ranges."""
+        params = [(_ident_key(ident), end, start) for ident, start, end in ranges]
+        if params:
+            await asyncio.to_thread(self._delete_segments, params)
+
+    async def invalidate_from_subscription(self, updates: Iterable[DatapointsUpdate]) -> None:
+        ranges: list[tuple[Identifier, int, int]] = []
+        for update in updates:
+            time_series = update.time_series
+            identifiers: list[Identifier] = []
+            if time_series.id is not None:
+                identifiers.append(Identifier(time_series.id))
+            if time_series.external_id is not None:
+                identifiers.append(Identifier(time_series.external_id))
+            if time_series.instance_id is not None:
+                identifiers.append(Identifier(time_series.instance_id))
+            changed = [(d.inclusive_begin, d.exclusive_end or d.inclusive_begin + 1) for d in update.deletes]
+            if timestamps := update.upserts.timestamp:
+                changed.append((min(timestamps), max(timestamps) + 1))
+            ranges.extend((ident, start, end) for ident in identifiers for start, end in changed)
+        await self.invalidate(ranges)
+
+    def _delete_segments(self, params: list[tuple[str, int, int]]) -> None:
+        with self._connect() as conn:
+            conn.executemany("DELETE FROM segments WHERE ident = ? AND start < ? AND end > ?", params)
+
+
+def _ident_key(identifier: Identifier) -> str:
+    return _json.dumps_deterministic(identifier.as_dict())
+
+
+def _cache_key(query: DatapointsQuery) -> str:
+    settings: dict[str, Any] = {
+        "identifier": query.identifier.as_dict(),
+        "aggregates": sorted(query.aggs_camel_case),
+        "granularity": query.granularity,
+        "target_unit": query.target_unit,
+        "target_unit_system": query.target_unit_system,
+        "include_status": query.include_status,
+        "ignore_bad_datapoints": query.ignore_bad_datapoints,
+        "treat_uncertain_as_bad": query.treat_uncertain_as_bad,
+    }
+    if not query.is_raw_query:
+        # Aggregate intervals are laid out on a grid decided by 'start', so we cache per grid offset:
+        settings["grid_offset"] = query.start_ms % granularity_to_ms(query.granularity)  # type: ignore [arg-type]
+    return _json.dumps_deterministic(settings)
+
+
+def _find_gaps(start: int, end: int, segments: list[_Segment]) -> list[tuple[int, int]]:
+    gaps, covered_until = [], start
+    for segment in sorted(segments, key=lambda seg: seg.start):
+        if segment.start > covered_until:
+            gaps.append((covered_until, min(segment.start, end)))
+        covered_until = max(covered_until, segment.end)
+        if covered_until >= end:
+            return gaps
+    return [*gaps, (covered_until, end)]
+
+
+def _settled_part(query: DatapointsQuery, segment: _Segment, settled_until: int) -> _Segment | None:
+    end = min(segment.end, settled_until)
+    if not query.is_raw_query:
+        # Only whole aggregate intervals can be cached, so we round down to the grid:
+        granularity_ms = granularity_to_ms(query.granularity)  # type: ignore [arg-type]
+        end -= (end - segment.start) % granularity_ms
+    if end <= segment.start:
+        return None
+    return _Segment(segment.start, end, segment.clip(segment.start, end))
+
+
+def _merge_segments(query: DatapointsQuery, segments: list[_Segment]) -> DatapointsArray:
+    pieces, covered_until = [], query.start_ms
+    for segment in sorted(segments, key=lambda seg: seg.start):
+        end = min(segment.end, query.end_ms)
+        if end > covered_until:
+            pieces.append(segment.clip(covered_until, end))
+            covered_until = end
+    # All pieces share the same fields as they were fetched with identical query settings, but
+    # empty pieces may have different dtypes (e.g. status codes), so we only use those if needed:
+    non_empty = [dps for dps in pieces if len(dps)] or pieces[:1]
+    fields: dict[str, Any] = {
+        attr: np.concatenate([_get_fields(dps)[attr] for dps in non_empty]) for attr in _get_fields(non_empty[0])
+    }
+    if non_empty[0].null_timestamps is not None:
+        fields["null_timestamps"] = set().union(*(dps.null_timestamps or () for dps in non_empty))
+    ts_info = {**pieces[-1]._ts_info, "granularity": query.original_granularity, "timezone": query.original_timezone}
+    return DatapointsArray(**ts_info, **fields)
+
+
+def _get_fields(dps: DatapointsArray) -> dict[str, Any]:
+    fields = dict(zip(*dps._data_fields()))
+    if dps.status_code is not None:
+        fields.update(status_code=dps.status_code, status_symbol=dps.status_symbol)  # type: ignore [arg-type]
+    return fields
+
+
+def _encode_dps(dps: DatapointsArray) -> tuple[str, bytes, str]:
+    ts_info = {
+        key: value for key, value in dps._ts_info.items() if key not in ("instance_id", "granularity", "timezone")
+    }
+    if dps.instance_id is not None:
+        ts_info["instance_id"] = dps.instance_id.dump(include_instance_type=False)
+
+    arrays, objects = {}, {}
+    for attr, arr in _get_fields(dps).items():
+        if attr == "timestamp":
+            arrays[attr] = arr.astype("datetime64[ms]").astype(np.int64)
+        elif arr.dtype == np.object_:
+            # Strings (and None) are stored as JSON, so that we never need to unpickle anything:
+            objects[attr] = arr.tolist()
+        else:
+            arrays[attr] = arr
+    if dps.null_timestamps is not None:
+        objects["null_timestamps"] = sorted(dps.null_timestamps)
+
+    buffer = io.BytesIO()
+    np.savez(buffer, **arrays)
+    return _json.dumps(ts_info), buffer.getvalue(), _json.dumps(objects)
+
+
+def _decode_dps(query: DatapointsQuery, ts_info: str, arrays: bytes, objects: str) -> DatapointsArray:
+    info = _json.loads(ts_info)
+    if (instance_id := info.get("instance_id")) is not None:
+        info["instance_id"] = NodeId.load(instance_id)
+
+    with np.load(io.BytesIO(arrays), allow_pickle=False) as npz:
+        fields: dict[str, Any] = {attr: npz[attr] for attr in npz.files}
+    fields["timestamp"] = fields["timestamp"].astype("datetime64[ms]").astype("datetime64[ns]")
+    for attr, values in _json.loads(objects).items():
+        if attr == "null_timestamps":
+            fields[attr] = set(values)
+        else:
+            fields[attr] = np.array(values, dtype=np.object_)
+    return DatapointsArray(**info, **fields, granularity=query.original_granularity, timezone=query.original_timezone)
@@ -5,16 +5,21 @@ import datetime
 import heapq
 import itertools
 import math
+import time
 from abc import ABC, abstractmethod
-from collections import Counter, defaultdict
+from collections import Counter
 from collections.abc import AsyncIterator, Iterable, Iterator, MutableSequence, Sequence
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
+from dataclasses import dataclass
 from itertools import chain
 from operator import itemgetter
+from types import TracebackType
 from typing import (
     TYPE_CHECKING,
     Any,
     Literal,
     NamedTuple,
+    TypeAlias,
     TypeGuard,
     TypeVar,
     cast,
@@ -26,18 +31,26 @@ from cognite.client._api.datapoint_tasks import (
     BaseDpsFetchSubtask,
     BaseTaskOrchestrator,
 )
+from cognite.client._api.datapoints_cache import DatapointsCache
+from cognite.client._basic_api_client import FailedRequestHandler
+from cognite.client._constants import NUMPY_IS_AVAILABLE
 from cognite.client._proto.data_point_list_response_pb2 import DataPointListItem, DataPointListResponse
 from cognite.client.data_classes import (
     Datapoints,
     DatapointsArray,
     DatapointsArrayList,
+    DatapointsFetchStats,
     DatapointsList,
     DatapointsQuery,
+    LatestDatapoint,
+    LatestDatapointList,
     LatestDatapointQuery,
+    TimeSeriesFetchStats,
 )
 from cognite.client.data_classes.data_modeling import NodeId
-from cognite.client.exceptions import CogniteAPIError, CogniteNotFoundError
+from cognite.client.exceptions import CogniteAPIError, CogniteMultiException, CogniteNotFoundError
 from cognite.client.utils import _json_extended as _json
+from cognite.client.utils._async_helpers import run_sync
 from cognite.client.utils._auxiliary import (
     exactly_one_is_not_none,
     split_into_chunks,
@@ -46,23 +59,52 @@ from cognite.client.utils._auxiliary import (
     unpack_items_in_payload,
 )
 from cognite.client.utils._concurrency import AsyncSDKTask, execute_async_tasks
+from cognite.client.utils._datapoints import get_datapoints_from_proto
 from cognite.client.utils._identifier import Identifier, IdentifierSequence, IdentifierSequenceCore
+from cognite.client.utils._text import copy_doc_from_async
 from cognite.client.utils._time import (
+    estimate_count_in_time_range,
+    granularity_to_ms,
     timestamp_to_ms,
 )
 from cognite.client.utils._validation import validate_user_input_dict_with_identifier
 from cognite.client.utils.useful_types import SequenceNotStr
 
+if NUMPY_IS_AVAILABLE:
+    import numpy as np
+
 if TYPE_CHECKING:
+    import numpy.typing as npt
+
     from cognite.client._api.datapoints import DatapointsAPI
+    from cognite.client.data_classes.datapoints import NumpyInt64Array, NumpyUInt32Array
+    from cognite.client.data_classes.datapoints_subscriptions import DatapointsUpdate, TimeSeriesID
 
 
 PoolSubtaskType = tuple[float, int, BaseDpsFetchSubtask]
 
-_T = TypeVar("_T")
+_TSliceable = TypeVar("_TSliceable", bound="list[Any] | _InsertDatapointsArrays")
+
+
+class _TimedSemaphore:
+    # Wraps a semaphore to measure how long requests wait to acquire it:
+    def __init__(self, semaphore: asyncio.BoundedSemaphore, stats: DatapointsFetchStats) -> None:
+        self.semaphore = semaphore
+        self.stats = stats
+
+    async def __aenter__(self) -> None:
+        t0 = time.perf_counter()
+        await self.semaphore.acquire()
+        self.stats.semaphore_wait_seconds += time.perf_counter() - t0
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.semaphore.release()
 
 
 class DpsFetchStrategy(ABC):
+    _N_PLANNING_BUCKETS = 200
+    _MIN_PLANNING_MS = 60 * 60_000  # For very short time ranges, planning is not worth the extra request
+
     def __init__(self, dps_client: DatapointsAPI, all_queries: list[DatapointsQuery]) -> None:
         from cognite.client import global_config
 
@@ -73,6 +115,17 @@ class DpsFetchStrategy(ABC):
         self.n_queries = len(all_queries)
         self.semaphore = dps_client._get_semaphore("read")
 
+        self.stats_callback = global_config.datapoints_fetch_stats_callback
+        self.stats: DatapointsFetchStats | None = None
+        self._ts_stats: dict[tuple[str, Any], TimeSeriesFetchStats] = {}
+        if self.stats_callback is not None:
+            self.stats = DatapointsFetchStats(strategy=type(self).__name__, n_queries=self.n_queries)
+            for query in all_queries:
+                key = query.identifier.as_tuple()
+                if key not in self._ts_stats:
+                    self._ts_stats[key] = TimeSeriesFetchStats(query.identifier.as_dict(camel_case=False))
+            self.stats.time_series = list(self._ts_stats.values())
+
     @staticmethod
     def split_queries(all_queries: list[DatapointsQuery]) -> tuple[list[DatapointsQuery], list[DatapointsQuery]]:
         split_qs: tuple[list[DatapointsQuery], list[DatapointsQuery]] = [], []
@@ -81,26 +134,149 @@ class DpsFetchStrategy(ABC):
         return split_qs
 
     async def fetch_all_datapoints(self) -> DatapointsList:
-        return DatapointsList(
-            [ts_task.get_result(use_numpy=False) async for ts_task in self._fetch_all(use_numpy=False)],
-        ).set_client_ref(self.dps_client._cognite_client)
+        t0, failed = time.perf_counter(), True
+        try:
+            await self._maybe_plan_using_count_aggregates()
+            dps_lst = DatapointsList(
+                [ts_task.get_result(use_numpy=False) async for ts_task in self._fetch_all(use_numpy=False)],
+            ).set_client_ref(self.dps_client._cognite_client)
+            failed = False
+        finally:
+            self._report_stats(time.perf_counter() - t0, failed)
+        return dps_lst
 
     async def fetch_all_datapoints_numpy(self) -> DatapointsArrayList:
-        return DatapointsArrayList(
-            [ts_task.get_result(use_numpy=True) async for ts_task in self._fetch_all(use_numpy=True)],
-        ).set_client_ref(self.dps_client._cognite_client)
+        t0, failed = time.perf_counter(), True
+        try:
+            await self._maybe_plan_using_count_aggregates()
+            dps_lst = DatapointsArrayList(
+                [ts_task.get_result(use_numpy=True) async for ts_task in self._fetch_all(use_numpy=True)],
+            ).set_client_ref(self.dps_client._cognite_client)
+            failed = False
+        finally:
+            self._report_stats(time.perf_counter() - t0, failed)
+        return dps_lst
+
+    def _report_stats(self, fetch_seconds: float, failed: bool) -> None:
+        if self.stats is None or self.stats_callback is None:
+            return
+        self.stats.fetch_seconds = fetch_seconds
+        self.stats.failed = failed
+        self.stats_callback(self.stats)
+
+    def _record_subtasks(self, n_subtasks: int, is_split: bool) -> None:
+        if self.stats is None:
+            return
+        if is_split:
+            self.stats.n_subtasks_split += n_subtasks
+        else:
+            self.stats.n_subtasks += n_subtasks
+
+    def _record_response(self, n_bytes: int, decode_seconds: float, items: Sequence[DataPointListItem]) -> None:
+        if self.stats is None:
+            return
+        self.stats.n_requests += 1
+        self.stats.bytes_received += n_bytes
+        self.stats.decode_seconds += decode_seconds
+        for item in items:
+            for key in (("id", item.id), ("externalId", item.externalId), ("instanceId", self._proto_node_id(item))):
+                if (ts_stats := self._ts_stats.get(key)) is not None:
+                    ts_stats.n_requests += 1
+                    ts_stats.bytes_received += item.ByteSize()
+                    ts_stats.n_datapoints += len(get_datapoints_from_proto(item))
+                    break
+
+    @staticmethod
+    def _proto_node_id(item: DataPointListItem) -> NodeId | None:
+        if item.HasField("instanceId"):
+            return NodeId(item.instanceId.space, item.instanceId.externalId)
+        return None
+
+    async def _maybe_plan_using_count_aggregates(self) -> None:
+        """Opt-in: Fetch coarse 'count' aggregates for all unlimited raw queries in bulk, which lets us split
+        their time domain into pieces holding about the same number of datapoints (instead of assuming
+        uniform density), and estimate how dense each is (instead of guessing from the first batch).
+        """
+        from cognite.client import global_config
+
+        if not global_config.datapoints_density_planning:
+            return
+        queries = [q for q in self.raw_queries if q.limit is None and q.end_ms - q.start_ms > self._MIN_PLANNING_MS]
+        if not queries:
+            return
+        count_queries = [
+            DatapointsQuery.valid_from_user_query(
+                DatapointsQuery(**{query.identifier.name(camel_case=False): query.identifier.as_primitive()}),
+                start=query.start_ms,
+                end=query.end_ms,
+                aggregates="count",
+                granularity=self._decide_count_granularity(query.end_ms - query.start_ms),
+                ignore_unknown_ids=True,
+                ignore_bad_datapoints=query.ignore_bad_datapoints,
+                treat_uncertain_as_bad=query.treat_uncertain_as_bad,
+            )
+            for query in queries
+        ]
+        self.dps_client.query_validator(count_queries)
+        for query, count_query, dps in zip(queries, count_queries, await self._fetch_counts(count_queries)):
+            if dps is None:
+                continue
+            gran_ms = granularity_to_ms(cast(str, count_query.granularity))
+            query.density_profile = [
+                (ts, min(ts + gran_ms, query.end_ms), count)
+                for ts, count in zip(dps.timestamp, cast(list[int], dps.count))
+            ]
+
+    async def _fetch_counts(self, count_queries: list[DatapointsQuery]) -> list[Datapoints | None]:
+        fetcher = self.dps_client._select_dps_fetch_strategy(count_queries)(self.dps_client, count_queries)
+        try:
+            counts = await fetcher.fetch_all_datapoints()
+        except CogniteAPIError:
+            if len(count_queries) == 1:
+                return [None]
+            # Typically a string time series (no aggregates) failing the request for all. Planning is best-effort,
+            # so we ask for each time series separately and just skip planning for those that fail:
+            separate_counts = await asyncio.gather(*(self._fetch_counts([query]) for query in count_queries))
+            return list(chain.from_iterable(separate_counts))
+
+        # Missing time series are not part of the result, so we match in order by identifier:
+        count_iter = iter(counts)
+        dps = next(count_iter, None)
+        matched: list[Datapoints | None] = []
+        for count_query in count_queries:
+            if dps is not None and count_query.identifier.identifies(dps):
+                matched.append(dps)
+                dps = next(count_iter, None)
+            else:
+                matched.append(None)
+        return matched
+
+    @staticmethod
+    def _decide_count_granularity(tot_ms: int) -> str:
+        # We aim for a few hundred buckets per time series, which is plenty for planning, while making it cheap
+        # to get counts for many time series in the same request:
+        bucket_ms = math.ceil(tot_ms / DpsFetchStrategy._N_PLANNING_BUCKETS)
+        if bucket_ms <= 60 * 60_000:
+            return f"{math.ceil(bucket_ms / 60_000)}m"
+        elif bucket_ms <= 48 * 3_600_000:
+            return f"{math.ceil(bucket_ms / 3_600_000)}h"
+        return f"{math.ceil(bucket_ms / 86_400_000)}d"
 
     async def _request_datapoints(self, payload: dict[str, Any]) -> Sequence[DataPointListItem]:
-        (res := DataPointListResponse()).MergeFromString(
-            (
-                await self.dps_client._post(
-                    f"{self.dps_client._RESOURCE_PATH}/list",
-                    json=payload,
-                    headers={"accept": "application/protobuf"},
-                    semaphore=self.semaphore,
-                )
-            ).content
-        )
+        semaphore: AbstractAsyncContextManager[Any] = self.semaphore
+        if self.stats is not None:
+            semaphore = _TimedSemaphore(self.semaphore, self.stats)
+        content = (
+            await self.dps_client._post(
+                f"{self.dps_client._RESOURCE_PATH}/list",
+                json=payload,
+                headers={"accept": "application/protobuf"},
+                semaphore=semaphore,
+            )
+        ).content
+        t0 = time.perf_counter()
+        (res := DataPointListResponse()).MergeFromString(content)
+        self._record_response(len(content), time.perf_counter() - t0, res.items)
         return res.items
 
     async def _raise_if_missing(
@@ -176,6 +352,7 @@ class EagerDpsFetcher(DpsFetchStrategy):
 
                 # We may dynamically split subtasks based on what % of time range was returned:
                 if new_subtasks := subtask.store_partial_result(res):
+                    self._record_subtasks(len(new_subtasks), is_split=True)
                     self._queue_new_subtasks(futures_dct, new_subtasks)
                 if ts_task.is_done:
                     # Reduce peak memory consumption by finalizing as soon as tasks finish:
@@ -206,7 +383,9 @@ class EagerDpsFetcher(DpsFetchStrategy):
         ts_task_lookup = {}
         for query in self.all_queries:
             ts_task = ts_task_lookup[query] = query.task_orchestrator(query=query, eager_mode=True, use_numpy=use_numpy)
-            for subtask in ts_task.split_into_subtasks(self.concurrency_limit, self.n_queries):
+            subtasks = ts_task.split_into_subtasks(self.concurrency_limit, self.n_queries)
+            self._record_subtasks(len(subtasks), is_split=False)
+            for subtask in subtasks:
                 payload = {"items": [subtask.get_next_payload_item()], "ignoreUnknownIds": False}
                 future = asyncio.create_task(self._request_datapoints(payload))
                 futures_dct[future] = subtask
@@ -299,12 +478,14 @@ class ChunkingDpsFetcher(DpsFetchStrategy):
         await self._raise_if_missing(missing_to_raise, initial_futures_dct)
 
         if ts_tasks_left := self._update_queries_with_new_chunking_limit(ts_task_lookup):
-            self._add_to_subtask_pools(
+            subtasks = list(
                 chain.from_iterable(
                     task.split_into_subtasks(concurrency_limit=self.concurrency_limit, n_tot_queries=len(ts_tasks_left))
                     for task in ts_tasks_left
                 )
             )
+            self._record_subtasks(len(subtasks), is_split=False)
+            self._add_to_subtask_pools(subtasks)
             futures_dct: dict[asyncio.Task, list[BaseDpsFetchSubtask]] = {}
             await self._queue_new_subtasks(futures_dct)
             await self._fetch_until_complete(futures_dct, unknown_failed)
@@ -337,6 +518,7 @@ class ChunkingDpsFetcher(DpsFetchStrategy):
             for subtask, res in zip(subtask_lst_all, res_lst_all):
                 # We may dynamically split subtasks based on what % of time range was returned:
                 if new_subtasks := subtask.store_partial_result(res):
+                    self._record_subtasks(len(new_subtasks), is_split=True)
                     self._add_to_subtask_pools(new_subtasks)
                 if not subtask.is_done:
                     self._add_to_subtask_pools([subtask])
@@ -468,7 +650,10 @@ class ChunkingDpsFetcher(DpsFetchStrategy):
     def _decide_individual_query_limit(query: DatapointsQuery, ts_task: BaseTaskOrchestrator, n_ts_limit: int) -> int:
         # For a better estimate, we use first ts of first batch instead of `query.start`:
         batch_start, batch_end = ts_task.start_ts_first_batch, ts_task.end_ts_first_batch
-        est_remaining_dps = ts_task.n_dps_first_batch * (query.end_ms - batch_end) / (batch_end - batch_start)
+        if query.density_profile is not None:
+            est_remaining_dps = estimate_count_in_time_range(query.density_profile, batch_end + 1, query.end_ms)
+        else:
+            est_remaining_dps = ts_task.n_dps_first_batch * (query.end_ms - batch_end) / (batch_end - batch_start)
         # To use the full request limit on a single ts, the estimate must be >> max_limit (raw/agg dependent):
         if est_remaining_dps > 5 * (max_limit := query.max_query_limit):
             return max_limit
@@ -568,6 +753,76 @@ class _InsertDatapoint(NamedTuple):
         return dumped
 
 
+@dataclass(frozen=True)
+class _InsertDatapointsArrays:
+    """Columnar version of a list of _InsertDatapoint, used when inserting from numpy arrays (DatapointsArray or
+    a pandas DataFrame). Chunking slices the arrays (views, not copies), and Python objects are only created for
+    a single request at a time, when dumped.
+    """
+
+    timestamp: NumpyInt64Array  # in ms
+    value: npt.NDArray[Any]
+    status_code: NumpyUInt32Array | None = None
+    is_null: npt.NDArray[np.bool_] | None = None  # Missing values, e.g. bad datapoints
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    def __getitem__(self, item: slice) -> Self:
+        return type(self)(
+            self.timestamp[item],
+            self.value[item],
+            None if self.status_code is None else self.status_code[item],
+            None if self.is_null is None else self.is_null[item],
+        )
+
+    @classmethod
+    def concatenate(cls, first: Self, second: Self) -> Self:
+        def concat(a: npt.NDArray[Any] | None, b: npt.NDArray[Any] | None, fill: Any) -> npt.NDArray[Any] | None:
+            if a is None and b is None:
+                return None
+            a = np.full(len(first), fill) if a is None else a
+            b = np.full(len(second), fill) if b is None else b
+            return np.concatenate((a, b))
+
+        return cls(
+            np.concatenate((first.timestamp, second.timestamp)),
+            np.concatenate((first.value, second.value)),
+            concat(first.status_code, second.status_code, fill=0),
+            concat(first.is_null, second.is_null, fill=False),
+        )
+
+    def to_list(self) -> list[_InsertDatapoint]:
+        return list(map(_InsertDatapoint, self.timestamp.tolist(), self._values_as_list(), *self._status_as_list()))
+
+    def _values_as_list(self) -> list[Any]:
+        # Using `tolist()` converts to the nearest compatible built-in Python type (in C code):
+        values = self.value.tolist()
+        if self.is_null is not None:
+            # 'Missing' and NaN can not be differentiated when we read from numpy arrays:
+            for idx in np.flatnonzero(self.is_null).tolist():
+                values[idx] = None
+        return values
+
+    def _status_as_list(self) -> list[list[int]]:
+        return [] if self.status_code is None else [self.status_code.tolist()]
+
+    def dump(self) -> list[dict[str, Any]]:
+        timestamps, values = self.timestamp.tolist(), self._values_as_list()
+        # Out-of-range float values must be passed as strings. Object arrays may hold them too (mixed with strings):
+        if self.value.dtype.kind == "O" or (self.value.dtype.kind == "f" and not np.isfinite(self.value).all()):
+            values = list(map(_json.convert_nonfinite_float_to_str, values))
+        if self.status_code is None or not self.status_code.any():
+            return [{"timestamp": ts, "value": value} for ts, value in zip(timestamps, values)]
+        return [
+            {"timestamp": ts, "value": value, "status": {"code": code}} if code else {"timestamp": ts, "value": value}
+            for ts, value, code in zip(timestamps, values, self.status_code.tolist())
+        ]
+
+
+_InsertDatapoints: TypeAlias = "list[_InsertDatapoint] | _InsertDatapointsArrays"
+
+
 class DatapointsPoster:
     def __init__(self, dps_client: DatapointsAPI) -> None:
         self.dps_client = dps_client
@@ -585,31 +840,65 @@ class DatapointsPoster:
             for chunk in split_into_chunks(to_insert, self.ts_limit)
             for task in self._create_payload_tasks(chunk)
         ]
-        summary = await execute_async_tasks(tasks)
+        try:
+            summary = await execute_async_tasks(tasks)
+        finally:
+            if (cache := DatapointsCache.from_config(self.dps_client._config)) is not None:
+                await cache.invalidate(self._get_inserted_ranges(to_insert))
         summary.raise_compound_exception_if_failed_tasks(
             task_unwrap_fn=itemgetter(0),
             task_list_element_unwrap_fn=IdentifierSequenceCore.extract_identifiers,
         )
 
+    @staticmethod
+    def _get_inserted_ranges(
+        to_insert: list[tuple[Identifier, _InsertDatapoints]],
+    ) -> Iterator[tuple[Identifier, int, int]]:
+        for identifier, dps in to_insert:
+            if isinstance(dps, _InsertDatapointsArrays):
+                yield identifier, int(dps.timestamp.min()), int(dps.timestamp.max()) + 1
+                continue
+            timestamps = [timestamp_to_ms(dp.ts) for dp in dps]
+            yield identifier, min(timestamps), max(timestamps) + 1
+
     def _verify_and_prepare_dps_objects(
         self, dps_object_lst: list[dict[str, Any]]
-    ) -> list[tuple[Identifier, list[_InsertDatapoint]]]:
-        dps_to_insert: dict[Identifier, list[_InsertDatapoint]] = defaultdict(list)
+    ) -> list[tuple[Identifier, _InsertDatapoints]]:
+        dps_to_insert: dict[Identifier, _InsertDatapoints] = {}
         for obj in dps_object_lst:
-            if not obj["datapoints"]:
+            if not len(obj["datapoints"]):
                 continue
             identifier = validate_user_input_dict_with_identifier(obj, required_keys={"datapoints"})
             validated_dps = self._parse_and_validate_dps(obj["datapoints"])
-            dps_to_insert[identifier].extend(validated_dps)
+            if (existing := dps_to_insert.get(identifier)) is None:
+                dps_to_insert[identifier] = validated_dps
+            else:
+                dps_to_insert[identifier] = self._combine_dps(existing, validated_dps)
         return list(dps_to_insert.items())
 
-    def _parse_and_validate_dps(self, dps: Datapoints | DatapointsArray | list[tuple | dict]) -> list[_InsertDatapoint]:
+    @staticmethod
+    def _combine_dps(first: _InsertDatapoints, second: _InsertDatapoints) -> _InsertDatapoints:
+        # Note: We never modify the given lists of datapoints in-place, as they may belong to the user:
+        if isinstance(first, _InsertDatapointsArrays) and isinstance(second, _InsertDatapointsArrays):
+            return _InsertDatapointsArrays.concatenate(first, second)
+        if isinstance(first, _InsertDatapointsArrays):
+            first = first.to_list()
+        if isinstance(second, _InsertDatapointsArrays):
+            second = second.to_list()
+        return [*first, *second]
+
+    def _parse_and_validate_dps(
+        self, dps: Datapoints | DatapointsArray | _InsertDatapointsArrays | list[tuple | dict]
+    ) -> _InsertDatapoints:
         if isinstance(dps, Datapoints):
             self._verify_dps_object_for_insertion(dps)
             return self._extract_raw_data_from_datapoints(dps)
         elif isinstance(dps, DatapointsArray):
             self._verify_dps_object_for_insertion(dps)
             return self._extract_raw_data_from_datapoints_array(dps)
+        elif isinstance(dps, _InsertDatapointsArrays):
+            self._verify_arrays_for_insertion(dps)
+            return dps  # Internal SDK shortcut, e.g. from insert_dataframe
 
         if not isinstance(dps, SequenceNotStr):
             raise TypeError(f"Datapoints to be inserted must be a list, not {type(dps)}")
@@ -646,7 +935,7 @@ class DatapointsPoster:
         return isinstance(dps[0], dict)
 
     def _create_payload_tasks(
-        self, post_dps_objects: list[tuple[Identifier, list[_InsertDatapoint]]]
+        self, post_dps_objects: list[tuple[Identifier, _InsertDatapoints]]
     ) -> Iterator[list[dict[str, Any]]]:
         payload = []
         n_left = self.dps_limit
@@ -666,7 +955,10 @@ class DatapointsPoster:
         # Acquire the semaphore before converting to memory-intensive format:
         async with self.dps_client._get_semaphore("write"):
             for dct in payload:
-                dct["datapoints"] = [dp.dump() for dp in dct["datapoints"]]
+                if isinstance(dps := dct["datapoints"], _InsertDatapointsArrays):
+                    dct["datapoints"] = dps.dump()
+                else:
+                    dct["datapoints"] = [dp.dump() for dp in dps]
             await self.dps_client._post(
                 url_path=self.dps_client._RESOURCE_PATH,
                 json={"items": payload},
@@ -679,7 +971,7 @@ class DatapointsPoster:
             dct["datapoints"].clear()
 
     @staticmethod
-    def _split_datapoints(lst: list[_T], n_first: int, n: int) -> Iterator[tuple[list[_T], bool]]:
+    def _split_datapoints(lst: _TSliceable, n_first: int, n: int) -> Iterator[tuple[_TSliceable, bool]]:
         # Returns chunks with a boolean answering "are we there yet"
         chunk = lst[:n_first]
         yield chunk, len(chunk) == n_first
@@ -704,23 +996,242 @@ class DatapointsPoster:
             # Let's not silently ignore someone that have manually instantiated a dps object with just one status:
             raise ValueError("One of status code/symbol is missing on datapoints object")
 
+    @staticmethod
+    def _verify_arrays_for_insertion(dps: _InsertDatapointsArrays) -> None:
+        if (n_ts := len(dps.timestamp)) != (n_dps := len(dps.value)):
+            raise ValueError(f"Number of timestamps ({n_ts}) does not match number of datapoints ({n_dps}) to insert")
+        if dps.timestamp.dtype.kind not in "iu":
+            raise TypeError(f"Timestamps to be inserted must be integers (ms since epoch), not {dps.timestamp.dtype}")
+        if dps.value.dtype.kind in "iufU":
+            return
+        elif dps.value.dtype.kind != "O":
+            raise TypeError(f"Datapoint values to be inserted must be numeric or strings, not {dps.value.dtype}")
+        # Object arrays (e.g. strings from a DataFrame) can hold anything, so we check each value:
+        for value in dps._values_as_list():
+            if value is not None and not isinstance(value, (str, int, float)):
+                raise TypeError(f"Datapoint values to be inserted must be numeric or strings, not {type(value)}")
+
     def _extract_raw_data_from_datapoints(self, dps: Datapoints) -> list[_InsertDatapoint]:
         if dps.status_code is None:
             return list(map(_InsertDatapoint, dps.timestamp, dps.value))  # type: ignore [arg-type]
         return list(map(_InsertDatapoint, dps.timestamp, dps.value, dps.status_code))  # type: ignore [arg-type]
 
-    def _extract_raw_data_from_datapoints_array(self, dps: DatapointsArray) -> list[_InsertDatapoint]:
-        # Using `tolist()` converts to the nearest compatible built-in Python type (in C code):
-        values = dps.value.tolist()  # type: ignore [union-attr]
-        timestamps = dps.timestamp.astype("datetime64[ms]").astype("int64").tolist()
-
+    def _extract_raw_data_from_datapoints_array(self, dps: DatapointsArray) -> _InsertDatapointsArrays:
+        is_null = None
+        timestamps = dps.timestamp.astype("datetime64[ms]").astype(np.int64)
         if dps.null_timestamps:
-            # 'Missing' and NaN can not be differentiated when we read from numpy arrays:
-            values = [None if ts in dps.null_timestamps else dp for ts, dp in zip(timestamps, values)]
+            null_timestamps = np.fromiter(dps.null_timestamps, dtype=np.int64, count=len(dps.null_timestamps))
+            is_null = np.isin(timestamps, null_timestamps)
+        return _InsertDatapointsArrays(timestamps, dps.value, dps.status_code, is_null)  # type: ignore [arg-type]
+
+
+class DatapointsWriter(AbstractContextManager["DatapointsWriter"], AbstractAsyncContextManager["DatapointsWriter"]):
+    """A long-lived, buffered writer of datapoints, see :py:meth:`~DatapointsAPI.create_writer`.
+
+    Datapoints added (from any number of producers) are buffered and inserted together, in as few and as full
+    requests as possible. The buffer is flushed when it holds a full request worth of datapoints or time series,
+    when the oldest datapoint has been buffered for ``max_buffer_age`` seconds, and on close.
+
+    Note:
+        Can be used both as a regular and async context manager. Failed requests are retried like all other
+        requests made by the SDK. If a flush still fails, the error is raised on the next call to add, flush or
+        close, combining all flushes that failed since the last one raised. The datapoints that were not (or may
+        not have been) inserted are then found in the ``failed``, ``unknown`` and ``skipped`` attributes of the
+        error, as dicts like ``{"external_id": "foo", "datapoints": [...]}``. These can be passed to ``add`` (as
+        keyword arguments) or to ``insert_multiple``, to insert them again (inserting datapoints is idempotent).
+
+    Args:
+        dps_client (DatapointsAPI): The datapoints API to insert with.
+        max_buffer_age (float): The max number of seconds a datapoint is buffered before it is inserted.
+        max_buffered_datapoints (int): When the buffer holds this many datapoints, adding more waits for the
+            buffer to be flushed (backpressure).
+    """
 
-        if dps.status_code is None:
-            return list(map(_InsertDatapoint, timestamps, values))
-        return list(map(_InsertDatapoint, timestamps, values, dps.status_code.tolist()))
+    def __init__(self, dps_client: DatapointsAPI, max_buffer_age: float, max_buffered_datapoints: int) -> None:
+        self._dps_client = dps_client
+        self.max_buffer_age = max_buffer_age
+        self.max_buffered_datapoints = max_buffered_datapoints
+        self._buffer: list[tuple[Identifier, _InsertDatapoints]] = []
+        self._buffered_identifiers: set[Identifier] = set()
+        self._n_buffered_dps = 0
+        self._oldest_added: float | None = None
+        self._flush_lock = asyncio.Lock()
+        self._background_flusher: asyncio.Task | None = None
+        self._pending_flushes: set[asyncio.Task] = set()
+        self._failed: list[dict[str, Any]] = []
+        self._unknown: list[dict[str, Any]] = []
+        self._skipped: list[dict[str, Any]] = []
+        self._latest_exception: Exception | None = None
+        self._is_closed = False
+
+    async def add_async(
+        self,
+        datapoints: Datapoints | DatapointsArray | Sequence[dict[str, Any]] | Sequence[tuple],
+        id: int | None = None,
+        external_id: str | None = None,
+        instance_id: NodeId | None = None,
+    ) -> None:
+        """Add datapoints for a single time series to the buffer. Accepts the same datapoints formats as
+        :py:meth:`~DatapointsAPI.insert`.
+
+        Args:
+            datapoints (Datapoints | DatapointsArray | Sequence[dict[str, Any]] | Sequence[tuple]): The datapoints to add.
+            id (int | None): Id of time series to insert datapoints into.
+            external_id (str | None): External id of time series to insert datapoint into.
+            instance_id (NodeId | None): Instance ID of time series to insert datapoints into.
+        """
+        self._raise_if_closed_or_failed()
+        if self._background_flusher is None:
+            self._background_flusher = asyncio.create_task(self._flush_periodically())
+
+        identifier = Identifier.of_either(id, external_id, instance_id)
+        # We validate and parse up front, so that bad input is raised to the producer (and not in the background):
+        validated_dps = DatapointsPoster(self._dps_client)._parse_and_validate_dps(datapoints)  # type: ignore [arg-type]
+        if not len(validated_dps):
+            return
+        self._buffer.append((identifier, validated_dps))
+        self._buffered_identifiers.add(identifier)
+        self._n_buffered_dps += len(validated_dps)
+        if self._oldest_added is None:
+            self._oldest_added = time.monotonic()
+
+        if self._n_buffered_dps >= self.max_buffered_datapoints:
+            await self.flush_async()  # Backpressure: the producer waits for the buffer to be written
+        elif (
+            self._n_buffered_dps >= self._dps_client._DPS_INSERT_LIMIT
+            or len(self._buffered_identifiers) >= self._dps_client._POST_DPS_OBJECTS_LIMIT
+        ):
+            self._start_background_flush()
+
+    async def flush_async(self) -> None:
+        """Insert all buffered datapoints now."""
+        self._raise_if_closed_or_failed()
+        await self._flush()
+        self._raise_if_failed()
+
+    async def close_async(self) -> None:
+        """Insert all buffered datapoints, then stop the writer. Any datapoints added after this raises."""
+        if self._is_closed:
+            return
+        self._is_closed = True
+        if self._background_flusher is not None:
+            self._background_flusher.cancel()
+            await asyncio.gather(self._background_flusher, return_exceptions=True)
+        await asyncio.gather(*self._pending_flushes, return_exceptions=True)
+        await self._flush()
+        self._raise_if_failed()
+
+    @copy_doc_from_async(add_async)
+    def add(
+        self,
+        datapoints: Datapoints | DatapointsArray | Sequence[dict[str, Any]] | Sequence[tuple],
+        id: int | None = None,
+        external_id: str | None = None,
+        instance_id: NodeId | None = None,
+    ) -> None:
+        return run_sync(self.add_async(datapoints, id=id, external_id=external_id, instance_id=instance_id))
+
+    @copy_doc_from_async(flush_async)
+    def flush(self) -> None:
+        return run_sync(self.flush_async())
+
+    @copy_doc_from_async(close_async)
+    def close(self) -> None:
+        return run_sync(self.close_async())
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self, exc_type: type[BaseException] | None, exc_val: BaseException | None, exc_tb: TracebackType | None
+    ) -> None:
+        await self.close_async()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_val: BaseException | None, exc_tb: TracebackType | None
+    ) -> None:
+        self.close()
+
+    def _raise_if_closed_or_failed(self) -> None:
+        if self._is_closed:
+            raise RuntimeError("The DatapointsWriter has been closed")
+        self._raise_if_failed()
+
+    def _raise_if_failed(self) -> None:
+        if (err := self._latest_exception) is None:
+            return
+        failed, unknown, skipped = self._failed, self._unknown, self._skipped
+        self._latest_exception, self._failed, self._unknown, self._skipped = None, [], [], []
+
+        err_message = "One or more datapoints could not be inserted by the DatapointsWriter. Latest error:"
+        if isinstance(err, CogniteAPIError):
+            raise CogniteAPIError(
+                message=f"{err_message} {err.message}",
+                x_request_id=err.x_request_id,
+                code=err.code,
+                cluster=self._dps_client._config.cdf_cluster,
+                project=self._dps_client._config.project,
+                extra=err.extra,
+                failed=failed,
+                unknown=unknown,
+                skipped=skipped,
+            )
+        raise CogniteMultiException(failed=failed, unknown=unknown, skipped=skipped) from err
+
+    async def _flush(self) -> None:
+        async with self._flush_lock:
+            if not self._buffer:
+                return
+            buffered, self._buffer = self._buffer, []
+            self._buffered_identifiers.clear()
+            self._n_buffered_dps = 0
+            self._oldest_added = None
+            to_insert = [{**identifier.as_dict(), "datapoints": dps} for identifier, dps in buffered]
+            try:
+                await DatapointsPoster(self._dps_client).insert(to_insert)
+            except CogniteMultiException as err:
+                # Insert errors list identifiers, which we replace with the datapoints that were buffered:
+                for bad_items, identifiers in zip(
+                    (self._failed, self._unknown, self._skipped), (err.failed, err.unknown, err.skipped)
+                ):
+                    bad_items.extend(
+                        self._as_insertable(identifier, dps)
+                        for (identifier, dps), obj in zip(buffered, to_insert)
+                        if IdentifierSequenceCore.extract_identifiers(obj) in identifiers
+                    )
+                self._latest_exception = err
+            except Exception as err:
+                bad_items = self._failed if FailedRequestHandler.classify_error(err) == "failed" else self._unknown
+                bad_items.extend(self._as_insertable(identifier, dps) for identifier, dps in buffered)
+                self._latest_exception = err
+
+    @staticmethod
+    def _as_insertable(identifier: Identifier, dps: _InsertDatapoints) -> dict[str, Any]:
+        # The buffer has been emptied, so the datapoints not inserted are handed back through the error. We use the
+        # public format accepted by 'add' and 'insert_multiple', not the internal one:
+        if isinstance(dps, _InsertDatapointsArrays):
+            dps = dps.to_list()
+        return {identifier.name(): identifier.as_primitive(), "datapoints": [dp.dump() for dp in dps]}
+
+    def _start_background_flush(self) -> None:
+        # We keep a reference to the task, so that it is not garbage collected before it is done:
+        task = asyncio.create_task(self._flush())
+        self._pending_flushes.add(task)
+        task.add_done_callback(self._pending_flushes.discard)
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            if self._oldest_added is None:
+                wait = self.max_buffer_age
+            else:
+                wait = self._oldest_added + self.max_buffer_age - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+                continue
+            await self._flush()
 
 
 class RetrieveLatestDpsFetcher:
@@ -930,3 +1441,299 @@ class RetrieveLatestDpsFetcher:
         )
         result = tasks_summary.joined_results(unpack_items)
         return self._post_fix_status_codes_and_stringified_floats_and_add_before(result)
+
+
+class LatestDatapointsService(
+    AbstractContextManager["LatestDatapointsService"], AbstractAsyncContextManager["LatestDatapointsService"]
+):
+    """Serves the latest datapoint of time series to many concurrent readers, see
+    :py:meth:`~DatapointsAPI.create_latest_service`.
+
+    Concurrent requests are combined into as few API requests as possible (asking for the same time series
+    twice only fetches it once), and the result for each time series is cached for ``ttl`` seconds. Thus, the
+    load on the API is decided by the number of time series and the TTL, not by the number of readers.
+
+    When given a datapoint subscription, cached results for time series in the subscription are kept up to
+    date by the subscription instead, and do not expire. If reading the subscription fails, the service falls
+    back to using the TTL for all time series (and the error is raised on close).
+
+    Args:
+        dps_client (DatapointsAPI): The datapoints API to fetch with.
+        ttl (float): Number of seconds a fetched result is served from the cache.
+        subscription_external_id (str | None): External ID of a datapoint subscription used to keep results up to date.
+        target_unit (str | None): The unit_external_id of the datapoints returned.
+        target_unit_system (str | None): The unit system of the datapoints returned.
+        include_status (bool): Also return the status code for each datapoint.
+        ignore_bad_datapoints (bool): Prevent datapoints with a bad status code to be returned.
+        treat_uncertain_as_bad (bool): Treat uncertain status codes as bad.
+    """
+
+    # Requests arriving within this many seconds of each other are combined:
+    _COALESCE_WINDOW = 0.01
+
+    def __init__(
+        self,
+        dps_client: DatapointsAPI,
+        ttl: float,
+        subscription_external_id: str | None,
+        target_unit: str | None,
+        target_unit_system: str | None,
+        include_status: bool,
+        ignore_bad_datapoints: bool,
+        treat_uncertain_as_bad: bool,
+    ) -> None:
+        if target_unit is not None and target_unit_system is not None:
+            raise ValueError("You must use either 'target_unit' or 'target_unit_system', not both.")
+        if subscription_external_id is not None and (target_unit is not None or target_unit_system is not None):
+            # Subscriptions return datapoints in the unit of the time series, which we would serve as converted:
+            raise ValueError("A subscription can not be used together with 'target_unit' or 'target_unit_system'.")
+        self._dps_client = dps_client
+        self.ttl = ttl
+        self.subscription_external_id = subscription_external_id
+        self.target_unit = target_unit
+        self.target_unit_system = target_unit_system
+        self.include_status = include_status
+        self.ignore_bad_datapoints = ignore_bad_datapoints
+        self.treat_uncertain_as_bad = treat_uncertain_as_bad
+
+        # Cached results are stored as (time fetched, raw result), where the result is None for unknown time series:
+        self._cache: dict[Identifier, tuple[float, dict[str, Any] | None]] = {}
+        self._in_flight: dict[Identifier, asyncio.Future[dict[str, Any] | None]] = {}
+        self._pending: list[Identifier] = []
+        self._batch_fetcher: asyncio.Task | None = None
+        self._subscribed: set[Identifier] = set()
+        self._subscription_reader: asyncio.Task | None = None
+        self._is_closed = False
+
+    async def retrieve_async(
+        self,
+        id: int | Sequence[int] | None = None,
+        external_id: str | SequenceNotStr[str] | None = None,
+        instance_id: NodeId | Sequence[NodeId] | None = None,
+        ignore_unknown_ids: bool = False,
+    ) -> LatestDatapoint | LatestDatapointList | None:
+        """Get the latest datapoint for one or more time series, served from the cache when possible.
+
+        Args:
+            id (int | Sequence[int] | None): Id or list of ids.
+            external_id (str | SequenceNotStr[str] | None): External id or list of external ids.
+            instance_id (NodeId | Sequence[NodeId] | None): Instance id or list of instance ids.
+            ignore_unknown_ids (bool): Ignore time series that are not found rather than throw an exception.
+
+        Returns:
+            LatestDatapoint | LatestDatapointList | None: Same as :py:meth:`~DatapointsAPI.retrieve_latest`.
+        """
+        if self._is_closed:
+            raise RuntimeError("The LatestDatapointsService has been closed")
+        if self.subscription_external_id is not None and self._subscription_reader is None:
+            self._subscription_reader = asyncio.create_task(self._follow_subscription())
+
+        identifier_seq = IdentifierSequence.load(id, external_id, instance_id)
+        identifiers = [self._normalize(ident) for ident in identifier_seq]
+        now = time.monotonic()
+        # Cached results are picked up before awaiting, as the cache may be changed (e.g. by the subscription) meanwhile:
+        results: dict[Identifier, dict[str, Any] | None] = {}
+        to_await: dict[Identifier, asyncio.Future[dict[str, Any] | None]] = {}
+        for ident in identifiers:
+            if ident in to_await or ident in results:
+                continue
+            elif self._is_fresh(ident, now):
+                results[ident] = self._cache[ident][1]
+                continue
+            elif ident not in self._in_flight:
+                self._in_flight[ident] = asyncio.get_running_loop().create_future()
+                self._pending.append(ident)
+            to_await[ident] = self._in_flight[ident]
+
+        if self._pending and self._batch_fetcher is None:
+            self._batch_fetcher = asyncio.create_task(self._fetch_pending())
+        # A cancelled reader must not cancel the fetch that other readers are waiting for:
+        results.update(zip(to_await, await asyncio.gather(*map(asyncio.shield, to_await.values()))))
+
+        found = []
+        for ident in identifiers:
+            if (res := results[ident]) is not None:
+                found.append(res)
+            elif not ignore_unknown_ids:
+                raise CogniteNotFoundError(
+                    "Time series not found",
+                    code=400,
+                    missing=[ident.as_dict(camel_case=False)],
+                    x_request_id="<no failing request was made>",
+                    cluster=self._dps_client._config.cdf_cluster,
+                    project=self._dps_client._config.project,
+                )
+        if not identifier_seq.is_singleton():
+            return LatestDatapointList._load(found)
+        elif not found:
+            return None
+        return LatestDatapoint._load(found[0])
+
+    async def close_async(self) -> None:
+        """Stop following the subscription (if any) and clear the cache."""
+        if self._is_closed:
+            return
+        self._is_closed = True
+        self._cache.clear()
+        if (reader := self._subscription_reader) is not None:
+            reader.cancel()
+            (err,) = await asyncio.gather(reader, return_exceptions=True)
+            if isinstance(err, Exception):
+                raise err
+
+    @copy_doc_from_async(retrieve_async)
+    def retrieve(
+        self,
+        id: int | Sequence[int] | None = None,
+        external_id: str | SequenceNotStr[str] | None = None,
+        instance_id: NodeId | Sequence[NodeId] | None = None,
+        ignore_unknown_ids: bool = False,
+    ) -> LatestDatapoint | LatestDatapointList | None:
+        return run_sync(
+            self.retrieve_async(
+                id=id, external_id=external_id, instance_id=instance_id, ignore_unknown_ids=ignore_unknown_ids
+            )
+        )
+
+    @copy_doc_from_async(close_async)
+    def close(self) -> None:
+        return run_sync(self.close_async())
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self, exc_type: type[BaseException] | None, exc_val: BaseException | None, exc_tb: TracebackType | None
+    ) -> None:
+        await self.close_async()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_val: BaseException | None, exc_tb: TracebackType | None
+    ) -> None:
+        self.close()
+
+    @staticmethod
+    def _normalize(identifier: Identifier) -> Identifier:
+        # Instance IDs are given by the user as InstanceId or NodeId, but returned from the API as NodeId:
+        if identifier.is_instance_id:
+            inst_id = identifier.as_primitive()
+            return Identifier(NodeId(inst_id.space, inst_id.external_id))
+        return identifier
+
+    def _is_fresh(self, identifier: Identifier, now: float) -> bool:
+        if (cached := self._cache.get(identifier)) is None:
+            return False
+        fetched_at, _ = cached
+        return identifier in self._subscribed or now - fetched_at < self.ttl
+
+    async def _fetch_pending(self) -> None:
+        await asyncio.sleep(self._COALESCE_WINDOW)
+        to_fetch, self._pending, self._batch_fetcher = self._pending, [], None
+        try:
+            results = await self._fetch(to_fetch)
+        except Exception as err:
+            # The error is raised to all readers waiting for any of these time series:
+            for ident in to_fetch:
+                self._in_flight.pop(ident).set_exception(err)
+            return
+
+        fetched_at = time.monotonic()
+        for ident in to_fetch:
+            res = results.get(ident)
+            self._cache[ident] = fetched_at, res
+            self._in_flight.pop(ident).set_result(res)
+
+    async def _fetch(self, identifiers: list[Identifier]) -> dict[Identifier, dict[str, Any] | None]:
+        # We fetch each identifier type separately, so that duplicates across types (e.g. the id and external ID
+        # of the same time series) are allowed while we ignore unknown ids:
+        by_type: dict[str, list[Any]] = {"id": [], "external_id": [], "instance_id": []}
+        for ident in identifiers:
+            by_type[ident.name()].append(ident.as_primitive())
+        fetchers = [
+            RetrieveLatestDpsFetcher(
+                **{"id": None, "external_id": None, "instance_id": None, identifier_type: values},
+                before=None,
+                target_unit=self.target_unit,
+                target_unit_system=self.target_unit_system,
+                include_status=self.include_status,
+                ignore_bad_datapoints=self.ignore_bad_datapoints,
+                treat_uncertain_as_bad=self.treat_uncertain_as_bad,
+                ignore_unknown_ids=True,
+                dps_client=self._dps_client,
+            )
+            for identifier_type, values in by_type.items()
+            if values
+        ]
+        results: dict[Identifier, dict[str, Any] | None] = {}
+        for res in chain.from_iterable(await asyncio.gather(*(fetcher.fetch_datapoints() for fetcher in fetchers))):
+            results.update(dict.fromkeys(self._result_identifiers(res), res))
+        return results
+
+    @staticmethod
+    def _result_identifiers(res: dict[str, Any]) -> list[Identifier]:
+        identifiers = [Identifier(res["id"])]
+        if (xid := res.get("externalId")) is not None:
+            identifiers.append(Identifier(xid))
+        if (inst_id := res.get("instanceId")) is not None:
+            identifiers.append(Identifier(NodeId.load(inst_id)))
+        return identifiers
+
+    async def _follow_subscription(self) -> None:
+        assert self.subscription_external_id is not None
+        subscriptions = self._dps_client._cognite_client.time_series.subscriptions
+        try:
+            members = await subscriptions.list_member_time_series(self.subscription_external_id, limit=None)
+            is_first_batch = True
+            async for batch in subscriptions.iterate_data_partitions(
+                self.subscription_external_id,
+                start="now",
+                include_status=self.include_status,
+                ignore_bad_datapoints=self.ignore_bad_datapoints,
+                treat_uncertain_as_bad=self.treat_uncertain_as_bad,
+            ):
+                if is_first_batch:
+                    # Results cached before we started following the subscription may be outdated:
+                    self._subscribed = {ident for ts_id in members for ident in self._ts_id_identifiers(ts_id)}
+                    self._cache = {
+                        ident: cached for ident, cached in self._cache.items() if ident not in self._subscribed
+                    }
+                    is_first_batch = False
+                for ts_id in batch.subscription_changes.added:
+                    self._subscribed.update(self._ts_id_identifiers(ts_id))
+                for ts_id in batch.subscription_changes.removed:
+                    self._subscribed.difference_update(self._ts_id_identifiers(ts_id))
+                for update in batch.updates:
+                    self._apply_subscription_update(update)
+        finally:
+            self._subscribed = set()
+
+    @staticmethod
+    def _ts_id_identifiers(ts_id: TimeSeriesID) -> list[Identifier]:
+        return [Identifier(value) for value in (ts_id.id, ts_id.external_id, ts_id.instance_id) if value is not None]
+
+    def _apply_subscription_update(self, update: DatapointsUpdate) -> None:
+        fetched_at = time.monotonic()
+        for ident in self._ts_id_identifiers(update.time_series):
+            if (cached := self._cache.get(ident)) is None or (res := cached[1]) is None:
+                continue
+            latest_ts = res["datapoints"][0]["timestamp"] if res["datapoints"] else None
+            if latest_ts is not None and any(
+                deletion.inclusive_begin <= latest_ts < (deletion.exclusive_end or deletion.inclusive_begin + 1)
+                for deletion in update.deletes
+            ):
+                # The latest datapoint was deleted. We don't know what the new one is, so it must be fetched:
+                del self._cache[ident]
+                continue
+            upserts = update.upserts
+            if not upserts.timestamp:
+                continue
+            idx = max(range(len(upserts.timestamp)), key=upserts.timestamp.__getitem__)
+            if latest_ts is not None and upserts.timestamp[idx] < latest_ts:
+                continue
+            dp: dict[str, Any] = {"timestamp": upserts.timestamp[idx], "value": upserts.value[idx]}
+            if upserts.status_code is not None:
+                dp["status"] = {"code": upserts.status_code[idx], "symbol": upserts.status_symbol[idx]}  # type: ignore [index]
+            self._cache[ident] = fetched_at, {**res, "datapoints": [dp], "before": timestamp_to_ms("now")}
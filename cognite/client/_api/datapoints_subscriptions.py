@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Sequence
 from typing import TYPE_CHECKING, Literal, cast, overload
 
+from cognite.client._api.datapoints_cache import DatapointsCache
 from cognite.client._api_client import APIClient
 from cognite.client._constants import DEFAULT_LIMIT_READ
 from cognite.client.data_classes.datapoints_subscriptions import (
@@ -11,12 +12,15 @@ from cognite.client.data_classes.datapoints_subscriptions import (
     DatapointSubscriptionBatch,
     DatapointSubscriptionList,
     DatapointSubscriptionPartition,
+    DatapointSubscriptionPartitionBatch,
     DataPointSubscriptionUpdate,
     DataPointSubscriptionWrite,
+    SubscriptionCursorStore,
     TimeSeriesID,
     TimeSeriesIDList,
     _DatapointSubscriptionBatchWithPartitions,
 )
+from cognite.client.utils._auxiliary import is_positive_int
 from cognite.client.utils._identifier import IdentifierSequence
 from cognite.client.utils.useful_types import SequenceNotStr
 
@@ -333,31 +337,170 @@ class DatapointsSubscriptionAPI(APIClient):
                 ...     pass  # do something
         """
         current_partitions = [DatapointSubscriptionPartition(partition, cursor)]
-        semaphore = self._get_semaphore("read")
         while True:
-            body = {
-                "externalId": external_id,
-                "partitions": [p.dump(camel_case=True) for p in current_partitions],
-                "limit": limit,
-                "pollTimeoutSeconds": poll_timeout,
-                "includeStatus": include_status,
-                "ignoreBadDataPoints": ignore_bad_datapoints,
-                "treatUncertainAsBad": treat_uncertain_as_bad,
-            }
-            if start is not None:
-                body["initializeCursors"] = start
-                start = None
-
-            res = await self._post(url_path=self._RESOURCE_PATH + "/data/list", json=body, semaphore=semaphore)
-            batch = _DatapointSubscriptionBatchWithPartitions.load(
-                res.json(), include_status=include_status, ignore_bad_datapoints=ignore_bad_datapoints
+            batch = await self._list_data(
+                external_id,
+                current_partitions,
+                start,
+                limit,
+                poll_timeout,
+                include_status,
+                ignore_bad_datapoints,
+                treat_uncertain_as_bad,
             )
+            start = None
             cursor = cast(str, batch.partitions[0].cursor)
-
             yield DatapointSubscriptionBatch(batch.updates, batch.subscription_changes, batch.has_next, cursor)
 
             current_partitions = batch.partitions
 
+    async def iterate_data_partitions(
+        self,
+        external_id: str,
+        partitions: Sequence[int] | None = None,
+        start: str | None = None,
+        limit: int = DEFAULT_LIMIT_READ,
+        poll_timeout: int = 5,
+        include_status: bool = False,
+        ignore_bad_datapoints: bool = True,
+        treat_uncertain_as_bad: bool = True,
+        cursor_store: SubscriptionCursorStore | None = None,
+        max_buffered_batches: int = 10,
+    ) -> AsyncIterator[DatapointSubscriptionPartitionBatch]:
+        """`Iterate over data from all (or several) partitions of a subscription concurrently <https://api-docs.cognite.com/20230101/tag/Data-point-subscriptions/operation/listSubscriptionData>`_.
+
+        Each partition is read in the background with its own cursor, and the batches are yielded in the order they arrive.
+        At most ``max_buffered_batches`` batches are kept in memory; when the buffer is full, reading pauses until you catch up.
+
+        When a ``cursor_store`` is given, each partition starts from its stored cursor (if any, otherwise from ``start``),
+        and the cursor of a batch is stored once you ask for the next batch, i.e. after you have processed it. Thus,
+        if the iteration is interrupted, it resumes with the first batch not processed. This includes stopping early
+        (e.g. with ``break``): the cursor of the last batch you received is not stored, and you receive it again on the
+        next run. An exception raised while processing a batch stops the iteration the same way, so storing the cursor
+        then would mark a batch that failed as processed. To skip the last batch on the next run, store its cursor
+        yourself before you stop.
+
+        Note:
+            Each partition uses a long-polling request, which counts towards the concurrency limit for datapoints reads.
+            To read all partitions at the same time, the limit must be at least the number of partitions.
+
+        Args:
+            external_id (str): The external ID of the subscription.
+            partitions (Sequence[int] | None): The partitions to iterate over. Defaults to None, meaning all partitions of the subscription.
+            start (str | None): When to start the iteration for partitions without a stored cursor. If set to None, the iteration will start from the beginning. The format is "N[timeunit]-ago", where timeunit is w,d,h,m (week, day, hour, minute). You can also set it to "now" to jump straight to the end. Defaults to None.
+            limit (int): Approximate number of results to return per request (per partition).
+            poll_timeout (int): How many seconds to wait for new data, until an empty response is sent. Defaults to 5.
+            include_status (bool): Also return the status code, an integer, for each datapoint in the response.
+            ignore_bad_datapoints (bool): Do not return bad datapoints. Default: True.
+            treat_uncertain_as_bad (bool): Treat datapoints with uncertain status codes as bad. If false, treat datapoints with uncertain status codes as good. Default: True.
+            cursor_store (SubscriptionCursorStore | None): Where to load and store the cursor for each partition. Defaults to None (cursors are not stored).
+            max_buffered_batches (int): The maximum number of batches read ahead, across all partitions. Default: 10.
+
+        Yields:
+            DatapointSubscriptionPartitionBatch: Changes to the subscription and data in the subscribed time series, along with the partition they were read from.
+
+        Examples:
+
+            Iterate over all partitions continuously, storing cursors in a local file so that a restart resumes where it left off:
+
+                >>> from cognite.client import CogniteClient, AsyncCogniteClient
+                >>> from cognite.client.data_classes.datapoints_subscriptions import (
+                ...     FileSubscriptionCursorStore,
+                ... )
+                >>> client = CogniteClient()
+                >>> # async_client = AsyncCogniteClient()  # another option
+                >>> store = FileSubscriptionCursorStore("cursors.json")
+                >>> for batch in client.time_series.subscriptions.iterate_data_partitions(
+                ...     "my_subscription", cursor_store=store
+                ... ):
+                ...     for update in batch.updates:
+                ...         pass  # do something with update.upserts and update.deletes
+        """
+        if partitions is None:
+            if (subscription := await self.retrieve(external_id)) is None:
+                raise ValueError(f"Subscription with external ID {external_id!r} does not exist")
+            partitions = range(subscription.partition_count)
+        if not is_positive_int(max_buffered_batches):
+            raise ValueError(f"'max_buffered_batches' must be a positive integer, not {max_buffered_batches!r}")
+
+        queue: asyncio.Queue[DatapointSubscriptionPartitionBatch | Exception] = asyncio.Queue(max_buffered_batches)
+
+        async def read_partition(partition: int) -> None:
+            cursor = cursor_store.get_cursor(external_id, partition) if cursor_store else None
+            partition_start = start if cursor is None else None
+            current_partitions = [DatapointSubscriptionPartition(partition, cursor)]
+            try:
+                while True:
+                    batch = await self._list_data(
+                        external_id,
+                        current_partitions,
+                        partition_start,
+                        limit,
+                        poll_timeout,
+                        include_status,
+                        ignore_bad_datapoints,
+                        treat_uncertain_as_bad,
+                    )
+                    partition_start = None
+                    current_partitions = batch.partitions
+                    await queue.put(
+                        DatapointSubscriptionPartitionBatch(
+                            batch.updates,
+                            batch.subscription_changes,
+                            batch.has_next,
+                            cast(str, batch.partitions[0].cursor),
+                            partition=partition,
+                        )
+                    )
+            except Exception as err:
+                await queue.put(err)
+
+        readers = [asyncio.create_task(read_partition(partition)) for partition in partitions]
+        try:
+            while True:
+                if isinstance(item := await queue.get(), Exception):
+                    raise item
+                yield item
+                if cursor_store is not None:
+                    cursor_store.set_cursor(external_id, item.partition, item.cursor)
+        finally:
+            for reader in readers:
+                reader.cancel()
+            await asyncio.gather(*readers, return_exceptions=True)
+
+    async def _list_data(
+        self,
+        external_id: str,
+        partitions: list[DatapointSubscriptionPartition],
+        start: str | None,
+        limit: int,
+        poll_timeout: int,
+        include_status: bool,
+        ignore_bad_datapoints: bool,
+        treat_uncertain_as_bad: bool,
+    ) -> _DatapointSubscriptionBatchWithPartitions:
+        body = {
+            "externalId": external_id,
+            "partitions": [p.dump(camel_case=True) for p in partitions],
+            "limit": limit,
+            "pollTimeoutSeconds": poll_timeout,
+            "includeStatus": include_status,
+            "ignoreBadDataPoints": ignore_bad_datapoints,
+            "treatUncertainAsBad": treat_uncertain_as_bad,
+        }
+        if start is not None:
+            body["initializeCursors"] = start
+
+        res = await self._post(
+            url_path=self._RESOURCE_PATH + "/data/list", json=body, semaphore=self._get_semaphore("read")
+        )
+        batch = _DatapointSubscriptionBatchWithPartitions.load(
+            res.json(), include_status=include_status, ignore_bad_datapoints=ignore_bad_datapoints
+        )
+        if (cache := DatapointsCache.from_config(self._config)) is not None:
+            await cache.invalidate_from_subscription(batch.updates)
+        return batch
+
     async def list(self, limit: int | None = DEFAULT_LIMIT_READ) -> DatapointSubscriptionList:
         """`List data point subscriptions <https://api-docs.cognite.com/20230101/tag/Data-point-subscriptions/operation/listSubscriptions>`_.
 
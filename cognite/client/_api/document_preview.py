@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import functools
+from collections.abc import Callable, Mapping, Sequence
 from pathlib import Path
-from typing import IO
+from typing import IO, Any
 
 from cognite.client._api_client import APIClient
 from cognite.client.data_classes.documents import TemporaryLink
+from cognite.client.utils._concurrency import AsyncSDKTask, execute_async_tasks
 
 
 class DocumentPreviewAPI(APIClient):
@@ -80,6 +83,73 @@ class DocumentPreviewAPI(APIClient):
         content = await self.download_page_as_png_bytes(id, page_number)
         path.write_bytes(content)
 
+    async def download_pages_as_png(
+        self,
+        pages: Mapping[int, Sequence[int]],
+        directory: Path | str | None = None,
+        callback: Callable[[int, int, bytes], Any] | None = None,
+        overwrite: bool = False,
+    ) -> None:
+        """`Downloads image previews for many pages of many documents concurrently <https://api-docs.cognite.com/20230101/tag/Document-preview/operation/documentsPreviewImagePage>`_.
+
+        Pages are rendered and downloaded concurrently (bounded by the read concurrency settings), and each image is
+        handed off as soon as it arrives; either written to the given directory or passed to the callback, so that
+        only the images currently in flight are kept in memory.
+
+        Args:
+            pages (Mapping[int, Sequence[int]]): Mapping from the ID of each document to the page numbers to preview (starting at 1 for first page).
+            directory (Path | str | None): Directory to save the png previews in. The file names will be '[id]_page[page_number].png'.
+            callback (Callable[[int, int, bytes], Any] | None): Called with the document ID, page number and png bytes of each page preview, as they arrive.
+            overwrite (bool): Whether to overwrite existing files in the directory. Defaults to False.
+
+        Examples:
+
+            Download image previews of the first three pages of two documents to folder "previews":
+
+                >>> from cognite.client import CogniteClient, AsyncCogniteClient
+                >>> client = CogniteClient()
+                >>> # async_client = AsyncCogniteClient()  # another option
+                >>> client.documents.previews.download_pages_as_png(
+                ...     {123: [1, 2, 3], 456: [1, 2, 3]}, directory="previews"
+                ... )
+
+            Build a thumbnail index in memory by passing a callback instead:
+
+                >>> thumbnails = {}
+                >>> def store(doc_id, page_number, png):
+                ...     thumbnails[doc_id, page_number] = png
+                >>> client.documents.previews.download_pages_as_png({123: [1], 456: [1]}, callback=store)
+        """
+        handle_png: Callable[[int, int, bytes], Any]
+        if (directory is None) is (callback is None):
+            raise ValueError("Exactly one of 'directory' and 'callback' must be given")
+        elif callback is not None:
+            handle_png = callback
+        else:
+            if not (directory := Path(directory)).is_dir():  # type: ignore [arg-type]
+                raise NotADirectoryError(directory)
+            paths = [directory / f"{id}_page{page}.png" for id, page_numbers in pages.items() for page in page_numbers]
+            if not overwrite and (existing := [str(path) for path in paths if path.exists()]):
+                raise FileExistsError(
+                    f"Files {existing} already exist. Use overwrite=True to overwrite existing files."
+                )
+            handle_png = functools.partial(self._write_png, directory)
+
+        async def download_page(id: int, page_number: int) -> None:
+            handle_png(id, page_number, await self.download_page_as_png_bytes(id, page_number))
+
+        tasks = [
+            AsyncSDKTask(download_page, id, page_number)
+            for id, page_numbers in pages.items()
+            for page_number in page_numbers
+        ]
+        summary = await execute_async_tasks(tasks)
+        summary.raise_compound_exception_if_failed_tasks(task_unwrap_fn=lambda task: {"id": task[0], "page": task[1]})
+
+    @staticmethod
+    def _write_png(directory: Path, id: int, page_number: int, content: bytes) -> None:
+        (directory / f"{id}_page{page_number}.png").write_bytes(content)
+
     async def download_document_as_pdf_bytes(self, id: int) -> bytes:
         """`Downloads a pdf preview of the specified document <https://api-docs.cognite.com/20230101/tag/Document-preview/operation/documentsPreviewPdf>`_.
 
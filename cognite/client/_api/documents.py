@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from collections.abc import AsyncIterator
+import asyncio
+import gzip
+from collections.abc import AsyncIterator, Sequence
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, BinaryIO, Literal, overload
 
 from cognite.client._api.document_preview import DocumentPreviewAPI
@@ -19,7 +22,9 @@ from cognite.client.data_classes.documents import (
     SourceFileProperty,
 )
 from cognite.client.data_classes.filters import _BASIC_FILTERS, Filter, _validate_filter
-from cognite.client.utils._identifier import IdentifierSequence
+from cognite.client.utils import _json_extended as json
+from cognite.client.utils._identifier import Identifier, IdentifierSequence
+from cognite.client.utils.useful_types import SequenceNotStr
 
 if TYPE_CHECKING:
     from cognite.client import AsyncCogniteClient, ClientConfig
@@ -369,6 +374,9 @@ class DocumentsAPI(APIClient):
                 >>> content = client.documents.retrieve_content(instance_id=instance_id)
         """
         ident = IdentifierSequence.load(ids=id, external_ids=external_id, instance_ids=instance_id).as_singleton()[0]
+        return await self._retrieve_content(ident)
+
+    async def _retrieve_content(self, ident: Identifier) -> bytes:
         response = await self._post(
             f"{self._RESOURCE_PATH}/content",
             headers={"accept": "text/plain"},
@@ -377,6 +385,155 @@ class DocumentsAPI(APIClient):
         )
         return response.content
 
+    async def retrieve_content_multiple(
+        self,
+        ids: Sequence[int] | None = None,
+        external_ids: SequenceNotStr[str] | None = None,
+        instance_ids: Sequence[NodeId] | None = None,
+        filter: Filter | dict[str, Any] | None = None,
+    ) -> AsyncIterator[tuple[int | str | NodeId, bytes]]:
+        """`Retrieve the content of many documents concurrently <https://api-docs.cognite.com/20230101/tag/Documents/operation/documentsContentPost>`_.
+
+        The documents are given either by identifiers or by a filter (in which case all matching documents are listed
+        first). The content is fetched with bounded parallelism (given by the general read concurrency setting) and
+        yielded as soon as it arrives, i.e. not necessarily in the order the documents were given.
+
+        Args:
+            ids (Sequence[int] | None): The server-generated IDs of the documents.
+            external_ids (SequenceNotStr[str] | None): External IDs of the documents.
+            instance_ids (Sequence[NodeId] | None): Instance IDs of the documents.
+            filter (Filter | dict[str, Any] | None): Retrieve the content of all documents matching this filter. Can not be combined with identifiers.
+
+        Yields:
+            tuple[int | str | NodeId, bytes]: Pairs of document identifier (as given, or the document ID when using a filter) and content.
+
+        Examples:
+
+            Retrieve the content of a few documents:
+
+                >>> from cognite.client import CogniteClient, AsyncCogniteClient
+                >>> client = CogniteClient()
+                >>> # async_client = AsyncCogniteClient()  # another option
+                >>> for doc_id, content in client.documents.retrieve_content_multiple(ids=[123, 456]):
+                ...     pass  # do something with the content
+
+            Retrieve the content of all PDF documents:
+
+                >>> from cognite.client.data_classes import filters
+                >>> from cognite.client.data_classes.documents import DocumentProperty
+                >>> is_pdf = filters.Equals(DocumentProperty.mime_type, "application/pdf")
+                >>> for doc_id, content in client.documents.retrieve_content_multiple(filter=is_pdf):
+                ...     pass  # do something with the content
+        """  # noqa: DOC404
+        contents = self._retrieve_content_multiple(ids, external_ids, instance_ids, filter)
+        async for ident, content in contents:
+            yield ident.as_primitive(), content
+
+    async def _retrieve_content_multiple(
+        self,
+        ids: Sequence[int] | None,
+        external_ids: SequenceNotStr[str] | None,
+        instance_ids: Sequence[NodeId] | None,
+        filter: Filter | dict[str, Any] | None,
+    ) -> AsyncIterator[tuple[Identifier, bytes]]:
+        from cognite.client import global_config
+
+        if filter is None:
+            identifiers: IdentifierSequence | None = IdentifierSequence.load(ids, external_ids, instance_ids)
+        elif ids is external_ids is instance_ids is None:
+            identifiers = None
+        else:
+            raise ValueError("Pass either identifiers or a filter, not both")
+
+        n_workers = global_config.concurrency_settings.general.read
+        # Both queues are bounded, so that neither the listing (when using a filter) nor the content
+        # fetching can run far ahead of the consumer, which strictly bounds memory usage:
+        pending: asyncio.Queue[Identifier | None] = asyncio.Queue(maxsize=2 * n_workers)
+        results: asyncio.Queue[tuple[Identifier, bytes] | None] = asyncio.Queue(maxsize=n_workers)
+
+        async def _enqueue_identifiers() -> None:
+            if identifiers is None:
+                async for documents in self(chunk_size=self._LIST_LIMIT, filter=filter):
+                    for doc in documents:
+                        await pending.put(Identifier(doc.id))
+            else:
+                for ident in identifiers._identifiers:
+                    await pending.put(ident)
+            for _ in range(n_workers):
+                await pending.put(None)
+
+        async def _fetch_content() -> None:
+            while (ident := await pending.get()) is not None:
+                content = await self._retrieve_content(ident)
+                await results.put((ident, content))
+
+        tasks = [asyncio.create_task(_enqueue_identifiers())]
+        tasks.extend(asyncio.create_task(_fetch_content()) for _ in range(n_workers))
+
+        async def _signal_when_done() -> None:
+            try:
+                await asyncio.gather(*tasks)
+            finally:
+                await results.put(None)
+
+        supervisor = asyncio.create_task(_signal_when_done())
+        try:
+            while (result := await results.get()) is not None:
+                yield result
+            supervisor.result()  # Raises if any of the tasks failed
+        finally:
+            for task in (*tasks, supervisor):
+                task.cancel()
+            await asyncio.gather(*tasks, supervisor, return_exceptions=True)
+
+    async def retrieve_content_to_jsonl(
+        self,
+        path: Path | str,
+        ids: Sequence[int] | None = None,
+        external_ids: SequenceNotStr[str] | None = None,
+        instance_ids: Sequence[NodeId] | None = None,
+        filter: Filter | dict[str, Any] | None = None,
+        compress: bool = True,
+    ) -> int:
+        """Retrieve the content of many documents concurrently and write it to a JSONL file.
+
+        Each line holds the document identifier and its content, e.g. ``{"id": 123, "content": "..."}``. See
+        `retrieve_content_multiple` for how the documents are selected and fetched.
+
+        Args:
+            path (Path | str): The file to write to. Any existing file is overwritten.
+            ids (Sequence[int] | None): The server-generated IDs of the documents.
+            external_ids (SequenceNotStr[str] | None): External IDs of the documents.
+            instance_ids (Sequence[NodeId] | None): Instance IDs of the documents.
+            filter (Filter | dict[str, Any] | None): Retrieve the content of all documents matching this filter. Can not be combined with identifiers.
+            compress (bool): Whether to gzip-compress the file.
+
+        Returns:
+            int: The number of documents written.
+
+        Examples:
+
+            Write the content of all documents in a data set to a compressed file:
+
+                >>> from cognite.client import CogniteClient, AsyncCogniteClient
+                >>> from cognite.client.data_classes import filters
+                >>> from cognite.client.data_classes.documents import SourceFileProperty
+                >>> client = CogniteClient()
+                >>> # async_client = AsyncCogniteClient()  # another option
+                >>> in_data_set = filters.Equals(SourceFileProperty.data_set_id, 123)
+                >>> n_written = client.documents.retrieve_content_to_jsonl(
+                ...     "documents.jsonl.gz", filter=in_data_set
+                ... )
+        """
+        contents = self._retrieve_content_multiple(ids, external_ids, instance_ids, filter)
+        n_written = 0
+        opener = gzip.open if compress else open
+        with opener(Path(path), "wt", encoding="utf-8") as fh:
+            async for ident, content in contents:
+                fh.write(json.dumps({**ident.as_dict(), "content": content.decode("utf-8", errors="replace")}) + "\n")
+                n_written += 1
+        return n_written
+
     async def retrieve_content_buffer(
         self,
         buffer: BinaryIO,
@@ -1,14 +1,19 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import copy
+import functools
+import logging
 import math
+import mmap
 import os
+import time
 import warnings
 from collections import defaultdict
-from collections.abc import AsyncIterator, Sequence
+from collections.abc import AsyncIterator, Callable, Sequence
 from pathlib import Path
-from typing import Any, BinaryIO, Literal, overload
+from typing import Any, BinaryIO, Literal, TextIO, overload
 from urllib.parse import urlparse
 
 from typing_extensions import assert_never
@@ -17,6 +22,7 @@ from cognite.client._api_client import APIClient
 from cognite.client._constants import (
     _RUNNING_IN_PYODIDE,
     DEFAULT_LIMIT_READ,
+    FILE_CHECKSUM_METADATA_KEY,
     FILE_DEFAULT_MULTIPART_SIZE,
     FILE_MAX_MULTIPART_COUNT,
     FILE_MAX_MULTIPART_SIZE,
@@ -39,16 +45,21 @@ from cognite.client.data_classes.data_modeling import NodeId
 from cognite.client.exceptions import (
     CogniteAPIError,
     CogniteAuthorizationError,
+    CogniteFileChecksumError,
     CogniteFileUploadError,
     CogniteHTTPStatusError,
 )
+from cognite.client.utils import _json_extended as json
 from cognite.client.utils._auxiliary import append_url_path, find_duplicates, unpack_items
+from cognite.client.utils._checksum import FileChecksum
 from cognite.client.utils._concurrency import AsyncSDKTask, execute_async_tasks
 from cognite.client.utils._identifier import Identifier, IdentifierSequence
-from cognite.client.utils._uploading import AsyncFileChunker, prepare_content_for_upload
+from cognite.client.utils._uploading import AsyncFileChunker, AsyncMemoryViewChunker, prepare_content_for_upload
 from cognite.client.utils._validation import process_asset_subtree_ids, process_data_set_ids
 from cognite.client.utils.useful_types import SequenceNotStr
 
+logger = logging.getLogger(__name__)
+
 
 class FilesAPI(APIClient):
     _RESOURCE_PATH = "/files"
@@ -562,6 +573,8 @@ class FilesAPI(APIClient):
         security_categories: Sequence[int] | None = None,
         recursive: bool = False,
         overwrite: bool = False,
+        checksum: bool = False,
+        skip_if_unchanged: bool = False,
     ) -> FileMetadata | FileMetadataList:
         """`Upload a file or directory <https://api-docs.cognite.com/20230101/tag/Files/operation/initMultiPartUpload>`_
 
@@ -589,6 +602,8 @@ class FilesAPI(APIClient):
             security_categories (Sequence[int] | None): Security categories to attach to this file.
             recursive (bool): If path is a directory, upload all contained files recursively.
             overwrite (bool): If 'overwrite' is set to true, and the POST body content specifies a 'externalId' field, fields for the file found for externalId can be overwritten. The default setting is false. If metadata is included in the request body, all of the original metadata will be overwritten. The actual file will be overwritten after successful upload. If there is no successful upload, the current file contents will be kept. File-Asset mappings only change if explicitly stated in the assetIds field of the POST json body. Do not set assetIds in request body if you want to keep the current file-asset mappings.
+            checksum (bool): Compute a checksum of the content while uploading it, and store it in the file metadata (under the key 'cognite-sdk:checksum'). It can then be used to verify downloads, see `download_to_path`.
+            skip_if_unchanged (bool): Before uploading, compare the checksum of the local content with the checksum stored on the existing file with the same external ID, and skip the upload if they match. Implies `checksum=True` and requires an external ID.
 
         Returns:
             FileMetadata | FileMetadataList: The file metadata of the uploaded file(s).
@@ -633,6 +648,13 @@ class FilesAPI(APIClient):
                 ...     my_file, geo_location=GeoLocation(type="Feature", geometry=geometry)
                 ... )
 
+            Avoid re-sending identical content, e.g. repeated exports of a large artifact. The checksum is stored in
+            the file metadata, so the content is only sent if it changed since the last upload:
+
+                >>> res = client.files.upload(
+                ...     my_file, external_id="my_export", skip_if_unchanged=True, overwrite=True
+                ... )
+
         """
         file_metadata = FileMetadataWrite(
             # If a file is provided, we set name below based on the file name
@@ -651,11 +673,14 @@ class FilesAPI(APIClient):
             security_categories=security_categories,
         )
 
+        if skip_if_unchanged and external_id is None:
+            raise ValueError("An external ID is required when using skip_if_unchanged")
+
         path = Path(path)
         if path.is_file():
             if not name:
                 file_metadata.name = path.name
-            return await self._upload_file_from_path(file_metadata, path, overwrite)
+            return await self._upload_file_from_path(file_metadata, path, overwrite, checksum, skip_if_unchanged)
 
         elif not path.is_dir():
             raise FileNotFoundError(path)
@@ -665,24 +690,58 @@ class FilesAPI(APIClient):
             if file.is_file():
                 file_metadata = copy.copy(file_metadata)
                 file_metadata.name = file.name
-                tasks.append(AsyncSDKTask(self._upload_file_from_path, file_metadata, file, overwrite))
+                tasks.append(
+                    AsyncSDKTask(
+                        self._upload_file_from_path, file_metadata, file, overwrite, checksum, skip_if_unchanged
+                    )
+                )
 
         tasks_summary = await execute_async_tasks(tasks)
         tasks_summary.raise_compound_exception_if_failed_tasks(task_unwrap_fn=lambda task: task[0].name)
         return FileMetadataList(tasks_summary.results)
 
     async def _upload_file_from_path(
-        self, file_metadata: FileMetadataWrite, path: Path, overwrite: bool
+        self,
+        file_metadata: FileMetadataWrite,
+        path: Path,
+        overwrite: bool,
+        checksum: bool = False,
+        skip_if_unchanged: bool = False,
     ) -> FileMetadata:
         file_size = self._get_file_size(path)
         part_size, num_parts = self.calculate_part_size_and_count(file_size)
+        file_checksum = FileChecksum(part_size, num_parts) if checksum else None
+        checksum_value = None
+        if skip_if_unchanged:
+            # We need the checksum before uploading, so here we can't compute it in the same pass. Hashing a large
+            # file takes a while, so we do it in a thread to not block other uploads:
+            checksum_value = (await asyncio.to_thread(FileChecksum.from_path, path, part_size)).value()
+            existing = await self.retrieve(external_id=file_metadata.external_id)
+            if existing is not None and existing.uploaded and self._get_checksum(existing) == checksum_value:
+                return existing
+            file_checksum = None  # already computed
+
         session = await self.multipart_upload_session(
             parts=num_parts,
             overwrite=overwrite,
             **file_metadata.dump(camel_case=False),
         )
-        await self._run_multipart_upload(session, path, part_size, file_size, num_parts)
-        return session.file_metadata
+        await self._run_multipart_upload(session, path, part_size, file_size, num_parts, file_checksum)
+        if file_checksum is not None:
+            checksum_value = file_checksum.value()
+        if checksum_value is None:
+            return session.file_metadata
+
+        # The checksum is only stored once the content is uploaded. Otherwise, a failed upload overwriting a file
+        # would leave the old content with the new checksum, and it would never be replaced:
+        update = FileMetadataUpdate(id=session.file_metadata.id).metadata.add(
+            {FILE_CHECKSUM_METADATA_KEY: checksum_value}
+        )
+        return await self.update(update)
+
+    @staticmethod
+    def _get_checksum(file_metadata: FileMetadata) -> str | None:
+        return (file_metadata.metadata or {}).get(FILE_CHECKSUM_METADATA_KEY)
 
     async def _run_multipart_upload(
         self,
@@ -691,7 +750,13 @@ class FilesAPI(APIClient):
         part_size: int,
         file_size: int,
         num_parts: int,
+        file_checksum: FileChecksum | None = None,
     ) -> None:
+        from cognite.client import global_config
+
+        if global_config.file_upload_memory_map and file_size > 0 and not _RUNNING_IN_PYODIDE:
+            return await self._run_memory_mapped_multipart_upload(session, path, part_size, num_parts, file_checksum)
+
         # Use a semaphore to limit the number of open files at the same time,
         # since each multipart upload will open the file for the duration of the upload,
         # and having too many open files can cause issues on some operating systems.
@@ -701,12 +766,42 @@ class FilesAPI(APIClient):
             async with open_files_semaphore:
                 offset = part_no * part_size
                 read_size = min(part_size, file_size - offset)
+                on_chunk = functools.partial(file_checksum.update_part, part_no) if file_checksum else None
                 with path.open("rb") as fh:
-                    await session.upload_part_async(part_no, AsyncFileChunker(fh, offset=offset, size=read_size))
+                    await session.upload_part_async(
+                        part_no, AsyncFileChunker(fh, offset=offset, size=read_size, on_chunk=on_chunk)
+                    )
 
         async with session:
             await asyncio.gather(*(upload_part(i) for i in range(num_parts)))
 
+    async def _run_memory_mapped_multipart_upload(
+        self,
+        session: FileMultipartUploadSession,
+        path: Path,
+        part_size: int,
+        num_parts: int,
+        file_checksum: FileChecksum | None = None,
+    ) -> None:
+        # The file is mapped once and shared by all parts, which just stream zero-copy slices of it. Thus, we
+        # only hold a single file handle (briefly), so the open files semaphore is not needed here:
+        with path.open("rb") as fh:
+            mapped = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+        async def upload_part(part_no: int) -> None:
+            offset = part_no * part_size
+            on_chunk = functools.partial(file_checksum.update_part, part_no) if file_checksum else None
+            with memoryview(mapped)[offset : offset + part_size] as part:
+                await session.upload_part_async(part_no, AsyncMemoryViewChunker(part, on_chunk=on_chunk))
+
+        try:
+            async with session:
+                await asyncio.gather(*(upload_part(i) for i in range(num_parts)))
+        finally:
+            # If chunks are still referenced (e.g. by a traceback), the mapping is closed once they are garbage collected:
+            with contextlib.suppress(BufferError):
+                mapped.close()
+
     @staticmethod
     def _get_file_size(path: Path) -> int:
         size = path.stat().st_size
@@ -898,6 +993,17 @@ class FilesAPI(APIClient):
             source_modified_time=source_modified_time,
             security_categories=security_categories,
         )
+        return await self._create_and_upload_bytes(file_metadata, content, overwrite)
+
+    async def _create_and_upload_bytes(
+        self,
+        file_metadata: FileMetadataWrite,
+        content: str | bytes | BinaryIO | AsyncIterator[bytes],
+        overwrite: bool,
+    ) -> FileMetadata:
+        return await self._upload_bytes(content, await self._create_file(file_metadata, overwrite))
+
+    async def _create_file(self, file_metadata: FileMetadataWrite, overwrite: bool) -> dict[str, Any]:
         try:
             res = await self._post(
                 url_path=self._RESOURCE_PATH,
@@ -907,7 +1013,7 @@ class FilesAPI(APIClient):
             )
         except CogniteAPIError as e:
             if e.code == 403 and "insufficient access rights" in e.message:
-                dsid_notice = " Try to provide a data_set_id." if data_set_id is None else ""
+                dsid_notice = " Try to provide a data_set_id." if file_metadata.data_set_id is None else ""
                 msg = f"Could not create a file due to insufficient access rights.{dsid_notice}"
                 raise CogniteAuthorizationError(
                     message=msg,
@@ -917,8 +1023,123 @@ class FilesAPI(APIClient):
                     project=self._config.project,
                 ) from e
             raise
+        return res.json()
+
+    async def upload_bytes_multiple(
+        self,
+        items: Sequence[tuple[FileMetadataWrite, str | bytes]],
+        overwrite: bool = False,
+        journal: Path | str | None = None,
+    ) -> FileMetadataList:
+        """Create and upload many (small) files concurrently.
 
-        return await self._upload_bytes(content, res.json())
+        Each file is created and its content uploaded as soon as its upload URL is returned, so metadata creation
+        and content transfer are pipelined across all files, bounded by the file upload concurrency settings. Failed
+        requests are retried according to the global retry settings.
+
+        Note:
+            The maximum size of each file is 5GiB. In order to upload larger files use `upload` or `multipart_upload_session`.
+
+        Tip:
+            Pass a `journal` to make large ingestion jobs resumable: every file created and every file uploaded is
+            appended to it. On the next call, files already uploaded are skipped, and files created but not uploaded
+            (e.g. because the content upload failed) are created again with overwrite. All files must have an external
+            ID when a journal is used.
+
+        Args:
+            items (Sequence[tuple[FileMetadataWrite, str | bytes]]): The files to create along with their content (str will be encoded using UTF-8).
+            overwrite (bool): If 'overwrite' is set to true, existing files with the same external ID will be overwritten. See `upload_bytes` for details.
+            journal (Path | str | None): Path to a JSON lines file used to record uploaded files, and to skip files already uploaded.
+
+        Returns:
+            FileMetadataList: The metadata of the uploaded files (not including files skipped because of the journal).
+
+        Examples:
+
+            Upload many files from memory:
+
+                >>> from cognite.client import CogniteClient, AsyncCogniteClient
+                >>> from cognite.client.data_classes import FileMetadataWrite
+                >>> client = CogniteClient()
+                >>> # async_client = AsyncCogniteClient()  # another option
+                >>> items = [
+                ...     (
+                ...         FileMetadataWrite(name=f"report_{i}.txt", external_id=f"report_{i}"),
+                ...         f"content {i}",
+                ...     )
+                ...     for i in range(1000)
+                ... ]
+                >>> res = client.files.upload_bytes_multiple(items)
+
+            Make the upload resumable by recording progress in a journal file; on a rerun, only files not yet
+            uploaded are sent:
+
+                >>> res = client.files.upload_bytes_multiple(items, journal="upload_journal.jsonl")
+        """
+        # The journal, and retries of the creation, identify files by external ID, so it must be unique:
+        if duplicates := sorted(find_duplicates(meta.external_id for meta, _ in items if meta.external_id is not None)):
+            raise ValueError(f"External IDs must be unique, got duplicates: {duplicates}")
+
+        uploaded_xids: set[str] = set()
+        created_xids: set[str] = set()
+        if journal is not None:
+            journal = Path(journal)
+            if missing_xid := [meta.name for meta, _ in items if meta.external_id is None]:
+                raise ValueError(f"All files must have an external ID when using a journal, missing for: {missing_xid}")
+            for entry in await asyncio.to_thread(self._read_upload_journal, journal):
+                # Journals written before files were recorded on creation only contain uploaded files:
+                is_uploaded = entry.get("status", "uploaded") == "uploaded"
+                (uploaded_xids if is_uploaded else created_xids).add(entry["externalId"])
+
+        remaining = [(meta, content) for meta, content in items if meta.external_id not in uploaded_xids]
+        total_bytes = sum(len(content) for _, content in remaining)  # str-length is a good enough estimate
+        journal_fh = await asyncio.to_thread(journal.open, "a", encoding="utf-8") if journal is not None else None
+        journal_lock = asyncio.Lock()
+
+        async def write_to_journal(file: dict[str, Any], status: Literal["created", "uploaded"]) -> None:
+            if journal_fh is None:
+                return
+            line = json.dumps({"externalId": file["externalId"], "id": file["id"], "status": status}) + "\n"
+            async with journal_lock:
+                await asyncio.to_thread(self._append_to_upload_journal, journal_fh, line)
+
+        async def upload_one(file_metadata: FileMetadataWrite, content: str | bytes) -> FileMetadata:
+            # A file created by a previous (failed) call would make the creation fail on the duplicate external ID:
+            created = await self._create_file(file_metadata, overwrite or file_metadata.external_id in created_xids)
+            await write_to_journal(created, "created")
+            uploaded = await self._upload_bytes(content, created)
+            await write_to_journal(created, "uploaded")
+            return uploaded
+
+        t0 = time.perf_counter()
+        try:
+            tasks = [AsyncSDKTask(upload_one, meta, content) for meta, content in remaining]
+            tasks_summary = await execute_async_tasks(tasks)
+        finally:
+            if journal_fh is not None:
+                await asyncio.to_thread(journal_fh.close)
+
+        elapsed = time.perf_counter() - t0
+        logger.info(
+            f"Uploaded {len(tasks_summary.results):,} of {len(remaining):,} files ({len(items) - len(remaining):,} "
+            f"skipped by journal) in {elapsed:.2f}s, {total_bytes / max(elapsed, 1e-9) / 1024**2:.2f} MiB/s"
+        )
+        tasks_summary.raise_compound_exception_if_failed_tasks(
+            task_unwrap_fn=lambda task: task[0].external_id or task[0].name
+        )
+        return FileMetadataList(tasks_summary.results)
+
+    @staticmethod
+    def _read_upload_journal(journal: Path) -> list[dict[str, Any]]:
+        if not journal.is_file():
+            return []
+        with journal.open("r", encoding="utf-8") as fh:
+            return [json.loads(line) for line in fh if line.strip()]
+
+    @staticmethod
+    def _append_to_upload_journal(journal_fh: TextIO, line: str) -> None:
+        journal_fh.write(line)
+        journal_fh.flush()
 
     async def multipart_upload_session(
         self,
@@ -1403,7 +1624,9 @@ class FilesAPI(APIClient):
         download_link = await self._get_download_link(identifier)
         await self._download_file_to_path(download_link, file_path)
 
-    async def _download_file_to_path(self, download_link: str, path: Path) -> None:
+    async def _download_file_to_path(
+        self, download_link: str, path: Path, on_chunk: Callable[[bytes], object] | None = None
+    ) -> None:
         from cognite.client import global_config
 
         stream = self._stream(
@@ -1417,6 +1640,8 @@ class FilesAPI(APIClient):
             async with stream as response:
                 async for chunk in response.aiter_bytes(chunk_size=global_config.file_download_chunk_size):
                     file.write(chunk)
+                    if on_chunk is not None:
+                        on_chunk(chunk)
 
     async def download_to_path(
         self,
@@ -1424,6 +1649,7 @@ class FilesAPI(APIClient):
         id: int | None = None,
         external_id: str | None = None,
         instance_id: NodeId | tuple[str, str] | None = None,
+        verify_checksum: bool = False,
     ) -> None:
         """Download a file to a specific target.
 
@@ -1432,6 +1658,7 @@ class FilesAPI(APIClient):
             id (int | None): Id of of the file to download.
             external_id (str | None): External id of the file to download.
             instance_id (NodeId | tuple[str, str] | None): Instance id of the file to download.
+            verify_checksum (bool): Compute the checksum of the content while downloading it, and verify it against the checksum stored on the file (see the `checksum` parameter of `upload`). On mismatch, the downloaded file is removed and a CogniteFileChecksumError is raised.
 
         Examples:
 
@@ -1443,14 +1670,38 @@ class FilesAPI(APIClient):
                 >>> client.files.download_to_path(
                 ...     "~/mydir/my_downloaded_file.txt", instance_id=NodeId("my-space", "my-file-xid")
                 ... )
+
+            Download a file and verify its integrity, using the checksum stored when it was uploaded:
+
+                >>> client.files.download_to_path(
+                ...     "~/mydir/my_downloaded_file.txt", external_id="my_export", verify_checksum=True
+                ... )
         """
         path = Path(path)
         if not path.parent.is_dir():
             raise NotADirectoryError(path.parent)
 
-        identifier = Identifier.of_either(id, external_id, instance_id).as_dict()
+        file_identifier = Identifier.of_either(id, external_id, instance_id)
+        identifier = file_identifier.as_dict()
+        if not verify_checksum:
+            download_link = await self._get_download_link(identifier)
+            return await self._download_file_to_path(download_link, path)
+
+        # Not a singleton sequence, so that CogniteNotFoundError is raised if the file is missing:
+        (file_metadata,) = await self._retrieve_multiple(
+            list_cls=FileMetadataList,
+            resource_cls=FileMetadata,
+            identifiers=IdentifierSequence([file_identifier], is_singleton=False),
+        )
+        if (expected := self._get_checksum(file_metadata)) is None:
+            raise ValueError(f"Unable to verify checksum, the file has no {FILE_CHECKSUM_METADATA_KEY!r} metadata")
+
+        file_checksum = FileChecksum.from_value(expected)
         download_link = await self._get_download_link(identifier)
-        await self._download_file_to_path(download_link, path)
+        await self._download_file_to_path(download_link, path, on_chunk=file_checksum.update)
+        if (actual := file_checksum.value()) != expected:
+            path.unlink()
+            raise CogniteFileChecksumError(f"Checksum mismatch for downloaded file {identifier}", expected, actual)
 
     async def download_bytes(
         self, id: int | None = None, external_id: str | None = None, instance_id: NodeId | tuple[str, str] | None = None
@@ -1,12 +1,11 @@
 from __future__ import annotations
 
-import asyncio
 import functools
 import gzip
 import logging
 import platform
 from collections.abc import AsyncIterator, MutableMapping
-from contextlib import asynccontextmanager
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Literal, NoReturn, cast
 
@@ -245,7 +244,7 @@ class BasicAsyncAPIClient:
         include_cdf_headers: bool = False,
         api_subversion: str | None = None,
         *,
-        semaphore: asyncio.BoundedSemaphore | None,
+        semaphore: AbstractAsyncContextManager[Any] | None,
     ) -> CogniteHTTPResponse:
         """
         Make a request to something that is outside Cognite Data Fusion, with retry enabled.
@@ -259,7 +258,7 @@ class BasicAsyncAPIClient:
             timeout (float | None): Override the default timeout for this request.
             include_cdf_headers (bool): Whether to include Cognite Data Fusion headers in the request. Defaults to False.
             api_subversion (str | None): When include_cdf_headers=True, override the API subversion to use for the request. Has no effect otherwise.
-            semaphore (asyncio.BoundedSemaphore | None): Semaphore to limit concurrent requests. Pass None for no limit.
+            semaphore (AbstractAsyncContextManager[Any] | None): Semaphore (or other async context manager) to limit concurrent requests. Pass None for no limit.
 
         Returns:
             CogniteHTTPResponse: The response from the server.
@@ -300,7 +299,7 @@ class BasicAsyncAPIClient:
         full_headers: dict[str, Any] | None = None,
         timeout: float | None = None,
         api_subversion: str | None = None,
-        semaphore: asyncio.BoundedSemaphore | None,
+        semaphore: AbstractAsyncContextManager[Any] | None,
     ) -> AsyncIterator[CogniteHTTPResponse]:
         assert url_path or full_url, "Either url_path or full_url must be provided"
         full_url = full_url or resolve_url(self, method, cast(str, url_path))[1]
@@ -332,7 +331,7 @@ class BasicAsyncAPIClient:
         follow_redirects: bool = False,
         api_subversion: str | None = None,
         *,
-        semaphore: asyncio.BoundedSemaphore | None,
+        semaphore: AbstractAsyncContextManager[Any] | None,
     ) -> CogniteHTTPResponse:
         _, full_url = resolve_url(self, "GET", url_path)
         full_headers = self._configure_headers(additional_headers=headers, api_subversion=api_subversion)
@@ -361,7 +360,7 @@ class BasicAsyncAPIClient:
         follow_redirects: bool = False,
         api_subversion: str | None = None,
         *,
-        semaphore: asyncio.BoundedSemaphore | None,
+        semaphore: AbstractAsyncContextManager[Any] | None,
     ) -> CogniteHTTPResponse:
         is_retryable, full_url = resolve_url(self, "POST", url_path)
         full_headers = self._configure_headers(additional_headers=headers, api_subversion=api_subversion)
@@ -397,7 +396,7 @@ class BasicAsyncAPIClient:
         api_subversion: str | None = None,
         timeout: float | None = None,
         *,
-        semaphore: asyncio.BoundedSemaphore | None,
+        semaphore: AbstractAsyncContextManager[Any] | None,
     ) -> CogniteHTTPResponse:
         _, full_url = resolve_url(self, "PUT", url_path)
 
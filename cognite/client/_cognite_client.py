@@ -3,36 +3,6 @@ from __future__ import annotations
 import os
 from typing import TYPE_CHECKING, Any
 
-from cognite.client._api.agents import AgentsAPI
-from cognite.client._api.ai import AIAPI
-from cognite.client._api.annotations import AnnotationsAPI
-from cognite.client._api.assets import AssetsAPI
-from cognite.client._api.data_modeling import DataModelingAPI
-from cognite.client._api.data_sets import DataSetsAPI
-from cognite.client._api.diagrams import DiagramsAPI
-from cognite.client._api.documents import DocumentsAPI
-from cognite.client._api.entity_matching import EntityMatchingAPI
-from cognite.client._api.events import EventsAPI
-from cognite.client._api.extractionpipelines import ExtractionPipelinesAPI
-from cognite.client._api.files import FilesAPI
-from cognite.client._api.functions import FunctionsAPI
-from cognite.client._api.geospatial import GeospatialAPI
-from cognite.client._api.hosted_extractors import HostedExtractorsAPI
-from cognite.client._api.iam import IAMAPI
-from cognite.client._api.labels import LabelsAPI
-from cognite.client._api.limits import LimitsAPI
-from cognite.client._api.metering import MeteringAPI
-from cognite.client._api.postgres_gateway import PostgresGatewaysAPI
-from cognite.client._api.raw import RawAPI
-from cognite.client._api.relationships import RelationshipsAPI
-from cognite.client._api.sequences import SequencesAPI
-from cognite.client._api.simulators import SimulatorsAPI
-from cognite.client._api.three_d import ThreeDAPI
-from cognite.client._api.time_series import TimeSeriesAPI
-from cognite.client._api.transformations import TransformationsAPI
-from cognite.client._api.units import UnitAPI
-from cognite.client._api.vision import VisionAPI
-from cognite.client._api.workflows import WorkflowAPI
 from cognite.client._api_client import APIClient
 from cognite.client.config import ClientConfig, global_config
 from cognite.client.credentials import (
@@ -42,13 +12,48 @@ from cognite.client.credentials import (
     OAuthInteractive,
 )
 from cognite.client.utils._auxiliary import load_resource_to_dict
+from cognite.client.utils._importing import LazyAPI
+
+_should_build_docs = os.getenv("BUILD_COGNITE_SDK_DOCS") == "true"
+
+if TYPE_CHECKING or _should_build_docs:
+    from cognite.client._api.agents import AgentsAPI
+    from cognite.client._api.ai import AIAPI
+    from cognite.client._api.annotations import AnnotationsAPI
+    from cognite.client._api.assets import AssetsAPI
+    from cognite.client._api.data_modeling import DataModelingAPI
+    from cognite.client._api.data_sets import DataSetsAPI
+    from cognite.client._api.diagrams import DiagramsAPI
+    from cognite.client._api.documents import DocumentsAPI
+    from cognite.client._api.entity_matching import EntityMatchingAPI
+    from cognite.client._api.events import EventsAPI
+    from cognite.client._api.extractionpipelines import ExtractionPipelinesAPI
+    from cognite.client._api.files import FilesAPI
+    from cognite.client._api.functions import FunctionsAPI
+    from cognite.client._api.geospatial import GeospatialAPI
+    from cognite.client._api.hosted_extractors import HostedExtractorsAPI
+    from cognite.client._api.iam import IAMAPI
+    from cognite.client._api.labels import LabelsAPI
+    from cognite.client._api.limits import LimitsAPI
+    from cognite.client._api.metering import MeteringAPI
+    from cognite.client._api.postgres_gateway import PostgresGatewaysAPI
+    from cognite.client._api.raw import RawAPI
+    from cognite.client._api.relationships import RelationshipsAPI
+    from cognite.client._api.sequences import SequencesAPI
+    from cognite.client._api.simulators import SimulatorsAPI
+    from cognite.client._api.three_d import ThreeDAPI
+    from cognite.client._api.time_series import TimeSeriesAPI
+    from cognite.client._api.transformations import TransformationsAPI
+    from cognite.client._api.units import UnitAPI
+    from cognite.client._api.vision import VisionAPI
+    from cognite.client._api.workflows import WorkflowAPI
 
 if TYPE_CHECKING:
     from cognite.client._sync_cognite_client import CogniteClient
     from cognite.client.response import CogniteHTTPResponse
 
 
-if _should_build_docs := os.getenv("BUILD_COGNITE_SDK_DOCS") == "true":
+if _should_build_docs:
     from cognite.client._api.ai.tools import AIToolsAPI
     from cognite.client._api.ai.tools.documents import AIDocumentsAPI
     from cognite.client._api.data_modeling.containers import ContainersAPI
@@ -133,6 +138,43 @@ class AsyncCogniteClient:
 
     _API_VERSION = "v1"
 
+    # APIs using base_url / resource path. These are imported and created on first access, as importing
+    # all of them (and their data classes) up front is slow:
+    agents: LazyAPI[AgentsAPI] = LazyAPI("cognite.client._api.agents.agents.AgentsAPI")
+    ai: LazyAPI[AIAPI] = LazyAPI("cognite.client._api.ai.AIAPI")
+    assets: LazyAPI[AssetsAPI] = LazyAPI("cognite.client._api.assets.AssetsAPI")
+    events: LazyAPI[EventsAPI] = LazyAPI("cognite.client._api.events.EventsAPI")
+    files: LazyAPI[FilesAPI] = LazyAPI("cognite.client._api.files.FilesAPI")
+    iam: LazyAPI[IAMAPI] = LazyAPI("cognite.client._api.iam.IAMAPI")
+    data_sets: LazyAPI[DataSetsAPI] = LazyAPI("cognite.client._api.data_sets.DataSetsAPI")
+    sequences: LazyAPI[SequencesAPI] = LazyAPI("cognite.client._api.sequences.SequencesAPI")
+    time_series: LazyAPI[TimeSeriesAPI] = LazyAPI("cognite.client._api.time_series.TimeSeriesAPI")
+    geospatial: LazyAPI[GeospatialAPI] = LazyAPI("cognite.client._api.geospatial.GeospatialAPI")
+    raw: LazyAPI[RawAPI] = LazyAPI("cognite.client._api.raw.RawAPI")
+    three_d: LazyAPI[ThreeDAPI] = LazyAPI("cognite.client._api.three_d.ThreeDAPI")
+    labels: LazyAPI[LabelsAPI] = LazyAPI("cognite.client._api.labels.LabelsAPI")
+    limits: LazyAPI[LimitsAPI] = LazyAPI("cognite.client._api.limits.LimitsAPI")
+    metering: LazyAPI[MeteringAPI] = LazyAPI("cognite.client._api.metering.MeteringAPI")
+    relationships: LazyAPI[RelationshipsAPI] = LazyAPI("cognite.client._api.relationships.RelationshipsAPI")
+    entity_matching: LazyAPI[EntityMatchingAPI] = LazyAPI("cognite.client._api.entity_matching.EntityMatchingAPI")
+    vision: LazyAPI[VisionAPI] = LazyAPI("cognite.client._api.vision.VisionAPI")
+    extraction_pipelines: LazyAPI[ExtractionPipelinesAPI] = LazyAPI(
+        "cognite.client._api.extractionpipelines.ExtractionPipelinesAPI"
+    )
+    hosted_extractors: LazyAPI[HostedExtractorsAPI] = LazyAPI(
+        "cognite.client._api.hosted_extractors.HostedExtractorsAPI"
+    )
+    postgres_gateway: LazyAPI[PostgresGatewaysAPI] = LazyAPI("cognite.client._api.postgres_gateway.PostgresGatewaysAPI")
+    transformations: LazyAPI[TransformationsAPI] = LazyAPI("cognite.client._api.transformations.TransformationsAPI")
+    diagrams: LazyAPI[DiagramsAPI] = LazyAPI("cognite.client._api.diagrams.DiagramsAPI")
+    annotations: LazyAPI[AnnotationsAPI] = LazyAPI("cognite.client._api.annotations.AnnotationsAPI")
+    functions: LazyAPI[FunctionsAPI] = LazyAPI("cognite.client._api.functions.FunctionsAPI")
+    data_modeling: LazyAPI[DataModelingAPI] = LazyAPI("cognite.client._api.data_modeling.DataModelingAPI")
+    documents: LazyAPI[DocumentsAPI] = LazyAPI("cognite.client._api.documents.DocumentsAPI")
+    workflows: LazyAPI[WorkflowAPI] = LazyAPI("cognite.client._api.workflows.WorkflowAPI")
+    units: LazyAPI[UnitAPI] = LazyAPI("cognite.client._api.units.UnitAPI")
+    simulators: LazyAPI[SimulatorsAPI] = LazyAPI("cognite.client._api.simulators.SimulatorsAPI")
+
     def __init__(self, config: ClientConfig | None = None) -> None:
         if (client_config := config or global_config.default_client_config) is None:
             raise ValueError(
@@ -142,42 +184,14 @@ class AsyncCogniteClient:
         else:
             self._config = client_config
 
-        # APIs using base_url / resource path:
-        self.agents = AgentsAPI(self._config, self._API_VERSION, self)
-        self.ai = AIAPI(self._config, self._API_VERSION, self)
-        self.assets = AssetsAPI(self._config, self._API_VERSION, self)
-        self.events = EventsAPI(self._config, self._API_VERSION, self)
-        self.files = FilesAPI(self._config, self._API_VERSION, self)
-        self.iam = IAMAPI(self._config, self._API_VERSION, self)
-        self.data_sets = DataSetsAPI(self._config, self._API_VERSION, self)
-        self.sequences = SequencesAPI(self._config, self._API_VERSION, self)
-        self.time_series = TimeSeriesAPI(self._config, self._API_VERSION, self)
-        self.geospatial = GeospatialAPI(self._config, self._API_VERSION, self)
-        self.raw = RawAPI(self._config, self._API_VERSION, self)
-        self.three_d = ThreeDAPI(self._config, self._API_VERSION, self)
-        self.labels = LabelsAPI(self._config, self._API_VERSION, self)
-        self.limits = LimitsAPI(self._config, self._API_VERSION, self)
-        self.metering = MeteringAPI(self._config, self._API_VERSION, self)
-        self.relationships = RelationshipsAPI(self._config, self._API_VERSION, self)
-        self.entity_matching = EntityMatchingAPI(self._config, self._API_VERSION, self)
-        self.vision = VisionAPI(self._config, self._API_VERSION, self)
-        self.extraction_pipelines = ExtractionPipelinesAPI(self._config, self._API_VERSION, self)
-        self.hosted_extractors = HostedExtractorsAPI(self._config, self._API_VERSION, self)
-        self.postgres_gateway = PostgresGatewaysAPI(self._config, self._API_VERSION, self)
-        self.transformations = TransformationsAPI(self._config, self._API_VERSION, self)
-        self.diagrams = DiagramsAPI(self._config, self._API_VERSION, self)
-        self.annotations = AnnotationsAPI(self._config, self._API_VERSION, self)
-        self.functions = FunctionsAPI(self._config, self._API_VERSION, self)
-        self.data_modeling = DataModelingAPI(self._config, self._API_VERSION, self)
-        self.documents = DocumentsAPI(self._config, self._API_VERSION, self)
-        self.workflows = WorkflowAPI(self._config, self._API_VERSION, self)
-        self.units = UnitAPI(self._config, self._API_VERSION, self)
-        self.simulators = SimulatorsAPI(self._config, self._API_VERSION, self)
         # APIs just using base_url:
         self._api_client = APIClient(self._config, api_version=None, cognite_client=self)
 
         self.__sync_client: CogniteClient | None = None
 
+    def _create_api(self, api_cls: type[APIClient]) -> APIClient:
+        return api_cls(self._config, self._API_VERSION, self)
+
     @property
     def api_client(self) -> APIClient:
         """Returns the underlying API client used for HTTP requests.
@@ -58,3 +58,4 @@ FILE_MIN_MULTIPART_SIZE = 5 * 1024 * 1024  # 5 MiB
 FILE_MAX_MULTIPART_SIZE = 4000 * 1024 * 1024  # 4000 MiB
 FILE_DEFAULT_MULTIPART_SIZE = 50 * 1024 * 1024  # 50 MiB
 FILE_MAX_MULTIPART_COUNT = 250
+FILE_CHECKSUM_METADATA_KEY = "cognite-sdk:checksum"  # see FileChecksum for how the checksum is computed
@@ -12,7 +12,7 @@ from collections.abc import (
     Mapping,
     MutableMapping,
 )
-from contextlib import asynccontextmanager, nullcontext
+from contextlib import AbstractAsyncContextManager, asynccontextmanager, nullcontext
 from http.cookiejar import Cookie, CookieJar
 from typing import Any, Literal, TypeAlias
 
@@ -208,7 +208,7 @@ class AsyncHTTPClientWithRetry:
         headers: MutableMapping[str, str] | None = None,
         follow_redirects: bool = False,
         timeout: float | None = None,
-        semaphore: asyncio.BoundedSemaphore | None,
+        semaphore: AbstractAsyncContextManager[Any] | None,
     ) -> CogniteHTTPResponse:
         def coro_factory() -> HTTPResponseCoro:
             return self.httpx_async_client.request(
@@ -235,7 +235,7 @@ class AsyncHTTPClientWithRetry:
         json: Any = None,
         headers: MutableMapping[str, str] | None = None,
         timeout: float | None = None,
-        semaphore: asyncio.BoundedSemaphore | None,
+        semaphore: AbstractAsyncContextManager[Any] | None,
     ) -> AsyncIterator[CogniteHTTPResponse]:
         # This method is basically a clone of httpx.AsyncClient.stream() so that we may add our own retry logic.
         def coro_factory() -> HTTPResponseCoro:
@@ -257,7 +257,7 @@ class AsyncHTTPClientWithRetry:
         *,
         url: str,
         headers: MutableMapping[str, str] | None,
-        semaphore: asyncio.BoundedSemaphore | None,
+        semaphore: AbstractAsyncContextManager[Any] | None,
     ) -> CogniteHTTPResponse:
         # When no semaphore is passed, we use nullcontext to skip concurrency limiting. These come from
         # custom top-level POST or GET calls directly on the (Async)Cogniteclient. All normal API calls
@@ -1,6 +1,6 @@
 """
 ===============================================================================
-a2a99ff24ede65b8cb87fb19cba0dde7
+d6182b89d21117868510335a6826531f
 This file is auto-generated from the Async API modules, - do not edit manually!
 ===============================================================================
 """
@@ -8,7 +8,7 @@ This file is auto-generated from the Async API modules, - do not edit manually!
 from __future__ import annotations
 
 import logging
-from collections.abc import Awaitable, Callable, Iterator, Sequence
+from collections.abc import Awaitable, Callable, Iterator, MutableMapping, Sequence
 from datetime import timedelta
 from typing import TYPE_CHECKING, Any, Literal, TypeAlias, overload
 
@@ -78,6 +78,7 @@ class SyncInstancesAPI(SyncAPIClient):
         sort: list[InstanceSort | dict] | InstanceSort | dict | None = None,
         filter: Filter | dict[str, Any] | None = None,
         debug: DebugParameters | None = None,
+        partitions: int | None = None,
     ) -> Iterator[Node]: ...
 
     @overload
@@ -92,6 +93,7 @@ class SyncInstancesAPI(SyncAPIClient):
         sort: list[InstanceSort | dict] | InstanceSort | dict | None = None,
         filter: Filter | dict[str, Any] | None = None,
         debug: DebugParameters | None = None,
+        partitions: int | None = None,
     ) -> Iterator[Edge]: ...
 
     @overload
@@ -106,6 +108,7 @@ class SyncInstancesAPI(SyncAPIClient):
         sort: list[InstanceSort | dict] | InstanceSort | dict | None = None,
         filter: Filter | dict[str, Any] | None = None,
         debug: DebugParameters | None = None,
+        partitions: int | None = None,
     ) -> Iterator[NodeList]: ...
 
     @overload
@@ -120,6 +123,7 @@ class SyncInstancesAPI(SyncAPIClient):
         sort: list[InstanceSort | dict] | InstanceSort | dict | None = None,
         filter: Filter | dict[str, Any] | None = None,
         debug: DebugParameters | None = None,
+        partitions: int | None = None,
     ) -> Iterator[EdgeList]: ...
 
     def __call__(
@@ -133,6 +137,7 @@ class SyncInstancesAPI(SyncAPIClient):
         sort: list[InstanceSort | dict] | InstanceSort | dict | None = None,
         filter: Filter | dict[str, Any] | None = None,
         debug: DebugParameters | None = None,
+        partitions: int | None = None,
     ) -> Iterator[Edge | EdgeList | Node | NodeList]:
         """
         Iterate over nodes or edges.
@@ -148,6 +153,7 @@ class SyncInstancesAPI(SyncAPIClient):
             sort (list[InstanceSort | dict] | InstanceSort | dict | None): Sort(s) to apply to the returned instances. For nontrivial amounts of data, you need to have a backing, cursorable index.
             filter (Filter | dict[str, Any] | None): Advanced filtering of instances.
             debug (DebugParameters | None): Debug settings for profiling and troubleshooting.
+            partitions (int | None): Split the listing into this many disjoint parts (per space when listing multiple spaces, else by external ID ranges), fetched concurrently and yielded in no particular order. The number of concurrent requests is bounded by ``global_config.concurrency_settings.data_modeling.read``. Can not be used with sort, include_typing or debug.
 
         Yields:
             Edge | EdgeList | Node | NodeList: yields Instance one by one if chunk_size is not specified, else NodeList/EdgeList objects.
@@ -163,6 +169,7 @@ class SyncInstancesAPI(SyncAPIClient):
                 sort=sort,
                 filter=filter,
                 debug=debug,
+                partitions=partitions,
             )
         )  # type: ignore [misc]
 
@@ -195,7 +202,7 @@ class SyncInstancesAPI(SyncAPIClient):
     def retrieve_edges(
         self,
         edges: EdgeId | Sequence[EdgeId] | tuple[str, str] | Sequence[tuple[str, str]],
-        edge_cls: type[T_Edge] = Edge,  # type: ignore [assignment]
+        edge_cls: type[T_Edge] = Edge,
         sources: Source | Sequence[Source] | None = None,
         include_typing: bool = False,
     ) -> EdgeList[T_Edge] | T_Edge | Edge | None:
@@ -273,7 +280,7 @@ class SyncInstancesAPI(SyncAPIClient):
         return run_sync(
             self.__async_client.data_modeling.instances.retrieve_edges(
                 edges=edges, edge_cls=edge_cls, sources=sources, include_typing=include_typing
-            )  # type: ignore [call-overload]
+            )
         )
 
     @overload
@@ -305,7 +312,7 @@ class SyncInstancesAPI(SyncAPIClient):
     def retrieve_nodes(
         self,
         nodes: NodeId | Sequence[NodeId] | tuple[str, str] | Sequence[tuple[str, str]],
-        node_cls: type[T_Node] = Node,  # type: ignore [assignment]
+        node_cls: type[T_Node] = Node,
         sources: Source | Sequence[Source] | None = None,
         include_typing: bool = False,
     ) -> NodeList[T_Node] | T_Node | Node | None:
@@ -380,7 +387,7 @@ class SyncInstancesAPI(SyncAPIClient):
         return run_sync(
             self.__async_client.data_modeling.instances.retrieve_nodes(
                 nodes=nodes, node_cls=node_cls, sources=sources, include_typing=include_typing
-            )  # type: ignore [call-overload]
+            )
         )
 
     def retrieve(
@@ -608,6 +615,7 @@ class SyncInstancesAPI(SyncAPIClient):
         auto_create_direct_relations: bool = True,
         skip_on_version_conflict: bool = False,
         replace: bool = False,
+        skip_unchanged: bool | MutableMapping[str, str] = False,
     ) -> InstancesApplyResult:
         """
         `Add or update (upsert) instances <https://api-docs.cognite.com/20230101/tag/Instances/operation/applyNodeAndEdges>`_.
@@ -620,6 +628,7 @@ class SyncInstancesAPI(SyncAPIClient):
             auto_create_direct_relations (bool): Whether to create missing direct relation targets when ingesting.
             skip_on_version_conflict (bool): If existingVersion is specified on any of the nodes/edges in the input, the default behaviour is that the entire ingestion will fail when version conflicts occur. If skipOnVersionConflict is set to true, items with version conflicts will be skipped instead. If no version is specified for nodes/edges, it will do the writing directly.
             replace (bool): How do we behave when a property value exists? Do we replace all matching and existing values with the supplied values (true)? Or should we merge in new values for properties together with the existing values (false)? Note: This setting applies for all nodes or edges specified in the ingestion call.
+            skip_unchanged (bool | MutableMapping[str, str]): Only send the nodes and edges that would change something. If True, the instances are first retrieved (using the views in their sources) and compared. If given a mapping (e.g. a dict, or a ``shelve`` for persistence between runs), it is used as a store of content hashes of previously applied instances, which is compared against (and updated). The hash store assumes nothing else modifies the instances. Skipped instances are reported in the result.
 
         Returns:
             InstancesApplyResult: Created instance(s)
@@ -732,6 +741,72 @@ class SyncInstancesAPI(SyncAPIClient):
                 auto_create_direct_relations=auto_create_direct_relations,
                 skip_on_version_conflict=skip_on_version_conflict,
                 replace=replace,
+                skip_unchanged=skip_unchanged,
+            )
+        )
+
+    def apply_graph(
+        self,
+        nodes: Sequence[NodeApply] = (),
+        edges: Sequence[EdgeApply] = (),
+        auto_create_direct_relations: bool = True,
+        skip_on_version_conflict: bool = False,
+        replace: bool = False,
+    ) -> InstancesApplyResult:
+        """
+        Add or update (upsert) a large graph of nodes and edges, written in dependency order.
+
+        Nodes are written before the edges starting or ending in them, and before the instances referring to them
+        through direct relations (or as node type). Each batch is sent as soon as everything it depends on has been
+        written, using the full write concurrency, so large graphs can be loaded without auto-creating start- and end
+        nodes. Dependencies on nodes not part of the input are assumed to exist.
+
+        Note:
+            Nodes referring to each other in a cycle can not be ordered; these are written last, with
+            ``auto_create_direct_relations=True``.
+
+        Args:
+            nodes (Sequence[NodeApply]): Nodes to apply.
+            edges (Sequence[EdgeApply]): Edges to apply.
+            auto_create_direct_relations (bool): Whether to create missing direct relation targets when ingesting.
+            skip_on_version_conflict (bool): If existingVersion is specified on any of the nodes/edges in the input, the default behaviour is that the entire ingestion will fail when version conflicts occur. If skipOnVersionConflict is set to true, items with version conflicts will be skipped instead.
+            replace (bool): Whether to replace all matching and existing values with the supplied values (true), or merge in new values for properties together with the existing values (false).
+
+        Returns:
+            InstancesApplyResult: The applied instances.
+
+        Raises:
+            CogniteAPIError: If any batch failed. The error lists the ``successful``, ``failed`` and ``unknown``
+                instances, as well as those ``skipped`` because something they depend on failed.
+
+        Examples:
+
+            Load a graph of pumps and the pipes connecting them:
+
+                >>> from cognite.client import CogniteClient
+                >>> from cognite.client.data_classes.data_modeling import EdgeApply, NodeApply
+                >>> client = CogniteClient()
+                >>> # async_client = AsyncCogniteClient()  # another option
+                >>> pumps = [NodeApply("my-space", f"pump-{i}") for i in range(10_000)]
+                >>> pipes = [
+                ...     EdgeApply(
+                ...         "my-space",
+                ...         f"pipe-{i}",
+                ...         type=("my-space", "pipe"),
+                ...         start_node=("my-space", f"pump-{i}"),
+                ...         end_node=("my-space", f"pump-{i + 1}"),
+                ...     )
+                ...     for i in range(9_999)
+                ... ]
+                >>> res = client.data_modeling.instances.apply_graph(pumps, pipes)
+        """
+        return run_sync(
+            self.__async_client.data_modeling.instances.apply_graph(
+                nodes=nodes,
+                edges=edges,
+                auto_create_direct_relations=auto_create_direct_relations,
+                skip_on_version_conflict=skip_on_version_conflict,
+                replace=replace,
             )
         )
 
@@ -1172,6 +1247,61 @@ class SyncInstancesAPI(SyncAPIClient):
             self.__async_client.data_modeling.instances.query(query=query, include_typing=include_typing, debug=debug)
         )
 
+    def iterate_query(self, query: Query, include_typing: bool = False) -> Iterator[QueryResult]:
+        """
+        `Iterate over all results of a query, following the cursors of every result set <https://api-docs.cognite.com/20230101/tag/Instances/operation/queryContent>`_.
+
+        A single call to ``query`` returns one page per result set. This method keeps fetching, following the
+        cursor of each selected result set until all are exhausted. When a result set is paged, the result sets
+        depending on it (through ``from_`` or set operations) are fetched again for the new page. Requests that do
+        not depend on each other are issued concurrently, and each response is yielded as soon as it arrives, so
+        memory usage stays bounded regardless of the total size of the result.
+
+        Note:
+            A result set may be part of several yielded results, e.g. the instances of a dependent result set are
+            returned once per page of the result set it depends on. Each yielded result only contains the result sets
+            that were (re-)fetched in that request.
+
+        Args:
+            query (Query): Query.
+            include_typing (bool): Should we return property type information as part of the result?
+
+        Yields:
+            QueryResult: The resulting nodes and/or edges, one page at a time.
+
+        Examples:
+
+            Iterate over all pumps and the work orders connected to them:
+
+                >>> from cognite.client import CogniteClient
+                >>> from cognite.client.data_classes.data_modeling.query import (
+                ...     Query,
+                ...     Select,
+                ...     NodeResultSetExpression,
+                ...     EdgeResultSetExpression,
+                ...     SourceSelector,
+                ... )
+                >>> from cognite.client.data_classes.data_modeling.ids import ViewId
+                >>> client = CogniteClient()
+                >>> # async_client = AsyncCogniteClient()  # another option
+                >>> pump_view = ViewId("mySpace", "myPump", "v1")
+                >>> query = Query(
+                ...     with_={
+                ...         "pumps": NodeResultSetExpression(limit=1000),
+                ...         "work_orders": EdgeResultSetExpression(from_="pumps", limit=1000),
+                ...     },
+                ...     select={
+                ...         "pumps": Select([SourceSelector(pump_view, properties=["*"])]),
+                ...         "work_orders": Select(),
+                ...     },
+                ... )
+                >>> for result in client.data_modeling.instances.iterate_query(query):
+                ...     pumps = result.get("pumps", [])
+        """  # noqa: DOC404
+        yield from SyncIterator(
+            self.__async_client.data_modeling.instances.iterate_query(query=query, include_typing=include_typing)
+        )  # type: ignore [misc]
+
     def sync(self, query: QuerySync, include_typing: bool = False, debug: DebugParameters | None = None) -> QueryResult:
         """
         `Subscription to changes for nodes/edges <https://api-docs.cognite.com/20230101/tag/Instances/operation/syncContent>`_.
@@ -1283,6 +1413,7 @@ class SyncInstancesAPI(SyncAPIClient):
         security_category: int,
         backup_every: timedelta | None = timedelta(minutes=15),
         backup_on_exit: bool = False,
+        compact_every: int = 10,
     ) -> SyncSessionWithCache:
         """
         Create a managed sync session with persistent backup to a CDF file.
@@ -1321,6 +1452,9 @@ class SyncInstancesAPI(SyncAPIClient):
             backup_every (timedelta | None): How often to upload state to CDF during a
                 session (when active). ``None`` uploads only on context-manager exit.
             backup_on_exit (bool): Whether to upload state to CDF on context-manager exit.
+            compact_every (int): After the first full backup, only the instances changed since the previous backup
+                are uploaded, as separate delta files. After this many deltas, a new full backup is written
+                (and the deltas deleted).
 
         Raises:
             ValueError: If ``query`` already has cursors set (cursors are managed internally).
@@ -1328,6 +1462,7 @@ class SyncInstancesAPI(SyncAPIClient):
                 explicit ``limit`` set.
             ValueError: If the given ``security_category`` does not exist in this project.
             ValueError: If ``backup_every`` is set to a value smaller than 1 minute.
+            ValueError: If ``compact_every`` is negative.
 
         Returns:
             SyncSessionWithCache: The context manager for managing the sync session.
@@ -1386,6 +1521,7 @@ class SyncInstancesAPI(SyncAPIClient):
                 security_category=security_category,
                 backup_every=backup_every,
                 backup_on_exit=backup_on_exit,
+                compact_every=compact_every,
             )
         )
 
@@ -1400,6 +1536,7 @@ class SyncInstancesAPI(SyncAPIClient):
         sort: Sequence[InstanceSort | dict] | InstanceSort | dict | None = None,
         filter: Filter | dict[str, Any] | None = None,
         debug: DebugParameters | None = None,
+        partitions: int | None = None,
     ) -> NodeList[Node]: ...
 
     @overload
@@ -1413,6 +1550,7 @@ class SyncInstancesAPI(SyncAPIClient):
         sort: Sequence[InstanceSort | dict] | InstanceSort | dict | None = None,
         filter: Filter | dict[str, Any] | None = None,
         debug: DebugParameters | None = None,
+        partitions: int | None = None,
     ) -> EdgeList[Edge]: ...
 
     @overload
@@ -1425,6 +1563,7 @@ class SyncInstancesAPI(SyncAPIClient):
         sort: Sequence[InstanceSort | dict] | InstanceSort | dict | None = None,
         filter: Filter | dict[str, Any] | None = None,
         debug: DebugParameters | None = None,
+        partitions: int | None = None,
     ) -> NodeList[T_Node]: ...
 
     @overload
@@ -1437,6 +1576,7 @@ class SyncInstancesAPI(SyncAPIClient):
         sort: Sequence[InstanceSort | dict] | InstanceSort | dict | None = None,
         filter: Filter | dict[str, Any] | None = None,
         debug: DebugParameters | None = None,
+        partitions: int | None = None,
     ) -> EdgeList[T_Edge]: ...
 
     def list(
@@ -1449,6 +1589,7 @@ class SyncInstancesAPI(SyncAPIClient):
         sort: Sequence[InstanceSort | dict] | InstanceSort | dict | None = None,
         filter: Filter | dict[str, Any] | None = None,
         debug: DebugParameters | None = None,
+        partitions: int | None = None,
     ) -> NodeList[T_Node] | EdgeList[T_Edge]:
         """
         `List instances <https://api-docs.cognite.com/20230101/tag/Instances/operation/advancedListInstance>`_.
@@ -1462,6 +1603,7 @@ class SyncInstancesAPI(SyncAPIClient):
             sort (Sequence[InstanceSort | dict] | InstanceSort | dict | None): How you want the listed instances information ordered.
             filter (Filter | dict[str, Any] | None): Advanced filtering of instances.
             debug (DebugParameters | None): Debug settings for profiling and troubleshooting.
+            partitions (int | None): Retrieve instances in parallel by splitting the listing into this many disjoint parts (per space when listing multiple spaces, else by external ID ranges). The number of concurrent requests is bounded by ``global_config.concurrency_settings.data_modeling.read``, and limit must be set to `None` (or `-1`). Can not be used with sort, include_typing or debug.
 
         Returns:
             NodeList[T_Node] | EdgeList[T_Edge]: List of requested instances
@@ -1507,6 +1649,13 @@ class SyncInstancesAPI(SyncAPIClient):
                 >>> my_view = ViewId("mySpace", "myView", "v1")
                 >>> instance_list = client.data_modeling.instances.list(sources=my_view)
 
+            List all nodes with data in a view, fetching disjoint parts of the data concurrently:
+
+                >>> from cognite.client.data_classes.filters import HasData
+                >>> instance_list = client.data_modeling.instances.list(
+                ...     filter=HasData(views=[my_view]), sources=my_view, limit=None, partitions=10
+                ... )
+
             Convert instances to pandas DataFrame with expanded properties (``expand_properties=True``).
             This will add the properties directly as dataframe columns. Specifying ``camel_case=True``
             will convert the basic columns to camel case (e.g. externalId), but leave the property names as-is.
@@ -1530,7 +1679,7 @@ class SyncInstancesAPI(SyncAPIClient):
         """
         return run_sync(
             self.__async_client.data_modeling.instances.list(
-                instance_type=instance_type,  # type: ignore [arg-type]
+                instance_type=instance_type,
                 include_typing=include_typing,
                 sources=sources,
                 space=space,
@@ -1538,5 +1687,6 @@ class SyncInstancesAPI(SyncAPIClient):
                 sort=sort,
                 filter=filter,
                 debug=debug,
-            )  # type: ignore [misc]
+                partitions=partitions,
+            )
         )
@@ -1,6 +1,6 @@
 """
 ===============================================================================
-e50d855222acc9a875059316cd3d6fce
+9094fea7f7b635647811d7189a396838
 This file is auto-generated from the Async API modules, - do not edit manually!
 ===============================================================================
 """
@@ -11,6 +11,7 @@ from collections.abc import Iterator, Mapping, Sequence
 from typing import TYPE_CHECKING, Any, Literal, overload
 
 from cognite.client import AsyncCogniteClient
+from cognite.client._api.data_modeling.records_io import RecordsWriter
 from cognite.client._sync_api_client import SyncAPIClient
 from cognite.client.data_classes.data_modeling.aggregates import Aggregate
 from cognite.client.data_classes.data_modeling.instances import InstanceSort
@@ -18,11 +19,13 @@ from cognite.client.data_classes.data_modeling.records import (
     RecordId,
     RecordList,
     RecordsAggregation,
+    RecordsCursorStore,
     RecordSourceSelector,
     RecordTargetUnit,
     RecordTargetUnits,
     RecordWrite,
     SyncRecordList,
+    SyncRecordPartitionList,
     TimeRange,
 )
 from cognite.client.data_classes.filters import Filter
@@ -164,6 +167,60 @@ class SyncRecordsAPI(SyncAPIClient):
             self.__async_client.data_modeling.records.upsert(items=items, stream_id=stream_id, upsert_mode=upsert_mode)
         )
 
+    def create_writer(
+        self, *, upsert: bool = False, max_buffer_age: float = 5.0, max_buffered_records: int = 100000
+    ) -> RecordsWriter:
+        """
+        Create a buffered writer for streaming records into one or more streams.
+
+        The writer accepts records (from any number of producers) and writes them per stream in requests as
+        full as possible, sending requests in parallel as allowed by the ``records.write`` concurrency setting.
+        A stream is written as soon as it holds a full request worth of records, all streams are written when the
+        oldest buffered record is older than ``max_buffer_age`` seconds, and when the writer is closed. A request
+        that is too large, or rejected because of specific items, is split and retried, so that only the records
+        causing the failure fail. Use ``writer.stats`` to monitor throughput.
+
+        Args:
+            upsert (bool): Upsert the records (mutable streams only) rather than ingest them.
+            max_buffer_age (float): The max number of seconds a record is buffered before it is written.
+            max_buffered_records (int): When this many records are buffered or being written, adding more waits for them to be written.
+
+        Returns:
+            RecordsWriter: The writer, to be used as a (async) context manager, or closed explicitly with ``close``.
+
+        Examples:
+
+            Write records as they arrive, using the writer as a context manager to make sure that everything
+            is written before exiting:
+
+                >>> from cognite.client import CogniteClient
+                >>> from cognite.client.data_classes.data_modeling.records import (
+                ...     RecordWrite,
+                ...     RecordContainerId,
+                ...     RecordSource,
+                ... )
+                >>> client = CogniteClient()
+                >>> container = RecordContainerId(space="my-space", external_id="my-container")
+                >>> with client.data_modeling.records.create_writer(max_buffer_age=1) as writer:
+                ...     for i, temperature in enumerate([22.5, 23.0]):
+                ...         record = RecordWrite(
+                ...             space="my-space",
+                ...             external_id=f"rec-{i}",
+                ...             sources=[
+                ...                 RecordSource(
+                ...                     source=container, properties={"temperature": temperature}
+                ...                 )
+                ...             ],
+                ...         )
+                ...         writer.add(record, stream_id="my-stream")
+                >>> writer.stats.records_per_second  # doctest: +SKIP
+        """
+        return run_sync(
+            self.__async_client.data_modeling.records.create_writer(
+                upsert=upsert, max_buffer_age=max_buffer_age, max_buffered_records=max_buffered_records
+            )
+        )
+
     def aggregate(
         self,
         aggregates: Mapping[str, Aggregate | dict[str, Any]],
@@ -457,7 +514,7 @@ class SyncRecordsAPI(SyncAPIClient):
                 >>> second_chunk = next(feed)
         """  # noqa: DOC404
         yield from SyncIterator(
-            self.__async_client.data_modeling.records.sync(  # type: ignore [call-overload, misc]
+            self.__async_client.data_modeling.records.sync(
                 stream_id=stream_id,
                 initialize_cursor=initialize_cursor,
                 cursor=cursor,
@@ -467,4 +524,98 @@ class SyncRecordsAPI(SyncAPIClient):
                 chunk_size=chunk_size,
                 include_typing=include_typing,
             )
-        )
+        )  # type: ignore [misc]
+
+    def sync_partitions(
+        self,
+        stream_id: str,
+        partitions: Sequence[Filter] | None = None,
+        *,
+        initialize_cursor: str | None = None,
+        cursor_store: RecordsCursorStore | None = None,
+        filter: Filter | None = None,
+        sources: Sequence[RecordSourceSelector] | None = None,
+        target_units: RecordTargetUnits | Sequence[RecordTargetUnit] | None = None,
+        chunk_size: int = 1000,
+        include_typing: bool = False,
+        max_buffered_chunks: int = 10,
+    ) -> Iterator[SyncRecordPartitionList]:
+        """
+        `Sync records from a stream, split into partitions read concurrently <https://api-docs.cognite.com/20230101/tag/Records/operation/syncRecords>`_.
+
+        Each partition is a filter with its own change feed and cursor, read in the background, and the chunks are yielded
+        in the order they arrive (in order within each partition). Reading continues while you process a chunk, so the next
+        chunk is usually ready when you ask for it. At most ``max_buffered_chunks`` chunks are kept in memory; when the buffer
+        is full, reading pauses until you catch up. The iteration ends when all partitions have caught up (``has_next`` is False).
+
+        When a ``cursor_store`` is given, each partition starts from its stored cursor (if any, otherwise from ``initialize_cursor``),
+        and the cursor of a chunk is stored once you ask for the next chunk, i.e. after you have processed it, and before the next
+        chunk is handed to you. Thus, if the iteration is interrupted, it resumes with the first chunk not processed, and chunks
+        read ahead but not yet handed to you are never marked as processed. This includes stopping early (e.g. with ``break``):
+        the cursor of the last chunk you received is not stored, and you receive it again on the next run. An exception raised
+        while processing a chunk stops the iteration the same way, so storing the cursor then would mark a chunk that failed as
+        processed. To skip the last chunk on the next run, store its cursor yourself before you stop.
+
+        In short, delivery is at-least-once: after a restart, a chunk may be received again (the last chunk received before
+        stopping), but a chunk is never skipped. Make the processing of a chunk idempotent, e.g. by upserting on record ID.
+
+        Note:
+            The partitions should not overlap, as a record matching several partitions is yielded once for each of them.
+            Each partition counts towards the concurrency limit for records reads. To read all partitions at the same time,
+            the limit must be at least the number of partitions.
+
+        Args:
+            stream_id (str): External ID of the stream to sync.
+            partitions (Sequence[Filter] | None): One filter per partition. Defaults to None, meaning a single partition with
+                the entire stream (i.e. ``sync`` with prefetching and cursor storage).
+            initialize_cursor (str | None): Where to start partitions without a stored cursor, as a relative duration like ``"7d-ago"``.
+            cursor_store (RecordsCursorStore | None): Where to load and store the cursor for each partition. Defaults to None
+                (cursors are not stored).
+            filter (Filter | None): Filter expression applied to all partitions.
+            sources (Sequence[RecordSourceSelector] | None): Which container properties to return.
+            target_units (RecordTargetUnits | Sequence[RecordTargetUnit] | None): Properties to convert
+                to another unit.
+            chunk_size (int): Number of records per yielded chunk, between 1 and 1000. Defaults to 1000.
+            include_typing (bool): If True, include property type information on each yielded
+                list's ``typing`` attribute.
+            max_buffered_chunks (int): The maximum number of chunks read ahead, across all partitions. Default: 10.
+
+        Yields:
+            SyncRecordPartitionList: One chunk of change records, along with the partition it was read from.
+
+        Examples:
+
+            Sync a stream in two concurrent partitions, storing cursors in a local file so that a restart resumes
+            where it left off:
+
+                >>> from cognite.client import CogniteClient
+                >>> from cognite.client.data_classes import filters
+                >>> from cognite.client.data_classes.data_modeling.records import FileRecordsCursorStore
+                >>> client = CogniteClient()
+                >>> site = ["my-space", "my-container", "site"]
+                >>> for chunk in client.data_modeling.records.sync_partitions(
+                ...     stream_id="my-stream",
+                ...     partitions=[
+                ...         filters.Equals(site, "oslo"),
+                ...         filters.Not(filters.Equals(site, "oslo")),
+                ...     ],
+                ...     initialize_cursor="7d-ago",
+                ...     cursor_store=FileRecordsCursorStore("cursors.json"),
+                ... ):
+                ...     for record in chunk:
+                ...         pass  # process record; record.status is created/updated/deleted
+        """  # noqa: DOC404
+        yield from SyncIterator(
+            self.__async_client.data_modeling.records.sync_partitions(
+                stream_id=stream_id,
+                partitions=partitions,
+                initialize_cursor=initialize_cursor,
+                cursor_store=cursor_store,
+                filter=filter,
+                sources=sources,
+                target_units=target_units,
+                chunk_size=chunk_size,
+                include_typing=include_typing,
+                max_buffered_chunks=max_buffered_chunks,
+            )
+        )  # type: ignore [misc]
@@ -1,6 +1,6 @@
 """
 ===============================================================================
-e44ab8939fc1ef1d3f138a9cd48ba592
+aa46b4db6ae2895904a3438dec6a9052
 This file is auto-generated from the Async API modules, - do not edit manually!
 ===============================================================================
 """
@@ -9,12 +9,15 @@ from __future__ import annotations
 
 import datetime
 from collections.abc import Iterator, Sequence
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal, TypeVar, overload
 from zoneinfo import ZoneInfo
 
 from cognite.client import AsyncCogniteClient
-from cognite.client._api.datapoint_tasks import (
-    BaseDpsFetchSubtask,
+from cognite.client._api.datapoint_tasks import BaseDpsFetchSubtask
+from cognite.client._api.datapoints_io import (
+    DatapointsWriter,
+    LatestDatapointsService,
 )
 from cognite.client._constants import DEFAULT_DATAPOINTS_CHUNK_SIZE
 from cognite.client._sync_api.synthetic_time_series import SyncSyntheticDatapointsAPI
@@ -36,6 +39,9 @@ from cognite.client.utils.useful_types import SequenceNotStr
 
 if TYPE_CHECKING:
     import pandas as pd
+    import pyarrow as pa
+
+    from cognite.client import AsyncCogniteClient
 
 PoolSubtaskType = tuple[float, int, BaseDpsFetchSubtask]
 _T = TypeVar("_T")
@@ -177,12 +183,72 @@ class SyncDatapointsAPI(SyncAPIClient):
                 ...     )
         """  # noqa: DOC404
         yield from SyncIterator(
-            self.__async_client.time_series.data(  # type: ignore [call-overload]
+            self.__async_client.time_series.data(
                 queries=queries,
                 chunk_size_datapoints=chunk_size_datapoints,
                 chunk_size_time_series=chunk_size_time_series,
                 return_arrays=return_arrays,
             )
+        )  # type: ignore [misc]
+
+    def retrieve_to_files(
+        self,
+        queries: DatapointsQuery | Sequence[DatapointsQuery],
+        directory: str | Path,
+        *,
+        file_format: Literal["parquet", "npy"] = "parquet",
+        chunk_size_datapoints: int = DEFAULT_DATAPOINTS_CHUNK_SIZE,
+        chunk_size_time_series: int | None = None,
+    ) -> dict[str, Any]:
+        """
+        Retrieve datapoints for one or more time series and write them directly to files, chunk by chunk.
+
+        Each time series gets its own subdirectory, where each chunk of datapoints is written as a separate part, either
+        as a Parquet file, or as a directory with one ``.npy`` file per column (which can be memory mapped when read). The parts,
+        along with their number of datapoints and first/last timestamp, are listed in a manifest, ``manifest.json``, written to
+        the root of the directory. If the export fails, the manifest lists the parts written so far and has ``"complete": false``.
+
+        Note:
+            Memory usage is bounded just like when iterating datapoints, see :py:meth:`~DatapointsAPI.__call__`, as every chunk
+            is written to disk before the next is fetched. Use ``chunk_size_time_series`` to control how many time series to fetch
+            at the same time. Each time series can only be exported once. Duplicated identifiers are rejected up front, but a time
+            series queried by different identifier types (e.g. both id and external_id) is only detected once its datapoints are
+            fetched, which fails the export.
+
+        Args:
+            queries (DatapointsQuery | Sequence[DatapointsQuery]): Query, or queries, using id, external_id or instance_id for the time series to fetch data for, with individual settings specified. The options 'limit' and 'include_outside_points' are not supported.
+            directory (str | Path): The directory to write to. Created if it does not exist, but must not already contain an export.
+            file_format (Literal['parquet', 'npy']): The file format of each part. Parquet requires pyarrow, and is the only option supporting string time series and the aggregates 'min_datapoint' and 'max_datapoint'. Default: "parquet".
+            chunk_size_datapoints (int): The max number of datapoints per part (per individual time series). Must evenly divide 100k OR be an integer multiple of 100k. Default: 100_000.
+            chunk_size_time_series (int | None): The max number of time series to fetch at the same time. Default: None (all given queries are fetched at the same time).
+
+        Returns:
+            dict[str, Any]: The manifest of the files written.
+
+        Examples:
+
+            Export all raw datapoints for a list of time series, in parts of at most one million datapoints, fetching ten at a time:
+
+                >>> from cognite.client import CogniteClient
+                >>> from cognite.client.data_classes import DatapointsQuery
+                >>> client = CogniteClient()
+                >>> # async_client = AsyncCogniteClient()  # another option
+                >>> queries = [
+                ...     DatapointsQuery(external_id=xid, start="10y-ago")
+                ...     for xid in ["foo", "bar", "baz"]
+                ... ]
+                >>> manifest = client.time_series.data.retrieve_to_files(
+                ...     queries, "my-export/", chunk_size_datapoints=1_000_000, chunk_size_time_series=10
+                ... )
+        """
+        return run_sync(
+            self.__async_client.time_series.data.retrieve_to_files(
+                queries=queries,
+                directory=directory,
+                file_format=file_format,
+                chunk_size_datapoints=chunk_size_datapoints,
+                chunk_size_time_series=chunk_size_time_series,
+            )
         )
 
     @overload
@@ -862,7 +928,7 @@ class SyncDatapointsAPI(SyncAPIClient):
                 >>> series = pd.Series(dps.value, index=dps.timestamp)
         """
         return run_sync(
-            self.__async_client.time_series.data.retrieve_arrays(  # type: ignore [misc, call-overload]
+            self.__async_client.time_series.data.retrieve_arrays(
                 id=id,
                 external_id=external_id,
                 instance_id=instance_id,
@@ -1026,6 +1092,105 @@ class SyncDatapointsAPI(SyncAPIClient):
             )
         )
 
+    def retrieve_arrow(
+        self,
+        *,
+        id: int | DatapointsQuery | Sequence[int | DatapointsQuery] | None = None,
+        external_id: str | DatapointsQuery | SequenceNotStr[str | DatapointsQuery] | None = None,
+        instance_id: NodeId | DatapointsQuery | Sequence[NodeId | DatapointsQuery] | None = None,
+        start: int | str | datetime.datetime | None = None,
+        end: int | str | datetime.datetime | None = None,
+        aggregates: Aggregate | str | list[Aggregate | str] | None = None,
+        granularity: str | None = None,
+        timezone: str | datetime.timezone | ZoneInfo | None = None,
+        target_unit: str | None = None,
+        target_unit_system: str | None = None,
+        limit: int | None = None,
+        include_outside_points: bool = False,
+        ignore_unknown_ids: bool = False,
+        ignore_bad_datapoints: bool = True,
+        treat_uncertain_as_bad: bool = True,
+        include_status: bool = False,
+        layout: Literal["long", "wide"] = "long",
+        include_aggregate_name: bool = True,
+        include_granularity_name: bool = False,
+    ) -> pa.Table:
+        """
+        Get datapoints directly in a pyarrow Table.
+
+        Arrow tables can be handed over to e.g. pandas, polars or DuckDB without copying the numeric data. String datapoints
+        are stored as Arrow strings rather than Python objects, and missing values (for bad datapoints) become nulls instead of NaN.
+
+        Note:
+            For many more usage examples, check out the :py:meth:`~DatapointsAPI.retrieve` method which accepts exactly the same arguments.
+
+        Args:
+            id (int | DatapointsQuery | Sequence[int | DatapointsQuery] | None): Id, DatapointsQuery or (mixed) sequence of these. See examples.
+            external_id (str | DatapointsQuery | SequenceNotStr[str | DatapointsQuery] | None): External id, DatapointsQuery or (mixed) sequence of these. See examples.
+            instance_id (NodeId | DatapointsQuery | Sequence[NodeId | DatapointsQuery] | None): Instance id, DatapointsQuery or (mixed) sequence of these. See examples.
+            start (int | str | datetime.datetime | None): Inclusive start. Default: 1970-01-01 UTC.
+            end (int | str | datetime.datetime | None): Exclusive end. Default: "now"
+            aggregates (Aggregate | str | list[Aggregate | str] | None): Single aggregate or list of aggregates to retrieve. Available options: ``average``, ``continuous_variance``, ``count``, ``count_bad``, ``count_good``, ``count_uncertain``, ``discrete_variance``, ``duration_bad``, ``duration_good``, ``duration_uncertain``, ``interpolation``, ``max``, ``max_datapoint``, ``min``, ``min_datapoint``, ``step_interpolation``, ``sum`` and ``total_variation``. Default: None (raw datapoints returned)
+            granularity (str | None): The granularity to fetch aggregates at. Can be given as an abbreviation or spelled out for clarity: ``s/second(s)``, ``m/minute(s)``, ``h/hour(s)``, ``d/day(s)``, ``w/week(s)``, ``mo/month(s)``, ``q/quarter(s)``, or ``y/year(s)``. Examples: ``30s``, ``5m``, ``1day``, ``2weeks``. Default: None.
+            timezone (str | datetime.timezone | ZoneInfo | None): For raw datapoints, which timezone to use when displaying (will not affect what is retrieved). For aggregates, which timezone to align to for granularity 'hour' and longer. Align to the start of the hour, -day or -month. For timezones of type Region/Location, like 'Europe/Oslo', pass a string or ``ZoneInfo`` instance. The aggregate duration will then vary, typically due to daylight saving time. You can also use a fixed offset from UTC by passing a string like '+04:00', 'UTC-7' or 'UTC-02:30' or an instance of ``datetime.timezone``. Note: Historical timezones with second offset are not supported, and timezones with minute offsets (e.g. UTC+05:30 or Asia/Kolkata) may take longer to execute.
+            target_unit (str | None): The unit_external_id of the datapoints returned. If the time series does not have a unit_external_id that can be converted to the target_unit, an error will be returned. Cannot be used with target_unit_system.
+            target_unit_system (str | None): The unit system of the datapoints returned. Cannot be used with target_unit.
+            limit (int | None): Maximum number of datapoints to return for each time series. Default: None (no limit)
+            include_outside_points (bool): Whether to include outside points. Not allowed when fetching aggregates. Default: False
+            ignore_unknown_ids (bool): Whether to ignore missing time series rather than raising an exception. Default: False
+            ignore_bad_datapoints (bool): Treat datapoints with a bad status code as if they do not exist. If set to false, raw queries will include bad datapoints in the response, and aggregates will in general omit the time period between a bad datapoint and the next good datapoint. Also, the period between a bad datapoint and the previous good datapoint will be considered constant. Default: True.
+            treat_uncertain_as_bad (bool): Treat datapoints with uncertain status codes as bad. If false, treat datapoints with uncertain status codes as good. Used for both raw queries and aggregates. Default: True.
+            include_status (bool): Also return the status code, an integer, and the status symbol for each datapoint in the response. Only relevant for raw datapoint queries, and the object aggregates ``min_datapoint`` and ``max_datapoint``.
+            layout (Literal['long', 'wide']): With "long", the time series are stacked and told apart by the columns 'id', 'external_id' and 'instance_id'. With "wide", each time series gets its own column(s) on the union of all timestamps (nulls fill the gaps). Default: "long"
+            include_aggregate_name (bool): Include aggregate in the column names, if present. Only used with layout="wide".
+            include_granularity_name (bool): Include granularity in the column names, if present. Only used with layout="wide".
+
+        Returns:
+            pa.Table: A pyarrow Table containing the requested time series.
+
+        Examples:
+
+            Get raw datapoints for two time series from the last week, stacked in a single table, and hand them over to polars:
+
+                >>> from cognite.client import CogniteClient, AsyncCogniteClient
+                >>> client = CogniteClient()
+                >>> # async_client = AsyncCogniteClient()  # another option
+                >>> table = client.time_series.data.retrieve_arrow(
+                ...     external_id=["foo", "bar"], start="1w-ago"
+                ... )
+                >>> # import polars as pl
+                >>> # df = pl.from_arrow(table)
+
+            Get the hourly average for two time series side by side (one column each):
+
+                >>> table = client.time_series.data.retrieve_arrow(
+                ...     id=[123, 456], aggregates="average", granularity="1h", layout="wide"
+                ... )
+        """
+        return run_sync(
+            self.__async_client.time_series.data.retrieve_arrow(
+                id=id,
+                external_id=external_id,
+                instance_id=instance_id,
+                start=start,
+                end=end,
+                aggregates=aggregates,
+                granularity=granularity,
+                timezone=timezone,
+                target_unit=target_unit,
+                target_unit_system=target_unit_system,
+                limit=limit,
+                include_outside_points=include_outside_points,
+                ignore_unknown_ids=ignore_unknown_ids,
+                ignore_bad_datapoints=ignore_bad_datapoints,
+                treat_uncertain_as_bad=treat_uncertain_as_bad,
+                include_status=include_status,
+                layout=layout,
+                include_aggregate_name=include_aggregate_name,
+                include_granularity_name=include_granularity_name,
+            )
+        )
+
     @overload
     def retrieve_latest(
         self,
@@ -1321,6 +1486,65 @@ class SyncDatapointsAPI(SyncAPIClient):
             )
         )
 
+    def create_latest_service(
+        self,
+        ttl: float = 1.0,
+        subscription_external_id: str | None = None,
+        target_unit: str | None = None,
+        target_unit_system: str | None = None,
+        include_status: bool = False,
+        ignore_bad_datapoints: bool = True,
+        treat_uncertain_as_bad: bool = True,
+    ) -> LatestDatapointsService:
+        """
+        Create a service for serving the latest datapoint of time series to many concurrent readers, like live dashboards.
+
+        Concurrent requests are combined into as few API requests as possible, and the result for each time series is
+        cached for ``ttl`` seconds, so that the load on the API does not grow with the number of readers. Optionally,
+        a datapoint subscription can be used to keep the results for time series in the subscription up to date.
+
+        Args:
+            ttl (float): Number of seconds a fetched result is served from the cache.
+            subscription_external_id (str | None): External ID of a datapoint subscription used to keep results up to date. Results for time series in the subscription do not expire. Cannot be used with a target unit (system).
+            target_unit (str | None): The unit_external_id of the datapoints returned. Cannot be used with target_unit_system or a subscription.
+            target_unit_system (str | None): The unit system of the datapoints returned. Cannot be used with target_unit or a subscription.
+            include_status (bool): Also return the status code, an integer, for each datapoint in the response.
+            ignore_bad_datapoints (bool): Prevent datapoints with a bad status code to be returned. Default: True.
+            treat_uncertain_as_bad (bool): Treat uncertain status codes as bad. If false, treat uncertain as good. Default: True.
+
+        Returns:
+            LatestDatapointsService: The service, to be shared by all readers and closed when no longer needed.
+
+        Examples:
+
+            Serve the latest datapoints to many readers, fetching each time series at most every 5 seconds:
+
+                >>> from cognite.client import CogniteClient
+                >>> client = CogniteClient()
+                >>> # async_client = AsyncCogniteClient()  # another option
+                >>> with client.time_series.data.create_latest_service(ttl=5) as service:
+                ...     res = service.retrieve(external_id=["foo", "bar"])
+
+            Keep the results up to date using a datapoint subscription:
+
+                >>> service = client.time_series.data.create_latest_service(
+                ...     ttl=60, subscription_external_id="my-subscription"
+                ... )
+                >>> res = service.retrieve(external_id="foo")
+                >>> service.close()
+        """
+        return run_sync(
+            self.__async_client.time_series.data.create_latest_service(
+                ttl=ttl,
+                subscription_external_id=subscription_external_id,
+                target_unit=target_unit,
+                target_unit_system=target_unit_system,
+                include_status=include_status,
+                ignore_bad_datapoints=ignore_bad_datapoints,
+                treat_uncertain_as_bad=treat_uncertain_as_bad,
+            )
+        )
+
     def insert(
         self,
         datapoints: Datapoints
@@ -1525,6 +1749,40 @@ class SyncDatapointsAPI(SyncAPIClient):
         """
         return run_sync(self.__async_client.time_series.data.insert_multiple(datapoints=datapoints))
 
+    def create_writer(self, max_buffer_age: float = 5.0, max_buffered_datapoints: int = 1000000) -> DatapointsWriter:
+        """
+        Create a buffered writer for streaming datapoints into many time series.
+
+        The writer accepts datapoints for one time series at a time (from any number of producers), and inserts
+        them together in as few and as full requests as possible. The buffer is flushed when it holds a full request
+        worth of datapoints or time series, when the oldest buffered datapoint is older than ``max_buffer_age`` seconds,
+        and when the writer is closed.
+
+        Args:
+            max_buffer_age (float): The max number of seconds a datapoint is buffered before it is inserted.
+            max_buffered_datapoints (int): When the buffer holds this many datapoints, adding more waits for the buffer to be inserted.
+
+        Returns:
+            DatapointsWriter: The writer, to be used as a (async) context manager, or closed explicitly with ``close``.
+
+        Examples:
+
+            Insert datapoints as they arrive, using the writer as a context manager to make sure that everything
+            is inserted before exiting:
+
+                >>> from cognite.client import CogniteClient
+                >>> client = CogniteClient()
+                >>> # async_client = AsyncCogniteClient()  # another option
+                >>> with client.time_series.data.create_writer(max_buffer_age=1) as writer:
+                ...     for ts, value in [(1700000000000, 1.0), (1700000001000, 2.0)]:
+                ...         writer.add([(ts, value)], external_id="foo")
+        """
+        return run_sync(
+            self.__async_client.time_series.data.create_writer(
+                max_buffer_age=max_buffer_age, max_buffered_datapoints=max_buffered_datapoints
+            )
+        )
+
     def delete_range(
         self,
         start: int | str | datetime.datetime,
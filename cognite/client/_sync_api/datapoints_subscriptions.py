@@ -1,13 +1,13 @@
 """
 ===============================================================================
-175dd6dcb2b25e5980d8828619fc7db6
+ad5a00ea63a89dbdb2e44a6e6fc6ef05
 This file is auto-generated from the Async API modules, - do not edit manually!
 ===============================================================================
 """
 
 from __future__ import annotations
 
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
 from typing import TYPE_CHECKING, Literal, overload
 
 from cognite.client import AsyncCogniteClient
@@ -17,8 +17,10 @@ from cognite.client.data_classes.datapoints_subscriptions import (
     DatapointSubscription,
     DatapointSubscriptionBatch,
     DatapointSubscriptionList,
+    DatapointSubscriptionPartitionBatch,
     DataPointSubscriptionUpdate,
     DataPointSubscriptionWrite,
+    SubscriptionCursorStore,
     TimeSeriesIDList,
 )
 from cognite.client.utils._async_helpers import SyncIterator, run_sync
@@ -309,7 +311,85 @@ class SyncDatapointsSubscriptionAPI(SyncAPIClient):
                 ignore_bad_datapoints=ignore_bad_datapoints,
                 treat_uncertain_as_bad=treat_uncertain_as_bad,
             )
-        )
+        )  # type: ignore [misc]
+
+    def iterate_data_partitions(
+        self,
+        external_id: str,
+        partitions: Sequence[int] | None = None,
+        start: str | None = None,
+        limit: int = DEFAULT_LIMIT_READ,
+        poll_timeout: int = 5,
+        include_status: bool = False,
+        ignore_bad_datapoints: bool = True,
+        treat_uncertain_as_bad: bool = True,
+        cursor_store: SubscriptionCursorStore | None = None,
+        max_buffered_batches: int = 10,
+    ) -> Iterator[DatapointSubscriptionPartitionBatch]:
+        """
+        `Iterate over data from all (or several) partitions of a subscription concurrently <https://api-docs.cognite.com/20230101/tag/Data-point-subscriptions/operation/listSubscriptionData>`_.
+
+        Each partition is read in the background with its own cursor, and the batches are yielded in the order they arrive.
+        At most ``max_buffered_batches`` batches are kept in memory; when the buffer is full, reading pauses until you catch up.
+
+        When a ``cursor_store`` is given, each partition starts from its stored cursor (if any, otherwise from ``start``),
+        and the cursor of a batch is stored once you ask for the next batch, i.e. after you have processed it. Thus,
+        if the iteration is interrupted, it resumes with the first batch not processed. This includes stopping early
+        (e.g. with ``break``): the cursor of the last batch you received is not stored, and you receive it again on the
+        next run. An exception raised while processing a batch stops the iteration the same way, so storing the cursor
+        then would mark a batch that failed as processed. To skip the last batch on the next run, store its cursor
+        yourself before you stop.
+
+        Note:
+            Each partition uses a long-polling request, which counts towards the concurrency limit for datapoints reads.
+            To read all partitions at the same time, the limit must be at least the number of partitions.
+
+        Args:
+            external_id (str): The external ID of the subscription.
+            partitions (Sequence[int] | None): The partitions to iterate over. Defaults to None, meaning all partitions of the subscription.
+            start (str | None): When to start the iteration for partitions without a stored cursor. If set to None, the iteration will start from the beginning. The format is "N[timeunit]-ago", where timeunit is w,d,h,m (week, day, hour, minute). You can also set it to "now" to jump straight to the end. Defaults to None.
+            limit (int): Approximate number of results to return per request (per partition).
+            poll_timeout (int): How many seconds to wait for new data, until an empty response is sent. Defaults to 5.
+            include_status (bool): Also return the status code, an integer, for each datapoint in the response.
+            ignore_bad_datapoints (bool): Do not return bad datapoints. Default: True.
+            treat_uncertain_as_bad (bool): Treat datapoints with uncertain status codes as bad. If false, treat datapoints with uncertain status codes as good. Default: True.
+            cursor_store (SubscriptionCursorStore | None): Where to load and store the cursor for each partition. Defaults to None (cursors are not stored).
+            max_buffered_batches (int): The maximum number of batches read ahead, across all partitions. Default: 10.
+
+        Yields:
+            DatapointSubscriptionPartitionBatch: Changes to the subscription and data in the subscribed time series, along with the partition they were read from.
+
+        Examples:
+
+            Iterate over all partitions continuously, storing cursors in a local file so that a restart resumes where it left off:
+
+                >>> from cognite.client import CogniteClient, AsyncCogniteClient
+                >>> from cognite.client.data_classes.datapoints_subscriptions import (
+                ...     FileSubscriptionCursorStore,
+                ... )
+                >>> client = CogniteClient()
+                >>> # async_client = AsyncCogniteClient()  # another option
+                >>> store = FileSubscriptionCursorStore("cursors.json")
+                >>> for batch in client.time_series.subscriptions.iterate_data_partitions(
+                ...     "my_subscription", cursor_store=store
+                ... ):
+                ...     for update in batch.updates:
+                ...         pass  # do something with update.upserts and update.deletes
+        """  # noqa: DOC404
+        yield from SyncIterator(
+            self.__async_client.time_series.subscriptions.iterate_data_partitions(
+                external_id=external_id,
+                partitions=partitions,
+                start=start,
+                limit=limit,
+                poll_timeout=poll_timeout,
+                include_status=include_status,
+                ignore_bad_datapoints=ignore_bad_datapoints,
+                treat_uncertain_as_bad=treat_uncertain_as_bad,
+                cursor_store=cursor_store,
+                max_buffered_batches=max_buffered_batches,
+            )
+        )  # type: ignore [misc]
 
     def list(self, limit: int | None = DEFAULT_LIMIT_READ) -> DatapointSubscriptionList:
         """
@@ -1,14 +1,15 @@
 """
 ===============================================================================
-352e817508279c7999d9a45f31e16cf8
+99cb02c4a85510894fb87b18c707f6c7
 This file is auto-generated from the Async API modules, - do not edit manually!
 ===============================================================================
 """
 
 from __future__ import annotations
 
+from collections.abc import Callable, Mapping, Sequence
 from pathlib import Path
-from typing import IO
+from typing import IO, Any
 
 from cognite.client import AsyncCogniteClient
 from cognite.client._sync_api_client import SyncAPIClient
@@ -81,6 +82,50 @@ class SyncDocumentPreviewAPI(SyncAPIClient):
             )
         )
 
+    def download_pages_as_png(
+        self,
+        pages: Mapping[int, Sequence[int]],
+        directory: Path | str | None = None,
+        callback: Callable[[int, int, bytes], Any] | None = None,
+        overwrite: bool = False,
+    ) -> None:
+        """
+        `Downloads image previews for many pages of many documents concurrently <https://api-docs.cognite.com/20230101/tag/Document-preview/operation/documentsPreviewImagePage>`_.
+
+        Pages are rendered and downloaded concurrently (bounded by the read concurrency settings), and each image is
+        handed off as soon as it arrives; either written to the given directory or passed to the callback, so that
+        only the images currently in flight are kept in memory.
+
+        Args:
+            pages (Mapping[int, Sequence[int]]): Mapping from the ID of each document to the page numbers to preview (starting at 1 for first page).
+            directory (Path | str | None): Directory to save the png previews in. The file names will be '[id]_page[page_number].png'.
+            callback (Callable[[int, int, bytes], Any] | None): Called with the document ID, page number and png bytes of each page preview, as they arrive.
+            overwrite (bool): Whether to overwrite existing files in the directory. Defaults to False.
+
+        Examples:
+
+            Download image previews of the first three pages of two documents to folder "previews":
+
+                >>> from cognite.client import CogniteClient, AsyncCogniteClient
+                >>> client = CogniteClient()
+                >>> # async_client = AsyncCogniteClient()  # another option
+                >>> client.documents.previews.download_pages_as_png(
+                ...     {123: [1, 2, 3], 456: [1, 2, 3]}, directory="previews"
+                ... )
+
+            Build a thumbnail index in memory by passing a callback instead:
+
+                >>> thumbnails = {}
+                >>> def store(doc_id, page_number, png):
+                ...     thumbnails[doc_id, page_number] = png
+                >>> client.documents.previews.download_pages_as_png({123: [1], 456: [1]}, callback=store)
+        """
+        return run_sync(
+            self.__async_client.documents.previews.download_pages_as_png(
+                pages=pages, directory=directory, callback=callback, overwrite=overwrite
+            )
+        )
+
     def download_document_as_pdf_bytes(self, id: int) -> bytes:
         """
         `Downloads a pdf preview of the specified document <https://api-docs.cognite.com/20230101/tag/Document-preview/operation/documentsPreviewPdf>`_.
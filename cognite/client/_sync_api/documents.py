@@ -1,13 +1,14 @@
 """
 ===============================================================================
-cd41b0877c343fa505b6b809f823dd6f
+4f7442c9a3ab232e46720d1c55b77bcb
 This file is auto-generated from the Async API modules, - do not edit manually!
 ===============================================================================
 """
 
 from __future__ import annotations
 
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, BinaryIO, Literal, overload
 
 from cognite.client import AsyncCogniteClient
@@ -27,6 +28,7 @@ from cognite.client.data_classes.documents import (
 )
 from cognite.client.data_classes.filters import Filter
 from cognite.client.utils._async_helpers import SyncIterator, run_sync
+from cognite.client.utils.useful_types import SequenceNotStr
 
 if TYPE_CHECKING:
     from cognite.client import AsyncCogniteClient
@@ -349,6 +351,104 @@ class SyncDocumentsAPI(SyncAPIClient):
             self.__async_client.documents.retrieve_content(id=id, external_id=external_id, instance_id=instance_id)
         )
 
+    def retrieve_content_multiple(
+        self,
+        ids: Sequence[int] | None = None,
+        external_ids: SequenceNotStr[str] | None = None,
+        instance_ids: Sequence[NodeId] | None = None,
+        filter: Filter | dict[str, Any] | None = None,
+    ) -> Iterator[tuple[int | str | NodeId, bytes]]:
+        """
+        `Retrieve the content of many documents concurrently <https://api-docs.cognite.com/20230101/tag/Documents/operation/documentsContentPost>`_.
+
+        The documents are given either by identifiers or by a filter (in which case all matching documents are listed
+        first). The content is fetched with bounded parallelism (given by the general read concurrency setting) and
+        yielded as soon as it arrives, i.e. not necessarily in the order the documents were given.
+
+        Args:
+            ids (Sequence[int] | None): The server-generated IDs of the documents.
+            external_ids (SequenceNotStr[str] | None): External IDs of the documents.
+            instance_ids (Sequence[NodeId] | None): Instance IDs of the documents.
+            filter (Filter | dict[str, Any] | None): Retrieve the content of all documents matching this filter. Can not be combined with identifiers.
+
+        Yields:
+            tuple[int | str | NodeId, bytes]: Pairs of document identifier (as given, or the document ID when using a filter) and content.
+
+        Examples:
+
+            Retrieve the content of a few documents:
+
+                >>> from cognite.client import CogniteClient, AsyncCogniteClient
+                >>> client = CogniteClient()
+                >>> # async_client = AsyncCogniteClient()  # another option
+                >>> for doc_id, content in client.documents.retrieve_content_multiple(ids=[123, 456]):
+                ...     pass  # do something with the content
+
+            Retrieve the content of all PDF documents:
+
+                >>> from cognite.client.data_classes import filters
+                >>> from cognite.client.data_classes.documents import DocumentProperty
+                >>> is_pdf = filters.Equals(DocumentProperty.mime_type, "application/pdf")
+                >>> for doc_id, content in client.documents.retrieve_content_multiple(filter=is_pdf):
+                ...     pass  # do something with the content
+        """  # noqa: DOC404
+        yield from SyncIterator(
+            self.__async_client.documents.retrieve_content_multiple(
+                ids=ids, external_ids=external_ids, instance_ids=instance_ids, filter=filter
+            )
+        )
+
+    def retrieve_content_to_jsonl(
+        self,
+        path: Path | str,
+        ids: Sequence[int] | None = None,
+        external_ids: SequenceNotStr[str] | None = None,
+        instance_ids: Sequence[NodeId] | None = None,
+        filter: Filter | dict[str, Any] | None = None,
+        compress: bool = True,
+    ) -> int:
+        """
+        Retrieve the content of many documents concurrently and write it to a JSONL file.
+
+        Each line holds the document identifier and its content, e.g. ``{"id": 123, "content": "..."}``. See
+        `retrieve_content_multiple` for how the documents are selected and fetched.
+
+        Args:
+            path (Path | str): The file to write to. Any existing file is overwritten.
+            ids (Sequence[int] | None): The server-generated IDs of the documents.
+            external_ids (SequenceNotStr[str] | None): External IDs of the documents.
+            instance_ids (Sequence[NodeId] | None): Instance IDs of the documents.
+            filter (Filter | dict[str, Any] | None): Retrieve the content of all documents matching this filter. Can not be combined with identifiers.
+            compress (bool): Whether to gzip-compress the file.
+
+        Returns:
+            int: The number of documents written.
+
+        Examples:
+
+            Write the content of all documents in a data set to a compressed file:
+
+                >>> from cognite.client import CogniteClient, AsyncCogniteClient
+                >>> from cognite.client.data_classes import filters
+                >>> from cognite.client.data_classes.documents import SourceFileProperty
+                >>> client = CogniteClient()
+                >>> # async_client = AsyncCogniteClient()  # another option
+                >>> in_data_set = filters.Equals(SourceFileProperty.data_set_id, 123)
+                >>> n_written = client.documents.retrieve_content_to_jsonl(
+                ...     "documents.jsonl.gz", filter=in_data_set
+                ... )
+        """
+        return run_sync(
+            self.__async_client.documents.retrieve_content_to_jsonl(
+                path=path,
+                ids=ids,
+                external_ids=external_ids,
+                instance_ids=instance_ids,
+                filter=filter,
+                compress=compress,
+            )
+        )
+
     def retrieve_content_buffer(
         self, buffer: BinaryIO, id: int | None = None, external_id: str | None = None, instance_id: NodeId | None = None
     ) -> None:
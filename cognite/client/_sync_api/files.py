@@ -1,12 +1,13 @@
 """
 ===============================================================================
-a426d1f604f012652671a16f807ce52b
+9a4350b57c7532ecf748091dfaa1465f
 This file is auto-generated from the Async API modules, - do not edit manually!
 ===============================================================================
 """
 
 from __future__ import annotations
 
+import logging
 from collections.abc import AsyncIterator, Iterator, Sequence
 from pathlib import Path
 from typing import Any, BinaryIO, Literal, overload
@@ -33,6 +34,8 @@ from cognite.client.data_classes.data_modeling import NodeId
 from cognite.client.utils._async_helpers import SyncIterator, run_sync
 from cognite.client.utils.useful_types import SequenceNotStr
 
+logger = logging.getLogger(__name__)
+
 
 class SyncFilesAPI(SyncAPIClient):
     """Auto-generated, do not modify manually."""
@@ -489,6 +492,8 @@ class SyncFilesAPI(SyncAPIClient):
         security_categories: Sequence[int] | None = None,
         recursive: bool = False,
         overwrite: bool = False,
+        checksum: bool = False,
+        skip_if_unchanged: bool = False,
     ) -> FileMetadata | FileMetadataList:
         """
         `Upload a file or directory <https://api-docs.cognite.com/20230101/tag/Files/operation/initMultiPartUpload>`_
@@ -517,6 +522,8 @@ class SyncFilesAPI(SyncAPIClient):
             security_categories (Sequence[int] | None): Security categories to attach to this file.
             recursive (bool): If path is a directory, upload all contained files recursively.
             overwrite (bool): If 'overwrite' is set to true, and the POST body content specifies a 'externalId' field, fields for the file found for externalId can be overwritten. The default setting is false. If metadata is included in the request body, all of the original metadata will be overwritten. The actual file will be overwritten after successful upload. If there is no successful upload, the current file contents will be kept. File-Asset mappings only change if explicitly stated in the assetIds field of the POST json body. Do not set assetIds in request body if you want to keep the current file-asset mappings.
+            checksum (bool): Compute a checksum of the content while uploading it, and store it in the file metadata (under the key 'cognite-sdk:checksum'). It can then be used to verify downloads, see `download_to_path`.
+            skip_if_unchanged (bool): Before uploading, compare the checksum of the local content with the checksum stored on the existing file with the same external ID, and skip the upload if they match. Implies `checksum=True` and requires an external ID.
 
         Returns:
             FileMetadata | FileMetadataList: The file metadata of the uploaded file(s).
@@ -560,6 +567,13 @@ class SyncFilesAPI(SyncAPIClient):
                 >>> res = client.files.upload(
                 ...     my_file, geo_location=GeoLocation(type="Feature", geometry=geometry)
                 ... )
+
+            Avoid re-sending identical content, e.g. repeated exports of a large artifact. The checksum is stored in
+            the file metadata, so the content is only sent if it changed since the last upload:
+
+                >>> res = client.files.upload(
+                ...     my_file, external_id="my_export", skip_if_unchanged=True, overwrite=True
+                ... )
         """
         return run_sync(
             self.__async_client.files.upload(
@@ -579,6 +593,8 @@ class SyncFilesAPI(SyncAPIClient):
                 security_categories=security_categories,
                 recursive=recursive,
                 overwrite=overwrite,
+                checksum=checksum,
+                skip_if_unchanged=skip_if_unchanged,
             )
         )
 
@@ -700,6 +716,62 @@ class SyncFilesAPI(SyncAPIClient):
             )
         )
 
+    def upload_bytes_multiple(
+        self,
+        items: Sequence[tuple[FileMetadataWrite, str | bytes]],
+        overwrite: bool = False,
+        journal: Path | str | None = None,
+    ) -> FileMetadataList:
+        """
+        Create and upload many (small) files concurrently.
+
+        Each file is created and its content uploaded as soon as its upload URL is returned, so metadata creation
+        and content transfer are pipelined across all files, bounded by the file upload concurrency settings. Failed
+        requests are retried according to the global retry settings.
+
+        Note:
+            The maximum size of each file is 5GiB. In order to upload larger files use `upload` or `multipart_upload_session`.
+
+        Tip:
+            Pass a `journal` to make large ingestion jobs resumable: every file created and every file uploaded is
+            appended to it. On the next call, files already uploaded are skipped, and files created but not uploaded
+            (e.g. because the content upload failed) are created again with overwrite. All files must have an external
+            ID when a journal is used.
+
+        Args:
+            items (Sequence[tuple[FileMetadataWrite, str | bytes]]): The files to create along with their content (str will be encoded using UTF-8).
+            overwrite (bool): If 'overwrite' is set to true, existing files with the same external ID will be overwritten. See `upload_bytes` for details.
+            journal (Path | str | None): Path to a JSON lines file used to record uploaded files, and to skip files already uploaded.
+
+        Returns:
+            FileMetadataList: The metadata of the uploaded files (not including files skipped because of the journal).
+
+        Examples:
+
+            Upload many files from memory:
+
+                >>> from cognite.client import CogniteClient, AsyncCogniteClient
+                >>> from cognite.client.data_classes import FileMetadataWrite
+                >>> client = CogniteClient()
+                >>> # async_client = AsyncCogniteClient()  # another option
+                >>> items = [
+                ...     (
+                ...         FileMetadataWrite(name=f"report_{i}.txt", external_id=f"report_{i}"),
+                ...         f"content {i}",
+                ...     )
+                ...     for i in range(1000)
+                ... ]
+                >>> res = client.files.upload_bytes_multiple(items)
+
+            Make the upload resumable by recording progress in a journal file; on a rerun, only files not yet
+            uploaded are sent:
+
+                >>> res = client.files.upload_bytes_multiple(items, journal="upload_journal.jsonl")
+        """
+        return run_sync(
+            self.__async_client.files.upload_bytes_multiple(items=items, overwrite=overwrite, journal=journal)
+        )
+
     def multipart_upload_session(
         self,
         name: str,
@@ -971,6 +1043,7 @@ class SyncFilesAPI(SyncAPIClient):
         id: int | None = None,
         external_id: str | None = None,
         instance_id: NodeId | tuple[str, str] | None = None,
+        verify_checksum: bool = False,
     ) -> None:
         """
         Download a file to a specific target.
@@ -980,6 +1053,7 @@ class SyncFilesAPI(SyncAPIClient):
             id (int | None): Id of of the file to download.
             external_id (str | None): External id of the file to download.
             instance_id (NodeId | tuple[str, str] | None): Instance id of the file to download.
+            verify_checksum (bool): Compute the checksum of the content while downloading it, and verify it against the checksum stored on the file (see the `checksum` parameter of `upload`). On mismatch, the downloaded file is removed and a CogniteFileChecksumError is raised.
 
         Examples:
 
@@ -991,10 +1065,16 @@ class SyncFilesAPI(SyncAPIClient):
                 >>> client.files.download_to_path(
                 ...     "~/mydir/my_downloaded_file.txt", instance_id=NodeId("my-space", "my-file-xid")
                 ... )
+
+            Download a file and verify its integrity, using the checksum stored when it was uploaded:
+
+                >>> client.files.download_to_path(
+                ...     "~/mydir/my_downloaded_file.txt", external_id="my_export", verify_checksum=True
+                ... )
         """
         return run_sync(
             self.__async_client.files.download_to_path(
-                path=path, id=id, external_id=external_id, instance_id=instance_id
+                path=path, id=id, external_id=external_id, instance_id=instance_id, verify_checksum=verify_checksum
             )
         )
 
@@ -10,36 +10,7 @@ from typing import TYPE_CHECKING, Any
 
 from cognite.client import AsyncCogniteClient
 from cognite.client._api_client import APIClient
-from cognite.client._sync_api.agents.agents import SyncAgentsAPI
-from cognite.client._sync_api.ai import SyncAIAPI
-from cognite.client._sync_api.annotations import SyncAnnotationsAPI
-from cognite.client._sync_api.assets import SyncAssetsAPI
-from cognite.client._sync_api.data_modeling import SyncDataModelingAPI
-from cognite.client._sync_api.data_sets import SyncDataSetsAPI
-from cognite.client._sync_api.diagrams import SyncDiagramsAPI
-from cognite.client._sync_api.documents import SyncDocumentsAPI
-from cognite.client._sync_api.entity_matching import SyncEntityMatchingAPI
-from cognite.client._sync_api.events import SyncEventsAPI
-from cognite.client._sync_api.extractionpipelines import SyncExtractionPipelinesAPI
-from cognite.client._sync_api.files import SyncFilesAPI
-from cognite.client._sync_api.functions import SyncFunctionsAPI
-from cognite.client._sync_api.geospatial import SyncGeospatialAPI
-from cognite.client._sync_api.hosted_extractors import SyncHostedExtractorsAPI
-from cognite.client._sync_api.iam import SyncIAMAPI
-from cognite.client._sync_api.labels import SyncLabelsAPI
-from cognite.client._sync_api.limits import SyncLimitsAPI
-from cognite.client._sync_api.metering import SyncMeteringAPI
-from cognite.client._sync_api.postgres_gateway import SyncPostgresGatewaysAPI
-from cognite.client._sync_api.raw import SyncRawAPI
-from cognite.client._sync_api.relationships import SyncRelationshipsAPI
-from cognite.client._sync_api.sequences import SyncSequencesAPI
-from cognite.client._sync_api.simulators import SyncSimulatorsAPI
-from cognite.client._sync_api.three_d import Sync3DAPI
-from cognite.client._sync_api.time_series import SyncTimeSeriesAPI
-from cognite.client._sync_api.transformations import SyncTransformationsAPI
-from cognite.client._sync_api.units import SyncUnitAPI
-from cognite.client._sync_api.vision import SyncVisionAPI
-from cognite.client._sync_api.workflows import SyncWorkflowAPI
+from cognite.client._sync_api_client import SyncAPIClient
 from cognite.client.credentials import (
     CredentialProvider,
     InteractivePrompt,
@@ -48,9 +19,40 @@ from cognite.client.credentials import (
 )
 from cognite.client.utils._async_helpers import run_sync
 from cognite.client.utils._auxiliary import load_resource_to_dict
+from cognite.client.utils._importing import LazyAPI
 
 if TYPE_CHECKING:
     from cognite.client import ClientConfig
+    from cognite.client._sync_api.agents.agents import SyncAgentsAPI
+    from cognite.client._sync_api.ai import SyncAIAPI
+    from cognite.client._sync_api.annotations import SyncAnnotationsAPI
+    from cognite.client._sync_api.assets import SyncAssetsAPI
+    from cognite.client._sync_api.data_modeling import SyncDataModelingAPI
+    from cognite.client._sync_api.data_sets import SyncDataSetsAPI
+    from cognite.client._sync_api.diagrams import SyncDiagramsAPI
+    from cognite.client._sync_api.documents import SyncDocumentsAPI
+    from cognite.client._sync_api.entity_matching import SyncEntityMatchingAPI
+    from cognite.client._sync_api.events import SyncEventsAPI
+    from cognite.client._sync_api.extractionpipelines import SyncExtractionPipelinesAPI
+    from cognite.client._sync_api.files import SyncFilesAPI
+    from cognite.client._sync_api.functions import SyncFunctionsAPI
+    from cognite.client._sync_api.geospatial import SyncGeospatialAPI
+    from cognite.client._sync_api.hosted_extractors import SyncHostedExtractorsAPI
+    from cognite.client._sync_api.iam import SyncIAMAPI
+    from cognite.client._sync_api.labels import SyncLabelsAPI
+    from cognite.client._sync_api.limits import SyncLimitsAPI
+    from cognite.client._sync_api.metering import SyncMeteringAPI
+    from cognite.client._sync_api.postgres_gateway import SyncPostgresGatewaysAPI
+    from cognite.client._sync_api.raw import SyncRawAPI
+    from cognite.client._sync_api.relationships import SyncRelationshipsAPI
+    from cognite.client._sync_api.sequences import SyncSequencesAPI
+    from cognite.client._sync_api.simulators import SyncSimulatorsAPI
+    from cognite.client._sync_api.three_d import Sync3DAPI
+    from cognite.client._sync_api.time_series import SyncTimeSeriesAPI
+    from cognite.client._sync_api.transformations import SyncTransformationsAPI
+    from cognite.client._sync_api.units import SyncUnitAPI
+    from cognite.client._sync_api.vision import SyncVisionAPI
+    from cognite.client._sync_api.workflows import SyncWorkflowAPI
     from cognite.client.response import CogniteHTTPResponse
 
 
@@ -64,40 +66,55 @@ class CogniteClient:
         config (ClientConfig | None): The configuration for this client.
     """
 
+    # All sync. APIs, imported and created on first access:
+    ai: LazyAPI[SyncAIAPI] = LazyAPI("cognite.client._sync_api.ai.SyncAIAPI")
+    agents: LazyAPI[SyncAgentsAPI] = LazyAPI("cognite.client._sync_api.agents.agents.SyncAgentsAPI")
+    annotations: LazyAPI[SyncAnnotationsAPI] = LazyAPI("cognite.client._sync_api.annotations.SyncAnnotationsAPI")
+    assets: LazyAPI[SyncAssetsAPI] = LazyAPI("cognite.client._sync_api.assets.SyncAssetsAPI")
+    data_modeling: LazyAPI[SyncDataModelingAPI] = LazyAPI("cognite.client._sync_api.data_modeling.SyncDataModelingAPI")
+    data_sets: LazyAPI[SyncDataSetsAPI] = LazyAPI("cognite.client._sync_api.data_sets.SyncDataSetsAPI")
+    diagrams: LazyAPI[SyncDiagramsAPI] = LazyAPI("cognite.client._sync_api.diagrams.SyncDiagramsAPI")
+    documents: LazyAPI[SyncDocumentsAPI] = LazyAPI("cognite.client._sync_api.documents.SyncDocumentsAPI")
+    entity_matching: LazyAPI[SyncEntityMatchingAPI] = LazyAPI(
+        "cognite.client._sync_api.entity_matching.SyncEntityMatchingAPI"
+    )
+    events: LazyAPI[SyncEventsAPI] = LazyAPI("cognite.client._sync_api.events.SyncEventsAPI")
+    extraction_pipelines: LazyAPI[SyncExtractionPipelinesAPI] = LazyAPI(
+        "cognite.client._sync_api.extractionpipelines.SyncExtractionPipelinesAPI"
+    )
+    files: LazyAPI[SyncFilesAPI] = LazyAPI("cognite.client._sync_api.files.SyncFilesAPI")
+    functions: LazyAPI[SyncFunctionsAPI] = LazyAPI("cognite.client._sync_api.functions.SyncFunctionsAPI")
+    geospatial: LazyAPI[SyncGeospatialAPI] = LazyAPI("cognite.client._sync_api.geospatial.SyncGeospatialAPI")
+    hosted_extractors: LazyAPI[SyncHostedExtractorsAPI] = LazyAPI(
+        "cognite.client._sync_api.hosted_extractors.SyncHostedExtractorsAPI"
+    )
+    iam: LazyAPI[SyncIAMAPI] = LazyAPI("cognite.client._sync_api.iam.SyncIAMAPI")
+    labels: LazyAPI[SyncLabelsAPI] = LazyAPI("cognite.client._sync_api.labels.SyncLabelsAPI")
+    limits: LazyAPI[SyncLimitsAPI] = LazyAPI("cognite.client._sync_api.limits.SyncLimitsAPI")
+    metering: LazyAPI[SyncMeteringAPI] = LazyAPI("cognite.client._sync_api.metering.SyncMeteringAPI")
+    postgres_gateway: LazyAPI[SyncPostgresGatewaysAPI] = LazyAPI(
+        "cognite.client._sync_api.postgres_gateway.SyncPostgresGatewaysAPI"
+    )
+    raw: LazyAPI[SyncRawAPI] = LazyAPI("cognite.client._sync_api.raw.SyncRawAPI")
+    relationships: LazyAPI[SyncRelationshipsAPI] = LazyAPI(
+        "cognite.client._sync_api.relationships.SyncRelationshipsAPI"
+    )
+    sequences: LazyAPI[SyncSequencesAPI] = LazyAPI("cognite.client._sync_api.sequences.SyncSequencesAPI")
+    simulators: LazyAPI[SyncSimulatorsAPI] = LazyAPI("cognite.client._sync_api.simulators.SyncSimulatorsAPI")
+    three_d: LazyAPI[Sync3DAPI] = LazyAPI("cognite.client._sync_api.three_d.Sync3DAPI")
+    time_series: LazyAPI[SyncTimeSeriesAPI] = LazyAPI("cognite.client._sync_api.time_series.SyncTimeSeriesAPI")
+    transformations: LazyAPI[SyncTransformationsAPI] = LazyAPI(
+        "cognite.client._sync_api.transformations.SyncTransformationsAPI"
+    )
+    units: LazyAPI[SyncUnitAPI] = LazyAPI("cognite.client._sync_api.units.SyncUnitAPI")
+    vision: LazyAPI[SyncVisionAPI] = LazyAPI("cognite.client._sync_api.vision.SyncVisionAPI")
+    workflows: LazyAPI[SyncWorkflowAPI] = LazyAPI("cognite.client._sync_api.workflows.SyncWorkflowAPI")
+
     def __init__(self, config: ClientConfig | None = None) -> None:
-        self.__async_client = async_client = AsyncCogniteClient(config)
-
-        # Initialize all sync. APIs:
-        self.ai = SyncAIAPI(async_client)
-        self.agents = SyncAgentsAPI(async_client)
-        self.annotations = SyncAnnotationsAPI(async_client)
-        self.assets = SyncAssetsAPI(async_client)
-        self.data_modeling = SyncDataModelingAPI(async_client)
-        self.data_sets = SyncDataSetsAPI(async_client)
-        self.diagrams = SyncDiagramsAPI(async_client)
-        self.documents = SyncDocumentsAPI(async_client)
-        self.entity_matching = SyncEntityMatchingAPI(async_client)
-        self.events = SyncEventsAPI(async_client)
-        self.extraction_pipelines = SyncExtractionPipelinesAPI(async_client)
-        self.files = SyncFilesAPI(async_client)
-        self.functions = SyncFunctionsAPI(async_client)
-        self.geospatial = SyncGeospatialAPI(async_client)
-        self.hosted_extractors = SyncHostedExtractorsAPI(async_client)
-        self.iam = SyncIAMAPI(async_client)
-        self.labels = SyncLabelsAPI(async_client)
-        self.limits = SyncLimitsAPI(async_client)
-        self.metering = SyncMeteringAPI(async_client)
-        self.postgres_gateway = SyncPostgresGatewaysAPI(async_client)
-        self.raw = SyncRawAPI(async_client)
-        self.relationships = SyncRelationshipsAPI(async_client)
-        self.sequences = SyncSequencesAPI(async_client)
-        self.simulators = SyncSimulatorsAPI(async_client)
-        self.three_d = Sync3DAPI(async_client)
-        self.time_series = SyncTimeSeriesAPI(async_client)
-        self.transformations = SyncTransformationsAPI(async_client)
-        self.units = SyncUnitAPI(async_client)
-        self.vision = SyncVisionAPI(async_client)
-        self.workflows = SyncWorkflowAPI(async_client)
+        self.__async_client = AsyncCogniteClient(config)
+
+    def _create_api(self, api_cls: type[SyncAPIClient]) -> SyncAPIClient:
+        return api_cls(self.__async_client)  # type: ignore[call-arg]
 
     def get(
         self, url: str, params: dict[str, Any] | None = None, headers: dict[str, Any] | None = None
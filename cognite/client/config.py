@@ -5,7 +5,9 @@ import pprint
 import re
 import ssl
 import warnings
-from typing import Any, ClassVar, NoReturn, overload
+from collections.abc import Callable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar, NoReturn, overload
 
 from cognite.client._version import __api_subversion__
 from cognite.client.credentials import CredentialProvider
@@ -13,6 +15,9 @@ from cognite.client.utils._auxiliary import is_non_negative_int, is_positive_int
 from cognite.client.utils._concurrency import ConcurrencySettings
 from cognite.client.utils._importing import local_import
 
+if TYPE_CHECKING:
+    from cognite.client.data_classes import DatapointsFetchStats
+
 
 class GlobalConfig:
     """Global configuration object
@@ -48,6 +53,25 @@ class GlobalConfig:
             size, but optimized for network efficiency (best download speed).
         file_upload_chunk_size (int | None): Override the chunk size for streaming file uploads. Defaults to None, which
             translates to 65536 (64KiB chunks).
+        file_upload_memory_map (bool): Whether to memory-map files uploaded from a path (e.g. with `files.upload`), so that
+            all parts of the multipart upload stream zero-copy slices of one shared mapping instead of each part opening
+            the file and reading it into new bytes objects. Reduces CPU usage and memory allocation for very large files.
+            Ignored in the browser (Pyodide). Defaults to False.
+        datapoints_cache_directory (str | Path | None): Directory for a local, persistent cache of datapoints used by
+            `retrieve_arrays` and `retrieve_dataframe`. Repeated queries then only fetch the time ranges not already cached.
+            The cache is invalidated by inserts and deletes made through the SDK and by datapoint subscription updates,
+            but not by writes made elsewhere. Datapoints from the last 5 minutes are never cached. Requires numpy.
+            Defaults to None (no caching).
+        datapoints_density_planning (bool): Whether to first fetch coarse 'count' aggregates for all raw datapoints
+            queries without a limit, then use them to split each time series into time ranges holding about the same
+            number of datapoints and to group sparse time series into the same requests. Costs an extra round of
+            (cheap) requests, but speeds up fetching of time series with very uneven density. Skipped if the count
+            aggregates cannot be fetched, e.g. for string time series. Defaults to False.
+        datapoints_fetch_stats_callback (Callable[[DatapointsFetchStats], None] | None): Function called with statistics
+            after each fetch of datapoints (also failed ones), like the fetch strategy used, the number of requests made,
+            bytes received, time spent waiting for the datapoints semaphore and decoding, and the number of datapoints
+            per second. Useful for tuning concurrency settings and for finding time series that are slow to fetch.
+            Defaults to None.
         silence_feature_preview_warnings (bool): Whether or not to silence warnings triggered by using alpha or beta
             features. Defaults to False.
     """
@@ -81,6 +105,10 @@ class GlobalConfig:
         self.follow_redirects: bool = False
         self.file_download_chunk_size: int | None = None
         self.file_upload_chunk_size: int | None = None
+        self.file_upload_memory_map: bool = False
+        self.datapoints_cache_directory: str | Path | None = None
+        self.datapoints_density_planning: bool = False
+        self.datapoints_fetch_stats_callback: Callable[[DatapointsFetchStats], None] | None = None
         self.silence_feature_preview_warnings: bool = False
 
     def __setattr__(self, name: str, val: Any) -> None:
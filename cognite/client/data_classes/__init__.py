@@ -1,319 +1,327 @@
 from __future__ import annotations
 
-from cognite.client.data_classes.annotations import (
-    Annotation,
-    AnnotationFilter,
-    AnnotationList,
-    AnnotationReverseLookupFilter,
-    AnnotationUpdate,
-    AnnotationWrite,
-    AnnotationWriteList,
-)
-from cognite.client.data_classes.assets import (
-    AggregateResultItem,
-    Asset,
-    AssetFilter,
-    AssetHierarchy,
-    AssetList,
-    AssetUpdate,
-    AssetWrite,
-    AssetWriteList,
-)
-from cognite.client.data_classes.contextualization import (
-    ContextualizationJob,
-    ContextualizationJobList,
-    ContextualizationJobType,
-    EntityMatchingModel,
-    EntityMatchingModelList,
-    EntityMatchingModelUpdate,
-    EntityMatchingPredictionResult,
-    JobStatus,
-)
-from cognite.client.data_classes.data_sets import (
-    DataSet,
-    DataSetFilter,
-    DataSetList,
-    DataSetUpdate,
-    DataSetWrite,
-    DataSetWriteList,
-)
-from cognite.client.data_classes.datapoints import (
-    Datapoint,
-    Datapoints,
-    DatapointsArray,
-    DatapointsArrayList,
-    DatapointsList,
-    DatapointsQuery,
-    LatestDatapoint,
-    LatestDatapointList,
-    LatestDatapointQuery,
-    StatusCode,
-    SyntheticDatapoints,
-    SyntheticDatapointsList,
-)
-from cognite.client.data_classes.datapoints_subscriptions import (
-    DatapointSubscription,
-    DatapointSubscriptionList,
-    DataPointSubscriptionUpdate,
-    DataPointSubscriptionWrite,
-    DatapointSubscriptionWriteList,
-)
-from cognite.client.data_classes.documents import (
-    Document,
-    DocumentHighlight,
-    DocumentHighlightList,
-    DocumentList,
-    SourceFile,
-)
-from cognite.client.data_classes.events import (
-    EndTimeFilter,
-    Event,
-    EventFilter,
-    EventList,
-    EventUpdate,
-    EventWrite,
-    EventWriteList,
-)
-from cognite.client.data_classes.extractionpipelines import (
-    ExtractionPipeline,
-    ExtractionPipelineConfig,
-    ExtractionPipelineConfigRevision,
-    ExtractionPipelineConfigRevisionList,
-    ExtractionPipelineConfigWrite,
-    ExtractionPipelineConfigWriteList,
-    ExtractionPipelineContact,
-    ExtractionPipelineList,
-    ExtractionPipelineRun,
-    ExtractionPipelineRunFilter,
-    ExtractionPipelineRunList,
-    ExtractionPipelineRunWrite,
-    ExtractionPipelineRunWriteList,
-    ExtractionPipelineUpdate,
-    ExtractionPipelineWrite,
-    ExtractionPipelineWriteList,
-)
-from cognite.client.data_classes.files import (
-    FileMetadata,
-    FileMetadataFilter,
-    FileMetadataList,
-    FileMetadataUpdate,
-    FileMetadataWrite,
-    FileMetadataWriteList,
-    FileMultipartUploadSession,
-)
-from cognite.client.data_classes.functions import (
-    Function,
-    FunctionCall,
-    FunctionCallList,
-    FunctionCallLog,
-    FunctionCallLogEntry,
-    FunctionFilter,
-    FunctionList,
-    FunctionSchedule,
-    FunctionSchedulesFilter,
-    FunctionSchedulesList,
-    FunctionScheduleWrite,
-    FunctionScheduleWriteList,
-    FunctionsLimits,
-    FunctionWrite,
-    FunctionWriteList,
-)
-from cognite.client.data_classes.geospatial import (
-    CoordinateReferenceSystem,
-    CoordinateReferenceSystemList,
-    CoordinateReferenceSystemWrite,
-    CoordinateReferenceSystemWriteList,
-    Feature,
-    FeatureAggregate,
-    FeatureAggregateList,
-    FeatureList,
-    FeatureType,
-    FeatureTypeList,
-    FeatureTypePatch,
-    FeatureTypeWrite,
-    FeatureTypeWriteList,
-    FeatureWrite,
-    FeatureWriteList,
-)
-from cognite.client.data_classes.iam import (
-    ALL_USER_ACCOUNTS,
-    ClientCredentials,
-    CreatedSession,
-    Group,
-    GroupList,
-    GroupWrite,
-    GroupWriteList,
-    RevokedSession,
-    RevokedSessionList,
-    SecurityCategory,
-    SecurityCategoryList,
-    SecurityCategoryWrite,
-    SecurityCategoryWriteList,
-    Session,
-    SessionList,
-)
-from cognite.client.data_classes.labels import (
-    Label,
-    LabelDefinition,
-    LabelDefinitionFilter,
-    LabelDefinitionList,
-    LabelDefinitionWrite,
-    LabelFilter,
-)
-from cognite.client.data_classes.limits import Limit, LimitList
-from cognite.client.data_classes.metering import MeteringData, MeteringDataList, MeteringDataPoint
-from cognite.client.data_classes.raw import (
-    Database,
-    DatabaseList,
-    DatabaseWrite,
-    DatabaseWriteList,
-    Row,
-    RowList,
-    RowWrite,
-    RowWriteList,
-    Table,
-    TableList,
-    TableWrite,
-    TableWriteList,
-)
-from cognite.client.data_classes.relationships import (
-    Relationship,
-    RelationshipFilter,
-    RelationshipList,
-    RelationshipUpdate,
-    RelationshipWrite,
-    RelationshipWriteList,
-)
-from cognite.client.data_classes.sequences import (
-    Sequence,
-    SequenceColumn,
-    SequenceColumnList,
-    SequenceColumnUpdate,
-    SequenceColumnWrite,
-    SequenceColumnWriteList,
-    SequenceFilter,
-    SequenceList,
-    SequenceRow,
-    SequenceRows,
-    SequenceRowsList,
-    SequenceUpdate,
-    SequenceWrite,
-    SequenceWriteList,
-)
-from cognite.client.data_classes.shared import (
-    AggregateResult,
-    AggregateUniqueValuesResult,
-    GeoLocation,
-    GeoLocationFilter,
-    Geometry,
-    GeometryFilter,
-    TimestampRange,
-)
-from cognite.client.data_classes.three_d import (
-    BoundingBox3D,
-    RevisionCameraProperties,
-    ThreeDAssetMapping,
-    ThreeDAssetMappingList,
-    ThreeDAssetMappingWrite,
-    ThreeDAssetMappingWriteList,
-    ThreeDModel,
-    ThreeDModelList,
-    ThreeDModelRevision,
-    ThreeDModelRevisionList,
-    ThreeDModelRevisionUpdate,
-    ThreeDModelRevisionWrite,
-    ThreeDModelRevisionWriteList,
-    ThreeDModelUpdate,
-    ThreeDModelWrite,
-    ThreeDModelWriteList,
-    ThreeDNode,
-    ThreeDNodeList,
-)
-from cognite.client.data_classes.time_series import (
-    TimeSeries,
-    TimeSeriesFilter,
-    TimeSeriesList,
-    TimeSeriesUpdate,
-    TimeSeriesWrite,
-    TimeSeriesWriteList,
-)
-from cognite.client.data_classes.transformations import (
-    Transformation,
-    TransformationList,
-    TransformationPreviewResult,
-    TransformationUpdate,
-    TransformationWrite,
-    TransformationWriteList,
-)
-from cognite.client.data_classes.transformations.common import (
-    OidcCredentials,
-    RawTable,
-    TransformationBlockedInfo,
-    TransformationDestination,
-)
-from cognite.client.data_classes.transformations.jobs import (
-    TransformationJob,
-    TransformationJobFilter,
-    TransformationJobList,
-    TransformationJobMetric,
-    TransformationJobMetricList,
-    TransformationJobStatus,
-)
-from cognite.client.data_classes.transformations.notifications import (
-    TransformationNotification,
-    TransformationNotificationList,
-    TransformationNotificationWrite,
-    TransformationNotificationWriteList,
-)
-from cognite.client.data_classes.transformations.schedules import (
-    TransformationSchedule,
-    TransformationScheduleList,
-    TransformationScheduleUpdate,
-    TransformationScheduleWrite,
-    TransformationScheduleWriteList,
-)
-from cognite.client.data_classes.transformations.schema import (
-    TransformationSchemaColumn,
-    TransformationSchemaColumnList,
-)
-from cognite.client.data_classes.user_profiles import UserProfile, UserProfileList
-from cognite.client.data_classes.workflows import (
-    CDFTaskOutput,
-    CDFTaskParameters,
-    DynamicTaskOutput,
-    DynamicTaskParameters,
-    FunctionTaskOutput,
-    FunctionTaskParameters,
-    SimulationTaskOutput,
-    SimulationTaskParameters,
-    SubworkflowTaskParameters,
-    TransformationTaskOutput,
-    TransformationTaskParameters,
-    UnknownWorkflowTaskOutput,
-    UnknownWorkflowTaskParameters,
-    Workflow,
-    WorkflowDefinition,
-    WorkflowDefinitionUpsert,
-    WorkflowExecution,
-    WorkflowExecutionDetailed,
-    WorkflowExecutionList,
-    WorkflowList,
-    WorkflowTask,
-    WorkflowTaskExecution,
-    WorkflowTrigger,
-    WorkflowTriggerList,
-    WorkflowTriggerRun,
-    WorkflowTriggerRunList,
-    WorkflowTriggerUpsert,
-    WorkflowTriggerUpsertList,
-    WorkflowUpsert,
-    WorkflowUpsertList,
-    WorkflowVersion,
-    WorkflowVersionId,
-    WorkflowVersionList,
-    WorkflowVersionUpsert,
-    WorkflowVersionUpsertList,
-)
+from typing import TYPE_CHECKING
+
+from cognite.client.utils._importing import lazy_module_dir, lazy_module_getattr
+
+if TYPE_CHECKING:
+    from cognite.client.data_classes.annotations import (
+        Annotation,
+        AnnotationFilter,
+        AnnotationList,
+        AnnotationReverseLookupFilter,
+        AnnotationUpdate,
+        AnnotationWrite,
+        AnnotationWriteList,
+    )
+    from cognite.client.data_classes.assets import (
+        AggregateResultItem,
+        Asset,
+        AssetFilter,
+        AssetHierarchy,
+        AssetList,
+        AssetUpdate,
+        AssetWrite,
+        AssetWriteList,
+    )
+    from cognite.client.data_classes.contextualization import (
+        ContextualizationJob,
+        ContextualizationJobList,
+        ContextualizationJobType,
+        EntityMatchingModel,
+        EntityMatchingModelList,
+        EntityMatchingModelUpdate,
+        EntityMatchingPredictionResult,
+        JobStatus,
+    )
+    from cognite.client.data_classes.data_sets import (
+        DataSet,
+        DataSetFilter,
+        DataSetList,
+        DataSetUpdate,
+        DataSetWrite,
+        DataSetWriteList,
+    )
+    from cognite.client.data_classes.datapoints import (
+        Datapoint,
+        Datapoints,
+        DatapointsArray,
+        DatapointsArrayList,
+        DatapointsFetchStats,
+        DatapointsList,
+        DatapointsQuery,
+        LatestDatapoint,
+        LatestDatapointList,
+        LatestDatapointQuery,
+        StatusCode,
+        SyntheticDatapoints,
+        SyntheticDatapointsList,
+        TimeSeriesFetchStats,
+    )
+    from cognite.client.data_classes.datapoints_subscriptions import (
+        DatapointSubscription,
+        DatapointSubscriptionList,
+        DataPointSubscriptionUpdate,
+        DataPointSubscriptionWrite,
+        DatapointSubscriptionWriteList,
+    )
+    from cognite.client.data_classes.documents import (
+        Document,
+        DocumentHighlight,
+        DocumentHighlightList,
+        DocumentList,
+        SourceFile,
+    )
+    from cognite.client.data_classes.events import (
+        EndTimeFilter,
+        Event,
+        EventFilter,
+        EventList,
+        EventUpdate,
+        EventWrite,
+        EventWriteList,
+    )
+    from cognite.client.data_classes.extractionpipelines import (
+        ExtractionPipeline,
+        ExtractionPipelineConfig,
+        ExtractionPipelineConfigRevision,
+        ExtractionPipelineConfigRevisionList,
+        ExtractionPipelineConfigWrite,
+        ExtractionPipelineConfigWriteList,
+        ExtractionPipelineContact,
+        ExtractionPipelineList,
+        ExtractionPipelineRun,
+        ExtractionPipelineRunFilter,
+        ExtractionPipelineRunList,
+        ExtractionPipelineRunWrite,
+        ExtractionPipelineRunWriteList,
+        ExtractionPipelineUpdate,
+        ExtractionPipelineWrite,
+        ExtractionPipelineWriteList,
+    )
+    from cognite.client.data_classes.files import (
+        FileMetadata,
+        FileMetadataFilter,
+        FileMetadataList,
+        FileMetadataUpdate,
+        FileMetadataWrite,
+        FileMetadataWriteList,
+        FileMultipartUploadSession,
+    )
+    from cognite.client.data_classes.functions import (
+        Function,
+        FunctionCall,
+        FunctionCallList,
+        FunctionCallLog,
+        FunctionCallLogEntry,
+        FunctionFilter,
+        FunctionList,
+        FunctionSchedule,
+        FunctionSchedulesFilter,
+        FunctionSchedulesList,
+        FunctionScheduleWrite,
+        FunctionScheduleWriteList,
+        FunctionsLimits,
+        FunctionWrite,
+        FunctionWriteList,
+    )
+    from cognite.client.data_classes.geospatial import (
+        CoordinateReferenceSystem,
+        CoordinateReferenceSystemList,
+        CoordinateReferenceSystemWrite,
+        CoordinateReferenceSystemWriteList,
+        Feature,
+        FeatureAggregate,
+        FeatureAggregateList,
+        FeatureList,
+        FeatureType,
+        FeatureTypeList,
+        FeatureTypePatch,
+        FeatureTypeWrite,
+        FeatureTypeWriteList,
+        FeatureWrite,
+        FeatureWriteList,
+    )
+    from cognite.client.data_classes.iam import (
+        ALL_USER_ACCOUNTS,
+        ClientCredentials,
+        CreatedSession,
+        Group,
+        GroupList,
+        GroupWrite,
+        GroupWriteList,
+        RevokedSession,
+        RevokedSessionList,
+        SecurityCategory,
+        SecurityCategoryList,
+        SecurityCategoryWrite,
+        SecurityCategoryWriteList,
+        Session,
+        SessionList,
+    )
+    from cognite.client.data_classes.labels import (
+        Label,
+        LabelDefinition,
+        LabelDefinitionFilter,
+        LabelDefinitionList,
+        LabelDefinitionWrite,
+        LabelFilter,
+    )
+    from cognite.client.data_classes.limits import Limit, LimitList
+    from cognite.client.data_classes.metering import MeteringData, MeteringDataList, MeteringDataPoint
+    from cognite.client.data_classes.raw import (
+        Database,
+        DatabaseList,
+        DatabaseWrite,
+        DatabaseWriteList,
+        Row,
+        RowList,
+        RowWrite,
+        RowWriteList,
+        Table,
+        TableList,
+        TableWrite,
+        TableWriteList,
+    )
+    from cognite.client.data_classes.relationships import (
+        Relationship,
+        RelationshipFilter,
+        RelationshipList,
+        RelationshipUpdate,
+        RelationshipWrite,
+        RelationshipWriteList,
+    )
+    from cognite.client.data_classes.sequences import (
+        Sequence,
+        SequenceColumn,
+        SequenceColumnList,
+        SequenceColumnUpdate,
+        SequenceColumnWrite,
+        SequenceColumnWriteList,
+        SequenceFilter,
+        SequenceList,
+        SequenceRow,
+        SequenceRows,
+        SequenceRowsList,
+        SequenceUpdate,
+        SequenceWrite,
+        SequenceWriteList,
+    )
+    from cognite.client.data_classes.shared import (
+        AggregateResult,
+        AggregateUniqueValuesResult,
+        GeoLocation,
+        GeoLocationFilter,
+        Geometry,
+        GeometryFilter,
+        TimestampRange,
+    )
+    from cognite.client.data_classes.three_d import (
+        BoundingBox3D,
+        RevisionCameraProperties,
+        ThreeDAssetMapping,
+        ThreeDAssetMappingList,
+        ThreeDAssetMappingWrite,
+        ThreeDAssetMappingWriteList,
+        ThreeDModel,
+        ThreeDModelList,
+        ThreeDModelRevision,
+        ThreeDModelRevisionList,
+        ThreeDModelRevisionUpdate,
+        ThreeDModelRevisionWrite,
+        ThreeDModelRevisionWriteList,
+        ThreeDModelUpdate,
+        ThreeDModelWrite,
+        ThreeDModelWriteList,
+        ThreeDNode,
+        ThreeDNodeList,
+    )
+    from cognite.client.data_classes.time_series import (
+        TimeSeries,
+        TimeSeriesFilter,
+        TimeSeriesList,
+        TimeSeriesUpdate,
+        TimeSeriesWrite,
+        TimeSeriesWriteList,
+    )
+    from cognite.client.data_classes.transformations import (
+        Transformation,
+        TransformationList,
+        TransformationPreviewResult,
+        TransformationUpdate,
+        TransformationWrite,
+        TransformationWriteList,
+    )
+    from cognite.client.data_classes.transformations.common import (
+        OidcCredentials,
+        RawTable,
+        TransformationBlockedInfo,
+        TransformationDestination,
+    )
+    from cognite.client.data_classes.transformations.jobs import (
+        TransformationJob,
+        TransformationJobFilter,
+        TransformationJobList,
+        TransformationJobMetric,
+        TransformationJobMetricList,
+        TransformationJobStatus,
+    )
+    from cognite.client.data_classes.transformations.notifications import (
+        TransformationNotification,
+        TransformationNotificationList,
+        TransformationNotificationWrite,
+        TransformationNotificationWriteList,
+    )
+    from cognite.client.data_classes.transformations.schedules import (
+        TransformationSchedule,
+        TransformationScheduleList,
+        TransformationScheduleUpdate,
+        TransformationScheduleWrite,
+        TransformationScheduleWriteList,
+    )
+    from cognite.client.data_classes.transformations.schema import (
+        TransformationSchemaColumn,
+        TransformationSchemaColumnList,
+    )
+    from cognite.client.data_classes.user_profiles import UserProfile, UserProfileList
+    from cognite.client.data_classes.workflows import (
+        CDFTaskOutput,
+        CDFTaskParameters,
+        DynamicTaskOutput,
+        DynamicTaskParameters,
+        FunctionTaskOutput,
+        FunctionTaskParameters,
+        SimulationTaskOutput,
+        SimulationTaskParameters,
+        SubworkflowTaskParameters,
+        TransformationTaskOutput,
+        TransformationTaskParameters,
+        UnknownWorkflowTaskOutput,
+        UnknownWorkflowTaskParameters,
+        Workflow,
+        WorkflowDefinition,
+        WorkflowDefinitionUpsert,
+        WorkflowExecution,
+        WorkflowExecutionDetailed,
+        WorkflowExecutionList,
+        WorkflowList,
+        WorkflowTask,
+        WorkflowTaskExecution,
+        WorkflowTrigger,
+        WorkflowTriggerList,
+        WorkflowTriggerRun,
+        WorkflowTriggerRunList,
+        WorkflowTriggerUpsert,
+        WorkflowTriggerUpsertList,
+        WorkflowUpsert,
+        WorkflowUpsertList,
+        WorkflowVersion,
+        WorkflowVersionId,
+        WorkflowVersionList,
+        WorkflowVersionUpsert,
+        WorkflowVersionUpsertList,
+    )
+
 
 __all__ = [
     "ALL_USER_ACCOUNTS",
@@ -365,6 +373,7 @@ __all__ = [
     "Datapoints",
     "DatapointsArray",
     "DatapointsArrayList",
+    "DatapointsFetchStats",
     "DatapointsList",
     "DatapointsQuery",
     "Document",
@@ -521,6 +530,7 @@ __all__ = [
     "ThreeDNode",
     "ThreeDNodeList",
     "TimeSeries",
+    "TimeSeriesFetchStats",
     "TimeSeriesFilter",
     "TimeSeriesList",
     "TimeSeriesUpdate",
@@ -581,3 +591,276 @@ __all__ = [
     "WorkflowVersionUpsert",
     "WorkflowVersionUpsertList",
 ]
+
+# Importing all modules up front is slow, so names are imported on first access instead:
+_LAZY_IMPORTS = {
+    "Annotation": "cognite.client.data_classes.annotations",
+    "AnnotationFilter": "cognite.client.data_classes.annotations",
+    "AnnotationList": "cognite.client.data_classes.annotations",
+    "AnnotationReverseLookupFilter": "cognite.client.data_classes.annotations",
+    "AnnotationUpdate": "cognite.client.data_classes.annotations",
+    "AnnotationWrite": "cognite.client.data_classes.annotations",
+    "AnnotationWriteList": "cognite.client.data_classes.annotations",
+    "AggregateResultItem": "cognite.client.data_classes.assets",
+    "Asset": "cognite.client.data_classes.assets",
+    "AssetFilter": "cognite.client.data_classes.assets",
+    "AssetHierarchy": "cognite.client.data_classes.assets",
+    "AssetList": "cognite.client.data_classes.assets",
+    "AssetUpdate": "cognite.client.data_classes.assets",
+    "AssetWrite": "cognite.client.data_classes.assets",
+    "AssetWriteList": "cognite.client.data_classes.assets",
+    "ContextualizationJob": "cognite.client.data_classes.contextualization",
+    "ContextualizationJobList": "cognite.client.data_classes.contextualization",
+    "ContextualizationJobType": "cognite.client.data_classes.contextualization",
+    "EntityMatchingModel": "cognite.client.data_classes.contextualization",
+    "EntityMatchingModelList": "cognite.client.data_classes.contextualization",
+    "EntityMatchingModelUpdate": "cognite.client.data_classes.contextualization",
+    "EntityMatchingPredictionResult": "cognite.client.data_classes.contextualization",
+    "JobStatus": "cognite.client.data_classes.contextualization",
+    "DataSet": "cognite.client.data_classes.data_sets",
+    "DataSetFilter": "cognite.client.data_classes.data_sets",
+    "DataSetList": "cognite.client.data_classes.data_sets",
+    "DataSetUpdate": "cognite.client.data_classes.data_sets",
+    "DataSetWrite": "cognite.client.data_classes.data_sets",
+    "DataSetWriteList": "cognite.client.data_classes.data_sets",
+    "Datapoint": "cognite.client.data_classes.datapoints",
+    "Datapoints": "cognite.client.data_classes.datapoints",
+    "DatapointsArray": "cognite.client.data_classes.datapoints",
+    "DatapointsArrayList": "cognite.client.data_classes.datapoints",
+    "DatapointsFetchStats": "cognite.client.data_classes.datapoints",
+    "DatapointsList": "cognite.client.data_classes.datapoints",
+    "DatapointsQuery": "cognite.client.data_classes.datapoints",
+    "LatestDatapoint": "cognite.client.data_classes.datapoints",
+    "LatestDatapointList": "cognite.client.data_classes.datapoints",
+    "LatestDatapointQuery": "cognite.client.data_classes.datapoints",
+    "StatusCode": "cognite.client.data_classes.datapoints",
+    "SyntheticDatapoints": "cognite.client.data_classes.datapoints",
+    "SyntheticDatapointsList": "cognite.client.data_classes.datapoints",
+    "TimeSeriesFetchStats": "cognite.client.data_classes.datapoints",
+    "DatapointSubscription": "cognite.client.data_classes.datapoints_subscriptions",
+    "DatapointSubscriptionList": "cognite.client.data_classes.datapoints_subscriptions",
+    "DataPointSubscriptionUpdate": "cognite.client.data_classes.datapoints_subscriptions",
+    "DataPointSubscriptionWrite": "cognite.client.data_classes.datapoints_subscriptions",
+    "DatapointSubscriptionWriteList": "cognite.client.data_classes.datapoints_subscriptions",
+    "Document": "cognite.client.data_classes.documents",
+    "DocumentHighlight": "cognite.client.data_classes.documents",
+    "DocumentHighlightList": "cognite.client.data_classes.documents",
+    "DocumentList": "cognite.client.data_classes.documents",
+    "SourceFile": "cognite.client.data_classes.documents",
+    "EndTimeFilter": "cognite.client.data_classes.events",
+    "Event": "cognite.client.data_classes.events",
+    "EventFilter": "cognite.client.data_classes.events",
+    "EventList": "cognite.client.data_classes.events",
+    "EventUpdate": "cognite.client.data_classes.events",
+    "EventWrite": "cognite.client.data_classes.events",
+    "EventWriteList": "cognite.client.data_classes.events",
+    "ExtractionPipeline": "cognite.client.data_classes.extractionpipelines",
+    "ExtractionPipelineConfig": "cognite.client.data_classes.extractionpipelines",
+    "ExtractionPipelineConfigRevision": "cognite.client.data_classes.extractionpipelines",
+    "ExtractionPipelineConfigRevisionList": "cognite.client.data_classes.extractionpipelines",
+    "ExtractionPipelineConfigWrite": "cognite.client.data_classes.extractionpipelines",
+    "ExtractionPipelineConfigWriteList": "cognite.client.data_classes.extractionpipelines",
+    "ExtractionPipelineContact": "cognite.client.data_classes.extractionpipelines",
+    "ExtractionPipelineList": "cognite.client.data_classes.extractionpipelines",
+    "ExtractionPipelineRun": "cognite.client.data_classes.extractionpipelines",
+    "ExtractionPipelineRunFilter": "cognite.client.data_classes.extractionpipelines",
+    "ExtractionPipelineRunList": "cognite.client.data_classes.extractionpipelines",
+    "ExtractionPipelineRunWrite": "cognite.client.data_classes.extractionpipelines",
+    "ExtractionPipelineRunWriteList": "cognite.client.data_classes.extractionpipelines",
+    "ExtractionPipelineUpdate": "cognite.client.data_classes.extractionpipelines",
+    "ExtractionPipelineWrite": "cognite.client.data_classes.extractionpipelines",
+    "ExtractionPipelineWriteList": "cognite.client.data_classes.extractionpipelines",
+    "FileMetadata": "cognite.client.data_classes.files",
+    "FileMetadataFilter": "cognite.client.data_classes.files",
+    "FileMetadataList": "cognite.client.data_classes.files",
+    "FileMetadataUpdate": "cognite.client.data_classes.files",
+    "FileMetadataWrite": "cognite.client.data_classes.files",
+    "FileMetadataWriteList": "cognite.client.data_classes.files",
+    "FileMultipartUploadSession": "cognite.client.data_classes.files",
+    "Function": "cognite.client.data_classes.functions",
+    "FunctionCall": "cognite.client.data_classes.functions",
+    "FunctionCallList": "cognite.client.data_classes.functions",
+    "FunctionCallLog": "cognite.client.data_classes.functions",
+    "FunctionCallLogEntry": "cognite.client.data_classes.functions",
+    "FunctionFilter": "cognite.client.data_classes.functions",
+    "FunctionList": "cognite.client.data_classes.functions",
+    "FunctionSchedule": "cognite.client.data_classes.functions",
+    "FunctionSchedulesFilter": "cognite.client.data_classes.functions",
+    "FunctionSchedulesList": "cognite.client.data_classes.functions",
+    "FunctionScheduleWrite": "cognite.client.data_classes.functions",
+    "FunctionScheduleWriteList": "cognite.client.data_classes.functions",
+    "FunctionsLimits": "cognite.client.data_classes.functions",
+    "FunctionWrite": "cognite.client.data_classes.functions",
+    "FunctionWriteList": "cognite.client.data_classes.functions",
+    "CoordinateReferenceSystem": "cognite.client.data_classes.geospatial",
+    "CoordinateReferenceSystemList": "cognite.client.data_classes.geospatial",
+    "CoordinateReferenceSystemWrite": "cognite.client.data_classes.geospatial",
+    "CoordinateReferenceSystemWriteList": "cognite.client.data_classes.geospatial",
+    "Feature": "cognite.client.data_classes.geospatial",
+    "FeatureAggregate": "cognite.client.data_classes.geospatial",
+    "FeatureAggregateList": "cognite.client.data_classes.geospatial",
+    "FeatureList": "cognite.client.data_classes.geospatial",
+    "FeatureType": "cognite.client.data_classes.geospatial",
+    "FeatureTypeList": "cognite.client.data_classes.geospatial",
+    "FeatureTypePatch": "cognite.client.data_classes.geospatial",
+    "FeatureTypeWrite": "cognite.client.data_classes.geospatial",
+    "FeatureTypeWriteList": "cognite.client.data_classes.geospatial",
+    "FeatureWrite": "cognite.client.data_classes.geospatial",
+    "FeatureWriteList": "cognite.client.data_classes.geospatial",
+    "ALL_USER_ACCOUNTS": "cognite.client.data_classes.iam",
+    "ClientCredentials": "cognite.client.data_classes.iam",
+    "CreatedSession": "cognite.client.data_classes.iam",
+    "Group": "cognite.client.data_classes.iam",
+    "GroupList": "cognite.client.data_classes.iam",
+    "GroupWrite": "cognite.client.data_classes.iam",
+    "GroupWriteList": "cognite.client.data_classes.iam",
+    "RevokedSession": "cognite.client.data_classes.iam",
+    "RevokedSessionList": "cognite.client.data_classes.iam",
+    "SecurityCategory": "cognite.client.data_classes.iam",
+    "SecurityCategoryList": "cognite.client.data_classes.iam",
+    "SecurityCategoryWrite": "cognite.client.data_classes.iam",
+    "SecurityCategoryWriteList": "cognite.client.data_classes.iam",
+    "Session": "cognite.client.data_classes.iam",
+    "SessionList": "cognite.client.data_classes.iam",
+    "Label": "cognite.client.data_classes.labels",
+    "LabelDefinition": "cognite.client.data_classes.labels",
+    "LabelDefinitionFilter": "cognite.client.data_classes.labels",
+    "LabelDefinitionList": "cognite.client.data_classes.labels",
+    "LabelDefinitionWrite": "cognite.client.data_classes.labels",
+    "LabelFilter": "cognite.client.data_classes.labels",
+    "Limit": "cognite.client.data_classes.limits",
+    "LimitList": "cognite.client.data_classes.limits",
+    "MeteringData": "cognite.client.data_classes.metering",
+    "MeteringDataList": "cognite.client.data_classes.metering",
+    "MeteringDataPoint": "cognite.client.data_classes.metering",
+    "Database": "cognite.client.data_classes.raw",
+    "DatabaseList": "cognite.client.data_classes.raw",
+    "DatabaseWrite": "cognite.client.data_classes.raw",
+    "DatabaseWriteList": "cognite.client.data_classes.raw",
+    "Row": "cognite.client.data_classes.raw",
+    "RowList": "cognite.client.data_classes.raw",
+    "RowWrite": "cognite.client.data_classes.raw",
+    "RowWriteList": "cognite.client.data_classes.raw",
+    "Table": "cognite.client.data_classes.raw",
+    "TableList": "cognite.client.data_classes.raw",
+    "TableWrite": "cognite.client.data_classes.raw",
+    "TableWriteList": "cognite.client.data_classes.raw",
+    "Relationship": "cognite.client.data_classes.relationships",
+    "RelationshipFilter": "cognite.client.data_classes.relationships",
+    "RelationshipList": "cognite.client.data_classes.relationships",
+    "RelationshipUpdate": "cognite.client.data_classes.relationships",
+    "RelationshipWrite": "cognite.client.data_classes.relationships",
+    "RelationshipWriteList": "cognite.client.data_classes.relationships",
+    "Sequence": "cognite.client.data_classes.sequences",
+    "SequenceColumn": "cognite.client.data_classes.sequences",
+    "SequenceColumnList": "cognite.client.data_classes.sequences",
+    "SequenceColumnUpdate": "cognite.client.data_classes.sequences",
+    "SequenceColumnWrite": "cognite.client.data_classes.sequences",
+    "SequenceColumnWriteList": "cognite.client.data_classes.sequences",
+    "SequenceFilter": "cognite.client.data_classes.sequences",
+    "SequenceList": "cognite.client.data_classes.sequences",
+    "SequenceRow": "cognite.client.data_classes.sequences",
+    "SequenceRows": "cognite.client.data_classes.sequences",
+    "SequenceRowsList": "cognite.client.data_classes.sequences",
+    "SequenceUpdate": "cognite.client.data_classes.sequences",
+    "SequenceWrite": "cognite.client.data_classes.sequences",
+    "SequenceWriteList": "cognite.client.data_classes.sequences",
+    "AggregateResult": "cognite.client.data_classes.shared",
+    "AggregateUniqueValuesResult": "cognite.client.data_classes.shared",
+    "GeoLocation": "cognite.client.data_classes.shared",
+    "GeoLocationFilter": "cognite.client.data_classes.shared",
+    "Geometry": "cognite.client.data_classes.shared",
+    "GeometryFilter": "cognite.client.data_classes.shared",
+    "TimestampRange": "cognite.client.data_classes.shared",
+    "BoundingBox3D": "cognite.client.data_classes.three_d",
+    "RevisionCameraProperties": "cognite.client.data_classes.three_d",
+    "ThreeDAssetMapping": "cognite.client.data_classes.three_d",
+    "ThreeDAssetMappingList": "cognite.client.data_classes.three_d",
+    "ThreeDAssetMappingWrite": "cognite.client.data_classes.three_d",
+    "ThreeDAssetMappingWriteList": "cognite.client.data_classes.three_d",
+    "ThreeDModel": "cognite.client.data_classes.three_d",
+    "ThreeDModelList": "cognite.client.data_classes.three_d",
+    "ThreeDModelRevision": "cognite.client.data_classes.three_d",
+    "ThreeDModelRevisionList": "cognite.client.data_classes.three_d",
+    "ThreeDModelRevisionUpdate": "cognite.client.data_classes.three_d",
+    "ThreeDModelRevisionWrite": "cognite.client.data_classes.three_d",
+    "ThreeDModelRevisionWriteList": "cognite.client.data_classes.three_d",
+    "ThreeDModelUpdate": "cognite.client.data_classes.three_d",
+    "ThreeDModelWrite": "cognite.client.data_classes.three_d",
+    "ThreeDModelWriteList": "cognite.client.data_classes.three_d",
+    "ThreeDNode": "cognite.client.data_classes.three_d",
+    "ThreeDNodeList": "cognite.client.data_classes.three_d",
+    "TimeSeries": "cognite.client.data_classes.time_series",
+    "TimeSeriesFilter": "cognite.client.data_classes.time_series",
+    "TimeSeriesList": "cognite.client.data_classes.time_series",
+    "TimeSeriesUpdate": "cognite.client.data_classes.time_series",
+    "TimeSeriesWrite": "cognite.client.data_classes.time_series",
+    "TimeSeriesWriteList": "cognite.client.data_classes.time_series",
+    "Transformation": "cognite.client.data_classes.transformations",
+    "TransformationList": "cognite.client.data_classes.transformations",
+    "TransformationPreviewResult": "cognite.client.data_classes.transformations",
+    "TransformationUpdate": "cognite.client.data_classes.transformations",
+    "TransformationWrite": "cognite.client.data_classes.transformations",
+    "TransformationWriteList": "cognite.client.data_classes.transformations",
+    "OidcCredentials": "cognite.client.data_classes.transformations.common",
+    "RawTable": "cognite.client.data_classes.transformations.common",
+    "TransformationBlockedInfo": "cognite.client.data_classes.transformations.common",
+    "TransformationDestination": "cognite.client.data_classes.transformations.common",
+    "TransformationJob": "cognite.client.data_classes.transformations.jobs",
+    "TransformationJobFilter": "cognite.client.data_classes.transformations.jobs",
+    "TransformationJobList": "cognite.client.data_classes.transformations.jobs",
+    "TransformationJobMetric": "cognite.client.data_classes.transformations.jobs",
+    "TransformationJobMetricList": "cognite.client.data_classes.transformations.jobs",
+    "TransformationJobStatus": "cognite.client.data_classes.transformations.jobs",
+    "TransformationNotification": "cognite.client.data_classes.transformations.notifications",
+    "TransformationNotificationList": "cognite.client.data_classes.transformations.notifications",
+    "TransformationNotificationWrite": "cognite.client.data_classes.transformations.notifications",
+    "TransformationNotificationWriteList": "cognite.client.data_classes.transformations.notifications",
+    "TransformationSchedule": "cognite.client.data_classes.transformations.schedules",
+    "TransformationScheduleList": "cognite.client.data_classes.transformations.schedules",
+    "TransformationScheduleUpdate": "cognite.client.data_classes.transformations.schedules",
+    "TransformationScheduleWrite": "cognite.client.data_classes.transformations.schedules",
+    "TransformationScheduleWriteList": "cognite.client.data_classes.transformations.schedules",
+    "TransformationSchemaColumn": "cognite.client.data_classes.transformations.schema",
+    "TransformationSchemaColumnList": "cognite.client.data_classes.transformations.schema",
+    "UserProfile": "cognite.client.data_classes.user_profiles",
+    "UserProfileList": "cognite.client.data_classes.user_profiles",
+    "CDFTaskOutput": "cognite.client.data_classes.workflows",
+    "CDFTaskParameters": "cognite.client.data_classes.workflows",
+    "DynamicTaskOutput": "cognite.client.data_classes.workflows",
+    "DynamicTaskParameters": "cognite.client.data_classes.workflows",
+    "FunctionTaskOutput": "cognite.client.data_classes.workflows",
+    "FunctionTaskParameters": "cognite.client.data_classes.workflows",
+    "SimulationTaskOutput": "cognite.client.data_classes.workflows",
+    "SimulationTaskParameters": "cognite.client.data_classes.workflows",
+    "SubworkflowTaskParameters": "cognite.client.data_classes.workflows",
+    "TransformationTaskOutput": "cognite.client.data_classes.workflows",
+    "TransformationTaskParameters": "cognite.client.data_classes.workflows",
+    "UnknownWorkflowTaskOutput": "cognite.client.data_classes.workflows",
+    "UnknownWorkflowTaskParameters": "cognite.client.data_classes.workflows",
+    "Workflow": "cognite.client.data_classes.workflows",
+    "WorkflowDefinition": "cognite.client.data_classes.workflows",
+    "WorkflowDefinitionUpsert": "cognite.client.data_classes.workflows",
+    "WorkflowExecution": "cognite.client.data_classes.workflows",
+    "WorkflowExecutionDetailed": "cognite.client.data_classes.workflows",
+    "WorkflowExecutionList": "cognite.client.data_classes.workflows",
+    "WorkflowList": "cognite.client.data_classes.workflows",
+    "WorkflowTask": "cognite.client.data_classes.workflows",
+    "WorkflowTaskExecution": "cognite.client.data_classes.workflows",
+    "WorkflowTrigger": "cognite.client.data_classes.workflows",
+    "WorkflowTriggerList": "cognite.client.data_classes.workflows",
+    "WorkflowTriggerRun": "cognite.client.data_classes.workflows",
+    "WorkflowTriggerRunList": "cognite.client.data_classes.workflows",
+    "WorkflowTriggerUpsert": "cognite.client.data_classes.workflows",
+    "WorkflowTriggerUpsertList": "cognite.client.data_classes.workflows",
+    "WorkflowUpsert": "cognite.client.data_classes.workflows",
+    "WorkflowUpsertList": "cognite.client.data_classes.workflows",
+    "WorkflowVersion": "cognite.client.data_classes.workflows",
+    "WorkflowVersionId": "cognite.client.data_classes.workflows",
+    "WorkflowVersionList": "cognite.client.data_classes.workflows",
+    "WorkflowVersionUpsert": "cognite.client.data_classes.workflows",
+    "WorkflowVersionUpsertList": "cognite.client.data_classes.workflows",
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+__dir__ = lazy_module_dir(__name__)
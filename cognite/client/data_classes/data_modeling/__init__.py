@@ -1,145 +1,151 @@
 from __future__ import annotations
 
-from cognite.client.data_classes import aggregations, filters
-from cognite.client.data_classes.aggregations import AggregatedValue, Aggregation
-from cognite.client.data_classes.data_modeling import query
-from cognite.client.data_classes.data_modeling.containers import (
-    BTreeIndex,
-    BTreeIndexApply,
-    Constraint,
-    ConstraintApply,
-    Container,
-    ContainerApply,
-    ContainerApplyList,
-    ContainerList,
-    ContainerProperty,
-    ContainerPropertyApply,
-    ContainerUsedFor,
-    Index,
-    IndexApply,
-    InvertedIndex,
-    InvertedIndexApply,
-    RequiresConstraint,
-    RequiresConstraintApply,
-    UniquenessConstraint,
-    UniquenessConstraintApply,
-)
-from cognite.client.data_classes.data_modeling.data_models import (
-    DataModel,
-    DataModelApply,
-    DataModelApplyList,
-    DataModelFilter,
-    DataModelList,
-    DataModelsSort,
-)
-from cognite.client.data_classes.data_modeling.data_types import (
-    Boolean,
-    CDFExternalIdReference,
-    Date,
-    DirectRelation,
-    DirectRelationReference,
-    FileReference,
-    Float32,
-    Float64,
-    Int32,
-    Int64,
-    Json,
-    PropertyType,
-    SequenceReference,
-    Text,
-    TimeSeriesReference,
-    Timestamp,
-)
-from cognite.client.data_classes.data_modeling.debug import (
-    DebugNotice,
-    DebugNoticeList,
-    DebugParameters,
-    ExecutionPlan,
-    TranslatedQuery,
-)
-from cognite.client.data_classes.data_modeling.ids import (
-    ContainerId,
-    ContainerIdentifier,
-    DataModelId,
-    DataModelIdentifier,
-    DataModelingId,
-    EdgeId,
-    NodeId,
-    PropertyId,
-    VersionedDataModelingId,
-    ViewId,
-    ViewIdentifier,
-)
-from cognite.client.data_classes.data_modeling.instances import (
-    Edge,
-    EdgeApply,
-    EdgeApplyList,
-    EdgeApplyResult,
-    EdgeApplyResultList,
-    EdgeList,
-    EdgeListWithCursor,
-    InstanceApply,
-    InstancesApply,
-    InstancesApplyResult,
-    InstancesDeleteResult,
-    InstanceSort,
-    InstancesResult,
-    InvolvedContainers,
-    InvolvedViews,
-    Node,
-    NodeApply,
-    NodeApplyList,
-    NodeApplyResult,
-    NodeApplyResultList,
-    NodeList,
-    NodeListWithCursor,
-    NodeOrEdgeData,
-    PropertyOptions,
-    TypedEdge,
-    TypedEdgeApply,
-    TypedNode,
-    TypedNodeApply,
-)
-from cognite.client.data_classes.data_modeling.query import (
-    EdgeResultSetExpression,
-    EdgeResultSetExpressionSync,
-    Intersection,
-    NodeOrEdgeResultSetExpression,
-    NodeResultSetExpression,
-    NodeResultSetExpressionSync,
-    Query,
-    QueryResult,
-    QuerySync,
-    ResultSetExpression,
-    ResultSetExpressionSync,
-    Select,
-    SelectSync,
-    SetOperation,
-    SourceSelector,
-    Union,
-    UnionAll,
-)
-from cognite.client.data_classes.data_modeling.spaces import Space, SpaceApply, SpaceApplyList, SpaceList
-from cognite.client.data_classes.data_modeling.sync import SubscriptionContext
-from cognite.client.data_classes.data_modeling.views import (
-    ConnectionDefinition,
-    EdgeConnection,
-    EdgeConnectionApply,
-    MappedProperty,
-    MappedPropertyApply,
-    MultiEdgeConnection,
-    MultiEdgeConnectionApply,
-    MultiReverseDirectRelation,
-    MultiReverseDirectRelationApply,
-    RecordViewApply,
-    SingleHopConnectionDefinition,
-    View,
-    ViewApply,
-    ViewApplyList,
-    ViewFilter,
-    ViewList,
-)
-from cognite.client.data_classes.filters import Filter
+from typing import TYPE_CHECKING
+
+from cognite.client.utils._importing import lazy_module_dir, lazy_module_getattr
+
+if TYPE_CHECKING:
+    from cognite.client.data_classes import aggregations, filters
+    from cognite.client.data_classes.aggregations import AggregatedValue, Aggregation
+    from cognite.client.data_classes.data_modeling import query
+    from cognite.client.data_classes.data_modeling.containers import (
+        BTreeIndex,
+        BTreeIndexApply,
+        Constraint,
+        ConstraintApply,
+        Container,
+        ContainerApply,
+        ContainerApplyList,
+        ContainerList,
+        ContainerProperty,
+        ContainerPropertyApply,
+        ContainerUsedFor,
+        Index,
+        IndexApply,
+        InvertedIndex,
+        InvertedIndexApply,
+        RequiresConstraint,
+        RequiresConstraintApply,
+        UniquenessConstraint,
+        UniquenessConstraintApply,
+    )
+    from cognite.client.data_classes.data_modeling.data_models import (
+        DataModel,
+        DataModelApply,
+        DataModelApplyList,
+        DataModelFilter,
+        DataModelList,
+        DataModelsSort,
+    )
+    from cognite.client.data_classes.data_modeling.data_types import (
+        Boolean,
+        CDFExternalIdReference,
+        Date,
+        DirectRelation,
+        DirectRelationReference,
+        FileReference,
+        Float32,
+        Float64,
+        Int32,
+        Int64,
+        Json,
+        PropertyType,
+        SequenceReference,
+        Text,
+        TimeSeriesReference,
+        Timestamp,
+    )
+    from cognite.client.data_classes.data_modeling.debug import (
+        DebugNotice,
+        DebugNoticeList,
+        DebugParameters,
+        ExecutionPlan,
+        TranslatedQuery,
+    )
+    from cognite.client.data_classes.data_modeling.ids import (
+        ContainerId,
+        ContainerIdentifier,
+        DataModelId,
+        DataModelIdentifier,
+        DataModelingId,
+        EdgeId,
+        NodeId,
+        PropertyId,
+        VersionedDataModelingId,
+        ViewId,
+        ViewIdentifier,
+    )
+    from cognite.client.data_classes.data_modeling.instances import (
+        Edge,
+        EdgeApply,
+        EdgeApplyList,
+        EdgeApplyResult,
+        EdgeApplyResultList,
+        EdgeList,
+        EdgeListWithCursor,
+        InstanceApply,
+        InstancesApply,
+        InstancesApplyResult,
+        InstancesDeleteResult,
+        InstanceSort,
+        InstancesResult,
+        InvolvedContainers,
+        InvolvedViews,
+        Node,
+        NodeApply,
+        NodeApplyList,
+        NodeApplyResult,
+        NodeApplyResultList,
+        NodeList,
+        NodeListWithCursor,
+        NodeOrEdgeData,
+        PropertyOptions,
+        TypedEdge,
+        TypedEdgeApply,
+        TypedNode,
+        TypedNodeApply,
+    )
+    from cognite.client.data_classes.data_modeling.query import (
+        EdgeResultSetExpression,
+        EdgeResultSetExpressionSync,
+        Intersection,
+        NodeOrEdgeResultSetExpression,
+        NodeResultSetExpression,
+        NodeResultSetExpressionSync,
+        Query,
+        QueryResult,
+        QuerySync,
+        ResultSetExpression,
+        ResultSetExpressionSync,
+        Select,
+        SelectSync,
+        SetOperation,
+        SourceSelector,
+        Union,
+        UnionAll,
+    )
+    from cognite.client.data_classes.data_modeling.spaces import Space, SpaceApply, SpaceApplyList, SpaceList
+    from cognite.client.data_classes.data_modeling.sync import SubscriptionContext
+    from cognite.client.data_classes.data_modeling.views import (
+        ConnectionDefinition,
+        EdgeConnection,
+        EdgeConnectionApply,
+        MappedProperty,
+        MappedPropertyApply,
+        MultiEdgeConnection,
+        MultiEdgeConnectionApply,
+        MultiReverseDirectRelation,
+        MultiReverseDirectRelationApply,
+        RecordViewApply,
+        SingleHopConnectionDefinition,
+        View,
+        ViewApply,
+        ViewApplyList,
+        ViewFilter,
+        ViewList,
+    )
+    from cognite.client.data_classes.filters import Filter
+
 
 __all__ = [
     "AggregatedValue",
@@ -272,3 +278,139 @@ __all__ = [
     "filters",
     "query",
 ]
+
+# Importing all modules up front is slow, so names are imported on first access instead:
+_LAZY_IMPORTS = {
+    "aggregations": "cognite.client.data_classes.aggregations",
+    "filters": "cognite.client.data_classes.filters",
+    "AggregatedValue": "cognite.client.data_classes.aggregations",
+    "Aggregation": "cognite.client.data_classes.aggregations",
+    "query": "cognite.client.data_classes.data_modeling.query",
+    "BTreeIndex": "cognite.client.data_classes.data_modeling.containers",
+    "BTreeIndexApply": "cognite.client.data_classes.data_modeling.containers",
+    "Constraint": "cognite.client.data_classes.data_modeling.containers",
+    "ConstraintApply": "cognite.client.data_classes.data_modeling.containers",
+    "Container": "cognite.client.data_classes.data_modeling.containers",
+    "ContainerApply": "cognite.client.data_classes.data_modeling.containers",
+    "ContainerApplyList": "cognite.client.data_classes.data_modeling.containers",
+    "ContainerList": "cognite.client.data_classes.data_modeling.containers",
+    "ContainerProperty": "cognite.client.data_classes.data_modeling.containers",
+    "ContainerPropertyApply": "cognite.client.data_classes.data_modeling.containers",
+    "ContainerUsedFor": "cognite.client.data_classes.data_modeling.containers",
+    "Index": "cognite.client.data_classes.data_modeling.containers",
+    "IndexApply": "cognite.client.data_classes.data_modeling.containers",
+    "InvertedIndex": "cognite.client.data_classes.data_modeling.containers",
+    "InvertedIndexApply": "cognite.client.data_classes.data_modeling.containers",
+    "RequiresConstraint": "cognite.client.data_classes.data_modeling.containers",
+    "RequiresConstraintApply": "cognite.client.data_classes.data_modeling.containers",
+    "UniquenessConstraint": "cognite.client.data_classes.data_modeling.containers",
+    "UniquenessConstraintApply": "cognite.client.data_classes.data_modeling.containers",
+    "DataModel": "cognite.client.data_classes.data_modeling.data_models",
+    "DataModelApply": "cognite.client.data_classes.data_modeling.data_models",
+    "DataModelApplyList": "cognite.client.data_classes.data_modeling.data_models",
+    "DataModelFilter": "cognite.client.data_classes.data_modeling.data_models",
+    "DataModelList": "cognite.client.data_classes.data_modeling.data_models",
+    "DataModelsSort": "cognite.client.data_classes.data_modeling.data_models",
+    "Boolean": "cognite.client.data_classes.data_modeling.data_types",
+    "CDFExternalIdReference": "cognite.client.data_classes.data_modeling.data_types",
+    "Date": "cognite.client.data_classes.data_modeling.data_types",
+    "DirectRelation": "cognite.client.data_classes.data_modeling.data_types",
+    "DirectRelationReference": "cognite.client.data_classes.data_modeling.data_types",
+    "FileReference": "cognite.client.data_classes.data_modeling.data_types",
+    "Float32": "cognite.client.data_classes.data_modeling.data_types",
+    "Float64": "cognite.client.data_classes.data_modeling.data_types",
+    "Int32": "cognite.client.data_classes.data_modeling.data_types",
+    "Int64": "cognite.client.data_classes.data_modeling.data_types",
+    "Json": "cognite.client.data_classes.data_modeling.data_types",
+    "PropertyType": "cognite.client.data_classes.data_modeling.data_types",
+    "SequenceReference": "cognite.client.data_classes.data_modeling.data_types",
+    "Text": "cognite.client.data_classes.data_modeling.data_types",
+    "TimeSeriesReference": "cognite.client.data_classes.data_modeling.data_types",
+    "Timestamp": "cognite.client.data_classes.data_modeling.data_types",
+    "DebugNotice": "cognite.client.data_classes.data_modeling.debug",
+    "DebugNoticeList": "cognite.client.data_classes.data_modeling.debug",
+    "DebugParameters": "cognite.client.data_classes.data_modeling.debug",
+    "ExecutionPlan": "cognite.client.data_classes.data_modeling.debug",
+    "TranslatedQuery": "cognite.client.data_classes.data_modeling.debug",
+    "ContainerId": "cognite.client.data_classes.data_modeling.ids",
+    "ContainerIdentifier": "cognite.client.data_classes.data_modeling.ids",
+    "DataModelId": "cognite.client.data_classes.data_modeling.ids",
+    "DataModelIdentifier": "cognite.client.data_classes.data_modeling.ids",
+    "DataModelingId": "cognite.client.data_classes.data_modeling.ids",
+    "EdgeId": "cognite.client.data_classes.data_modeling.ids",
+    "NodeId": "cognite.client.data_classes.data_modeling.ids",
+    "PropertyId": "cognite.client.data_classes.data_modeling.ids",
+    "VersionedDataModelingId": "cognite.client.data_classes.data_modeling.ids",
+    "ViewId": "cognite.client.data_classes.data_modeling.ids",
+    "ViewIdentifier": "cognite.client.data_classes.data_modeling.ids",
+    "Edge": "cognite.client.data_classes.data_modeling.instances",
+    "EdgeApply": "cognite.client.data_classes.data_modeling.instances",
+    "EdgeApplyList": "cognite.client.data_classes.data_modeling.instances",
+    "EdgeApplyResult": "cognite.client.data_classes.data_modeling.instances",
+    "EdgeApplyResultList": "cognite.client.data_classes.data_modeling.instances",
+    "EdgeList": "cognite.client.data_classes.data_modeling.instances",
+    "EdgeListWithCursor": "cognite.client.data_classes.data_modeling.instances",
+    "InstanceApply": "cognite.client.data_classes.data_modeling.instances",
+    "InstancesApply": "cognite.client.data_classes.data_modeling.instances",
+    "InstancesApplyResult": "cognite.client.data_classes.data_modeling.instances",
+    "InstancesDeleteResult": "cognite.client.data_classes.data_modeling.instances",
+    "InstanceSort": "cognite.client.data_classes.data_modeling.instances",
+    "InstancesResult": "cognite.client.data_classes.data_modeling.instances",
+    "InvolvedContainers": "cognite.client.data_classes.data_modeling.instances",
+    "InvolvedViews": "cognite.client.data_classes.data_modeling.instances",
+    "Node": "cognite.client.data_classes.data_modeling.instances",
+    "NodeApply": "cognite.client.data_classes.data_modeling.instances",
+    "NodeApplyList": "cognite.client.data_classes.data_modeling.instances",
+    "NodeApplyResult": "cognite.client.data_classes.data_modeling.instances",
+    "NodeApplyResultList": "cognite.client.data_classes.data_modeling.instances",
+    "NodeList": "cognite.client.data_classes.data_modeling.instances",
+    "NodeListWithCursor": "cognite.client.data_classes.data_modeling.instances",
+    "NodeOrEdgeData": "cognite.client.data_classes.data_modeling.instances",
+    "PropertyOptions": "cognite.client.data_classes.data_modeling.instances",
+    "TypedEdge": "cognite.client.data_classes.data_modeling.instances",
+    "TypedEdgeApply": "cognite.client.data_classes.data_modeling.instances",
+    "TypedNode": "cognite.client.data_classes.data_modeling.instances",
+    "TypedNodeApply": "cognite.client.data_classes.data_modeling.instances",
+    "EdgeResultSetExpression": "cognite.client.data_classes.data_modeling.query",
+    "EdgeResultSetExpressionSync": "cognite.client.data_classes.data_modeling.query",
+    "Intersection": "cognite.client.data_classes.data_modeling.query",
+    "NodeOrEdgeResultSetExpression": "cognite.client.data_classes.data_modeling.query",
+    "NodeResultSetExpression": "cognite.client.data_classes.data_modeling.query",
+    "NodeResultSetExpressionSync": "cognite.client.data_classes.data_modeling.query",
+    "Query": "cognite.client.data_classes.data_modeling.query",
+    "QueryResult": "cognite.client.data_classes.data_modeling.query",
+    "QuerySync": "cognite.client.data_classes.data_modeling.query",
+    "ResultSetExpression": "cognite.client.data_classes.data_modeling.query",
+    "ResultSetExpressionSync": "cognite.client.data_classes.data_modeling.query",
+    "Select": "cognite.client.data_classes.data_modeling.query",
+    "SelectSync": "cognite.client.data_classes.data_modeling.query",
+    "SetOperation": "cognite.client.data_classes.data_modeling.query",
+    "SourceSelector": "cognite.client.data_classes.data_modeling.query",
+    "Union": "cognite.client.data_classes.data_modeling.query",
+    "UnionAll": "cognite.client.data_classes.data_modeling.query",
+    "Space": "cognite.client.data_classes.data_modeling.spaces",
+    "SpaceApply": "cognite.client.data_classes.data_modeling.spaces",
+    "SpaceApplyList": "cognite.client.data_classes.data_modeling.spaces",
+    "SpaceList": "cognite.client.data_classes.data_modeling.spaces",
+    "SubscriptionContext": "cognite.client.data_classes.data_modeling.sync",
+    "ConnectionDefinition": "cognite.client.data_classes.data_modeling.views",
+    "EdgeConnection": "cognite.client.data_classes.data_modeling.views",
+    "EdgeConnectionApply": "cognite.client.data_classes.data_modeling.views",
+    "MappedProperty": "cognite.client.data_classes.data_modeling.views",
+    "MappedPropertyApply": "cognite.client.data_classes.data_modeling.views",
+    "MultiEdgeConnection": "cognite.client.data_classes.data_modeling.views",
+    "MultiEdgeConnectionApply": "cognite.client.data_classes.data_modeling.views",
+    "MultiReverseDirectRelation": "cognite.client.data_classes.data_modeling.views",
+    "MultiReverseDirectRelationApply": "cognite.client.data_classes.data_modeling.views",
+    "RecordViewApply": "cognite.client.data_classes.data_modeling.views",
+    "SingleHopConnectionDefinition": "cognite.client.data_classes.data_modeling.views",
+    "View": "cognite.client.data_classes.data_modeling.views",
+    "ViewApply": "cognite.client.data_classes.data_modeling.views",
+    "ViewApplyList": "cognite.client.data_classes.data_modeling.views",
+    "ViewFilter": "cognite.client.data_classes.data_modeling.views",
+    "ViewList": "cognite.client.data_classes.data_modeling.views",
+    "Filter": "cognite.client.data_classes.filters",
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+__dir__ = lazy_module_dir(__name__)
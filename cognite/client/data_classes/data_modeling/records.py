@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from abc import ABC, abstractmethod
 from collections.abc import Sequence
 from copy import deepcopy
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any, Literal
 
 from typing_extensions import Self
@@ -18,6 +20,7 @@ from cognite.client.data_classes.data_modeling._validation import validate_prope
 from cognite.client.data_classes.data_modeling.data_types import UnitReference, UnitSystemReference
 from cognite.client.data_classes.data_modeling.ids import ContainerId
 from cognite.client.data_classes.data_modeling.instances import TypeInformation
+from cognite.client.utils._cursor_store import FileCursors, InMemoryCursors
 from cognite.client.utils._identifier import IdentifierSequenceCore
 from cognite.client.utils._identifier import RecordId as RecordId  # explicit re-export
 from cognite.client.utils.useful_types import SequenceNotStr
@@ -439,3 +442,105 @@ class SyncRecordList(CogniteResourceList[SyncRecord]):
             has_next=last_response["hasNext"],
             typing=typing,
         )
+
+
+class SyncRecordPartitionList(SyncRecordList):
+    """A page of :class:`SyncRecord` objects from a single partition of a stream, see :py:meth:`~RecordsAPI.sync_partitions`.
+
+    Args:
+        resources (Sequence[SyncRecord]): The records in this page.
+        cursor (str | None): Cursor to continue reading this partition from.
+        has_next (bool): Whether more changes are available in this partition beyond this page.
+        typing (TypeInformation | None): Property type information, present when the request was
+            made with ``include_typing=True``.
+        partition (int): The index of the partition the page was read from.
+    """
+
+    def __init__(
+        self,
+        resources: Sequence[SyncRecord],
+        cursor: str | None = None,
+        has_next: bool = False,
+        typing: TypeInformation | None = None,
+        partition: int = 0,
+    ) -> None:
+        super().__init__(resources, cursor=cursor, has_next=has_next, typing=typing)
+        self.partition = partition
+
+
+class RecordsCursorStore(ABC):
+    """Base class for storing sync cursors of a stream (one per partition), so that syncing can resume where it left off.
+
+    Implement this to store cursors somewhere else, e.g. in CDF RAW or a database.
+    """
+
+    @abstractmethod
+    def get_cursor(self, stream_id: str, partition: int) -> str | None:
+        """Get the stored cursor for a partition of a stream, or None if there is none."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def set_cursor(self, stream_id: str, partition: int, cursor: str) -> None:
+        """Store the cursor for a partition of a stream."""
+        raise NotImplementedError
+
+
+class InMemoryRecordsCursorStore(RecordsCursorStore):
+    """Stores sync cursors in memory, i.e. they are lost when the process exits."""
+
+    def __init__(self) -> None:
+        self._cursors = InMemoryCursors()
+
+    def get_cursor(self, stream_id: str, partition: int) -> str | None:
+        return self._cursors.get(stream_id, partition)
+
+    def set_cursor(self, stream_id: str, partition: int, cursor: str) -> None:
+        self._cursors.set(stream_id, partition, cursor)
+
+
+class FileRecordsCursorStore(RecordsCursorStore):
+    """Stores sync cursors in a local JSON file, which is rewritten (atomically) on every update.
+
+    Args:
+        path (str | Path): The file to store cursors in. Created if it does not exist.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._cursors = FileCursors(self.path)
+
+    def get_cursor(self, stream_id: str, partition: int) -> str | None:
+        return self._cursors.get(stream_id, partition)
+
+    def set_cursor(self, stream_id: str, partition: int, cursor: str) -> None:
+        self._cursors.set(stream_id, partition, cursor)
+
+
+@dataclass
+class RecordsWriterStats:
+    """Throughput statistics of a records writer, see :py:meth:`~RecordsAPI.create_writer`.
+
+    Args:
+        n_records_added (int): Number of records added to the writer.
+        n_records_written (int): Number of records written successfully.
+        n_records_failed (int): Number of records that could not be written. These are raised on the next call to
+            add, flush or close.
+        n_requests (int): Number of requests made, including failed ones.
+        n_requests_split (int): Number of failed requests that were split in two and retried, in order to write
+            all but the records causing the failure.
+        n_buffered_records (int): Number of records buffered or being written.
+        elapsed_seconds (float): Wall time since the first record was added.
+    """
+
+    n_records_added: int = 0
+    n_records_written: int = 0
+    n_records_failed: int = 0
+    n_requests: int = 0
+    n_requests_split: int = 0
+    n_buffered_records: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def records_per_second(self) -> float:
+        """Number of records written per second of wall time."""
+        return self.n_records_written / self.elapsed_seconds if self.elapsed_seconds else 0.0
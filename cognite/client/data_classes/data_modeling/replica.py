@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator, MutableMapping
+from typing import Any
+
+from cognite.client.data_classes.data_modeling.ids import NodeId
+from cognite.client.data_classes.data_modeling.instances import EdgeList, NodeList
+from cognite.client.data_classes.filters import Filter, PropertyReference, _dump_property
+from cognite.client.utils._text import to_camel_case
+
+_InstanceKey = tuple[str, str]  # (space, external ID)
+_Predicate = Callable[[dict[str, Any]], bool]
+
+_MISSING = object()
+_PROPERTY_FILTERS = frozenset({"equals", "in", "exists", "prefix", "range", "containsAny", "containsAll"})
+
+
+def _hashable(value: Any) -> Any:
+    # Direct relations are dicts and list properties are lists, neither of which can be used as dict keys:
+    if isinstance(value, dict):
+        return tuple(sorted((k, _hashable(v)) for k, v in value.items()))
+    elif isinstance(value, list):
+        return tuple(map(_hashable, value))
+    return value
+
+
+def _as_property_path(property: PropertyReference | list[str] | tuple[str, ...]) -> tuple[str, ...]:
+    match path := tuple(_dump_property(property, camel_case=False)):
+        case ("node" | "edge", _) | (_, _, _):
+            return path
+    raise ValueError(
+        f"Unable to evaluate property reference {list(path)} locally, expected e.g. ['node', 'externalId'] or "
+        "[space, 'view_xid/version', property]"
+    )
+
+
+def _resolve_property(item: dict[str, Any], path: tuple[str, ...]) -> Any:
+    if len(path) == 2:
+        if item.get("instanceType", "node") != path[0]:
+            return _MISSING
+        return item.get(to_camel_case(path[1]), _MISSING)
+    space, view_and_version, prop = path
+    value = item.get("properties", {}).get(space, {}).get(view_and_version, {}).get(prop)
+    return _MISSING if value is None else value
+
+
+def _compare(value: Any, other: Any, op: str) -> bool:
+    try:
+        match op:
+            case "gt":
+                return value > other
+            case "gte":
+                return value >= other
+            case "lt":
+                return value < other
+            case "lte":
+                return value <= other
+    except TypeError:
+        pass
+    return False
+
+
+def _check_raw_value(value: Any) -> Any:
+    if isinstance(value, dict) and ("property" in value or "parameter" in value) and len(value) == 1:
+        raise ValueError(f"Filter values referencing properties or parameters can not be evaluated locally: {value}")
+    return value
+
+
+def _compile_filter(dumped: dict[str, Any]) -> _Predicate:
+    ((name, body),) = dumped.items()
+    match name:
+        case "and":
+            predicates = [_compile_filter(flt) for flt in body]
+            return lambda item: all(pred(item) for pred in predicates)
+        case "or":
+            predicates = [_compile_filter(flt) for flt in body]
+            return lambda item: any(pred(item) for pred in predicates)
+        case "not":
+            predicate = _compile_filter(body)
+            return lambda item: not predicate(item)
+        case "matchAll":
+            return lambda item: True
+        case "hasData":
+            if any(ref["type"] == "container" for ref in body):
+                raise ValueError("HasData with containers can not be evaluated locally, only views are supported")
+            views = [(ref["space"], f"{ref['externalId']}/{ref['version']}") for ref in body]
+            return lambda item: any(view in item.get("properties", {}).get(space, {}) for space, view in views)
+
+    if name not in _PROPERTY_FILTERS:
+        raise ValueError(f"The filter {name!r} can not be evaluated locally")
+    path = _as_property_path(body["property"])
+    match name:
+        case "equals":
+            value = _check_raw_value(body["value"])
+            return lambda item: _resolve_property(item, path) == value
+        case "in":
+            values = _check_raw_value(body["values"])
+            return lambda item: (v := _resolve_property(item, path)) is not _MISSING and v in values
+        case "exists":
+            return lambda item: _resolve_property(item, path) is not _MISSING
+        case "prefix":
+            prefix = _check_raw_value(body["value"])
+            if isinstance(prefix, str):
+                return lambda item: isinstance(v := _resolve_property(item, path), str) and v.startswith(prefix)
+            return lambda item: isinstance(v := _resolve_property(item, path), list) and v[: len(prefix)] == prefix
+        case "range":
+            bounds = [(op, _check_raw_value(body[op])) for op in ("gt", "gte", "lt", "lte") if op in body]
+            return lambda item: (
+                (v := _resolve_property(item, path)) is not _MISSING
+                and all(_compare(v, bound, op) for op, bound in bounds)
+            )
+        case "containsAny":
+            values = _check_raw_value(body["values"])
+            return lambda item: isinstance(v := _resolve_property(item, path), list) and any(x in v for x in values)
+        case _:  # containsAll
+            values = _check_raw_value(body["values"])
+            return lambda item: isinstance(v := _resolve_property(item, path), list) and all(x in v for x in values)
+
+
+class InstanceReplica(MutableMapping[_InstanceKey, dict[str, Any]]):
+    """An in-memory store of instances (as returned by the API), indexed for fast lookups.
+
+    Instances are keyed by (space, external ID). For edges, adjacency indexes on start- and end node are kept,
+    and indexes on any property can be added with :meth:`create_index`. All indexes are kept up to date as
+    instances are added or removed.
+
+    Args:
+        items (Iterable[dict[str, Any]]): Instances to add initially, as dumped by the API (camel cased).
+    """
+
+    def __init__(self, items: Iterable[dict[str, Any]] = ()) -> None:
+        self._items: dict[_InstanceKey, dict[str, Any]] = {}
+        self._by_start_node: defaultdict[_InstanceKey, set[_InstanceKey]] = defaultdict(set)
+        self._by_end_node: defaultdict[_InstanceKey, set[_InstanceKey]] = defaultdict(set)
+        self._property_indexes: dict[tuple[str, ...], defaultdict[Any, set[_InstanceKey]]] = {}
+        for item in items:
+            self[item["space"], item["externalId"]] = item
+
+    def __getitem__(self, key: _InstanceKey) -> dict[str, Any]:
+        return self._items[key]
+
+    def __setitem__(self, key: _InstanceKey, item: dict[str, Any]) -> None:
+        if key in self._items:
+            self._unindex(key, self._items[key])
+        self._items[key] = item
+        if item.get("instanceType") == "edge":
+            self._by_start_node[item["startNode"]["space"], item["startNode"]["externalId"]].add(key)
+            self._by_end_node[item["endNode"]["space"], item["endNode"]["externalId"]].add(key)
+        for path, index in self._property_indexes.items():
+            if (value := _resolve_property(item, path)) is not _MISSING:
+                index[_hashable(value)].add(key)
+
+    def __delitem__(self, key: _InstanceKey) -> None:
+        self._unindex(key, self._items.pop(key))
+
+    def __iter__(self) -> Iterator[_InstanceKey]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def clear(self) -> None:
+        self._items.clear()
+        self._by_start_node.clear()
+        self._by_end_node.clear()
+        for index in self._property_indexes.values():
+            index.clear()
+
+    def _unindex(self, key: _InstanceKey, item: dict[str, Any]) -> None:
+        if item.get("instanceType") == "edge":
+            self._discard(self._by_start_node, (item["startNode"]["space"], item["startNode"]["externalId"]), key)
+            self._discard(self._by_end_node, (item["endNode"]["space"], item["endNode"]["externalId"]), key)
+        for path, index in self._property_indexes.items():
+            if (value := _resolve_property(item, path)) is not _MISSING:
+                self._discard(index, _hashable(value), key)
+
+    @staticmethod
+    def _discard(index: defaultdict[Any, set[_InstanceKey]], value: Any, key: _InstanceKey) -> None:
+        if (keys := index.get(value)) is not None:
+            keys.discard(key)
+            if not keys:
+                del index[value]
+
+    def create_index(self, property: PropertyReference) -> None:
+        """Create a hash index on a property, speeding up :meth:`filter` for Equals- and In-filters on it.
+
+        Args:
+            property (PropertyReference): The property to index, e.g. ``my_view.as_property_ref("name")``
+                or ``["node", "type"]``.
+        """
+        path = _as_property_path(property)
+        if path in self._property_indexes:
+            return
+        self._property_indexes[path] = index = defaultdict(set)
+        for key, item in self._items.items():
+            if (value := _resolve_property(item, path)) is not _MISSING:
+                index[_hashable(value)].add(key)
+
+    def edges_from(self, node: NodeId | tuple[str, str]) -> EdgeList:
+        """Get all edges starting in the given node.
+
+        Args:
+            node (NodeId | tuple[str, str]): The start node.
+
+        Returns:
+            EdgeList: The edges starting in the node.
+        """
+        return EdgeList._load([self._items[key] for key in self._by_start_node.get(self._as_key(node), ())])
+
+    def edges_to(self, node: NodeId | tuple[str, str]) -> EdgeList:
+        """Get all edges ending in the given node.
+
+        Args:
+            node (NodeId | tuple[str, str]): The end node.
+
+        Returns:
+            EdgeList: The edges ending in the node.
+        """
+        return EdgeList._load([self._items[key] for key in self._by_end_node.get(self._as_key(node), ())])
+
+    def filter(self, filter: Filter) -> NodeList | EdgeList:
+        """Get all instances matching the filter, evaluated locally.
+
+        Supported filters are And, Or, Not, Equals, In, Range, Prefix, Exists, ContainsAny, ContainsAll, MatchAll
+        and HasData (views only), on node/edge attributes or view properties. When an Equals- or In-filter (possibly
+        as part of a top-level And-filter) targets an indexed property, only the matching instances are evaluated.
+
+        Args:
+            filter (Filter): The filter to evaluate.
+
+        Returns:
+            NodeList | EdgeList: The matching instances.
+        """
+        dumped = filter.dump(camel_case_property=False)
+        predicate = _compile_filter(dumped)
+        candidates = self._find_candidates(dumped)
+        items = candidates if candidates is not None else self._items.keys()
+        matches = [self._items[key] for key in items if predicate(self._items[key])]
+        is_edges = next(iter(self._items.values()), {}).get("instanceType") == "edge"
+        return (EdgeList if is_edges else NodeList)._load(matches)
+
+    def _find_candidates(self, dumped: dict[str, Any]) -> set[_InstanceKey] | None:
+        # Returns a superset of the matching instances if an index can be used, else None:
+        ((name, body),) = dumped.items()
+        if name == "and":
+            candidate_sets = [c for flt in body if (c := self._find_candidates(flt)) is not None]
+            return set.intersection(*candidate_sets) if candidate_sets else None
+        elif name not in ("equals", "in"):
+            return None
+        if (index := self._property_indexes.get(_as_property_path(body["property"]))) is None:
+            return None
+        values = [body["value"]] if name == "equals" else body["values"]
+        return set().union(*(index.get(_hashable(value), ()) for value in values))
+
+    @staticmethod
+    def _as_key(node: NodeId | tuple[str, str]) -> _InstanceKey:
+        if isinstance(node, NodeId):
+            return node.space, node.external_id
+        return node
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import asyncio
+import gzip
 import hashlib
+import io
 import logging
+from collections.abc import Iterable, Iterator, Mapping
 from contextlib import AbstractAsyncContextManager
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
@@ -10,16 +14,21 @@ from typing import TYPE_CHECKING, Any, NoReturn
 from cognite.client._version import __version__ as sdk_version
 from cognite.client.data_classes.data_modeling.instances import EdgeList, NodeList
 from cognite.client.data_classes.data_modeling.query import QueryResult, QuerySync
+from cognite.client.data_classes.data_modeling.replica import InstanceReplica
 from cognite.client.exceptions import CogniteAPIError, CogniteNotFoundError
 from cognite.client.utils import _json_extended as json
+from cognite.client.utils._text import random_string
 
 if TYPE_CHECKING:
-    import asyncio
-
     from cognite.client._api.data_modeling.instances import InstancesAPI
 
 logger = logging.getLogger(__name__)
 
+_InstanceKey = tuple[str, str]  # (space, external ID)
+# Each line in a snapshot file: [result-expression key, space, external ID, instance dump or null if deleted]:
+_SnapshotLine = tuple[str, str, str, dict[str, Any] | None]
+_SNAPSHOT_FORMAT = "jsonl-gzip"
+
 
 @dataclass
 class SubscriptionContext:
@@ -48,6 +57,11 @@ class SyncSessionWithCache(AbstractAsyncContextManager["SyncSessionWithCache"]):
     On entry the session downloads the backup file from CDF and restores the instance data and
     previous cursor positions if the query hash matches, allowing you to immediately continue
     syncing instances from where your last session left off (no need for a full backfill).
+
+    Backups are stored as gzip-compressed JSON lines. A full snapshot is written to the backup file,
+    while subsequent backups only upload the instances changed since the previous one, as numbered
+    delta files (``<file_external_id>-delta-<n>``). Every ``compact_every`` deltas, a new full snapshot
+    is written and the deltas are deleted.
     """
 
     def __init__(
@@ -59,6 +73,7 @@ class SyncSessionWithCache(AbstractAsyncContextManager["SyncSessionWithCache"]):
         security_category: int,
         backup_every: timedelta | None,
         backup_on_exit: bool,
+        compact_every: int = 10,
     ) -> None:
         self._api = api
         self._query = query
@@ -66,6 +81,7 @@ class SyncSessionWithCache(AbstractAsyncContextManager["SyncSessionWithCache"]):
         self._security_category = security_category
         self._backup_every = backup_every
         self._backup_on_exit = backup_on_exit
+        self._compact_every = compact_every
 
         # Populated on enter:
         self._query_hash: str
@@ -73,8 +89,13 @@ class SyncSessionWithCache(AbstractAsyncContextManager["SyncSessionWithCache"]):
 
         # Runtime state
         self._cursors: dict[str, str] = {}
-        self._instances: dict[str, list[dict[str, Any]]] = {}
+        self._instances: dict[str, InstanceReplica] = {}
         self._has_changes_since_backup: bool = False
+        # Backup state: changes not yet part of any backup (None meaning deleted), the random generation
+        # of the current full snapshot (deltas are only valid for it) and the number of deltas written:
+        self._changes: dict[str, dict[_InstanceKey, dict[str, Any] | None]] = {}
+        self._generation: str | None = None
+        self._n_deltas: int = 0
         self._entered: bool = False
         # When the user is running with sync_mode="two_phase" (default), the backfill phase may be done
         # (we don't know), so we'll fetch two consecutive batches with "less than limit" before we consider
@@ -140,7 +161,7 @@ class SyncSessionWithCache(AbstractAsyncContextManager["SyncSessionWithCache"]):
             KeyError: If *key* is not found.
             ValueError: If the data stored under *key* contains edges, not nodes.
         """
-        items = self._instances[key]
+        items = list(self._instances[key].values())
         if items and items[0].get("instanceType") == "edge":
             raise ValueError(f"Key {key!r} contains edges, not nodes. Use get_edges() instead.")
         return NodeList._load(items)
@@ -158,16 +179,54 @@ class SyncSessionWithCache(AbstractAsyncContextManager["SyncSessionWithCache"]):
             KeyError: If *key* is not found.
             ValueError: If the data stored under *key* contains nodes, not edges.
         """
-        items = self._instances[key]
+        items = list(self._instances[key].values())
         if items and items[0].get("instanceType") != "edge":
             raise ValueError(f"Key {key!r} contains nodes, not edges. Use get_nodes() instead.")
         return EdgeList._load(items)
 
+    def get_replica(self, key: str) -> InstanceReplica:
+        """Return the indexed in-memory store of instances for the given result-expression key.
+
+        The replica is kept up to date on every sync, and supports lookups by (space, external ID), edges by start- or
+        end node, and locally evaluated filters (with optional property indexes), without calling the API.
+
+        Args:
+            key (str): A key from ``query.select``.
+
+        Returns:
+            InstanceReplica: The live replica of instances for that key.
+
+        Raises:
+            KeyError: If *key* is not in ``query.select``.
+
+        Examples:
+
+            Find open work orders and the edges pointing to them, from the local replica:
+
+                >>> from cognite.client.data_classes.filters import Equals
+                >>> async with session:  # doctest: +SKIP
+                ...     await session.sync_until_live()
+                ...     work_orders = session.get_replica("work_orders")
+                ...     work_orders.create_index(my_view.as_property_ref("status"))
+                ...     open_orders = work_orders.filter(
+                ...         Equals(my_view.as_property_ref("status"), "open")
+                ...     )
+                ...     edges = session.get_replica("assigned_to").edges_to(open_orders[0].as_id())
+        """
+        if key not in self._query.select:
+            raise KeyError(key)
+        if key not in self._instances:
+            self._instances[key] = InstanceReplica()
+        return self._instances[key]
+
     async def invalidate(self) -> None:
         """Clear all in-memory state and immediately overwrite the CDF backup file."""
         self._cursors = {}
         self._query.cursors = {}
-        self._instances = {}
+        for replica in self._instances.values():
+            replica.clear()  # Cleared in-place to keep any property indexes
+        self._changes = {}
+        self._generation = None  # Forces a new full snapshot
         self._has_changes_since_backup = True
         await self._backup_to_cdf()
 
@@ -194,57 +253,176 @@ class SyncSessionWithCache(AbstractAsyncContextManager["SyncSessionWithCache"]):
 
     def _merge_result(self, sync_result: QueryResult) -> None:
         for key, sync_list in sync_result.items():
-            cached_by_id: dict[tuple[str, str], dict[str, Any]] = {
-                (item["space"], item["externalId"]): item for item in self._instances.get(key, [])
-            }
+            cached_by_id = self.get_replica(key)
+            changes = self._changes.setdefault(key, {})
             # Deletes first: an instance may be deleted and re-created in the same batch,
             # so we must not let a delete that appears after a re-create win.
             for item in sync_list:
                 if item.deleted_time is not None:
                     cached_by_id.pop((item.space, item.external_id), None)
+                    changes[item.space, item.external_id] = None
             for item in sync_list:
                 if item.deleted_time is None:
-                    cached_by_id[(item.space, item.external_id)] = item.dump(camel_case=True)
-            self._instances[key] = list(cached_by_id.values())
+                    dumped = item.dump(camel_case=True)
+                    cached_by_id[item.space, item.external_id] = changes[item.space, item.external_id] = dumped
 
-    async def _load_from_cdf(self) -> None:
+    def _delta_file_external_id(self, sequence: int) -> str:
+        return f"{self._file_external_id}-delta-{sequence}"
+
+    async def _download_snapshot(self, external_id: str) -> bytes | None:
         try:
-            cached_bytes = await self._api._cognite_client.files.download_bytes(external_id=self._file_external_id)
+            return await self._api._cognite_client.files.download_bytes(external_id=external_id)
         except CogniteNotFoundError:
+            return None
+
+    async def _load_from_cdf(self) -> None:
+        if (cached_bytes := await self._download_snapshot(self._file_external_id)) is None:
             logger.info(f"No existing cache file {self._file_external_id!r}, will create on first backup")
             return
 
+        if not cached_bytes.startswith(b"\x1f\x8b"):  # gzip magic number
+            self._load_legacy_json(cached_bytes)
+            return
+
+        if (header := self._peek_header(cached_bytes)).get("hash") != self._query_hash:
+            logger.warning(f"Cache hash mismatch for {self._file_external_id!r}, starting fresh")
+            return
+
+        instances: dict[str, InstanceReplica] = {}
+        await asyncio.to_thread(self._read_snapshot, cached_bytes, instances)
+
+        # Deltas are applied in order, until one is missing or belongs to an older full snapshot:
+        n_deltas = 0
+        while (delta_bytes := await self._download_snapshot(self._delta_file_external_id(n_deltas + 1))) is not None:
+            delta_header = self._peek_header(delta_bytes)
+            if delta_header.get("generation") != header["generation"] or delta_header.get("sequence") != n_deltas + 1:
+                break
+            await asyncio.to_thread(self._read_snapshot, delta_bytes, instances)
+            n_deltas += 1
+            header["cursors"] = delta_header["cursors"]
+
+        self._instances = instances
+        self._cursors = header["cursors"]
+        self._generation, self._n_deltas = header["generation"], n_deltas
+        n_instances = sum(len(v) for v in self._instances.values())
+        logger.info(
+            f"Restored cache state from CDF file {self._file_external_id!r} ({n_instances:,} instances, "
+            f"{n_deltas} delta(s))"
+        )
+
+    def _load_legacy_json(self, cached_bytes: bytes) -> None:
+        # Backups made by SDK versions before the snapshot format was introduced:
         cached_data = json.loads(cached_bytes.decode("utf-8"))
         if cached_data.get("hash") != self._query_hash:
             logger.warning(f"Cache hash mismatch for {self._file_external_id!r}, starting fresh")
             return
 
-        self._instances = cached_data["instances"]
+        self._instances = {key: InstanceReplica(items) for key, items in cached_data["instances"].items()}
         self._cursors = cached_data["cursors"]
+        # The next backup must be a full snapshot in the new format:
+        self._has_changes_since_backup = True
         n_instances = sum(len(v) for v in self._instances.values())
         logger.info(f"Restored cache state from CDF file {self._file_external_id!r} ({n_instances:,} instances)")
 
     async def _backup_to_cdf(self) -> None:
+        write_full = self._generation is None or self._n_deltas >= self._compact_every
+        generation = random_string(16) if write_full else self._generation
+        sequence = 0 if write_full else self._n_deltas + 1
+        header = {
+            "format": _SNAPSHOT_FORMAT,
+            "hash": self._query_hash,
+            "generation": generation,
+            "sequence": sequence,
+            "cursors": dict(self._cursors),
+            # We add the SDK version in case we ever need to evolve (break) the format of the cache file,
+            # then we can reason based on current- vs. cached SDK version:
+            "sdk-version": sdk_version,
+        }
+        # The state may be changed by syncing while we await the backup, so we snapshot it before the first await.
+        # Changes merged from here on are part of the next backup:
+        changes, self._changes = self._changes, {}
+        snapshot: Mapping[str, Mapping[_InstanceKey, dict[str, Any] | None]]
+        if write_full:
+            snapshot = self._instances
+            external_id = self._file_external_id
+        else:
+            snapshot = changes
+            external_id = self._delta_file_external_id(sequence)
+        lines: list[_SnapshotLine] = [
+            (key, *instance_key, item) for key, items in snapshot.items() for instance_key, item in items.items()
+        ]
+        uploaded = False
         try:
-            cache_data: dict[str, Any] = {
-                "hash": self._query_hash,
-                "cursors": self._cursors,
-                "instances": self._instances,
-                # We add the SDK version in case we ever need to evolve (break) the format of the cache file,
-                # then we can reason based on current- vs. cached SDK version:
-                "sdk-version": sdk_version,
-            }
+            content = await asyncio.to_thread(self._write_snapshot, header, lines)
             await self._api._cognite_client.files.upload_bytes(
-                content=json.dumps(cache_data).encode("utf-8"),
-                name=self._file_external_id,
-                external_id=self._file_external_id,
-                mime_type="application/json",
+                content=content,
+                name=external_id,
+                external_id=external_id,
+                mime_type="application/gzip",
                 security_categories=[self._security_category],
                 overwrite=True,
             )
-            logger.info(f"Backed up cache to CDF file {self._file_external_id!r}")
+            uploaded = True
+            logger.info(f"Backed up cache to CDF file {external_id!r}")
         except CogniteAPIError as e:
-            logger.warning(f"Failed to back up to CDF Files ({self._file_external_id!r}): {e}. In-memory state intact.")
+            logger.warning(f"Failed to back up to CDF Files ({external_id!r}): {e}. In-memory state intact.")
+            return
+        finally:
+            if not uploaded:
+                # Changes are kept, so they'll be part of the next backup:
+                self._restore_changes(changes)
+
+        if not write_full:
+            self._n_deltas = sequence
+            return
+
+        stale_deltas = [self._delta_file_external_id(seq) for seq in range(1, self._n_deltas + 1)]
+        self._generation, self._n_deltas = generation, 0
+        if stale_deltas:
+            try:
+                # Not strictly needed, as deltas from an older generation are ignored on load:
+                await self._api._cognite_client.files.delete(external_id=stale_deltas, ignore_unknown_ids=True)
+            except CogniteAPIError as e:
+                logger.warning(f"Failed to delete compacted delta files: {e}")
+
+    def _restore_changes(self, changes: dict[str, dict[_InstanceKey, dict[str, Any] | None]]) -> None:
+        # Changes merged after the backup started are newer, so they take precedence:
+        for key, items in changes.items():
+            self._changes[key] = {**items, **self._changes.get(key, {})}
+
+    @staticmethod
+    def _write_snapshot(header: dict[str, Any], lines: Iterable[_SnapshotLine]) -> bytes:
+        buffer = io.BytesIO()
+        # A moderate compression level, as the default (9) is much slower for little gain:
+        with gzip.GzipFile(fileobj=buffer, mode="wb", compresslevel=6) as stream:
+            stream.write(json.dumps(header).encode("utf-8") + b"\n")
+            for line in lines:
+                stream.write(json.dumps(line).encode("utf-8") + b"\n")
+        return buffer.getvalue()
+
+    @staticmethod
+    def _iterate_snapshot(content: bytes) -> Iterator[Any]:
+        # Decompresses and decodes one line at a time, so the full snapshot is never in memory as text:
+        with gzip.GzipFile(fileobj=io.BytesIO(content), mode="rb") as stream:
+            for line in stream:
+                yield json.loads(line)
+
+    @classmethod
+    def _peek_header(cls, content: bytes) -> dict[str, Any]:
+        return next(cls._iterate_snapshot(content))
+
+    @classmethod
+    def _read_snapshot(cls, content: bytes, instances: dict[str, InstanceReplica]) -> dict[str, Any]:
+        lines = cls._iterate_snapshot(content)
+        header = next(lines)
+        for key, space, external_id, item in lines:
+            if key not in instances:
+                instances[key] = InstanceReplica()
+            if item is None:
+                instances[key].pop((space, external_id), None)
+            else:
+                instances[key][space, external_id] = item
+        return header
 
     @staticmethod
     def _compute_query_hash(query: QuerySync) -> str:
@@ -6,7 +6,7 @@ import json
 from abc import abstractmethod
 from collections import ChainMap, defaultdict
 from collections.abc import Iterator, Sequence
-from dataclasses import InitVar, dataclass, fields
+from dataclasses import InitVar, dataclass, field, fields
 from enum import IntEnum
 from functools import cached_property, partial
 from types import MappingProxyType
@@ -29,6 +29,7 @@ from cognite.client.data_classes.datapoint_aggregates import (
     Aggregate,
 )
 from cognite.client.utils import _json_extended as _json
+from cognite.client.utils._arrow_helpers import concat_dps_arrow_tables, convert_dps_to_arrow_table
 from cognite.client.utils._auxiliary import find_duplicates
 from cognite.client.utils._identifier import Identifier, InstanceId
 from cognite.client.utils._importing import local_import
@@ -59,6 +60,7 @@ if NUMPY_IS_AVAILABLE:
 if TYPE_CHECKING:
     import numpy.typing as npt
     import pandas
+    import pyarrow
 
     from cognite.client._api.datapoint_tasks import BaseTaskOrchestrator
 
@@ -266,6 +268,7 @@ class DatapointsQuery:
             self._identifier = Identifier(NodeId(*self._identifier.as_primitive().as_tuple()))
         # Store the possibly custom granularity (we support more than the API and a translation is done)
         self._original_granularity = self.granularity
+        self._density_profile: list[tuple[int, int, int]] | None = None
 
     def __eq__(self, other: object) -> bool:
         # Note: Instances representing identical queries should -not- compare equal as this would mean we
@@ -351,6 +354,15 @@ class DatapointsQuery:
         assert isinstance(value, int)
         self._max_query_limit = value
 
+    @property
+    def density_profile(self) -> list[tuple[int, int, int]] | None:
+        # Coarse (bucket start, bucket end, count) of the datapoints in the query time range, when planned up front:
+        return self._density_profile
+
+    @density_profile.setter
+    def density_profile(self, value: list[tuple[int, int, int]] | None) -> None:
+        self._density_profile = value
+
     @property
     def capped_limit(self) -> int:
         if self.limit is None:
@@ -439,6 +451,65 @@ class LatestDatapointQuery:
         return self._identifier  # type: ignore [attr-defined]
 
 
+@dataclass
+class TimeSeriesFetchStats:
+    """Statistics from fetching the datapoints of a single time series, see :py:class:`DatapointsFetchStats`.
+
+    Args:
+        identifier (dict[str, Any]): The identifier of the time series, e.g. ``{"external_id": "foo"}``.
+        n_requests (int): Number of requests returning datapoints for the time series.
+        bytes_received (int): Number of bytes (encoded as protobuf) received for the time series.
+        n_datapoints (int): Number of datapoints received for the time series.
+    """
+
+    identifier: dict[str, Any]
+    n_requests: int = 0
+    bytes_received: int = 0
+    n_datapoints: int = 0
+
+
+@dataclass
+class DatapointsFetchStats:
+    """Statistics from fetching datapoints, passed to the callback set in ``global_config.datapoints_fetch_stats_callback``.
+
+    Args:
+        strategy (str): Name of the fetch strategy used, ``EagerDpsFetcher`` or ``ChunkingDpsFetcher``.
+        n_queries (int): Number of queries fetched.
+        n_subtasks (int): Number of subtasks the queries were split into up front (each fetching part of a time range).
+        n_subtasks_split (int): Number of additional subtasks created while fetching, by splitting up dense time ranges.
+        n_requests (int): Number of requests made.
+        bytes_received (int): Total size of all responses in bytes.
+        semaphore_wait_seconds (float): Time spent by requests waiting for the datapoints (read) semaphore, summed over
+            all requests (thus it may exceed the wall time of the fetch).
+        decode_seconds (float): Time spent decoding (protobuf) responses.
+        fetch_seconds (float): Wall time of the fetch.
+        time_series (list[TimeSeriesFetchStats]): Statistics for each time series fetched.
+        failed (bool): Whether the fetch raised an error. If so, the statistics only cover the requests made before it.
+    """
+
+    strategy: str
+    n_queries: int
+    n_subtasks: int = 0
+    n_subtasks_split: int = 0
+    n_requests: int = 0
+    bytes_received: int = 0
+    semaphore_wait_seconds: float = 0.0
+    decode_seconds: float = 0.0
+    fetch_seconds: float = 0.0
+    time_series: list[TimeSeriesFetchStats] = field(default_factory=list)
+    failed: bool = False
+
+    @property
+    def n_datapoints(self) -> int:
+        """Total number of datapoints received."""
+        return sum(ts_stats.n_datapoints for ts_stats in self.time_series)
+
+    @property
+    def datapoints_per_second(self) -> float:
+        """Number of datapoints received per second of wall time."""
+        return self.n_datapoints / self.fetch_seconds if self.fetch_seconds else 0.0
+
+
 class Datapoint(CogniteResource):
     """An object representing a datapoint.
 
@@ -927,6 +998,22 @@ class DatapointsArray(CogniteResource):
             include_unit=include_unit,
         )
 
+    def to_arrow(self, include_status: bool = True) -> pyarrow.Table:
+        """Convert the DatapointsArray into a pyarrow Table.
+
+        The table has a 'timestamp' column, followed by either 'value' (raw datapoints) or one column per aggregate.
+        Numeric columns wrap the underlying numpy arrays without copying, while string values are stored as Arrow
+        strings (not Python objects). Missing values (for bad datapoints) become nulls.
+
+        Args:
+            include_status (bool): Include status code and status symbol as separate columns, if available.
+
+        Returns:
+            pyarrow.Table: The datapoints as a pyarrow Table.
+        """
+        local_import("pyarrow")  # throw nice import error early
+        return convert_dps_to_arrow_table(self, include_status=include_status)
+
 
 class Datapoints(CogniteResource):
     """An object representing a list of datapoints.
@@ -1455,6 +1542,40 @@ class DatapointsArrayList(CogniteResourceListWithClientRef[DatapointsArray]):
             include_unit=include_unit,
         )
 
+    def to_arrow(
+        self,
+        layout: Literal["long", "wide"] = "long",
+        include_aggregate_name: bool = True,
+        include_granularity_name: bool = False,
+        include_status: bool = True,
+    ) -> pyarrow.Table:
+        """Convert the DatapointsArrayList into a pyarrow Table.
+
+        With ``layout="long"``, the datapoints of all time series are stacked, with the identifier columns 'id', 'external_id'
+        and 'instance_id' telling them apart. With ``layout="wide"``, the timestamps are the union of all timestamps and each
+        time series gets its own column(s), named like 'my-xid|average' (nulls fill the gaps).
+
+        Numeric columns wrap the underlying numpy arrays without copying, which makes the handoff to e.g. polars or DuckDB
+        cheap, and string values are stored as Arrow strings (not Python objects).
+
+        Args:
+            layout (Literal['long', 'wide']): Whether to stack the time series ("long") or put them side by side ("wide").
+            include_aggregate_name (bool): Include aggregate in the column names, if present. Only used with layout="wide".
+            include_granularity_name (bool): Include granularity in the column names, if present. Only used with layout="wide".
+            include_status (bool): Include status code and status symbol as separate columns, if available.
+
+        Returns:
+            pyarrow.Table: The datapoints as a pyarrow Table.
+        """
+        local_import("pyarrow")  # throw nice import error early
+        return concat_dps_arrow_tables(
+            self,
+            layout=layout,
+            include_aggregate_name=include_aggregate_name,
+            include_granularity_name=include_granularity_name,
+            include_status=include_status,
+        )
+
     def dump(self, camel_case: bool = True, convert_timestamps: bool = False) -> list[dict[str, Any]]:
         """Dump the instance into a json serializable Python data type.
 
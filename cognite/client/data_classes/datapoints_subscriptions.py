@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from abc import ABC
+from abc import ABC, abstractmethod
 from collections.abc import Iterator
 from dataclasses import dataclass
 from enum import auto
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal
 
 from typing_extensions import Self
@@ -27,6 +28,7 @@ from cognite.client.data_classes.filters import _BASIC_FILTERS as _FILTERS_SUPPO
 from cognite.client.data_classes.filters import Filter, _validate_filter
 from cognite.client.utils import _json_extended as _json
 from cognite.client.utils._auxiliary import exactly_one_is_not_none
+from cognite.client.utils._cursor_store import FileCursors, InMemoryCursors
 
 if TYPE_CHECKING:
     import pandas as pd
@@ -505,6 +507,69 @@ class DatapointSubscriptionBatch:
     cursor: str
 
 
+@dataclass(frozen=True)
+class DatapointSubscriptionPartitionBatch(DatapointSubscriptionBatch):
+    """A batch of data from a single partition of a subscription, see :py:meth:`~DatapointsSubscriptionAPI.iterate_data_partitions`.
+
+    Args:
+        updates (list[DatapointsUpdate]): List of updates from the partition, sorted by point in time they were applied to the time series.
+        subscription_changes (SubscriptionTimeSeriesUpdate): Changes to the subscription definition, if any.
+        has_next (bool): Whether there is more data available in this partition at the time of the query.
+        cursor (str): The cursor to continue reading this partition from.
+        partition (int): The index of the partition the batch was read from.
+    """
+
+    partition: int
+
+
+class SubscriptionCursorStore(ABC):
+    """Base class for storing subscription cursors (one per partition), so that iteration can resume where it left off.
+
+    Implement this to store cursors somewhere else, e.g. in CDF RAW or a database.
+    """
+
+    @abstractmethod
+    def get_cursor(self, external_id: str, partition: int) -> str | None:
+        """Get the stored cursor for a partition of a subscription, or None if there is none."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def set_cursor(self, external_id: str, partition: int, cursor: str) -> None:
+        """Store the cursor for a partition of a subscription."""
+        raise NotImplementedError
+
+
+class InMemorySubscriptionCursorStore(SubscriptionCursorStore):
+    """Stores subscription cursors in memory, i.e. they are lost when the process exits."""
+
+    def __init__(self) -> None:
+        self._cursors = InMemoryCursors()
+
+    def get_cursor(self, external_id: str, partition: int) -> str | None:
+        return self._cursors.get(external_id, partition)
+
+    def set_cursor(self, external_id: str, partition: int, cursor: str) -> None:
+        self._cursors.set(external_id, partition, cursor)
+
+
+class FileSubscriptionCursorStore(SubscriptionCursorStore):
+    """Stores subscription cursors in a local JSON file, which is rewritten (atomically) on every update.
+
+    Args:
+        path (str | Path): The file to store cursors in. Created if it does not exist.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._cursors = FileCursors(self.path)
+
+    def get_cursor(self, external_id: str, partition: int) -> str | None:
+        return self._cursors.get(external_id, partition)
+
+    def set_cursor(self, external_id: str, partition: int, cursor: str) -> None:
+        self._cursors.set(external_id, partition, cursor)
+
+
 @dataclass(frozen=True)
 class _DatapointSubscriptionBatchWithPartitions:
     """A batch of data from a subscription.
@@ -154,6 +154,24 @@ class CogniteFileUploadError(CogniteException):
         return f"{self.message} | code: {self.code}"
 
 
+class CogniteFileChecksumError(CogniteException):
+    """Raised when the checksum of transferred file content does not match the checksum stored on the file.
+
+    Args:
+        message (str): The error message.
+        expected (str): The checksum stored on the file in CDF.
+        actual (str): The checksum computed from the transferred content.
+    """
+
+    def __init__(self, message: str, expected: str, actual: str) -> None:
+        self.message = message
+        self.expected = expected
+        self.actual = actual
+
+    def __str__(self) -> str:
+        return f"{self.message} | expected: {self.expected}, actual: {self.actual}"
+
+
 class CogniteMultiException(CogniteException):
     def __init__(
         self,
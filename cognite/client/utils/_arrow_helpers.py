@@ -0,0 +1,289 @@
+from __future__ import annotations
+
+import datetime
+import json
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, Literal
+from zoneinfo import ZoneInfo
+
+from cognite.client.data_classes.data_modeling.data_types import (
+    Boolean,
+    Date,
+    DirectRelation,
+    DirectRelationReference,
+    Float32,
+    Float64,
+    Int32,
+    Int64,
+    Json,
+    ListablePropertyType,
+    PropertyType,
+    Timestamp,
+)
+from cognite.client.data_classes.datapoint_aggregates import ALL_SORTED_DP_AGGS, OBJECT_AGGREGATES
+from cognite.client.utils._importing import local_import
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+    from cognite.client.data_classes import DatapointsArray
+    from cognite.client.data_classes.data_modeling.ids import NodeId
+
+
+def convert_tz_for_arrow(tz: datetime.timezone | ZoneInfo | None) -> str | None:
+    # Arrow accepts IANA names or fixed offsets like '+01:00' (but not e.g. 'UTC+01:00'):
+    if tz is None:
+        return None
+    elif isinstance(tz, ZoneInfo):
+        if tz.key is not None:
+            return tz.key
+        raise ValueError("timezone of type ZoneInfo does not have the required 'key' attribute set")
+    offset_min = int(tz.utcoffset(None).total_seconds()) // 60
+    sign = "-" if offset_min < 0 else "+"
+    return f"{sign}{abs(offset_min) // 60:02d}:{abs(offset_min) % 60:02d}"
+
+
+def _resolve_ts_identifier_as_column_name(dps: DatapointsArray) -> str:
+    if dps.instance_id:
+        return f"{dps.instance_id.space}:{dps.instance_id.external_id}"
+    elif dps.external_id is not None:  # "" is legal xid
+        return dps.external_id
+    elif dps.id:
+        return str(dps.id)
+    raise ValueError("DatapointsArray object has no identifier (id, external_id or instance_id)")
+
+
+def _create_timestamp_array(dps: DatapointsArray) -> pa.Array:
+    pa = local_import("pyarrow")
+    # Timestamps are stored as datetime64[ns], which Arrow can wrap without copying:
+    return pa.array(dps.timestamp, type=pa.timestamp("ns", tz=convert_tz_for_arrow(dps.timezone)))
+
+
+def _create_value_array(dps: DatapointsArray) -> pa.Array:
+    pa, np = local_import("pyarrow", "numpy")
+    if dps.is_string:
+        # Strings end up in a contiguous Arrow buffer rather than as Python objects:
+        return pa.array(dps.value, type=pa.large_string(), from_pandas=True)
+    if not dps.null_timestamps:
+        return pa.array(dps.value, type=pa.float64())
+    # Missing values (bad datapoints without a value) become proper nulls, not NaN:
+    timestamps = dps.timestamp.astype("datetime64[ms]").astype(np.int64)
+    mask = np.isin(timestamps, np.fromiter(dps.null_timestamps, dtype=np.int64, count=len(dps.null_timestamps)))
+    return pa.array(dps.value, type=pa.float64(), mask=mask)
+
+
+def _create_aggregate_array(agg: str, arr: Any) -> pa.Array:
+    pa = local_import("pyarrow")
+    if agg in OBJECT_AGGREGATES:
+        return pa.array([dp.dump(camel_case=False) for dp in arr])
+    return pa.array(arr)
+
+
+def _extract_arrow_columns(dps: DatapointsArray, include_status: bool) -> list[tuple[str | None, str, pa.Array]]:
+    # Returns (aggregate, field name, array) for each data column (i.e. not including timestamps):
+    pa = local_import("pyarrow")
+    columns: list[tuple[str | None, str, pa.Array]] = []
+    if dps.value is not None:
+        columns.append((None, "value", _create_value_array(dps)))
+    for agg in ALL_SORTED_DP_AGGS:
+        if (arr := getattr(dps, agg)) is not None:
+            columns.append((agg, agg, _create_aggregate_array(agg, arr)))
+    if include_status:
+        if dps.status_code is not None:
+            columns.append((None, "status_code", pa.array(dps.status_code, type=pa.uint32())))
+        if dps.status_symbol is not None:
+            columns.append((None, "status_symbol", pa.array(dps.status_symbol, type=pa.large_string())))
+    return columns
+
+
+def convert_dps_to_arrow_table(dps: DatapointsArray, include_status: bool) -> pa.Table:
+    pa = local_import("pyarrow")
+    columns = _extract_arrow_columns(dps, include_status)
+    return pa.table(
+        [_create_timestamp_array(dps), *(arr for *_, arr in columns)],
+        names=["timestamp", *(name for _, name, _ in columns)],
+    )
+
+
+def _create_identifier_arrays(dps: DatapointsArray) -> list[pa.Array]:
+    pa = local_import("pyarrow")
+    n = len(dps)
+    instance_id: NodeId | None = dps.instance_id
+    instance_id_type = pa.struct([("space", pa.string()), ("external_id", pa.string())])
+    return [
+        pa.repeat(pa.scalar(dps.id, type=pa.int64()), n),
+        pa.repeat(pa.scalar(dps.external_id, type=pa.string()), n),
+        pa.repeat(
+            pa.scalar(
+                None if instance_id is None else {"space": instance_id.space, "external_id": instance_id.external_id},
+                type=instance_id_type,
+            ),
+            n,
+        ),
+    ]
+
+
+def concat_dps_arrow_tables(
+    dps_lst: Sequence[DatapointsArray],
+    layout: Literal["long", "wide"],
+    include_aggregate_name: bool,
+    include_granularity_name: bool,
+    include_status: bool,
+) -> pa.Table:
+    if layout == "long":
+        return _concat_dps_arrow_tables_long(dps_lst, include_status)
+    elif layout == "wide":
+        return _concat_dps_arrow_tables_wide(dps_lst, include_aggregate_name, include_granularity_name, include_status)
+    raise ValueError(f"'layout' must be one of 'long' or 'wide', not {layout!r}")
+
+
+def _concat_dps_arrow_tables_long(dps_lst: Sequence[DatapointsArray], include_status: bool) -> pa.Table:
+    pa = local_import("pyarrow")
+    if len({dps.is_string for dps in dps_lst if dps.value is not None}) > 1:
+        raise ValueError(
+            "Cannot use layout='long' when mixing raw datapoints from string and numeric time series, as they "
+            "would share the 'value' column. Use layout='wide' instead."
+        )
+    tables = []
+    for dps in dps_lst:
+        table = convert_dps_to_arrow_table(dps, include_status)
+        for i, (name, arr) in enumerate(zip(("id", "external_id", "instance_id"), _create_identifier_arrays(dps))):
+            table = table.add_column(i, name, arr)
+        tables.append(table)
+    if not tables:
+        return pa.table({})
+    # Time series with different aggregates get their missing columns filled with nulls:
+    return pa.concat_tables(tables, promote_options="default")
+
+
+def _concat_dps_arrow_tables_wide(
+    dps_lst: Sequence[DatapointsArray],
+    include_aggregate_name: bool,
+    include_granularity_name: bool,
+    include_status: bool,
+) -> pa.Table:
+    pa, np = local_import("pyarrow", "numpy")
+    if not dps_lst:
+        return pa.table({})
+    if len({dps.timezone for dps in dps_lst}) > 1:
+        raise ValueError("Cannot use layout='wide' when the time series have different timezones")
+
+    # The timestamp column is the (sorted) union of all timestamps. For each time series not covering every
+    # timestamp, we 'take' its values with null indices where it has no datapoint:
+    all_timestamps = np.unique(np.concatenate([dps.timestamp for dps in dps_lst]))
+    names, arrays = ["timestamp"], [pa.array(all_timestamps, type=_create_timestamp_array(dps_lst[0]).type)]
+    for dps in dps_lst:
+        indices = None
+        if len(dps) != len(all_timestamps):
+            positions = np.searchsorted(all_timestamps, dps.timestamp)
+            take_idx = np.zeros(len(all_timestamps), dtype=np.int64)
+            take_idx[positions] = np.arange(len(dps))
+            is_missing = np.ones(len(all_timestamps), dtype=bool)
+            is_missing[positions] = False
+            indices = pa.array(take_idx, mask=is_missing)
+
+        identifier = _resolve_ts_identifier_as_column_name(dps)
+        for agg, name, arr in _extract_arrow_columns(dps, include_status):
+            parts = [identifier]
+            if agg is None and name != "value":
+                parts.append(name)  # status_code/status_symbol
+            if agg is not None and include_aggregate_name:
+                parts.append(agg)
+            if agg is not None and include_granularity_name and dps.granularity:
+                parts.append(dps.granularity)
+            names.append("|".join(parts))
+            arrays.append(arr if indices is None else arr.take(indices))
+    return pa.table(arrays, names=names)
+
+
+def _instance_id_struct_type() -> pa.DataType:
+    pa = local_import("pyarrow")
+    return pa.struct([("space", pa.string()), ("external_id", pa.string())])
+
+
+def _as_instance_id_dict(ref: Any) -> dict[str, str] | None:
+    match ref:
+        case None:
+            return None
+        case {"space": space, "externalId": xid}:
+            return {"space": space, "external_id": xid}
+    return {"space": ref.space, "external_id": ref.external_id}  # DirectRelationReference, NodeId
+
+
+def _is_direct_relation_value(value: Any) -> bool:
+    return isinstance(value, DirectRelationReference) or (
+        isinstance(value, dict) and value.keys() == {"space", "externalId"}
+    )
+
+
+def create_instance_id_array(refs: Sequence[Any]) -> pa.Array:
+    """Create a struct array with fields 'space' and 'external_id' from direct relation references (or their dumps)."""
+    pa = local_import("pyarrow")
+    return pa.array([_as_instance_id_dict(ref) for ref in refs], type=_instance_id_struct_type())
+
+
+def _arrow_type_for_property(property_type: PropertyType) -> pa.DataType | None:
+    # Returns None for JSON properties, which are stored as serialized strings:
+    pa = local_import("pyarrow")
+    match property_type:
+        case Boolean():
+            arrow_type = pa.bool_()
+        case Int32():
+            arrow_type = pa.int32()
+        case Int64():
+            arrow_type = pa.int64()
+        case Float32():
+            arrow_type = pa.float32()
+        case Float64():
+            arrow_type = pa.float64()
+        case Timestamp():
+            arrow_type = pa.timestamp("ms", tz="UTC")
+        case Date():
+            arrow_type = pa.date32()
+        case DirectRelation():
+            arrow_type = _instance_id_struct_type()
+        case Json():
+            return None
+        case _:  # Text, Enum and references to time series, files and sequences
+            arrow_type = pa.string()
+    if isinstance(property_type, ListablePropertyType) and property_type.is_list:
+        return pa.list_(arrow_type)
+    return arrow_type
+
+
+def _create_json_array(values: Sequence[Any]) -> pa.Array:
+    pa = local_import("pyarrow")
+    return pa.array([None if v is None else json.dumps(v) for v in values], type=pa.large_string())
+
+
+def create_property_array(values: Sequence[Any], property_type: PropertyType | None) -> pa.Array:
+    """Create an Arrow array from the values of a single (view) property, as returned by the API.
+
+    With a known property type, timestamps and dates are parsed, numbers get their exact width and direct relations
+    become structs. Without, the type is inferred from the values, and values of mixed types are stored as JSON.
+    """
+    pa = local_import("pyarrow")
+    if property_type is None:
+        first = next((v for v in values if v is not None and v != []), None)
+        sample = first[0] if isinstance(first, list) else first
+        if _is_direct_relation_value(sample):
+            return create_property_array(values, DirectRelation(is_list=isinstance(first, list)))
+        elif isinstance(sample, dict):
+            return _create_json_array(values)
+        try:
+            return pa.array(values)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            return _create_json_array(values)
+
+    if (arrow_type := _arrow_type_for_property(property_type)) is None:
+        return _create_json_array(values)
+    is_list = pa.types.is_list(arrow_type)
+    match property_type:
+        case DirectRelation() if is_list:
+            values = [None if v is None else list(map(_as_instance_id_dict, v)) for v in values]
+        case DirectRelation():
+            values = list(map(_as_instance_id_dict, values))
+        case Timestamp() | Date():
+            # The API returns ISO 8601 strings, which Arrow parses in bulk:
+            return pa.array(values, type=pa.list_(pa.string()) if is_list else pa.string()).cast(arrow_type)
+    return pa.array(values, type=arrow_type)
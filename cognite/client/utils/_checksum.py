@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+
+class FileChecksum:
+    """
+    Computes the checksum of a file while it is being transferred, i.e. without having to read it an extra time.
+
+    Since the parts of a multipart upload are transferred concurrently (and thus out of order), the checksum is a
+    composite: the SHA-256 digest of the concatenated SHA-256 digests of each part. The part size is part of the
+    resulting value, so that a download (a sequential stream fed to `update`) can be split on the same boundaries.
+
+    Args:
+        part_size (int): Size of each part in bytes (except the last, which may be smaller).
+        num_parts (int): Number of parts, if known up front (uploads). When streaming with `update`, parts are added as needed.
+    """
+
+    PREFIX = "sha256"
+
+    def __init__(self, part_size: int, num_parts: int = 1) -> None:
+        self.part_size = part_size
+        self._part_hashers = [hashlib.sha256() for _ in range(num_parts)]
+        self._position = 0
+
+    def update_part(self, part_no: int, data: bytes) -> None:
+        self._part_hashers[part_no].update(data)
+
+    def update(self, data: bytes) -> None:
+        view = memoryview(data)
+        while view:
+            part_no, part_offset = divmod(self._position, self.part_size)
+            if part_no == len(self._part_hashers):
+                self._part_hashers.append(hashlib.sha256())
+            n_bytes = min(len(view), self.part_size - part_offset)
+            self._part_hashers[part_no].update(view[:n_bytes])
+            self._position += n_bytes
+            view = view[n_bytes:]
+
+    def value(self) -> str:
+        combined = hashlib.sha256(b"".join(hasher.digest() for hasher in self._part_hashers))
+        return f"{self.PREFIX}:{self.part_size}:{combined.hexdigest()}"
+
+    @classmethod
+    def from_value(cls, value: str) -> FileChecksum:
+        """Create an empty checksum, using the same part size as the given checksum value."""
+        prefix, part_size, _ = value.split(":")
+        if prefix != cls.PREFIX:
+            raise ValueError(f"Unknown checksum format: {value!r}")
+        return cls(int(part_size))
+
+    @classmethod
+    def from_path(cls, path: Path, part_size: int) -> FileChecksum:
+        checksum = cls(part_size)
+        with path.open("rb") as fh:
+            while chunk := fh.read(1024**2):
+                checksum.update(chunk)
+        return checksum
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+
+class InMemoryCursors:
+    """Cursors of partitioned resources (one per partition), keyed by the resource being read, e.g. a subscription
+    or a stream. Backs the public in-memory cursor stores, which are lost when the process exits.
+    """
+
+    def __init__(self) -> None:
+        self._cursors: dict[tuple[str, int], str] = {}
+
+    def get(self, key: str, partition: int) -> str | None:
+        return self._cursors.get((key, partition))
+
+    def set(self, key: str, partition: int, cursor: str) -> None:
+        self._cursors[key, partition] = cursor
+
+
+class FileCursors:
+    """Cursors of partitioned resources (one per partition), keyed by the resource being read, e.g. a subscription
+    or a stream. Backs the public file cursor stores: the cursors are kept in a local JSON file, which is rewritten
+    (atomically) on every update.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._cursors: dict[str, dict[str, str]] = {}
+        if self.path.exists():
+            self._cursors = json.loads(self.path.read_text(encoding="utf-8"))
+
+    def get(self, key: str, partition: int) -> str | None:
+        return self._cursors.get(key, {}).get(str(partition))
+
+    def set(self, key: str, partition: int, cursor: str) -> None:
+        self._cursors.setdefault(key, {})[str(partition)] = cursor
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(self._cursors), encoding="utf-8")
+        os.replace(tmp_path, self.path)
@@ -1,8 +1,22 @@
 from __future__ import annotations
 
+import hashlib
+import os
+from collections.abc import Iterator
+from typing import Any
+
 from cognite.client.data_classes.data_modeling.ids import ViewId
-from cognite.client.data_classes.data_modeling.instances import Node, NodeList
+from cognite.client.data_classes.data_modeling.instances import Edge, EdgeApply, Node, NodeApply, NodeList
+from cognite.client.data_classes.data_modeling.query import (
+    Intersection,
+    NodeOrEdgeResultSetExpression,
+    Query,
+    ResultSetExpression,
+    Union,
+    UnionAll,
+)
 from cognite.client.data_classes.data_modeling.views import View
+from cognite.client.utils import _json_extended as json
 
 
 def resolve_source(
@@ -37,3 +51,104 @@ def strip_canonical_source(result: Node | NodeList[Node] | None, canonical_view_
 
     for node in [result] if isinstance(result, Node) else result:
         node.drop_source(canonical_view_id)
+
+
+def find_dependent_result_sets(query: Query) -> dict[str, set[str]]:
+    """For each result set expression in the query, find all expressions depending on it, directly or through
+    others (including the expression itself). When paging through an expression, these all change.
+    """
+    direct_dependents: dict[str, set[str]] = {name: set() for name in query.with_}
+    for name, expression in query.with_.items():
+        for referenced in _referenced_result_sets(expression):
+            if referenced in direct_dependents:
+                direct_dependents[referenced].add(name)
+
+    all_dependents = {}
+    for name in query.with_:
+        found, to_check = {name}, [name]
+        while to_check:
+            for dependent in direct_dependents[to_check.pop()] - found:
+                found.add(dependent)
+                to_check.append(dependent)
+        all_dependents[name] = found
+    return all_dependents
+
+
+def _referenced_result_sets(expression: ResultSetExpression | str) -> Iterator[str]:
+    match expression:
+        case str():
+            yield expression
+        case NodeOrEdgeResultSetExpression():
+            if expression.from_ is not None:
+                yield expression.from_
+        case Union() | UnionAll() | Intersection():
+            operands = {Union: "union", UnionAll: "union_all", Intersection: "intersection"}[type(expression)]
+            for operand in getattr(expression, operands):
+                yield from _referenced_result_sets(operand)
+            yield from expression.except_ or []
+
+
+def instance_apply_key(instance: NodeApply | EdgeApply) -> str:
+    """A string key identifying the instance, usable with e.g. a dict or a shelve as content-hash store."""
+    return json.dumps([instance.instance_type, instance.space, instance.external_id])
+
+
+def instance_apply_hash(instance: NodeApply | EdgeApply, replace: bool) -> str:
+    """Hash of everything an apply writes, i.e. ignoring the existing version used for optimistic locking."""
+    dumped = instance.dump(camel_case=True)
+    dumped.pop("existingVersion", None)
+    dumped["replace"] = replace
+    return hashlib.sha256(json.dumps(dumped, sort_keys=True).encode()).hexdigest()
+
+
+def is_apply_unchanged(instance: NodeApply | EdgeApply, existing: Node | Edge, replace: bool) -> bool:
+    """Check if applying the instance would leave the existing instance (retrieved with the same views) unchanged."""
+    dumped, existing_dumped = instance.dump(camel_case=True), existing.dump(camel_case=True)
+    if any(dumped.get(attr) != existing_dumped.get(attr) for attr in ("type", "startNode", "endNode")):
+        return False
+
+    existing_properties: dict[str, Any] = existing_dumped.get("properties", {})
+    for source in dumped.get("sources", []):
+        match source["source"]:
+            case {"type": "view", "space": space, "externalId": xid, "version": str(version)}:
+                current = existing_properties.get(space, {}).get(f"{xid}/{version}", {})
+            case _:
+                return False  # Container sources, or views without version, can't be compared
+        given = source["properties"]
+        if any(current.get(prop) != value for prop, value in given.items()):
+            return False
+        if replace and any(value is not None for prop, value in current.items() if prop not in given):
+            return False
+    return True
+
+
+# Keys are assumed to be spread over printable ASCII when splitting key ranges:
+_KEY_ALPHABET_START, _KEY_ALPHABET_SIZE, _KEY_DIGITS = 0x20, 95, 3
+
+
+def split_key_range(lowest: str, highest: str, n: int) -> list[str]:
+    """Find up to n - 1 boundaries splitting the keys between lowest and highest into ranges of roughly equal width.
+
+    The keys are compared as base-95 numbers (printable ASCII) over the first few characters after the common prefix,
+    so boundaries are exact in order, but the ranges are only balanced when keys are evenly spread.
+    """
+    prefix = os.path.commonprefix([lowest, highest])
+
+    def to_number(key: str) -> int:
+        digits = [ord(c) - _KEY_ALPHABET_START for c in key[len(prefix) :][:_KEY_DIGITS].ljust(_KEY_DIGITS, " ")]
+        value = 0
+        for digit in digits:
+            value = value * _KEY_ALPHABET_SIZE + min(max(digit, 0), _KEY_ALPHABET_SIZE - 1)
+        return value
+
+    def to_key(value: int) -> str:
+        chars = []
+        for _ in range(_KEY_DIGITS):
+            value, digit = divmod(value, _KEY_ALPHABET_SIZE)
+            chars.append(chr(_KEY_ALPHABET_START + digit))
+        return prefix + "".join(reversed(chars)).rstrip(" ")
+
+    low, high = to_number(lowest), to_number(highest)
+    boundaries = (to_key(low + (high - low) * i // n) for i in range(1, n))
+    # Every boundary must be unique, and leave at least one key on either side:
+    return sorted({key for key in boundaries if lowest < key <= highest})
@@ -270,8 +270,28 @@ def datapoints_in_order(container: _DataContainer) -> Iterator[list]:
     return chain.from_iterable(container[k] for k in sorted(container))
 
 
+def drain_datapoints_in_order(container: _DataContainer) -> Iterator[Any]:
+    # Like 'datapoints_in_order', but each chunk is released as soon as the consumer moves past it:
+    for key in sorted(container):
+        chunks = container.pop(key)
+        chunks.reverse()
+        while chunks:
+            yield chunks.pop()
+
+
 def create_array_from_dps_container(container: _DataContainer) -> npt.NDArray:
-    return np.hstack(list(datapoints_in_order(container)))
+    # We copy each chunk into a preallocated output array and drop our reference to it straight after. Peak
+    # memory use is thus the size of the result plus a single chunk, rather than twice the size of the result
+    # that we would get from np.hstack. Note: this empties the container.
+    n_dps, dtypes = 0, set()
+    for arr in datapoints_in_order(container):
+        n_dps += len(arr)
+        dtypes.add(arr.dtype)
+    out = np.empty(n_dps, dtype=np.result_type(*dtypes))
+    offset = 0
+    for arr in drain_datapoints_in_order(container):
+        out[offset : (offset := offset + len(arr))] = arr
+    return out
 
 
 def create_object_array_from_container(container: _DataContainer) -> npt.NDArray[np.object_]:
@@ -279,8 +299,18 @@ def create_object_array_from_container(container: _DataContainer) -> npt.NDArray
 
 
 def create_aggregates_arrays_from_dps_container(container: _DataContainer, n_aggs: int) -> list[npt.NDArray]:
-    all_aggs_arr = np.vstack(list(datapoints_in_order(container)))
-    return list(map(np.ravel, np.hsplit(all_aggs_arr, n_aggs)))
+    # Each chunk has shape (n_dps, n_aggs). We preallocate one output per aggregate and copy the columns of each
+    # chunk straight into them, instead of first stacking all chunks and then splitting the result. Note: this
+    # empties the container.
+    n_dps = sum(map(len, datapoints_in_order(container)))
+    out = [np.empty(n_dps, dtype=np.float64) for _ in range(n_aggs)]
+    offset = 0
+    for arr in drain_datapoints_in_order(container):
+        end = offset + len(arr)
+        for agg_arr, column in zip(out, arr.T):
+            agg_arr[offset:end] = column
+        offset = end
+    return out
 
 
 def create_list_from_dps_container(container: _DataContainer) -> list:
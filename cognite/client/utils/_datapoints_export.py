@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import os
+from collections import Counter
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+from cognite.client.data_classes.datapoint_aggregates import ALL_SORTED_DP_AGGS, OBJECT_AGGREGATES
+from cognite.client.utils import _json_extended as json
+from cognite.client.utils._arrow_helpers import convert_dps_to_arrow_table
+from cognite.client.utils._importing import local_import
+
+if TYPE_CHECKING:
+    from cognite.client.data_classes import DatapointsArray, DatapointsQuery
+
+
+class DatapointsFileWriter:
+    """Writes chunks of datapoints to one directory per time series, each chunk as a separate part, and
+    keeps track of it all in a manifest (JSON) at the root of the directory.
+
+    Parts are either Parquet files, or a directory with one .npy file per column (which can be memory mapped
+    when read, e.g. ``np.load(path, mmap_mode="r")``).
+    """
+
+    MANIFEST_NAME = "manifest.json"
+
+    def __init__(
+        self, directory: str | Path, queries: list[DatapointsQuery], file_format: Literal["parquet", "npy"]
+    ) -> None:
+        if file_format == "parquet":
+            local_import("pyarrow.parquet")
+        elif file_format == "npy":
+            local_import("numpy")
+        else:
+            raise ValueError(f"'file_format' must be one of 'parquet' or 'npy', not {file_format!r}")
+
+        identifiers = [(query.identifier.name(camel_case=False), query.identifier.as_primitive()) for query in queries]
+        if duplicates := [f"{name}={value!r}" for (name, value), n in Counter(identifiers).items() if n > 1]:
+            # Datapoints are matched to their query by identifier, so each time series can only be exported once. Note that the
+            # same time series queried by different identifier types is caught by the datapoints iterator, not here:
+            raise ValueError(f"Each time series can only be exported once, got duplicated identifiers: {duplicates}")
+
+        self.directory = Path(directory)
+        self.manifest_path = self.directory / self.MANIFEST_NAME
+        if self.manifest_path.exists():
+            raise FileExistsError(f"Directory {self.directory} already contains an export, see {self.manifest_path}")
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        self.file_format = file_format
+        # Time series are stored in directories named by their position in the given queries, as identifiers
+        # (e.g. external IDs) may contain characters not allowed in file names:
+        self._entries = {
+            ident: {**query.identifier.as_dict(), "directory": str(i), "count": 0, "parts": []}
+            for i, (ident, query) in enumerate(zip(identifiers, queries))
+        }
+
+    def write(self, dps: DatapointsArray) -> None:
+        np = local_import("numpy")
+        if not len(dps):
+            return
+        entry = self._find_entry(dps)
+        part_name = f"part-{len(entry['parts']):06d}"
+        ts_directory = self.directory / entry["directory"]
+        ts_directory.mkdir(exist_ok=True)
+
+        if self.file_format == "parquet":
+            part_path = ts_directory / f"{part_name}.parquet"
+            local_import("pyarrow.parquet").write_table(convert_dps_to_arrow_table(dps, include_status=True), part_path)
+        else:
+            part_path = ts_directory / part_name
+            part_path.mkdir()
+            for name, arr in self._extract_numpy_columns(dps):
+                np.save(part_path / f"{name}.npy", arr, allow_pickle=False)
+
+        timestamps_ms = dps.timestamp[[0, -1]].astype("datetime64[ms]").astype(np.int64).tolist()
+        entry["count"] += len(dps)
+        entry["parts"].append(
+            {
+                "path": part_path.relative_to(self.directory).as_posix(),
+                "count": len(dps),
+                "firstTimestamp": timestamps_ms[0],
+                "lastTimestamp": timestamps_ms[1],
+            }
+        )
+
+    def _find_entry(self, dps: DatapointsArray) -> dict[str, Any]:
+        for key in [("instance_id", dps.instance_id), ("external_id", dps.external_id), ("id", dps.id)]:
+            if key in self._entries:
+                return self._entries[key]
+        raise ValueError(f"Got datapoints for a time series not part of the export: {dps.id=}")
+
+    @staticmethod
+    def _extract_numpy_columns(dps: DatapointsArray) -> list[tuple[str, Any]]:
+        np = local_import("numpy")
+        if dps.is_string:
+            raise ValueError(
+                "Datapoints from string time series can not be written to .npy files, use file_format='parquet'"
+            )
+        columns: list[tuple[str, Any]] = [("timestamp", dps.timestamp.astype("datetime64[ms]").astype(np.int64))]
+        if dps.value is not None:
+            columns.append(("value", dps.value))
+        for agg in ALL_SORTED_DP_AGGS:
+            if (arr := getattr(dps, agg)) is None:
+                continue
+            elif agg in OBJECT_AGGREGATES:
+                raise ValueError(f"The aggregate {agg!r} can not be written to .npy files, use file_format='parquet'")
+            columns.append((agg, arr))
+        if dps.status_code is not None:
+            columns.append(("status_code", dps.status_code))
+        if dps.status_symbol is not None:
+            columns.append(("status_symbol", dps.status_symbol.astype(np.str_)))
+        return columns
+
+    def write_manifest(self, complete: bool) -> dict[str, Any]:
+        manifest = {"format": self.file_format, "complete": complete, "timeSeries": list(self._entries.values())}
+        # Write to a temporary file first, so that a manifest is never left half-written:
+        tmp_path = self.manifest_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        os.replace(tmp_path, self.manifest_path)
+        return manifest
@@ -202,6 +202,10 @@ class Identifier(Generic[T_ID]):
     def as_tuple(self, camel_case: bool = True) -> tuple[str, T_ID]:
         return self.name(camel_case), self.__value
 
+    def identifies(self, resource: Any) -> bool:
+        # Works for any resource with id, external_id and instance_id attributes (like datapoints):
+        return getattr(resource, self.name(camel_case=False), None) == self.__value
+
 
 class UserIdentifier:
     def __init__(self, value: str) -> None:
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import importlib
+import sys
+from collections.abc import Callable
 from types import ModuleType
-from typing import TypeVar, overload
+from typing import Any, Generic, TypeVar, overload
 
 _T = TypeVar("_T")
 
@@ -40,3 +42,91 @@ def local_import(*module: str) -> ModuleType | tuple[ModuleType, ...]:
         except ImportError as e:
             raise CogniteImportError(name.split(".")[0]) from e
     return tuple(modules)
+
+
+def lazy_module_getattr(module_name: str, lazy_imports: dict[str, str]) -> Callable[[str], Any]:
+    """Create a module level ``__getattr__`` (PEP 562) that imports the names of a package on first access.
+
+    Args:
+        module_name (str): Name of the package, i.e. its ``__name__``.
+        lazy_imports (dict[str, str]): Maps each lazily imported name to the module defining it. A name
+            mapping to a module of the same name (e.g. ``"filters": "cognite.client.data_classes.filters"``)
+            gives the module itself.
+
+    Returns:
+        Callable[[str], Any]: The ``__getattr__`` function for the package.
+    """
+    namespace = sys.modules[module_name].__dict__
+
+    def __getattr__(name: str) -> Any:
+        if (source := lazy_imports.get(name)) is not None:
+            module = importlib.import_module(source)
+            value = module if source.rpartition(".")[2] == name else getattr(module, name)
+        else:
+            # Submodules are (only) set as attributes on the package once imported:
+            try:
+                value = importlib.import_module(f"{module_name}.{name}")
+            except ModuleNotFoundError as e:
+                if e.name != f"{module_name}.{name}":
+                    raise
+                raise AttributeError(f"module {module_name!r} has no attribute {name!r}") from None
+        namespace[name] = value
+        return value
+
+    return __getattr__
+
+
+def lazy_module_dir(module_name: str) -> Callable[[], list[str]]:
+    """Create a module level ``__dir__`` (PEP 562) that also lists the names not yet lazily imported.
+
+    Args:
+        module_name (str): Name of the package, i.e. its ``__name__``.
+
+    Returns:
+        Callable[[], list[str]]: The ``__dir__`` function for the package.
+    """
+    namespace = sys.modules[module_name].__dict__
+
+    def __dir__() -> list[str]:
+        return sorted({*namespace, *namespace.get("__all__", ())})
+
+    return __dir__
+
+
+class LazyAPI(Generic[_T]):
+    """Class level descriptor for the API attributes of the clients, importing and creating the API on first access.
+
+    The API is created by calling ``_create_api(api_cls)`` on the client, and stored on the client instance
+    under the same name, so that later lookups bypass the descriptor altogether.
+
+    Args:
+        import_path (str): Full import path of the API class, e.g. ``"cognite.client._api.assets.AssetsAPI"``.
+    """
+
+    def __init__(self, import_path: str) -> None:
+        self.module_name, _, self.class_name = import_path.rpartition(".")
+        self.name = self.class_name
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    @overload
+    def __get__(self, instance: None, owner: type | None = None) -> LazyAPI[_T]: ...
+
+    @overload
+    def __get__(self, instance: object, owner: type | None = None) -> _T: ...
+
+    def __get__(self, instance: object | None, owner: type | None = None) -> LazyAPI[_T] | _T:
+        if instance is None:
+            return self
+        api_cls = getattr(importlib.import_module(self.module_name), self.class_name)
+        api = instance._create_api(api_cls)  # type: ignore[attr-defined]
+        # If two threads race, make sure they both end up with the same API object:
+        return instance.__dict__.setdefault(self.name, api)
+
+
+def create_lazy_apis(obj: object) -> None:
+    """Create all lazily created APIs of the given client (or API) object, e.g. before inspecting ``vars(obj)``."""
+    for attr, value in vars(type(obj)).items():
+        if isinstance(value, LazyAPI):
+            getattr(obj, attr)
@@ -3,6 +3,7 @@ from __future__ import annotations
 import numbers
 import re
 import time
+from collections.abc import Sequence
 from datetime import datetime, timedelta, timezone
 from typing import ParamSpec, TypeVar, cast, overload
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
@@ -345,3 +346,44 @@ def split_time_range(start: int, end: int, n_splits: int, granularity_in_ms: int
     # Find a `delta_ms` that's a multiple of granularity in ms (trivial for raw queries).
     delta_ms = granularity_in_ms * round(tot_ms / n_splits / granularity_in_ms)
     return [*(start + delta_ms * i for i in range(n_splits)), end]
+
+
+def estimate_count_in_time_range(density_profile: Sequence[tuple[int, int, int]], start: int, end: int) -> float:
+    # We assume the count of each bucket is evenly spread across it:
+    total = 0.0
+    for bucket_start, bucket_end, count in density_profile:
+        if (overlap := min(end, bucket_end) - max(start, bucket_start)) > 0:
+            total += count * overlap / (bucket_end - bucket_start)
+    return total
+
+
+def split_time_range_by_density(
+    start: int, end: int, n_splits: int, density_profile: Sequence[tuple[int, int, int]]
+) -> list[int]:
+    """Like `split_time_range`, but places the boundaries so that each piece holds about the same count (given
+    a profile of (bucket start, bucket end, count)) rather than spanning the same amount of time. Boundaries
+    are strictly increasing, thus fewer than `n_splits` pieces may be returned.
+    """
+    if n_splits < 1:
+        raise ValueError(f"Cannot split into less than 1 piece, got {n_splits=}")
+    buckets = []
+    for bucket_start, bucket_end, count in density_profile:
+        clipped_start, clipped_end = max(start, bucket_start), min(end, bucket_end)
+        if clipped_end > clipped_start and count > 0:
+            buckets.append(
+                (clipped_start, clipped_end, count * (clipped_end - clipped_start) / (bucket_end - bucket_start))
+            )
+
+    boundaries = [start]
+    if not (total := sum(count for *_, count in buckets)):
+        return [start, end]
+    step = next_target = total / n_splits
+    cumulative = 0.0
+    for bucket_start, bucket_end, count in buckets:
+        while len(boundaries) < n_splits and cumulative + count >= next_target:
+            ts = bucket_start + round((next_target - cumulative) / count * (bucket_end - bucket_start))
+            if boundaries[-1] < ts < end:
+                boundaries.append(ts)
+            next_target += step
+        cumulative += count
+    return [*boundaries, end]
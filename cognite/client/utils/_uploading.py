@@ -2,14 +2,14 @@ from __future__ import annotations
 
 import os
 import warnings
-from collections.abc import AsyncIterable, AsyncIterator
+from collections.abc import AsyncIterable, AsyncIterator, Callable
 from io import BufferedReader, BytesIO, StringIO, TextIOBase, UnsupportedOperation
-from typing import Any, BinaryIO
+from typing import Any, BinaryIO, cast
 
 
 def prepare_content_for_upload(
     content: str | bytes | BinaryIO | AsyncIterator[bytes],
-) -> tuple[int | None, AsyncFileChunker | bytes | AsyncIterator[bytes]]:
+) -> tuple[int | None, AsyncFileChunker | AsyncMemoryViewChunker | bytes | AsyncIterator[bytes]]:
     # Note: future dev, please no "hasattr read" checks here, we are strict on what we accept
     match content:
         case BufferedReader() | BytesIO():
@@ -20,7 +20,7 @@ def prepare_content_for_upload(
         case str():
             content = content.encode("utf-8")
             file_size = len(content)
-        case AsyncFileChunker():
+        case AsyncFileChunker() | AsyncMemoryViewChunker():
             file_size = content.size
         case AsyncIterable():
             file_size = None
@@ -53,14 +53,23 @@ class AsyncFileChunker(AsyncIterator[bytes]):
         file_handle (BinaryIO): An open file handle.
         offset (int): Byte offset to seek to before reading. Defaults to 0 (beginning of file).
         size (int | None): Maximum number of bytes to yield in total. If None, reads until EOF.
+        on_chunk (Callable[[bytes], object] | None): Called with each chunk as it is read, e.g. to compute a checksum.
     """
 
     CHUNK_SIZE = 64 * 1024  # 64 KiB chunks by default, copying httpx default
 
-    def __init__(self, file_handle: BinaryIO, *, offset: int = 0, size: int | None = None) -> None:
+    def __init__(
+        self,
+        file_handle: BinaryIO,
+        *,
+        offset: int = 0,
+        size: int | None = None,
+        on_chunk: Callable[[bytes], object] | None = None,
+    ) -> None:
         from cognite.client import global_config
 
         self._file_handle = file_handle
+        self._on_chunk = on_chunk
         self._chunk_size = global_config.file_upload_chunk_size or self.CHUNK_SIZE
         self._remaining = size
         self.size = size  # exposed so prepare_content_for_upload can set Content-Length
@@ -81,10 +90,45 @@ class AsyncFileChunker(AsyncIterator[bytes]):
         if chunk := self._file_handle.read(to_read):
             if self._remaining is not None:
                 self._remaining -= len(chunk)
+            if self._on_chunk is not None:
+                self._on_chunk(chunk)
             return chunk
         raise StopAsyncIteration
 
 
+class AsyncMemoryViewChunker(AsyncIterator[bytes]):
+    """
+    An asynchronous iterator yielding zero-copy chunks of a buffer, typically a slice of a memory-mapped file.
+    Unlike AsyncFileChunker, no file is (re)opened and no data is read into new bytes objects.
+
+    Args:
+        buffer (memoryview): The buffer to yield chunks from.
+        on_chunk (Callable[[bytes], object] | None): Called with each chunk before it is yielded, e.g. to compute a checksum.
+    """
+
+    def __init__(self, buffer: memoryview, *, on_chunk: Callable[[bytes], object] | None = None) -> None:
+        from cognite.client import global_config
+
+        self._buffer = buffer
+        self._on_chunk = on_chunk
+        self._chunk_size = global_config.file_upload_chunk_size or AsyncFileChunker.CHUNK_SIZE
+        self._position = 0
+        self.size = len(buffer)  # exposed so prepare_content_for_upload can set Content-Length
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return self
+
+    async def __anext__(self) -> bytes:
+        if self._position >= self.size:
+            raise StopAsyncIteration
+        chunk = self._buffer[self._position : self._position + self._chunk_size]
+        self._position += len(chunk)
+        if self._on_chunk is not None:
+            self._on_chunk(cast(bytes, chunk))
+        # The transport just needs a bytes-like object, so we avoid the copy that bytes(chunk) would incur:
+        return cast(bytes, chunk)
+
+
 # Straight from httpx/_utils.py (comments removed) as it's currently not
 # exposed - unlike requests and its super_len function:
 def peek_filelike_length(stream: Any) -> int | None:
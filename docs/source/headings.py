@@ -49,9 +49,11 @@ headings = {
     "AsyncCogniteClient.data_modeling.instances.__call__": "Iterate over instances",
     "AsyncCogniteClient.data_modeling.instances.aggregate": "Aggregate instances",
     "AsyncCogniteClient.data_modeling.instances.apply": "Apply instances",
+    "AsyncCogniteClient.data_modeling.instances.apply_graph": "Apply a graph of instances in dependency order",
     "AsyncCogniteClient.data_modeling.instances.delete": "Delete instances",
     "AsyncCogniteClient.data_modeling.instances.inspect": "Inspect instances",
     "AsyncCogniteClient.data_modeling.instances.list": "List instances",
+    "AsyncCogniteClient.data_modeling.instances.iterate_query": "Iterate over all query results",
     "AsyncCogniteClient.data_modeling.instances.query": "Query instances",
     "AsyncCogniteClient.data_modeling.instances.retrieve": "Retrieve instances by id(s)",
     "AsyncCogniteClient.data_modeling.instances.retrieve_edges": "Retrieve Edges by id(s)",
@@ -148,8 +150,12 @@ headings = {
     "AsyncCogniteClient.time_series.data.retrieve_arrays": "Retrieve datapoints as numpy arrays",
     "AsyncCogniteClient.time_series.data.retrieve": "Retrieve datapoints",
     "AsyncCogniteClient.time_series.data.retrieve_dataframe": "Retrieve datapoints in pandas dataframe",
+    "AsyncCogniteClient.time_series.data.retrieve_arrow": "Retrieve datapoints in pyarrow table",
+    "AsyncCogniteClient.time_series.data.retrieve_to_files": "Retrieve datapoints to files",
     "AsyncCogniteClient.time_series.data.retrieve_latest": "Retrieve latest datapoint",
+    "AsyncCogniteClient.time_series.data.create_latest_service": "Create a service for latest datapoints",
     "AsyncCogniteClient.time_series.data.insert_multiple": "Insert datapoints into multiple time series",
+    "AsyncCogniteClient.time_series.data.create_writer": "Create a buffered datapoints writer",
     "AsyncCogniteClient.time_series.data.delete_ranges": "Delete ranges of datapoints",
     "AsyncCogniteClient.time_series.data.insert_dataframe": "Insert pandas dataframe",
     "AsyncCogniteClient.time_series.data.__call__": "Iterate through datapoints in chunks",
@@ -161,6 +167,7 @@ headings = {
     "AsyncCogniteClient.time_series.subscriptions.update": "Update datapoint subscription",
     "AsyncCogniteClient.time_series.subscriptions.list_member_time_series": "List member time series of subscription",
     "AsyncCogniteClient.time_series.subscriptions.iterate_data": "Iterate over subscriptions data",
+    "AsyncCogniteClient.time_series.subscriptions.iterate_data_partitions": "Iterate over data from all subscription partitions",
     "AsyncCogniteClient.sequences.__call__": "Iterate over sequences",
     "AsyncCogniteClient.sequences.aggregate_cardinality_properties": "Aggregate Sequences Property Cardinality",
     "AsyncCogniteClient.sequences.aggregate_cardinality_values": "Aggregate Sequences Value Cardinality",
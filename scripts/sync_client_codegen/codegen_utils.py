@@ -13,11 +13,13 @@ from cognite.client import AsyncCogniteClient
 from cognite.client._api_client import APIClient
 from cognite.client.config import ClientConfig
 from cognite.client.credentials import Token
+from cognite.client.utils._importing import create_lazy_apis
 from scripts.sync_client_codegen.constants import ASYNC_METHODS_TO_KEEP, MAYBE_IMPORTS, SYNC_METHODS_TO_KEEP
 
 
 def get_api_class_by_attribute(cls_: object, parent_name: tuple[str, ...] = ()) -> dict[str, type[APIClient]]:
     available_apis: dict[str, type[APIClient]] = {}
+    create_lazy_apis(cls_)
     for attr, obj in cls_.__dict__.items():
         if attr.startswith("_") or not isinstance(obj, APIClient):
             continue
@@ -109,7 +111,8 @@ def get_module_level_type_checking_imports(tree: ast.Module) -> str:
         for sub in node.body:
             if isinstance(sub, (ast.Import, ast.ImportFrom)):
                 imports.append(ast.unparse(sub))
-    return "\n".join(imports)
+    # Indented to stay inside the 'if TYPE_CHECKING:' block of the template:
+    return "\n    ".join(imports)
 
 
 def get_all_imports(tree: ast.Module, source_code: str, source_path: Path) -> tuple[str, str]:
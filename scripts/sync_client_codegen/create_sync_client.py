@@ -25,16 +25,17 @@ def create_sync_cognite_client(
     all_imports = []
     for api, attr in filter_base_apis_and_sort_alphabetically(dot_path_lookup):
         override_api_name = foolish_cls_name_rewrite(api)
-        all_apis.append(f"self.{attr} = Sync{override_api_name}(async_client)\n")
-
         import_path = path_as_importable(
             SYNC_API_DIR / Path(file_path_lookup[api]).relative_to(ASYNC_API_DIR.resolve())
         ).replace(".__init__", "")
-        all_imports.append(f"from {import_path} import Sync{override_api_name}")
+        all_apis.append(
+            f'{attr}: LazyAPI[Sync{override_api_name}] = LazyAPI("{import_path}.Sync{override_api_name}")\n'
+        )
+        all_imports.append(f"from {import_path} import Sync{override_api_name}\n")
 
     return COGNITE_CLIENT_TEMPLATE.format(
-        all_api_imports="\n".join(all_imports),
-        nested_apis_init="        ".join(all_apis).rstrip(),
+        all_api_imports="    ".join(all_imports).rstrip(),
+        lazy_apis="    ".join(all_apis).rstrip(),
     )
 
 
@@ -1,25 +1,35 @@
 from __future__ import annotations
 
+import gzip
 import json
 import math
 import re
-from typing import Any
-from unittest.mock import MagicMock
+from typing import Any, ClassVar
+from unittest.mock import AsyncMock, MagicMock
 
+import httpx
 import pytest
 from pytest_httpx import HTTPXMock
 
 from cognite.client import AsyncCogniteClient, CogniteClient
 from cognite.client.data_classes.aggregations import Count
-from cognite.client.data_classes.data_modeling.ids import ViewId
+from cognite.client.data_classes.data_modeling.ids import NodeId, ViewId
+from cognite.client.data_classes.data_modeling.instances import EdgeApply, InstanceSort, Node, NodeApply, NodeOrEdgeData
 from cognite.client.data_classes.data_modeling.query import (
+    EdgeResultSetExpression,
+    NodeListWithCursor,
+    NodeResultSetExpression,
     NodeResultSetExpressionSync,
+    Query,
     QueryResult,
     QuerySync,
+    Select,
     SelectSync,
     SourceSelector,
 )
 from cognite.client.data_classes.data_modeling.sync import SyncSessionWithCache
+from cognite.client.exceptions import CogniteAPIError, CogniteNotFoundError
+from cognite.client.utils._data_modeling import is_apply_unchanged
 from tests.tests_unit.test_api.test_data_modeling.conftest import make_test_view
 
 SINGLE_SRC_DUMP = {"source": {"space": "a", "externalId": "b", "version": "c", "type": "view"}}
@@ -125,6 +135,359 @@ class TestSearch:
             )
 
 
+class TestApplySkipUnchanged:
+    VIEW = ViewId("s", "Pump", "v1")
+
+    def _apply(self, xid: str, **properties: Any) -> NodeApply:
+        return NodeApply("s", xid, sources=[NodeOrEdgeData(self.VIEW, properties)])
+
+    @staticmethod
+    def _applied_xids(httpx_mock: HTTPXMock) -> list[list[str]]:
+        return [
+            [item["externalId"] for item in json.loads(req.content)["items"]]
+            for req in httpx_mock.get_requests()
+            if req.url.path.endswith("/models/instances")
+        ]
+
+    @staticmethod
+    def _apply_callback(request: httpx.Request) -> httpx.Response:
+        items = [
+            {**{k: item[k] for k in ("instanceType", "space", "externalId")}, "version": 2, "wasModified": True}
+            | {"createdTime": 0, "lastUpdatedTime": 0}
+            for item in json.loads(request.content)["items"]
+        ]
+        return httpx.Response(200, json={"items": items})
+
+    @pytest.mark.usefixtures("disable_gzip")
+    def test_skip_unchanged_using_hash_store(self, httpx_mock: HTTPXMock, cognite_client: CogniteClient) -> None:
+        httpx_mock.add_callback(
+            self._apply_callback, method="POST", url=re.compile(r".*/models/instances$"), is_reusable=True
+        )
+        hash_store: dict[str, str] = {}
+        apply = cognite_client.data_modeling.instances.apply
+
+        res = apply([self._apply("a", name="A"), self._apply("b", name="B")], skip_unchanged=hash_store)
+        assert len(res.nodes) == 2 and res.skipped_nodes == []
+        assert len(hash_store) == 2
+
+        # Only the changed node is sent, and a different existing version does not count as a change:
+        changed_b = self._apply("b", name="B2")
+        res = apply(
+            [NodeApply("s", "a", 1, [NodeOrEdgeData(self.VIEW, {"name": "A"})]), changed_b], skip_unchanged=hash_store
+        )
+        assert res.skipped_nodes == [NodeId("s", "a")]
+        assert [node.external_id for node in res.nodes] == ["b"]
+        assert self._applied_xids(httpx_mock) == [["a", "b"], ["b"]]
+
+        # Replace-mode writes are not considered equal to merge-mode writes:
+        res = apply([changed_b], skip_unchanged=hash_store, replace=True)
+        assert res.skipped_nodes == []
+
+    @pytest.mark.usefixtures("disable_gzip")
+    def test_skip_unchanged_using_retrieve(self, httpx_mock: HTTPXMock, cognite_client: CogniteClient) -> None:
+        existing = {
+            "a": {"name": "A", "pressure": 1.0},
+            "b": {"name": "B"},
+        }
+        retrieve_bodies = []
+
+        def retrieve_callback(request: httpx.Request) -> httpx.Response:
+            body = json.loads(request.content)
+            retrieve_bodies.append(body)
+            items = [
+                {
+                    "instanceType": "node",
+                    "space": "s",
+                    "externalId": item["externalId"],
+                    "version": 1,
+                    "createdTime": 0,
+                    "lastUpdatedTime": 0,
+                    "properties": {"s": {"Pump/v1": existing[item["externalId"]]}},
+                }
+                for item in body["items"]
+                if item["externalId"] in existing
+            ]
+            return httpx.Response(200, json={"items": items})
+
+        httpx_mock.add_callback(retrieve_callback, method="POST", url=re.compile(r".*/models/instances/byids$"))
+        httpx_mock.add_callback(self._apply_callback, method="POST", url=re.compile(r".*/models/instances$"))
+        res = cognite_client.data_modeling.instances.apply(
+            [
+                self._apply("a", name="A"),  # Unchanged, 'pressure' is kept when merging
+                self._apply("b", name="B2"),  # Changed
+                self._apply("c", name="C"),  # New
+            ],
+            skip_unchanged=True,
+        )
+        assert res.skipped_nodes == [NodeId("s", "a")]
+        assert self._applied_xids(httpx_mock) == [["b", "c"]]
+        (retrieve_body,) = retrieve_bodies
+        assert retrieve_body["sources"] == [{"source": self.VIEW.dump(camel_case=True, include_type=True)}]
+
+    def test_is_apply_unchanged_with_replace(self) -> None:
+        existing = Node._load(
+            {
+                "space": "s",
+                "externalId": "a",
+                "version": 1,
+                "createdTime": 0,
+                "lastUpdatedTime": 0,
+                "instanceType": "node",
+                "properties": {"s": {"Pump/v1": {"name": "A", "pressure": 1.0}}},
+            }
+        )
+        assert is_apply_unchanged(self._apply("a", name="A"), existing, replace=False)
+        assert not is_apply_unchanged(self._apply("a", name="A"), existing, replace=True)
+        assert is_apply_unchanged(self._apply("a", name="A", pressure=1.0), existing, replace=True)
+        assert not is_apply_unchanged(self._apply("a", name="A", pressure=2.0), existing, replace=False)
+
+
+class TestListPartitions:
+    XIDS: ClassVar[list[str]] = [f"n{i:03d}" for i in range(250)]
+
+    @classmethod
+    def _node(cls, xid: str, space: str = "s") -> dict[str, Any]:
+        return {
+            "instanceType": "node",
+            "space": space,
+            "externalId": xid,
+            "version": 1,
+            "createdTime": 0,
+            "lastUpdatedTime": 0,
+            "properties": {},
+        }
+
+    @staticmethod
+    def _matches(flt: dict[str, Any], item: dict[str, Any]) -> bool:
+        ((name, body),) = flt.items()
+        match name:
+            case "and":
+                return all(TestListPartitions._matches(f, item) for f in body)
+            case "range":
+                key = item[body["property"][1]]
+                return ("gte" not in body or key >= body["gte"]) and ("lt" not in body or key < body["lt"])
+            case "in":
+                return item[body["property"][1]] in body["values"]
+            case "equals":
+                return item[body["property"][1]] == body["value"]
+        raise NotImplementedError(name)
+
+    def _list_callback(self, items: list[dict[str, Any]]) -> Any:
+        def callback(request: httpx.Request) -> httpx.Response:
+            body = json.loads(request.content)
+            matches = [item for item in items if "filter" not in body or self._matches(body["filter"], item)]
+            if sort := body.get("sort"):
+                matches.sort(key=lambda item: item["externalId"], reverse=sort[0]["direction"] == "descending")
+            # Page through the results using the offset as cursor:
+            offset = int(body.get("cursor") or 0)
+            page = matches[offset : offset + body["limit"]]
+            next_cursor = str(offset + len(page)) if offset + len(page) < len(matches) else None
+            return httpx.Response(200, json={"items": page, "nextCursor": next_cursor})
+
+        return callback
+
+    @pytest.mark.usefixtures("disable_gzip")
+    def test_list_by_external_id_ranges(self, httpx_mock: HTTPXMock, cognite_client: CogniteClient) -> None:
+        items = [self._node(xid) for xid in self.XIDS]
+        httpx_mock.add_callback(
+            self._list_callback(items), method="POST", url=re.compile(r".*/instances/list$"), is_reusable=True
+        )
+        res = cognite_client.data_modeling.instances.list(space="s", limit=None, partitions=4)
+        assert sorted(node.external_id for node in res) == self.XIDS
+
+        bodies = [json.loads(req.content) for req in httpx_mock.get_requests()]
+        # Two requests to find the lowest and highest external ID, then one per partition:
+        assert sum("sort" in body for body in bodies) == 2
+        partition_filters = [body["filter"] for body in bodies if "sort" not in body]
+        assert len(partition_filters) == 4
+        assert all(any("range" in f for f in flt["and"]) for flt in partition_filters)
+
+    @pytest.mark.usefixtures("disable_gzip")
+    def test_iterate_by_space(self, httpx_mock: HTTPXMock, cognite_client: CogniteClient) -> None:
+        items = [self._node(xid, space) for space in "abc" for xid in self.XIDS[:20]]
+        httpx_mock.add_callback(
+            self._list_callback(items), method="POST", url=re.compile(r".*/instances/list$"), is_reusable=True
+        )
+        chunks = list(cognite_client.data_modeling.instances(chunk_size=15, space=["a", "b", "c"], partitions=2))
+        assert sorted((node.space, node.external_id) for chunk in chunks for node in chunk) == sorted(
+            (item["space"], item["externalId"]) for item in items
+        )
+        assert all(len(chunk) <= 15 for chunk in chunks)
+        filters = [json.loads(req.content)["filter"] for req in httpx_mock.get_requests()]
+        spaces_per_request = [flt["in"]["values"] if "in" in flt else [flt["equals"]["value"]] for flt in filters]
+        assert sorted(spaces_per_request) == [["a", "c"], ["b"]]
+
+    @pytest.mark.usefixtures("disable_gzip")
+    def test_iterate_with_limit(self, httpx_mock: HTTPXMock, cognite_client: CogniteClient) -> None:
+        items = [self._node(xid) for xid in self.XIDS]
+        httpx_mock.add_callback(
+            self._list_callback(items), method="POST", url=re.compile(r".*/instances/list$"), is_reusable=True
+        )
+        nodes = list(cognite_client.data_modeling.instances(limit=42, partitions=3))
+        assert len(nodes) == len({node.external_id for node in nodes}) == 42
+
+    @pytest.mark.parametrize(
+        "kwargs, match",
+        [
+            ({"limit": 10}, "finite limit"),
+            ({"limit": None, "sort": InstanceSort(["node", "externalId"])}, "sort"),
+            ({"limit": None, "include_typing": True}, "include_typing"),
+            ({"limit": None, "partitions": 0}, "positive integer"),
+        ],
+    )
+    def test_invalid_parameters(self, cognite_client: CogniteClient, kwargs: dict[str, Any], match: str) -> None:
+        with pytest.raises(ValueError, match=match):
+            cognite_client.data_modeling.instances.list(**{"partitions": 2, **kwargs})
+
+
+class TestApplyGraph:
+    VIEW = ViewId("s", "Pump", "v1")
+
+    def _node(self, xid: str, *refs: str) -> NodeApply:
+        properties = {f"ref_{ref}": {"space": "s", "externalId": ref} for ref in refs}
+        return NodeApply("s", xid, sources=[NodeOrEdgeData(self.VIEW, properties)])
+
+    @staticmethod
+    def _edge(xid: str, start: str, end: str) -> EdgeApply:
+        return EdgeApply("s", xid, type=("s", "flows_to"), start_node=("s", start), end_node=("s", end))
+
+    @staticmethod
+    def _apply_requests(httpx_mock: HTTPXMock) -> list[dict[str, Any]]:
+        return [json.loads(req.content) for req in httpx_mock.get_requests() if req.url.path.endswith("/instances")]
+
+    @staticmethod
+    def _apply_callback(request: httpx.Request) -> httpx.Response:
+        items = json.loads(request.content)["items"]
+        if any(item["externalId"] == "bad" for item in items):
+            return httpx.Response(400, json={"error": {"code": 400, "message": "Invalid node"}})
+        return httpx.Response(
+            200,
+            json={
+                "items": [
+                    {k: item[k] for k in ("instanceType", "space", "externalId")}
+                    | {"version": 1, "wasModified": True, "createdTime": 0, "lastUpdatedTime": 0}
+                    for item in items
+                ]
+            },
+        )
+
+    @pytest.mark.usefixtures("disable_gzip")
+    def test_dependencies_are_written_first(self, httpx_mock: HTTPXMock, cognite_client: CogniteClient) -> None:
+        httpx_mock.add_callback(self._apply_callback, method="POST", url=re.compile(r".*/instances$"), is_reusable=True)
+        res = cognite_client.data_modeling.instances.apply_graph(
+            nodes=[self._node("b", "a", "outside"), self._node("a"), self._node("c", "c")],
+            edges=[self._edge("e", "a", "c")],
+        )
+        # Self-references and references to nodes not part of the input do not block anything:
+        requested = [[item["externalId"] for item in body["items"]] for body in self._apply_requests(httpx_mock)]
+        assert requested == [["a", "c"], ["b", "e"]]
+        assert sorted(node.external_id for node in res.nodes) == ["a", "b", "c"]
+        assert [edge.external_id for edge in res.edges] == ["e"]
+
+    @pytest.mark.usefixtures("disable_gzip")
+    def test_cycles_are_written_with_auto_create(self, httpx_mock: HTTPXMock, cognite_client: CogniteClient) -> None:
+        httpx_mock.add_callback(self._apply_callback, method="POST", url=re.compile(r".*/instances$"), is_reusable=True)
+        cognite_client.data_modeling.instances.apply_graph(
+            nodes=[self._node("x", "y"), self._node("y", "x")],
+            edges=[self._edge("e", "x", "y")],
+            auto_create_direct_relations=False,
+        )
+        requested = [
+            ([item["externalId"] for item in body["items"]], body["autoCreateDirectRelations"])
+            for body in self._apply_requests(httpx_mock)
+        ]
+        assert requested == [(["x", "y"], True), (["e"], False)]
+
+    @pytest.mark.usefixtures("disable_gzip")
+    def test_dependents_of_failed_are_skipped(self, httpx_mock: HTTPXMock, cognite_client: CogniteClient) -> None:
+        httpx_mock.add_callback(self._apply_callback, method="POST", url=re.compile(r".*/instances$"), is_reusable=True)
+        with pytest.raises(CogniteAPIError, match="Invalid node") as err:
+            cognite_client.data_modeling.instances.apply_graph(
+                nodes=[
+                    self._node("bad"),
+                    self._node("ok"),
+                    self._node("child", "bad"),
+                    self._node("grandchild", "child"),
+                ],
+                edges=[self._edge("e", "ok", "ok")],
+            )
+        assert err.value.code == 400
+        assert sorted(inst.external_id for inst in err.value.failed) == ["bad", "ok"]
+        assert sorted(inst.external_id for inst in err.value.skipped) == ["child", "e", "grandchild"]
+        assert err.value.successful == []
+
+
+class TestIterateQuery:
+    @staticmethod
+    def _node(xid: str) -> dict[str, Any]:
+        return {
+            "instanceType": "node",
+            "version": 1,
+            "space": "s",
+            "externalId": xid,
+            "createdTime": 0,
+            "lastUpdatedTime": 0,
+        }
+
+    @staticmethod
+    def _edge(xid: str) -> dict[str, Any]:
+        node_ref = {"space": "s", "externalId": "n"}
+        return {
+            **TestIterateQuery._node(xid),
+            "instanceType": "edge",
+            "type": node_ref,
+            "startNode": node_ref,
+            "endNode": node_ref,
+        }
+
+    @pytest.mark.usefixtures("disable_gzip")
+    def test_follows_cursors_of_all_result_sets(self, httpx_mock: HTTPXMock, cognite_client: CogniteClient) -> None:
+        # Two pages of pumps, and for each pump page, two pages of work orders:
+        pump_pages = {None: (["pump1"], "p2"), "p2": (["pump2"], None)}
+        work_order_pages = {
+            (None, None): (["wo1a"], "w2"),
+            (None, "w2"): (["wo1b"], None),
+            ("p2", None): (["wo2a"], "w2"),
+            ("p2", "w2"): (["wo2b"], None),
+        }
+        request_bodies = []
+
+        def callback(request: httpx.Request) -> httpx.Response:
+            body = json.loads(request.content)
+            request_bodies.append(body)
+            pump_cursor, wo_cursor = body["cursors"].get("pumps"), body["cursors"].get("work_orders")
+            items, next_cursor = {}, {}
+            if "pumps" in body["select"]:
+                xids, next_cursor["pumps"] = pump_pages[pump_cursor]
+                items["pumps"] = [self._node(xid) for xid in xids]
+            if "work_orders" in body["select"]:
+                xids, next_cursor["work_orders"] = work_order_pages[pump_cursor, wo_cursor]
+                items["work_orders"] = [self._edge(xid) for xid in xids]
+            return httpx.Response(200, json={"items": items, "nextCursor": next_cursor})
+
+        httpx_mock.add_callback(
+            callback, method="POST", url=re.compile(r".*/models/instances/query$"), is_reusable=True
+        )
+        query = Query(
+            with_={
+                "pumps": NodeResultSetExpression(),
+                "work_orders": EdgeResultSetExpression(from_="pumps"),
+            },
+            select={"pumps": Select([SourceSelector(ViewId("s", "Pump", "v1"), ["*"])]), "work_orders": Select()},
+        )
+        results = list(cognite_client.data_modeling.instances.iterate_query(query))
+
+        retrieved = {name: [inst.external_id for res in results for inst in res.get(name, [])] for name in query.with_}
+        assert sorted(retrieved["pumps"]) == ["pump1", "pump2"]
+        assert sorted(retrieved["work_orders"]) == ["wo1a", "wo1b", "wo2a", "wo2b"]
+        assert len(request_bodies) == 4
+
+        # When paging work orders for the second page of pumps, the pumps are kept at that page (selected without
+        # properties, and not part of the yielded results):
+        (last_page_body,) = [body for body in request_bodies if body["cursors"] == {"pumps": "p2", "work_orders": "w2"}]
+        assert last_page_body["select"]["pumps"] == {}
+
+
 class TestSyncSessionWithCache:
     @pytest.fixture
     def session(self) -> SyncSessionWithCache:
@@ -183,11 +546,106 @@ class TestSyncSessionWithCache:
         assert hash_without == hash_with
 
     def test_get_nodes_raises_on_edge_data(self, session: SyncSessionWithCache) -> None:
-        session._instances = {"movies": [{"instanceType": "edge", "space": "s", "externalId": "e"}]}
+        session._instances = {"movies": {("s", "e"): {"instanceType": "edge", "space": "s", "externalId": "e"}}}
         with pytest.raises(ValueError, match="edges"):
             session.get_nodes("movies")
 
     def test_get_edges_raises_on_node_data(self, session: SyncSessionWithCache) -> None:
-        session._instances = {"movies": [{"instanceType": "node", "space": "s", "externalId": "e"}]}
+        session._instances = {"movies": {("s", "e"): {"instanceType": "node", "space": "s", "externalId": "e"}}}
         with pytest.raises(ValueError, match="nodes"):
             session.get_edges("movies")
+
+    @staticmethod
+    def _attach_fake_files_api(session: SyncSessionWithCache) -> dict[str, bytes]:
+        stored: dict[str, bytes] = {}
+
+        async def download_bytes(external_id: str) -> bytes:
+            if external_id not in stored:
+                raise CogniteNotFoundError("not found", code=404, missing=[{"externalId": external_id}])
+            return stored[external_id]
+
+        async def upload_bytes(content: bytes, external_id: str, **_: Any) -> None:
+            stored[external_id] = content
+
+        async def delete(external_id: list[str], ignore_unknown_ids: bool) -> None:
+            for xid in external_id:
+                stored.pop(xid, None)
+
+        files = session._api._cognite_client.files
+        files.download_bytes, files.upload_bytes, files.delete = download_bytes, upload_bytes, delete
+        return stored
+
+    async def test_incremental_backups_are_restored_and_compacted(self, session: SyncSessionWithCache) -> None:
+        def sync_result(*xids: str, deleted: bool = False) -> QueryResult:
+            nodes = [
+                Node("s", xid, 1, 0, 0, deleted_time=1 if deleted else None, properties=None, type=None) for xid in xids
+            ]
+            return QueryResult({"movies": NodeListWithCursor(nodes, cursor=f"cursor-{xids[-1]}")})
+
+        session._compact_every, session._backup_on_exit = 2, False
+        stored = self._attach_fake_files_api(session)
+        session._api.sync = AsyncMock(
+            side_effect=[sync_result("a", "b"), sync_result("c"), sync_result("a", deleted=True), sync_result("d")]
+        )
+        async with session:
+            for _ in range(4):
+                await session.sync()
+                await session._backup_to_cdf()
+                if len(stored) == 3:  # Full snapshot and two deltas
+                    assert gzip.decompress(stored["test_cache_file-delta-1"]).count(b"\n") == 2  # Header and "c"
+
+        # The fourth backup compacted the deltas into a new full snapshot:
+        assert list(stored) == ["test_cache_file"]
+        restored = SyncSessionWithCache(
+            api=session._api,
+            query=session._query,
+            file_external_id="test_cache_file",
+            security_category=42,
+            backup_every=None,
+            backup_on_exit=False,
+        )
+        async with restored:
+            assert sorted(node.external_id for node in restored.get_nodes("movies")) == ["b", "c", "d"]
+            assert restored._cursors == {"movies": "cursor-d"}
+
+    async def test_changes_during_backup_are_kept_for_next_backup(self, session: SyncSessionWithCache) -> None:
+        stored = self._attach_fake_files_api(session)
+        session._query_hash = session._compute_query_hash(session._query)
+        session._generation, session._n_deltas = "gen", 0
+        session._changes = {"movies": {("s", "a"): None}}
+
+        async def upload_bytes(content: bytes, external_id: str, **_: Any) -> None:
+            # A sync finishing while the upload is in flight:
+            session._changes.setdefault("movies", {})[("s", "b")] = None
+            if external_id.endswith("-2"):
+                raise CogniteAPIError("upload failed", code=500)
+            stored[external_id] = content
+
+        session._api._cognite_client.files.upload_bytes = upload_bytes
+        await session._backup_to_cdf()
+        assert gzip.decompress(stored["test_cache_file-delta-1"]).count(b"\n") == 2  # Header and "a"
+        assert session._changes == {"movies": {("s", "b"): None}}
+
+        session._changes["movies"][("s", "c")] = None
+        await session._backup_to_cdf()  # Fails, so all changes must be kept
+        assert session._changes == {"movies": {("s", "b"): None, ("s", "c"): None}}
+        assert session._n_deltas == 1
+
+    async def test_restore_applies_deltas_of_current_snapshot_only(self, session: SyncSessionWithCache) -> None:
+        stored = self._attach_fake_files_api(session)
+        session._query_hash = session._compute_query_hash(session._query)
+        session._cursors = {"movies": "c1"}
+        session._instances = {"movies": {("s", "a"): {"instanceType": "node", "space": "s", "externalId": "a"}}}
+        await session._backup_to_cdf()
+        session._cursors = {"movies": "c2"}
+        session._changes = {"movies": {("s", "a"): None}}
+        await session._backup_to_cdf()
+        # A leftover delta from an older snapshot must be ignored:
+        stored["test_cache_file-delta-2"] = SyncSessionWithCache._write_snapshot(
+            {"generation": "old", "sequence": 2, "cursors": {"movies": "old"}}, []
+        )
+        session._instances, session._cursors = {}, {}
+        await session._load_from_cdf()
+        assert session._instances == {"movies": {}}
+        assert session._cursors == {"movies": "c2"}
+        assert session._n_deltas == 1
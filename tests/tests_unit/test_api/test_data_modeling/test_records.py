@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import re
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
 
+import httpx
 import pytest
 from pytest_httpx import HTTPXMock
 
@@ -29,6 +34,8 @@ from cognite.client.data_classes.data_modeling.aggregates import (
 from cognite.client.data_classes.data_modeling.data_types import UnitReference
 from cognite.client.data_classes.data_modeling.instances import InstanceSort, TypeInformation
 from cognite.client.data_classes.data_modeling.records import (
+    FileRecordsCursorStore,
+    InMemoryRecordsCursorStore,
     Record,
     RecordContainerId,
     RecordId,
@@ -36,13 +43,16 @@ from cognite.client.data_classes.data_modeling.records import (
     RecordsAggregation,
     RecordSource,
     RecordSourceSelector,
+    RecordsWriterStats,
     RecordTargetUnit,
     RecordTargetUnits,
     RecordWrite,
     SyncRecord,
     SyncRecordList,
+    SyncRecordPartitionList,
     TimeRange,
 )
+from cognite.client.exceptions import CogniteAPIError
 from tests.utils import jsgz_load
 
 
@@ -283,6 +293,126 @@ class TestRecordsAPIUpsert:
         assert len(jsgz_load(requests[1].content)["items"]) == 1
 
 
+class TestRecordsWriter:
+    def test_writes_full_requests_per_stream(
+        self, cognite_client: CogniteClient, async_client: AsyncCogniteClient, httpx_mock: HTTPXMock
+    ) -> None:
+        base_url = async_client.data_modeling.records._base_url_with_base_path
+        httpx_mock.add_response(
+            method="POST",
+            url=re.compile(re.escape(base_url) + r"/streams/.+/records$"),
+            status_code=202,
+            is_reusable=True,
+        )
+        with cognite_client.data_modeling.records.create_writer() as writer:
+            writer.add([RecordWrite(space="sp", external_id=f"a-{i}", sources=[]) for i in range(1500)], stream_id="a")
+            writer.add(RecordWrite(space="sp", external_id="b-0", sources=[]), stream_id="b")
+
+        sizes = sorted(
+            (request.url.path.split("/")[-2], len(jsgz_load(request.content)["items"]))
+            for request in httpx_mock.get_requests()
+        )
+        assert sizes == [("a", 500), ("a", 1000), ("b", 1)]
+        stats = writer.stats
+        assert (stats.n_records_added, stats.n_records_written, stats.n_requests) == (1501, 1501, 3)
+        assert stats.n_buffered_records == stats.n_records_failed == 0
+
+    def test_upsert(
+        self,
+        cognite_client: CogniteClient,
+        httpx_mock: HTTPXMock,
+        mock_upsert: None,
+        stream_id: str,
+        write_item: RecordWrite,
+    ) -> None:
+        with cognite_client.data_modeling.records.create_writer(upsert=True) as writer:
+            writer.add(write_item, stream_id=stream_id)
+        (request,) = httpx_mock.get_requests()
+        assert request.url.path.endswith("/records/upsert")
+        assert jsgz_load(request.content)["items"][0]["externalId"] == "rec-1"
+
+    def test_rejected_requests_are_split_until_only_invalid_records_fail(
+        self, cognite_client: CogniteClient, httpx_mock: HTTPXMock, ingest_url_pattern: re.Pattern, stream_id: str
+    ) -> None:
+        def reject_invalid(request: httpx.Request) -> httpx.Response:
+            if any(item["externalId"] == "bad" for item in jsgz_load(request.content)["items"]):
+                missing = [{"space": "sp", "externalId": "missing-container"}]
+                return httpx.Response(
+                    422, json={"error": {"code": 422, "message": "Invalid record", "missing": missing}}
+                )
+            return httpx.Response(202)
+
+        httpx_mock.add_callback(reject_invalid, method="POST", url=ingest_url_pattern, is_reusable=True)
+        items = [RecordWrite(space="sp", external_id=xid, sources=[]) for xid in ["r-0", "r-1", "bad", "r-3"]]
+        writer = cognite_client.data_modeling.records.create_writer()
+        writer.add(items, stream_id=stream_id)
+        with pytest.raises(CogniteAPIError, match="Invalid record") as err:
+            writer.close()
+
+        assert err.value.code == 422
+        assert [record.external_id for record in err.value.failed] == ["bad"]
+        stats = writer.stats
+        assert (stats.n_records_written, stats.n_records_failed, stats.n_requests_split) == (3, 1, 2)
+
+    def test_requests_rejected_as_a_whole_are_not_split(
+        self, cognite_client: CogniteClient, httpx_mock: HTTPXMock, ingest_url_pattern: re.Pattern, stream_id: str
+    ) -> None:
+        httpx_mock.add_response(
+            method="POST",
+            url=ingest_url_pattern,
+            status_code=400,
+            json={"error": {"code": 400, "message": "Stream not found"}},
+        )
+        items = [RecordWrite(space="sp", external_id=f"r-{i}", sources=[]) for i in range(4)]
+        writer = cognite_client.data_modeling.records.create_writer()
+        writer.add(items, stream_id=stream_id)
+        with pytest.raises(CogniteAPIError, match="Stream not found") as err:
+            writer.close()
+
+        assert err.value.failed == items
+        assert len(httpx_mock.get_requests()) == 1
+        stats = writer.stats
+        assert (stats.n_records_written, stats.n_records_failed, stats.n_requests_split) == (0, 4, 0)
+
+    async def test_producer_waits_for_records_being_written(self, async_client: AsyncCogniteClient) -> None:
+        write_done = asyncio.Event()
+        n_posts = 0
+
+        async def slow_post(*args: Any, **kwargs: Any) -> None:
+            nonlocal n_posts
+            n_posts += 1
+            await write_done.wait()
+
+        def make_records() -> list[RecordWrite]:
+            return [RecordWrite(space="sp", external_id=f"r-{i}", sources=[]) for i in range(1000)]
+
+        writer = await async_client.data_modeling.records.create_writer(max_buffered_records=2000)
+        with patch.object(async_client.data_modeling.records, "_post", slow_post):
+            await writer.add_async(make_records(), stream_id="a")  # A full request, written in the background
+            producer = asyncio.create_task(writer.add_async(make_records(), stream_id="a"))
+            await asyncio.sleep(0.05)
+            # The first records are not written yet, so the producer must wait:
+            assert not producer.done()
+            assert n_posts == 2
+            assert writer.stats.n_buffered_records == 2000
+
+            write_done.set()
+            await producer
+            assert writer.stats.n_buffered_records == 0
+            await writer.close_async()
+        assert writer.stats.n_records_written == 2000
+
+    def test_add_after_close_raises(self, cognite_client: CogniteClient, write_item: RecordWrite) -> None:
+        with cognite_client.data_modeling.records.create_writer() as writer:
+            pass
+        with pytest.raises(RuntimeError, match="closed"):
+            writer.add(write_item, stream_id="my-stream")
+
+    def test_stats_records_per_second(self) -> None:
+        assert RecordsWriterStats(n_records_written=500, elapsed_seconds=2.0).records_per_second == 250.0
+        assert RecordsWriterStats().records_per_second == 0.0
+
+
 class TestRecordsAPIAggregate:
     def test_aggregate_posts_request_and_returns_wrapper(
         self,
@@ -665,6 +795,94 @@ class TestRecordsAPIFilter:
         assert isinstance(result.typing, TypeInformation)
 
 
+class TestRecordsAPISyncPartitions:
+    @staticmethod
+    def serve_two_pages_per_partition(request: httpx.Request) -> httpx.Response:
+        body = jsgz_load(request.content)
+        partition = body["filter"]["equals"]["value"]
+        page = 2 if body.get("cursor") == f"{partition}-1" else 1
+        item = {
+            "space": "sp",
+            "externalId": f"{partition}-{page}",
+            "createdTime": 1,
+            "lastUpdatedTime": 2,
+            "status": "created",
+        }
+        return httpx.Response(200, json={"items": [item], "nextCursor": f"{partition}-{page}", "hasNext": page == 1})
+
+    def test_sync_partitions_stores_cursor_after_chunk_is_processed(
+        self, cognite_client: CogniteClient, httpx_mock: HTTPXMock, sync_url_pattern: re.Pattern, stream_id: str
+    ) -> None:
+        httpx_mock.add_callback(
+            self.serve_two_pages_per_partition, method="POST", url=sync_url_pattern, is_reusable=True
+        )
+        store = InMemoryRecordsCursorStore()
+        partitions = [filters.Equals(["sp", "c", "site"], site) for site in ("a", "b")]
+        seen = []
+        for chunk in cognite_client.data_modeling.records.sync_partitions(
+            stream_id, partitions, initialize_cursor="1d-ago", cursor_store=store
+        ):
+            assert isinstance(chunk, SyncRecordPartitionList)
+            # The cursor of the chunk being processed must not be stored before we are done with it:
+            assert store.get_cursor(stream_id, chunk.partition) != chunk.cursor
+            seen.append((chunk.partition, chunk[0].external_id))
+
+        assert sorted(seen) == [(0, "a-1"), (0, "a-2"), (1, "b-1"), (1, "b-2")]
+        assert [xid for partition, xid in seen if partition == 0] == ["a-1", "a-2"]
+        assert (store.get_cursor(stream_id, 0), store.get_cursor(stream_id, 1)) == ("a-2", "b-2")
+
+    def test_sync_partitions_resumes_from_stored_cursor(
+        self,
+        cognite_client: CogniteClient,
+        httpx_mock: HTTPXMock,
+        sync_url_pattern: re.Pattern,
+        stream_id: str,
+        tmp_path: Path,
+    ) -> None:
+        httpx_mock.add_callback(
+            self.serve_two_pages_per_partition, method="POST", url=sync_url_pattern, is_reusable=True
+        )
+        FileRecordsCursorStore(tmp_path / "cursors.json").set_cursor(stream_id, 0, "a-1")
+        store = FileRecordsCursorStore(tmp_path / "cursors.json")
+        chunks = list(
+            cognite_client.data_modeling.records.sync_partitions(
+                stream_id, [filters.Equals(["sp", "c", "site"], "a")], cursor_store=store, chunk_size=1
+            )
+        )
+        assert [chunk[0].external_id for chunk in chunks] == ["a-2"]
+        assert jsgz_load(httpx_mock.get_requests()[0].content) == {
+            "limit": 1,
+            "cursor": "a-1",
+            "filter": {"equals": {"property": ["sp", "c", "site"], "value": "a"}},
+        }
+        assert store.get_cursor(stream_id, 0) == "a-2"
+
+    def test_sync_partitions_raises_errors_from_partitions(self, cognite_client: CogniteClient, stream_id: str) -> None:
+        with pytest.raises(ValueError, match="No cursor stored for partition 0"):
+            list(
+                cognite_client.data_modeling.records.sync_partitions(
+                    stream_id, cursor_store=InMemoryRecordsCursorStore()
+                )
+            )
+        with pytest.raises(ValueError, match="'initialize_cursor', 'cursor_store' or both"):
+            list(cognite_client.data_modeling.records.sync_partitions(stream_id))
+
+    def test_sync_partitions_raises_errors_from_cursor_store(
+        self, cognite_client: CogniteClient, stream_id: str
+    ) -> None:
+        class UnavailableCursorStore(InMemoryRecordsCursorStore):
+            def get_cursor(self, stream_id: str, partition: int) -> str | None:
+                raise ConnectionError("Cursor store unavailable")
+
+        # Must be raised, not leave the consumer waiting for the reader forever:
+        with pytest.raises(ConnectionError, match="Cursor store unavailable"):
+            list(
+                cognite_client.data_modeling.records.sync_partitions(
+                    stream_id, initialize_cursor="1d-ago", cursor_store=UnavailableCursorStore()
+                )
+            )
+
+
 class TestRecordsAPISync:
     def test_sync_returns_page_with_cursor(
         self,
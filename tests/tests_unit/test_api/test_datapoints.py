@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import gc
 import itertools
+import json
 import math
 import re
 import unittest
@@ -10,9 +11,11 @@ from collections.abc import Iterator
 from contextlib import contextmanager
 from copy import deepcopy
 from datetime import datetime, timezone
+from pathlib import Path
 from random import randint, random, shuffle
 from types import SimpleNamespace
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal
+from unittest.mock import ANY
 
 import pytest
 from _pytest.monkeypatch import MonkeyPatch
@@ -21,12 +24,27 @@ from pytest_httpx import HTTPXMock
 
 import cognite.client._api.datapoints_io as dps_io  # for mocking
 from cognite.client import AsyncCogniteClient
+from cognite.client._api.datapoint_tasks import _DpsQueryValidator
 from cognite.client._api.datapoints_io import _InsertDatapoint
-from cognite.client.data_classes import Datapoint, Datapoints, DatapointsList, LatestDatapointQuery
+from cognite.client._proto.data_point_list_response_pb2 import DataPointListResponse
+from cognite.client._proto.data_points_pb2 import NumericDatapoint
+from cognite.client.config import global_config
+from cognite.client.data_classes import (
+    Datapoint,
+    Datapoints,
+    DatapointsArray,
+    DatapointsFetchStats,
+    DatapointsList,
+    DatapointsQuery,
+    LatestDatapointQuery,
+)
 from cognite.client.data_classes.data_modeling.ids import NodeId
 from cognite.client.data_classes.datapoints import LatestDatapoint, LatestDatapointList
+from cognite.client.data_classes.datapoints_subscriptions import DatapointsUpdate
 from cognite.client.exceptions import CogniteAPIError, CogniteNotFoundError
-from cognite.client.utils._time import datetime_to_ms
+from cognite.client.utils._identifier import Identifier
+from cognite.client.utils._importing import local_import
+from cognite.client.utils._time import datetime_to_ms, granularity_to_ms
 from tests.utils import get_or_raise, get_url, jsgz_load, random_gamma_dist_integer
 
 if TYPE_CHECKING:
@@ -209,6 +227,124 @@ class TestGetLatest:
                 cognite_client.time_series.data.retrieve_latest(id=[123, ldq, ldq, 123])
 
 
+@pytest.fixture
+def mock_latest_callback(httpx_mock: HTTPXMock, async_client: AsyncCogniteClient) -> list[list[dict]]:
+    # Serves a datapoint for all time series with id < 100 (or external ID "ts-<id>"), records requested items:
+    requested = []
+
+    def serve_latest(request: Any) -> Response:
+        items = jsgz_load(request.content)["items"]
+        requested.append(items)
+        res = []
+        for item in items:
+            id_ = item.get("id") or int(item["externalId"].removeprefix("ts-"))
+            if id_ < 100:
+                res.append(
+                    {
+                        "id": id_,
+                        "externalId": f"ts-{id_}",
+                        "isString": False,
+                        "isStep": False,
+                        "type": "numeric",
+                        "datapoints": [{"timestamp": 1000 * len(requested), "value": float(id_)}],
+                    }
+                )
+        return Response(200, json={"items": res})
+
+    url = get_url(async_client.time_series.data, "/timeseries/data/latest")
+    httpx_mock.add_callback(serve_latest, method="POST", url=url, is_reusable=True)
+    return requested
+
+
+class TestLatestDatapointsService:
+    async def test_concurrent_requests_are_combined_and_cached(
+        self, async_client: AsyncCogniteClient, mock_latest_callback: list[list[dict]]
+    ) -> None:
+        async with await async_client.time_series.data.create_latest_service(ttl=0.2) as service:
+            results = await asyncio.gather(
+                service.retrieve_async(id=[1, 2]),
+                service.retrieve_async(id=[2, 3], external_id="ts-4"),
+                service.retrieve_async(id=1),
+            )
+            assert len(mock_latest_callback) == 2  # One per identifier type
+            assert sorted(item.get("id", 0) for items in mock_latest_callback for item in items) == [0, 1, 2, 3]
+            assert [dp.id for dp in results[1]] == [2, 3, 4]
+            assert results[2].value == 1.0
+
+            await service.retrieve_async(id=[1, 2, 3])
+            assert len(mock_latest_callback) == 2
+
+            await asyncio.sleep(0.25)
+            res = await service.retrieve_async(id=[3, 1])
+            assert len(mock_latest_callback) == 3
+            assert [dp.id for dp in res] == [3, 1]
+
+    async def test_cache_changing_while_fetching(
+        self, async_client: AsyncCogniteClient, mock_latest_callback: list[list[dict]]
+    ) -> None:
+        async with await async_client.time_series.data.create_latest_service(ttl=60) as service:
+            await service.retrieve_async(id=1)
+            pending = asyncio.create_task(service.retrieve_async(id=[1, 2]))
+            await asyncio.sleep(0)
+            service._cache.clear()  # E.g. when the subscription starts, or the latest datapoint is deleted
+            assert [dp.id for dp in await pending] == [1, 2]
+
+    async def test_subscription_can_not_be_combined_with_unit_conversion(
+        self, async_client: AsyncCogniteClient
+    ) -> None:
+        with pytest.raises(ValueError, match="subscription can not be used together with 'target_unit'"):
+            await async_client.time_series.data.create_latest_service(
+                subscription_external_id="my-sub", target_unit="temperature:deg_f"
+            )
+
+    async def test_unknown_time_series(
+        self, async_client: AsyncCogniteClient, mock_latest_callback: list[list[dict]]
+    ) -> None:
+        service = await async_client.time_series.data.create_latest_service()
+        assert await service.retrieve_async(id=123, ignore_unknown_ids=True) is None
+        res = await service.retrieve_async(id=[1, 123], ignore_unknown_ids=True)
+        assert [dp.id for dp in res] == [1]
+        with pytest.raises(CogniteNotFoundError, match="Time series not found"):
+            await service.retrieve_async(id=[1, 123])
+        assert len(mock_latest_callback) == 2
+        await service.close_async()
+
+    async def test_subscription_updates_are_applied(
+        self, async_client: AsyncCogniteClient, mock_latest_callback: list[list[dict]]
+    ) -> None:
+        service = await async_client.time_series.data.create_latest_service()
+        await service.retrieve_async(id=[1, 2])
+        service._apply_subscription_update(
+            DatapointsUpdate.load(
+                {
+                    "timeSeries": {"id": 1, "externalId": "ts-1", "isString": False, "type": "numeric"},
+                    "upserts": [{"timestamp": 5000, "value": 5.0}, {"timestamp": 500, "value": 0.5}],
+                    "deletes": [],
+                }
+            )
+        )
+        service._apply_subscription_update(
+            DatapointsUpdate.load(
+                {
+                    "timeSeries": {"id": 2, "isString": False, "type": "numeric"},
+                    "upserts": [],
+                    "deletes": [{"inclusiveBegin": 0, "exclusiveEnd": 2000}],
+                }
+            )
+        )
+        # Results for time series in the subscription do not expire:
+        service._subscribed = {Identifier(1), Identifier(2)}
+        service.ttl = 0
+        res = await service.retrieve_async(id=1)
+        assert (datetime_to_ms(get_or_raise(res.timestamp)), res.value) == (5000, 5.0)
+        assert len(mock_latest_callback) == 1
+
+        # The latest datapoint of id=2 was deleted, so it must be fetched again:
+        await service.retrieve_async(id=2)
+        assert mock_latest_callback[-1] == [{"id": 2, "before": ANY}]
+        await service.close_async()
+
+
 @pytest.fixture
 def mock_post_datapoints(httpx_mock: HTTPXMock, async_client: AsyncCogniteClient) -> HTTPXMock:
     httpx_mock.add_response(
@@ -1062,6 +1198,29 @@ class TestPandasIntegration:
         )
         cognite_client.time_series.data.insert_dataframe(df)
 
+    @pytest.mark.allow_no_semaphore
+    def test_insert_dataframe_object_column_with_nonfinite_floats(
+        self, cognite_client: CogniteClient, mock_post_datapoints: HTTPXMock
+    ) -> None:
+        import pandas as pd
+
+        df = pd.DataFrame({"a": [1.0, math.inf, "x"]}, index=pd.to_datetime([1, 2, 3], unit="ms"))
+        assert df["a"].dtype == object
+        cognite_client.time_series.data.insert_dataframe(df)
+        (item,) = jsgz_load(mock_post_datapoints.get_requests()[0].content)["items"]
+        assert [dp["value"] for dp in item["datapoints"]] == [1.0, "Infinity", "x"]
+
+    def test_insert_dataframe_with_invalid_values(self, cognite_client: CogniteClient) -> None:
+        import pandas as pd
+
+        df = pd.DataFrame({"a": [1.0, {"not": "a value"}]}, index=pd.to_datetime([1, 2]))
+        with pytest.raises(TypeError, match="must be numeric or strings"):
+            cognite_client.time_series.data.insert_dataframe(df)
+
+        df = pd.DataFrame({"a": pd.to_datetime([1, 2])}, index=pd.to_datetime([1, 2]))
+        with pytest.raises(TypeError, match="must be numeric or strings"):
+            cognite_client.time_series.data.insert_dataframe(df)
+
 
 # Increase readability in test data:
 d, t, v = "datapoints", "timestamp", "value"
@@ -1226,3 +1385,420 @@ class TestDatapointsPoster:
             assert 0 < n_dps <= dps_limit
             assert 0 < len(call) <= ts_limit
         assert expected_n_dps == tot_n_dps
+
+    @pytest.mark.dsl
+    def test_insert_from_arrays_is_chunked_and_dumped(
+        self, cognite_client: CogniteClient, async_client: AsyncCogniteClient, monkeypatch: MonkeyPatch
+    ) -> None:
+        np = local_import("numpy")
+        calls = []
+
+        async def override_insert_dps(self: Any, payload: list[dict]) -> None:
+            calls.append([{**dct, "datapoints": dct["datapoints"].dump()} for dct in payload])
+
+        monkeypatch.setattr(dps_io.DatapointsPoster, "_insert_datapoints", override_insert_dps)
+        monkeypatch.setattr(async_client.time_series.data, "_DPS_INSERT_LIMIT", 3)
+        dps = DatapointsArray(
+            id=1,
+            is_string=False,
+            is_step=False,
+            type="numeric",
+            timestamp=np.array([0, 1, 2, 3, 4], dtype="datetime64[ms]").astype("datetime64[ns]"),
+            value=np.array([0.0, np.nan, np.inf, 3.0, 4.0]),
+            status_code=np.array([0, 0, 0, 1073741824, 0], dtype=np.uint32),
+            status_symbol=np.array(["Good", "Good", "Good", "Uncertain", "Good"], dtype=np.object_),
+            null_timestamps={1},
+        )
+        cognite_client.time_series.data.insert_multiple([{"id": 1, "datapoints": dps}, {"id": 1, "datapoints": dps}])
+
+        expected = [
+            {"timestamp": 0, "value": 0.0},
+            {"timestamp": 1, "value": None},
+            {"timestamp": 2, "value": "Infinity"},
+            {"timestamp": 3, "value": 3.0, "status": {"code": 1073741824}},
+            {"timestamp": 4, "value": 4.0},
+        ]
+        # We don't know ordering of calls (executed asynchronously):
+        assert sorted(len(call[0]["datapoints"]) for call in calls) == [1, 3, 3, 3]
+        unittest.TestCase().assertCountEqual([dp for call in calls for dp in call[0]["datapoints"]], 2 * expected)
+
+
+class TestDatapointsWriter:
+    @pytest.fixture
+    def inserted(self, monkeypatch: MonkeyPatch) -> list[list[dict]]:
+        calls: list[list[dict]] = []
+
+        async def override_insert_dps(self: Any, payload: list[dict]) -> None:
+            calls.append(payload)
+
+        monkeypatch.setattr(dps_io.DatapointsPoster, "_insert_datapoints", override_insert_dps)
+        return calls
+
+    def test_coalesces_datapoints_and_flushes_on_close(
+        self, cognite_client: CogniteClient, inserted: list[list[dict]]
+    ) -> None:
+        with cognite_client.time_series.data.create_writer(max_buffer_age=60) as writer:
+            writer.add([(1, 1.0)], external_id="a")
+            writer.add([(2, 2.0)], id=1)
+            writer.add([{"timestamp": 3, "value": 3.0}], external_id="a")
+            assert not inserted
+
+        assert inserted == [
+            [
+                {"externalId": "a", "datapoints": [_InsertDatapoint(1, 1.0), _InsertDatapoint(3, 3.0)]},
+                {"id": 1, "datapoints": [_InsertDatapoint(2, 2.0)]},
+            ]
+        ]
+        with pytest.raises(RuntimeError, match="has been closed"):
+            writer.add([(4, 4.0)], id=1)
+
+    async def test_flushes_on_size_and_age(
+        self, async_client: AsyncCogniteClient, inserted: list[list[dict]], monkeypatch: MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(async_client.time_series.data, "_DPS_INSERT_LIMIT", 3)
+        async with await async_client.time_series.data.create_writer(max_buffer_age=0.3) as writer:
+            await writer.add_async([(1, 1.0), (2, 2.0), (3, 3.0)], id=1)
+            await asyncio.sleep(0.05)  # Let the background flush run
+            assert len(inserted) == 1
+
+            await writer.add_async([(4, 4.0)], id=1)
+            await asyncio.sleep(0.1)
+            assert len(inserted) == 1
+            await asyncio.sleep(0.4)
+            assert len(inserted) == 2
+
+        n_inserted = [len(obj["datapoints"]) for call in inserted for obj in call]
+        assert n_inserted == [3, 1]
+
+    async def test_backpressure_and_background_errors(
+        self, async_client: AsyncCogniteClient, monkeypatch: MonkeyPatch
+    ) -> None:
+        async def failing_insert_dps(self: Any, payload: list[dict]) -> None:
+            raise CogniteAPIError("Boom", code=500)
+
+        monkeypatch.setattr(dps_io.DatapointsPoster, "_insert_datapoints", failing_insert_dps)
+        writer = await async_client.time_series.data.create_writer(max_buffered_datapoints=2)
+        await writer.add_async([(1, 1.0)], id=1)
+        with pytest.raises(CogniteAPIError, match="Boom"):
+            # Buffer is full, so the producer has to wait for the insert (and sees it fail):
+            await writer.add_async([(2, 2.0)], id=1)
+        await writer.close_async()
+
+    def test_datapoints_not_inserted_are_handed_back(
+        self, cognite_client: CogniteClient, monkeypatch: MonkeyPatch
+    ) -> None:
+        async def failing_insert_dps(self: Any, payload: list[dict]) -> None:
+            raise CogniteAPIError("Boom", code=400)
+
+        monkeypatch.setattr(dps_io.DatapointsPoster, "_insert_datapoints", failing_insert_dps)
+        writer = cognite_client.time_series.data.create_writer(max_buffer_age=60)
+        writer.add([(1, 1.0)], id=1)
+        writer.add([(2, 2.0)], external_id="a")
+        with pytest.raises(CogniteAPIError, match="Boom") as err:
+            writer.close()
+
+        # The datapoints are handed back in the format accepted by 'add', instead of being lost with the buffer:
+        assert err.value.failed == [
+            {"id": 1, "datapoints": [{"timestamp": 1, "value": 1.0}]},
+            {"external_id": "a", "datapoints": [{"timestamp": 2, "value": 2.0}]},
+        ]
+        assert err.value.successful == err.value.unknown == []
+
+        # ...so that they can be added again:
+        inserted: list[dict] = []
+
+        async def insert_dps(self: Any, payload: list[dict]) -> None:
+            inserted.extend(payload)
+
+        monkeypatch.setattr(dps_io.DatapointsPoster, "_insert_datapoints", insert_dps)
+        with cognite_client.time_series.data.create_writer() as writer:
+            for item in err.value.failed:
+                writer.add(**item)
+        assert [obj["datapoints"] for obj in inserted] == [[_InsertDatapoint(1, 1.0)], [_InsertDatapoint(2, 2.0)]]
+
+    async def test_errors_of_all_failed_flushes_are_raised_together(
+        self, async_client: AsyncCogniteClient, monkeypatch: MonkeyPatch
+    ) -> None:
+        fail_now = asyncio.Event()
+
+        async def failing_insert_dps(self: Any, payload: list[dict]) -> None:
+            await fail_now.wait()
+            raise CogniteAPIError("Boom", code=500 if payload[0]["id"] == 2 else 400)
+
+        monkeypatch.setattr(dps_io.DatapointsPoster, "_insert_datapoints", failing_insert_dps)
+        monkeypatch.setattr(async_client.time_series.data, "_DPS_INSERT_LIMIT", 1)
+        writer = await async_client.time_series.data.create_writer(max_buffer_age=60)
+        await writer.add_async([(1, 1.0)], id=1)  # Both are flushed in the background...
+        await writer.add_async([(2, 2.0)], id=2)
+        fail_now.set()  # ...and fail before the next call to the writer
+        with pytest.raises(CogniteAPIError, match="Boom") as err:
+            await writer.close_async()
+
+        assert err.value.failed == [{"id": 1, "datapoints": [{"timestamp": 1, "value": 1.0}]}]
+        assert err.value.unknown == [{"id": 2, "datapoints": [{"timestamp": 2, "value": 2.0}]}]
+
+
+@pytest.fixture
+def mock_dps_protobuf(httpx_mock: HTTPXMock, async_client: AsyncCogniteClient) -> list[tuple[int, int]]:
+    # Serves one raw datapoint per second, value is the timestamp in seconds. Records the requested ranges:
+    requested_ranges = []
+
+    def serve_datapoints(request: Any) -> Response:
+        res = DataPointListResponse()
+        for item in jsgz_load(request.content)["items"]:
+            requested_ranges.append((item["start"], item["end"]))
+            first = math.ceil(item["start"] / 1000) * 1000
+            timestamps = range(first, item["end"], 1000)[: item["limit"]]
+            dps_item = res.items.add(id=item["id"], externalId=f"ts-{item['id']}")
+            dps_item.numericDatapoints.datapoints.extend(
+                NumericDatapoint(timestamp=ts, value=ts / 1000) for ts in timestamps
+            )
+        return Response(200, content=res.SerializeToString())
+
+    url = get_url(async_client.time_series.data) + "/timeseries/data/list"
+    httpx_mock.add_callback(serve_datapoints, method="POST", url=url, is_reusable=True)
+    return requested_ranges
+
+
+class TestDatapointsCache:
+    @pytest.fixture(autouse=True)
+    def cache_directory(self, monkeypatch: MonkeyPatch, tmp_path: Path) -> Path:
+        monkeypatch.setattr(global_config, "datapoints_cache_directory", tmp_path)
+        return tmp_path
+
+    def test_only_missing_ranges_are_fetched(
+        self, cognite_client: CogniteClient, mock_dps_protobuf: list[tuple[int, int]]
+    ) -> None:
+        dps = cognite_client.time_series.data.retrieve_arrays(id=1, start=0, end=10_000)
+        assert dps is not None and dps.value is not None
+        assert dps.value.tolist() == list(range(10))
+        assert min(mock_dps_protobuf) == (0, mock_dps_protobuf[0][1])
+        mock_dps_protobuf.clear()
+
+        dps = cognite_client.time_series.data.retrieve_arrays(id=1, start=5_000, end=20_000)
+        assert dps is not None and dps.value is not None
+        assert dps.value.tolist() == list(range(5, 20))
+        assert dps.external_id == "ts-1"
+        assert all(10_000 <= start and end <= 20_000 for start, end in mock_dps_protobuf)
+        mock_dps_protobuf.clear()
+
+        df = cognite_client.time_series.data.retrieve_dataframe(id=1, start=2_000, end=15_000)
+        assert df["ts-1"].tolist() == list(range(2, 15))
+        assert not mock_dps_protobuf
+
+    @pytest.mark.allow_no_semaphore
+    def test_cache_is_invalidated_on_writes(
+        self,
+        cognite_client: CogniteClient,
+        async_client: AsyncCogniteClient,
+        httpx_mock: HTTPXMock,
+        mock_dps_protobuf: list[tuple[int, int]],
+    ) -> None:
+        dps_url = get_url(async_client.time_series.data) + "/timeseries/data"
+        httpx_mock.add_response(method="POST", url=dps_url, json={})
+        httpx_mock.add_response(method="POST", url=dps_url + "/delete", json={})
+        cognite_client.time_series.data.retrieve_arrays(id=1, start=0, end=10_000)
+
+        cognite_client.time_series.data.insert([(3_500, 3.5)], id=1)
+        mock_dps_protobuf.clear()
+        cognite_client.time_series.data.retrieve_arrays(id=1, start=0, end=10_000)
+        assert mock_dps_protobuf
+
+        cognite_client.time_series.data.delete_range(start=0, end=1, id=1)
+        mock_dps_protobuf.clear()
+        cognite_client.time_series.data.retrieve_arrays(id=1, start=0, end=10_000)
+        assert mock_dps_protobuf
+
+    def test_recent_datapoints_are_not_cached(
+        self, cognite_client: CogniteClient, mock_dps_protobuf: list[tuple[int, int]]
+    ) -> None:
+        cognite_client.time_series.data.retrieve_arrays(id=1, start="2m-ago", end="now")
+        mock_dps_protobuf.clear()
+        cognite_client.time_series.data.retrieve_arrays(id=1, start="2m-ago", end="now")
+        assert mock_dps_protobuf
+
+
+class TestDensityPlanning:
+    DENSE_START, END = 9 * 3_600_000, 10 * 3_600_000  # 1 dp/sec in the last hour, nothing before
+    STRING_ID = 3  # Fails requests for aggregates, like string time series
+
+    @pytest.fixture
+    def requested_raw_ranges(
+        self, monkeypatch: MonkeyPatch, httpx_mock: HTTPXMock, async_client: AsyncCogniteClient
+    ) -> list[tuple[int, int, int]]:
+        monkeypatch.setattr(global_config, "datapoints_density_planning", True)
+        dps_api = async_client.time_series.data
+        monkeypatch.setattr(dps_api, "query_validator", _DpsQueryValidator(dps_limit_raw=1000, dps_limit_agg=10_000))
+        requested_ranges = []
+
+        def serve_datapoints(request: Any) -> Response:
+            res = DataPointListResponse()
+            for item in jsgz_load(request.content)["items"]:
+                dps_item = res.items.add(id=item["id"], externalId=f"ts-{item['id']}")
+                if "aggregates" in item:
+                    if item["id"] == self.STRING_ID:
+                        return Response(400, json={"error": {"code": 400, "message": "Aggregates are not supported"}})
+                    gran_ms = granularity_to_ms(item["granularity"])
+                    for ts in range(item["start"], item["end"], gran_ms):
+                        lo, hi = max(ts, self.DENSE_START), min(ts + gran_ms, self.END)
+                        if (count := max(0, math.ceil((hi - lo) / 1000))) > 0:
+                            dps_item.aggregateDatapoints.datapoints.add(timestamp=ts, count=count)
+                    continue
+                start = int(item["cursor"]) if item.get("cursor") else item["start"]
+                requested_ranges.append((item["id"], start, item["end"]))
+                first = max(math.ceil(start / 1000) * 1000, self.DENSE_START)
+                timestamps = range(first, item["end"], 1000)
+                dps_item.numericDatapoints.datapoints.extend(
+                    NumericDatapoint(timestamp=ts, value=ts / 1000) for ts in timestamps[: item["limit"]]
+                )
+                if len(timestamps) > item["limit"]:
+                    dps_item.nextCursor = str(timestamps[item["limit"]])
+            return Response(200, content=res.SerializeToString())
+
+        url = get_url(dps_api) + "/timeseries/data/list"
+        httpx_mock.add_callback(serve_datapoints, method="POST", url=url, is_reusable=True)
+        return requested_ranges
+
+    def test_raw_query_is_split_by_density(
+        self, cognite_client: CogniteClient, requested_raw_ranges: list[tuple[int, int, int]]
+    ) -> None:
+        dps = cognite_client.time_series.data.retrieve_arrays(id=1, start=0, end=self.END)
+        assert dps is not None and dps.value is not None
+        assert dps.value.tolist() == [ts / 1000 for ts in range(self.DENSE_START, self.END, 1000)]
+        # Splitting uniformly would have given many requests for the empty part:
+        assert sum(start < self.DENSE_START for _, start, _ in requested_raw_ranges) == 1
+
+    def test_planning_is_skipped_only_for_time_series_without_aggregates(
+        self, cognite_client: CogniteClient, requested_raw_ranges: list[tuple[int, int, int]]
+    ) -> None:
+        dps_lst = cognite_client.time_series.data.retrieve_arrays(id=[1, self.STRING_ID], start=0, end=self.END)
+        expected = [ts / 1000 for ts in range(self.DENSE_START, self.END, 1000)]
+        assert [dps.value.tolist() for dps in dps_lst] == [expected, expected]
+        assert sum(start < self.DENSE_START for id_, start, _ in requested_raw_ranges if id_ == 1) == 1
+        assert sum(start < self.DENSE_START for id_, start, _ in requested_raw_ranges if id_ != 1) > 1
+
+    def test_planning_is_skipped_for_short_and_limited_queries(
+        self, cognite_client: CogniteClient, requested_raw_ranges: list[tuple[int, int, int]]
+    ) -> None:
+        dps = cognite_client.time_series.data.retrieve(
+            id=[DatapointsQuery(id=1, limit=5), DatapointsQuery(id=2, start=self.END - 60_000)], start=0, end=self.END
+        )
+        assert [len(d) for d in dps] == [5, 60]
+        assert len(requested_raw_ranges) == 2
+
+
+class TestFetchStats:
+    def test_stats_are_reported_per_fetch(
+        self, cognite_client: CogniteClient, mock_dps_protobuf: list[tuple[int, int]], monkeypatch: MonkeyPatch
+    ) -> None:
+        reported: list[DatapointsFetchStats] = []
+        monkeypatch.setattr(global_config, "datapoints_fetch_stats_callback", reported.append)
+
+        dps_lst = cognite_client.time_series.data.retrieve(id=[1, 2, 3], start=0, end=100_000)
+        assert [len(dps) for dps in dps_lst] == [100, 100, 100]
+
+        (stats,) = reported
+        assert stats.failed is False
+        assert stats.strategy == "EagerDpsFetcher"
+        assert stats.n_queries == 3
+        assert stats.n_subtasks >= 3
+        assert stats.n_requests == len(mock_dps_protobuf)
+        assert stats.bytes_received > 0
+        assert stats.fetch_seconds > 0 and stats.semaphore_wait_seconds >= 0 and stats.decode_seconds > 0
+        assert stats.n_datapoints == 300
+        assert stats.datapoints_per_second > 0
+        assert [ts_stats.identifier for ts_stats in stats.time_series] == [{"id": 1}, {"id": 2}, {"id": 3}]
+        assert [ts_stats.n_datapoints for ts_stats in stats.time_series] == [100, 100, 100]
+        assert all(ts_stats.n_requests >= 1 and ts_stats.bytes_received > 0 for ts_stats in stats.time_series)
+
+    def test_stats_are_reported_for_failed_fetch(
+        self,
+        cognite_client: CogniteClient,
+        async_client: AsyncCogniteClient,
+        httpx_mock: HTTPXMock,
+        monkeypatch: MonkeyPatch,
+    ) -> None:
+        reported: list[DatapointsFetchStats] = []
+        monkeypatch.setattr(global_config, "datapoints_fetch_stats_callback", reported.append)
+        httpx_mock.add_response(
+            method="POST",
+            url=get_url(async_client.time_series.data) + "/timeseries/data/list",
+            status_code=400,
+            json={"error": {"code": 400, "message": "Bad request"}},
+        )
+        with pytest.raises(CogniteAPIError, match="Bad request"):
+            cognite_client.time_series.data.retrieve(id=1, start=0, end=100_000)
+
+        (stats,) = reported
+        assert stats.failed is True
+        assert stats.n_datapoints == 0
+        assert stats.fetch_seconds > 0
+
+
+@pytest.mark.dsl
+class TestRetrieveToFiles:
+    @pytest.mark.parametrize("file_format", ["parquet", "npy"])
+    def test_parts_and_manifest(
+        self,
+        file_format: Literal["parquet", "npy"],
+        tmp_path: Path,
+        cognite_client: CogniteClient,
+        mock_dps_protobuf: list[tuple[int, int]],
+    ) -> None:
+        np = local_import("numpy")
+        if file_format == "parquet":
+            pq = pytest.importorskip("pyarrow.parquet")
+        queries = [DatapointsQuery(id=1, start=0, end=250_000), DatapointsQuery(id=2, start=0, end=20_000)]
+        manifest = cognite_client.time_series.data.retrieve_to_files(
+            queries, tmp_path, file_format=file_format, chunk_size_datapoints=100
+        )
+        assert manifest == json.loads((tmp_path / "manifest.json").read_text())
+        assert manifest["complete"] is True
+        ts_1, ts_2 = manifest["timeSeries"]
+        assert (ts_1["id"], ts_1["count"], len(ts_1["parts"])) == (1, 250, 3)
+        assert (ts_2["id"], ts_2["count"], len(ts_2["parts"])) == (2, 20, 1)
+        assert [(p["firstTimestamp"], p["lastTimestamp"]) for p in ts_1["parts"]] == [
+            (0, 99_000),
+            (100_000, 199_000),
+            (200_000, 249_000),
+        ]
+        last_part = tmp_path / ts_1["parts"][-1]["path"]
+        if file_format == "parquet":
+            values = pq.read_table(last_part).column("value").to_pylist()
+        else:
+            values = np.load(last_part / "value.npy", mmap_mode="r").tolist()
+        assert values == list(range(200, 250))
+
+    def test_existing_export_is_not_overwritten(self, tmp_path: Path, cognite_client: CogniteClient) -> None:
+        (tmp_path / "manifest.json").write_text("{}")
+        with pytest.raises(FileExistsError, match="already contains an export"):
+            cognite_client.time_series.data.retrieve_to_files(DatapointsQuery(id=1), tmp_path, file_format="npy")
+
+    def test_duplicated_time_series_are_rejected(self, tmp_path: Path, cognite_client: CogniteClient) -> None:
+        queries = [DatapointsQuery(id=1, start=0, end=10), DatapointsQuery(id=1, start=10, end=20)]
+        with pytest.raises(ValueError, match=r"duplicated identifiers: \['id=1'\]"):
+            cognite_client.time_series.data.retrieve_to_files(queries, tmp_path / "export", file_format="npy")
+        assert not (tmp_path / "export").exists()
+
+    def test_time_series_queried_by_different_identifiers_fails_the_export(
+        self, tmp_path: Path, cognite_client: CogniteClient, async_client: AsyncCogniteClient, httpx_mock: HTTPXMock
+    ) -> None:
+        def serve_same_time_series(request: Any) -> Response:
+            res = DataPointListResponse()
+            for item in jsgz_load(request.content)["items"]:
+                res_item = res.items.add(id=1, externalId="ts-1")
+                res_item.numericDatapoints.datapoints.extend(
+                    NumericDatapoint(timestamp=ts, value=1) for ts in range(item["start"], item["end"], 1000)
+                )
+            return Response(200, content=res.SerializeToString())
+
+        httpx_mock.add_callback(
+            serve_same_time_series,
+            method="POST",
+            url=get_url(async_client.time_series.data) + "/timeseries/data/list",
+            is_reusable=True,
+        )
+        queries = [DatapointsQuery(id=1, start=0, end=5000), DatapointsQuery(external_id="ts-1", start=0, end=5000)]
+        with pytest.raises(RuntimeError, match="identifiers must be unique"):
+            cognite_client.time_series.data.retrieve_to_files(queries, tmp_path, file_format="npy")
+        assert json.loads((tmp_path / "manifest.json").read_text())["complete"] is False
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from httpx import Response
+from pytest_httpx import HTTPXMock
+
+from cognite.client import AsyncCogniteClient
+from cognite.client.data_classes.datapoints_subscriptions import (
+    FileSubscriptionCursorStore,
+    InMemorySubscriptionCursorStore,
+)
+from tests.utils import get_url, jsgz_load
+
+if TYPE_CHECKING:
+    from cognite.client import CogniteClient
+
+
+class TestIterateDataPartitions:
+    def test_partitions_are_read_with_independent_cursors(
+        self, cognite_client: CogniteClient, async_client: AsyncCogniteClient, httpx_mock: HTTPXMock
+    ) -> None:
+        requests = []
+
+        def serve_data(request: Any) -> Response:
+            body = jsgz_load(request.content)
+            ((partition,),) = [body["partitions"]]
+            requests.append((partition["index"], partition.get("cursor"), body.get("initializeCursors")))
+            # Cursors are "<partition>-<number of reads>":
+            n_reads = int(partition["cursor"].split("-")[1]) + 1 if "cursor" in partition else 1
+            return Response(
+                200,
+                json={
+                    "updates": [],
+                    "subscriptionChanges": {},
+                    "partitions": [{"index": partition["index"], "nextCursor": f"{partition['index']}-{n_reads}"}],
+                    "hasNext": False,
+                },
+            )
+
+        url = get_url(async_client.time_series.subscriptions) + "/timeseries/subscriptions/data/list"
+        httpx_mock.add_callback(serve_data, method="POST", url=url, is_reusable=True)
+
+        store = InMemorySubscriptionCursorStore()
+        store.set_cursor("my-sub", 1, "1-5")
+        seen: dict[int, list[str]] = {0: [], 1: []}
+        for batch in cognite_client.time_series.subscriptions.iterate_data_partitions(
+            "my-sub", partitions=[0, 1], start="1d-ago", cursor_store=store, max_buffered_batches=1
+        ):
+            seen[batch.partition].append(batch.cursor)
+            if min(map(len, seen.values())) >= 3:
+                break
+        last_partition = batch.partition
+
+        assert seen[0][:3] == ["0-1", "0-2", "0-3"]
+        assert seen[1][:3] == ["1-6", "1-7", "1-8"]
+        # Only the partition without a stored cursor is initialized from 'start':
+        assert (0, None, "1d-ago") in requests
+        assert (1, "1-5", None) in requests
+        # A cursor is only stored once the batch has been processed (i.e. not for the batch we broke out on):
+        assert store.get_cursor("my-sub", last_partition) == seen[last_partition][-2]
+        assert store.get_cursor("my-sub", 1 - last_partition) == seen[1 - last_partition][-1]
+
+
+class TestFileSubscriptionCursorStore:
+    def test_cursors_survive_reload(self, tmp_path: Path) -> None:
+        path = tmp_path / "cursors.json"
+        store = FileSubscriptionCursorStore(path)
+        assert store.get_cursor("my-sub", 0) is None
+        store.set_cursor("my-sub", 0, "abc")
+        store.set_cursor("my-sub", 1, "def")
+
+        reloaded = FileSubscriptionCursorStore(path)
+        assert reloaded.get_cursor("my-sub", 0) == "abc"
+        assert reloaded.get_cursor("my-sub", 1) == "def"
+        assert reloaded.get_cursor("other-sub", 0) is None
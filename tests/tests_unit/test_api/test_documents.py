@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+import gzip
+import json
 import re
 from collections.abc import Iterator
-from typing import TYPE_CHECKING, Any
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar
 
 import pytest
+from httpx import Request, Response
 from pytest_httpx import HTTPXMock
 
 from cognite.client import CogniteClient
 from cognite.client.data_classes import Document
-from tests.utils import get_url
+from tests.utils import get_or_raise, get_url, jsgz_load
 
 if TYPE_CHECKING:
     from pytest_httpx import HTTPXMock
@@ -157,6 +161,17 @@ def mock_documents_search_response(
     yield httpx_mock
 
 
+@pytest.fixture
+def mock_document_content(httpx_mock: HTTPXMock, async_client: AsyncCogniteClient) -> HTTPXMock:
+    def extract_content(request: Request) -> Response:
+        ((_, identifier),) = jsgz_load(request.content).items()
+        return Response(200, content=f"content of {identifier}".encode())
+
+    url = get_url(async_client.documents) + "/documents/content"
+    httpx_mock.add_callback(extract_content, method="POST", url=url, is_reusable=True)
+    return httpx_mock
+
+
 class TestDocumentsAPI:
     @pytest.mark.usefixtures("mock_documents_list_response")
     def test_list(self, cognite_client: CogniteClient, example_documents: list[dict[str, Any]]) -> None:
@@ -178,3 +193,87 @@ class TestDocumentsAPI:
     def test_search_limit(self, cognite_client: CogniteClient) -> None:
         documents = cognite_client.documents.search(query="a", limit=1)
         assert len(documents) == 1
+
+    @pytest.mark.usefixtures("mock_document_content")
+    def test_retrieve_content_multiple(self, cognite_client: CogniteClient) -> None:
+        ids = list(range(1, 51))
+        result = dict(cognite_client.documents.retrieve_content_multiple(ids=ids))
+        assert result == {i: f"content of {i}".encode() for i in ids}
+
+        result = dict(cognite_client.documents.retrieve_content_multiple(external_ids=["a", "b"]))
+        assert result == {"a": b"content of a", "b": b"content of b"}
+
+    def test_retrieve_content_multiple_by_filter(
+        self,
+        cognite_client: CogniteClient,
+        async_client: AsyncCogniteClient,
+        mock_document_content: HTTPXMock,
+        example_documents: list[dict[str, Any]],
+    ) -> None:
+        mock_document_content.add_response(
+            method="POST", url=get_url(async_client.documents) + "/documents/list", json={"items": example_documents}
+        )
+        result = dict(cognite_client.documents.retrieve_content_multiple(filter={"equals": {"property": ["id"]}}))
+        assert result == {doc["id"]: f"content of {doc['id']}".encode() for doc in example_documents}
+
+        with pytest.raises(ValueError, match="not both"):
+            next(cognite_client.documents.retrieve_content_multiple(ids=[1], filter={"equals": {"property": ["id"]}}))
+
+    @pytest.mark.usefixtures("mock_document_content")
+    def test_retrieve_content_to_jsonl(self, cognite_client: CogniteClient, tmp_path: Path) -> None:
+        path = tmp_path / "documents.jsonl.gz"
+        n_written = cognite_client.documents.retrieve_content_to_jsonl(path, ids=[1, 2], external_ids=["a"])
+
+        assert n_written == 3
+        with gzip.open(path, "rt") as fh:
+            lines = [json.loads(line) for line in fh]
+        assert sorted(lines, key=str) == [
+            {"externalId": "a", "content": "content of a"},
+            {"id": 1, "content": "content of 1"},
+            {"id": 2, "content": "content of 2"},
+        ]
+
+
+@pytest.fixture
+def mock_page_previews(httpx_mock: HTTPXMock, async_client: AsyncCogniteClient) -> HTTPXMock:
+    url_pattern = re.compile(re.escape(get_url(async_client.documents)) + r"/documents/(\d+)/preview/image/pages/(\d+)")
+
+    def render_page(request: Request) -> Response:
+        doc_id, page_number = get_or_raise(url_pattern.match(str(request.url))).groups()
+        return Response(200, content=f"png-{doc_id}-{page_number}".encode())
+
+    httpx_mock.add_callback(render_page, method="GET", url=url_pattern, is_reusable=True)
+    return httpx_mock
+
+
+class TestDocumentPreviewAPI:
+    pages: ClassVar[dict[int, list[int]]] = {123: [1, 2], 456: [3]}
+
+    @pytest.mark.usefixtures("mock_page_previews")
+    def test_download_pages_as_png_to_directory(self, cognite_client: CogniteClient, tmp_path: Path) -> None:
+        cognite_client.documents.previews.download_pages_as_png(self.pages, directory=tmp_path)
+
+        assert {p.name: p.read_bytes() for p in tmp_path.iterdir()} == {
+            "123_page1.png": b"png-123-1",
+            "123_page2.png": b"png-123-2",
+            "456_page3.png": b"png-456-3",
+        }
+        with pytest.raises(FileExistsError, match="overwrite=True"):
+            cognite_client.documents.previews.download_pages_as_png(self.pages, directory=tmp_path)
+
+    @pytest.mark.usefixtures("mock_page_previews")
+    def test_download_pages_as_png_to_callback(self, cognite_client: CogniteClient) -> None:
+        received = {}
+
+        def callback(doc_id: int, page_number: int, png: bytes) -> None:
+            received[doc_id, page_number] = png
+
+        cognite_client.documents.previews.download_pages_as_png(self.pages, callback=callback)
+
+        assert received == {(123, 1): b"png-123-1", (123, 2): b"png-123-2", (456, 3): b"png-456-3"}
+
+    def test_download_pages_as_png_requires_one_output(self, cognite_client: CogniteClient, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="Exactly one of"):
+            cognite_client.documents.previews.download_pages_as_png(self.pages)
+        with pytest.raises(ValueError, match="Exactly one of"):
+            cognite_client.documents.previews.download_pages_as_png(self.pages, directory=tmp_path, callback=print)
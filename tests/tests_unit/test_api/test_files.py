@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import os
 import re
 from collections.abc import Callable, Iterator
@@ -16,7 +17,12 @@ from pytest_httpx import HTTPXMock
 
 from cognite.client import CogniteClient
 from cognite.client._api.files import FilesAPI
-from cognite.client._constants import FILE_MAX_MULTIPART_COUNT, FILE_MAX_MULTIPART_SIZE, FILE_MIN_MULTIPART_SIZE
+from cognite.client._constants import (
+    FILE_CHECKSUM_METADATA_KEY,
+    FILE_MAX_MULTIPART_COUNT,
+    FILE_MAX_MULTIPART_SIZE,
+    FILE_MIN_MULTIPART_SIZE,
+)
 from cognite.client.config import global_config
 from cognite.client.data_classes import GeoLocation, GeoLocationFilter, Geometry, GeometryFilter, TimestampRange
 from cognite.client.data_classes._base import UnknownCogniteResource
@@ -29,7 +35,13 @@ from cognite.client.data_classes.files import (
     FileMetadataWrite,
 )
 from cognite.client.data_classes.labels import Label, LabelFilter
-from cognite.client.exceptions import CogniteAPIError, CogniteAuthorizationError, CogniteFileUploadError
+from cognite.client.exceptions import (
+    CogniteAPIError,
+    CogniteAuthorizationError,
+    CogniteFileChecksumError,
+    CogniteFileUploadError,
+)
+from cognite.client.utils._checksum import FileChecksum
 from tests.tests_unit.conftest import DefaultResourceGenerator
 from tests.utils import get_or_raise, get_url, jsgz_load
 
@@ -832,6 +844,81 @@ class TestFilesAPI:
         assert {"name": "bla"} == jsgz_load(httpx_mock.get_requests()[0].content)
         assert f"content1{os.linesep}".encode() == httpx_mock.get_requests()[1].content
 
+    def test_upload_bytes_multiple_with_journal(
+        self,
+        cognite_client: CogniteClient,
+        example_file: dict[str, Any],
+        async_client: AsyncCogniteClient,
+        httpx_mock: HTTPXMock,
+        tmp_path: Path,
+    ) -> None:
+        def create_file(request: Request) -> Response:
+            return Response(200, json={**example_file, "externalId": jsgz_load(request.content)["externalId"]})
+
+        httpx_mock.add_callback(
+            create_file, method="POST", url=get_url(async_client.files) + "/files?overwrite=false", is_reusable=True
+        )
+        httpx_mock.add_response(method="PUT", url="https://upload.here", status_code=200, is_reusable=True)
+        journal = tmp_path / "journal.jsonl"
+        journal.write_text('{"externalId": "a", "id": 1}\n')
+        items = [(FileMetadataWrite(name=xid, external_id=xid), f"content-{xid}") for xid in "abc"]
+
+        res = cognite_client.files.upload_bytes_multiple(items, journal=journal)
+
+        assert sorted(res.as_external_ids()) == ["b", "c"]
+        created = [jsgz_load(r.content)["externalId"] for r in httpx_mock.get_requests(method="POST")]
+        assert sorted(created) == ["b", "c"]
+        assert sorted(r.content for r in httpx_mock.get_requests(method="PUT")) == [b"content-b", b"content-c"]
+        assert len(journal.read_text().splitlines()) == 5  # 'created' and 'uploaded' for each new file
+
+        # Everything is now recorded in the journal, so nothing more should be uploaded:
+        assert len(cognite_client.files.upload_bytes_multiple(items, journal=journal)) == 0
+
+    def test_upload_bytes_multiple_journal_overwrites_files_created_but_not_uploaded(
+        self,
+        cognite_client: CogniteClient,
+        example_file: dict[str, Any],
+        async_client: AsyncCogniteClient,
+        httpx_mock: HTTPXMock,
+        tmp_path: Path,
+    ) -> None:
+        httpx_mock.add_response(
+            method="POST",
+            url=get_url(async_client.files) + "/files?overwrite=true",
+            json={**example_file, "externalId": "a"},
+        )
+        httpx_mock.add_response(method="PUT", url="https://upload.here", status_code=200)
+        journal = tmp_path / "journal.jsonl"
+        journal.write_text('{"externalId": "a", "id": 1, "status": "created"}\n')
+
+        res = cognite_client.files.upload_bytes_multiple(
+            [(FileMetadataWrite(name="a", external_id="a"), b"content")], journal=journal
+        )
+        assert res.as_external_ids() == ["a"]
+        assert [json.loads(line)["status"] for line in journal.read_text().splitlines()] == [
+            "created",
+            "created",
+            "uploaded",
+        ]
+
+    def test_upload_bytes_multiple_journal_requires_external_id(
+        self, cognite_client: CogniteClient, tmp_path: Path
+    ) -> None:
+        with pytest.raises(ValueError, match="must have an external ID"):
+            cognite_client.files.upload_bytes_multiple(
+                [(FileMetadataWrite(name="no-xid"), b"content")], journal=tmp_path / "journal.jsonl"
+            )
+
+    def test_upload_bytes_multiple_rejects_duplicated_external_ids(self, cognite_client: CogniteClient) -> None:
+        items = [
+            (FileMetadataWrite(name="a", external_id="a"), b"content"),
+            (FileMetadataWrite(name="b", external_id="b"), b"content"),
+            (FileMetadataWrite(name="a-again", external_id="a"), b"content"),
+            (FileMetadataWrite(name="no-xid"), b"content"),
+        ]
+        with pytest.raises(ValueError, match=r"got duplicates: \['a'\]"):
+            cognite_client.files.upload_bytes_multiple(items)
+
     def test_upload_path_does_not_exist(self, cognite_client: CogniteClient) -> None:
         with pytest.raises(FileNotFoundError):
             cognite_client.files.upload(path=Path("/no/such/path"))
@@ -887,6 +974,41 @@ class TestFilesAPI:
 
         assert exc_info.value.code == 400
 
+    @pytest.mark.parametrize("memory_map", [False, True])
+    def test_upload_multipart_parts_content(
+        self,
+        cognite_client: CogniteClient,
+        example_file: dict[str, Any],
+        async_client: AsyncCogniteClient,
+        httpx_mock: HTTPXMock,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        memory_map: bool,
+    ) -> None:
+        monkeypatch.setattr(global_config, "file_upload_memory_map", memory_map)
+        monkeypatch.setattr(global_config, "file_upload_chunk_size", 3)
+        upload_urls = [f"https://upload.here/part{i}" for i in range(3)]
+        httpx_mock.add_response(
+            method="POST",
+            url=re.compile(re.escape(get_url(async_client.files) + "/files/initmultipartupload") + r"\?.*"),
+            status_code=200,
+            json={**example_file, "uploadUrls": upload_urls, "uploadId": "test-id"},
+        )
+        for url in upload_urls:
+            httpx_mock.add_response(method="PUT", url=url, status_code=200)
+        httpx_mock.add_response(
+            method="POST", url=get_url(async_client.files) + "/files/completemultipartupload", status_code=200, json={}
+        )
+        test_file = tmp_path / "test.bin"
+        test_file.write_bytes(b"0123456789")
+
+        with patch.object(async_client.files, "calculate_part_size_and_count", return_value=(4, 3)):
+            cognite_client.files.upload(test_file, external_id="test")
+
+        put_requests = {str(r.url): r for r in httpx_mock.get_requests(method="PUT")}
+        assert [put_requests[url].content for url in upload_urls] == [b"0123", b"4567", b"89"]
+        assert [put_requests[url].headers["Content-Length"] for url in upload_urls] == ["4", "4", "2"]
+
     @pytest.mark.parametrize(
         "file_size, expected_parts",
         [
@@ -1238,6 +1360,151 @@ class TestFilesAPI:
         assert peak == concurrency_limit
 
 
+class TestFileChecksum:
+    def test_composite_checksum_is_independent_of_transfer_order(self, tmp_path: Path) -> None:
+        content = bytes(range(256)) * 10
+        sequential = FileChecksum(part_size=1000)
+        for i in range(0, len(content), 7):
+            sequential.update(content[i : i + 7])
+
+        by_part = FileChecksum(part_size=1000, num_parts=3)
+        for part_no in reversed(range(3)):
+            by_part.update_part(part_no, content[part_no * 1000 : (part_no + 1) * 1000])
+
+        (path := tmp_path / "content.bin").write_bytes(content)
+        assert sequential.value() == by_part.value() == FileChecksum.from_path(path, part_size=1000).value()
+        assert FileChecksum.from_value(by_part.value()).part_size == 1000
+
+    def test_upload_stores_checksum(
+        self,
+        cognite_client: CogniteClient,
+        async_client: AsyncCogniteClient,
+        mock_file_upload_response: dict[str, Any],
+        httpx_mock: HTTPXMock,
+        tmp_path: Path,
+    ) -> None:
+        httpx_mock.add_response(
+            method="POST",
+            url=get_url(async_client.files) + "/files/update",
+            json={"items": [mock_file_upload_response]},
+        )
+        (path := tmp_path / "test.bin").write_bytes(b"content")
+
+        cognite_client.files.upload(path, external_id="test", checksum=True)
+
+        expected = FileChecksum.from_path(path, part_size=FILE_MIN_MULTIPART_SIZE).value()
+        (update_request,) = [r for r in httpx_mock.get_requests() if r.url.path.endswith("/files/update")]
+        assert jsgz_load(update_request.content)["items"][0]["update"] == {
+            "metadata": {"add": {FILE_CHECKSUM_METADATA_KEY: expected}}
+        }
+
+    @pytest.mark.parametrize("unchanged", [True, False])
+    def test_upload_skip_if_unchanged(
+        self,
+        cognite_client: CogniteClient,
+        async_client: AsyncCogniteClient,
+        mock_file_upload_response: dict[str, Any],
+        httpx_mock: HTTPXMock,
+        tmp_path: Path,
+        unchanged: bool,
+    ) -> None:
+        (path := tmp_path / "test.bin").write_bytes(b"content")
+        checksum = FileChecksum.from_path(path, part_size=FILE_MIN_MULTIPART_SIZE).value()
+        existing = {
+            **mock_file_upload_response,
+            "metadata": {FILE_CHECKSUM_METADATA_KEY: checksum if unchanged else "sha256:1:abc"},
+        }
+        httpx_mock.add_response(
+            method="POST", url=get_url(async_client.files) + "/files/byids", json={"items": [existing]}
+        )
+
+        if not unchanged:
+            httpx_mock.add_response(
+                method="POST",
+                url=get_url(async_client.files) + "/files/update",
+                json={"items": [mock_file_upload_response]},
+            )
+
+        cognite_client.files.upload(path, external_id="test", skip_if_unchanged=True, overwrite=True)
+
+        init_requests = [r for r in httpx_mock.get_requests() if "/initmultipartupload" in str(r.url)]
+        if unchanged:
+            assert not init_requests
+            httpx_mock.reset()  # the upload mocks are not used
+        else:
+            # The checksum is only stored once the content is uploaded:
+            (init_request,) = init_requests
+            assert "metadata" not in jsgz_load(init_request.content)
+            (update_request,) = [r for r in httpx_mock.get_requests() if r.url.path.endswith("/files/update")]
+            assert jsgz_load(update_request.content)["items"][0]["update"] == {
+                "metadata": {"add": {FILE_CHECKSUM_METADATA_KEY: checksum}}
+            }
+
+    def test_failed_upload_skip_if_unchanged_does_not_store_checksum(
+        self,
+        cognite_client: CogniteClient,
+        async_client: AsyncCogniteClient,
+        example_file: dict[str, Any],
+        httpx_mock: HTTPXMock,
+        tmp_path: Path,
+    ) -> None:
+        (path := tmp_path / "test.bin").write_bytes(b"new content")
+        existing = {**example_file, "metadata": {FILE_CHECKSUM_METADATA_KEY: "sha256:1:abc"}}
+        httpx_mock.add_response(
+            method="POST", url=get_url(async_client.files) + "/files/byids", json={"items": [existing]}
+        )
+        httpx_mock.add_response(
+            method="POST",
+            url=re.compile(re.escape(get_url(async_client.files) + "/files/initmultipartupload") + r"\?.*"),
+            json={**example_file, "uploadUrls": ["https://upload.here/part0"], "uploadId": "test-upload-id"},
+        )
+        httpx_mock.add_response(method="PUT", url="https://upload.here/part0", status_code=400)
+
+        with pytest.raises(CogniteFileUploadError):
+            cognite_client.files.upload(path, external_id="test", skip_if_unchanged=True, overwrite=True)
+
+        # Otherwise, the old content would be kept with the new checksum, and never be replaced:
+        for request in httpx_mock.get_requests():
+            assert not request.url.path.endswith("/files/update")
+            if "/initmultipartupload" in request.url.path:
+                assert FILE_CHECKSUM_METADATA_KEY not in jsgz_load(request.content).get("metadata", {})
+
+    def test_skip_if_unchanged_requires_external_id(self, cognite_client: CogniteClient, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="external ID is required"):
+            cognite_client.files.upload(tmp_path, skip_if_unchanged=True)
+
+    @pytest.mark.parametrize("content, is_valid", [(b"content1", True), (b"corrupted", False)])
+    def test_download_to_path_verify_checksum(
+        self,
+        cognite_client: CogniteClient,
+        async_client: AsyncCogniteClient,
+        httpx_mock: HTTPXMock,
+        tmp_path: Path,
+        content: bytes,
+        is_valid: bool,
+    ) -> None:
+        checksum = FileChecksum(part_size=FILE_MIN_MULTIPART_SIZE)
+        checksum.update(b"content1")
+        file = {"id": 1, "name": "file1", "uploaded": True, "createdTime": 123, "lastUpdatedTime": 123}
+        file["metadata"] = {FILE_CHECKSUM_METADATA_KEY: checksum.value()}
+        httpx_mock.add_response(method="POST", url=get_url(async_client.files) + "/files/byids", json={"items": [file]})
+        httpx_mock.add_response(
+            method="POST",
+            url=get_url(async_client.files) + "/files/downloadlink",
+            json={"items": [{"id": 1, "downloadUrl": "https://download.file1.here"}]},
+        )
+        httpx_mock.add_response(method="GET", url="https://download.file1.here", content=content)
+        path = tmp_path / "file1"
+
+        if is_valid:
+            cognite_client.files.download_to_path(path, id=1, verify_checksum=True)
+            assert path.read_bytes() == content
+        else:
+            with pytest.raises(CogniteFileChecksumError, match="Checksum mismatch"):
+                cognite_client.files.download_to_path(path, id=1, verify_checksum=True)
+            assert not path.exists()
+
+
 @pytest.fixture
 def lying_stat(monkeypatch: pytest.MonkeyPatch) -> None:
     """Monkeypatch Path.stat to report st_size=0, mimicking Pyodide's broken fstat."""
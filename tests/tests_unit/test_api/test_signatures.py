@@ -136,6 +136,8 @@ class TestFileMetadataUploadSignatures:
         del upload_parameters["overwrite"]
         del upload_parameters["name"]
         del upload_parameters["security_categories"]
+        del upload_parameters["checksum"]
+        del upload_parameters["skip_if_unchanged"]
         upload_from_memory_parameters = dict(inspect.signature(files.FilesAPI.upload_bytes).parameters)
         del upload_from_memory_parameters["content"]
         del upload_from_memory_parameters["overwrite"]
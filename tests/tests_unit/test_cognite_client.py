@@ -11,7 +11,9 @@ import pytest
 from pytest_httpx import HTTPXMock
 
 from cognite.client import AsyncCogniteClient, ClientConfig, CogniteClient, global_config
+from cognite.client._api.assets import AssetsAPI
 from cognite.client._http_client import _global_async_httpx_clients, get_global_async_httpx_client
+from cognite.client._sync_api.time_series import SyncTimeSeriesAPI
 from cognite.client.credentials import OAuthClientCredentials, Token
 from cognite.client.utils._logging import DebugLogFormatter
 
@@ -187,3 +189,48 @@ class TestCogniteClient:
             text=True,
         )
         assert result.returncode == 0, result.stderr
+
+    def test_apis_are_created_on_first_access(self, client_config_w_token_factory: ClientConfig) -> None:
+        async_client = AsyncCogniteClient(client_config_w_token_factory)
+        assert "assets" not in vars(async_client)
+        assets_api = async_client.assets
+        assert isinstance(assets_api, AssetsAPI)
+        assert async_client.assets is assets_api is vars(async_client)["assets"]
+
+        sync_client = CogniteClient(client_config_w_token_factory)
+        assert "time_series" not in vars(sync_client)
+        assert sync_client.time_series is sync_client.time_series
+        assert isinstance(sync_client.time_series, SyncTimeSeriesAPI)
+
+
+class TestImportTime:
+    # Runs in a subprocess, as the test suite itself has imported most of the SDK already:
+    CODE = """
+import sys, time
+
+t0 = time.perf_counter()
+from cognite.client import AsyncCogniteClient, ClientConfig, CogniteClient
+from cognite.client.credentials import Token
+
+config = ClientConfig(client_name="a", project="p", cluster="api", credentials=Token("abc"))
+client = CogniteClient(config)
+async_client = AsyncCogniteClient(config)
+elapsed = time.perf_counter() - t0
+
+loaded = [m for m in sys.modules if m.startswith(("cognite.client._api.", "cognite.client._sync_api."))]
+loaded += [m for m in ("cognite.client.data_classes.capabilities", "cognite.client.data_classes.datapoints",
+    "cognite.client.data_classes.data_modeling.instances", "cognite.client.data_classes.data_modeling.cdm.v1")
+    if m in sys.modules]
+assert not loaded, f"Expected lazily imported modules to not be loaded, got: {loaded}"
+
+t0 = time.perf_counter()
+client.assets, client.data_modeling.instances
+assert "cognite.client._api.assets" in sys.modules
+assert "cognite.client._api.time_series" not in sys.modules
+print(f"Import and client creation: {elapsed * 1000:.0f} ms, first use of two APIs: "
+      f"{(time.perf_counter() - t0) * 1000:.0f} ms")
+"""
+
+    def test_import_and_client_creation_is_lazy(self) -> None:
+        result = subprocess.run([sys.executable, "-c", self.CODE], capture_output=True, text=True)
+        assert result.returncode == 0, result.stdout + result.stderr
@@ -73,6 +73,7 @@ class TestGlobalConfig:
             ("file_download_chunk_size", 1024),
             ("file_upload_chunk_size", None),
             ("file_upload_chunk_size", 65536),
+            ("file_upload_memory_map", True),
         ],
     )
     def test_validated_attrs_valid(self, monkeypatch: MonkeyPatch, attr: str, value: object) -> None:
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import date, datetime
+from datetime import date, datetime, timezone
 from typing import Any, cast
 
 import pytest
@@ -27,6 +27,7 @@ from cognite.client.data_classes.data_modeling.instances import (
     TypeInformation,
     TypePropertyDefinition,
 )
+from cognite.client.utils._importing import local_import
 
 
 class TestEdgeApply:
@@ -598,6 +599,86 @@ class TestInstancesToPandas:
         assert node_df2.at["name", "value"] == "Foo Bar"
 
 
+@pytest.mark.dsl
+class TestInstancesToArrow:
+    @staticmethod
+    def _raw_node(xid: str, **properties: Any) -> dict[str, Any]:
+        return {
+            "instanceType": "node",
+            "space": "s",
+            "externalId": xid,
+            "version": 1,
+            "createdTime": 1_700_000_000_000,
+            "lastUpdatedTime": 1_700_000_000_001,
+            "type": {"space": "s", "externalId": "Pump"},
+            "properties": {"s": {"Pump/v1": properties}},
+        }
+
+    def test_property_types_from_typing(self) -> None:
+        typing = TypeInformation._load(
+            {
+                "s": {
+                    "Pump/v1": {
+                        "pressure": {"type": {"type": "float32", "list": False}},
+                        "count": {"type": {"type": "int32", "list": False}},
+                        "installed": {"type": {"type": "timestamp", "list": False}},
+                        "site": {"type": {"type": "direct", "list": False}},
+                        "parts": {"type": {"type": "direct", "list": True}},
+                        "meta": {"type": {"type": "json", "list": False}},
+                    }
+                }
+            }
+        )
+        site = {"space": "s", "externalId": "oslo"}
+        nodes = NodeList._load(
+            [
+                self._raw_node(
+                    "a", pressure=1.5, count=1, installed="2024-01-01T12:00:00.000+01:00", site=site, parts=[site]
+                ),
+                self._raw_node("b", count=2, meta={"x": [1, 2]}),
+            ]
+        )
+        nodes.typing = typing
+        table = nodes.to_arrow()
+
+        pa = local_import("pyarrow")
+        instance_id_type = pa.struct([("space", pa.string()), ("external_id", pa.string())])
+        assert table.schema.field("created_time").type == pa.timestamp("ms", tz="UTC")
+        assert table.schema.field("type").type == instance_id_type
+        assert table.schema.field("pressure").type == pa.float32()
+        assert table.schema.field("count").type == pa.int32()
+        assert table.schema.field("parts").type == pa.list_(instance_id_type)
+        assert table.column("installed").to_pylist() == [datetime(2024, 1, 1, 11, tzinfo=timezone.utc), None]
+        assert table.column("site").to_pylist() == [{"space": "s", "external_id": "oslo"}, None]
+        assert table.column("meta").to_pylist() == [None, '{"x": [1, 2]}']
+        assert table.column("external_id").to_pylist() == ["a", "b"]
+
+    def test_property_types_inferred(self) -> None:
+        nodes = NodeList._load(
+            [
+                self._raw_node("a", name="A", mixed=1, site={"space": "s", "externalId": "oslo"}),
+                self._raw_node("b", name="B", mixed="one"),
+            ]
+        )
+        table = nodes.to_arrow(camel_case=True, remove_property_prefix=False)
+        assert table.column_names[:2] == ["space", "externalId"]
+        assert table.column("s.Pump/v1.name").to_pylist() == ["A", "B"]
+        assert table.column("s.Pump/v1.mixed").to_pylist() == ["1", '"one"']
+        assert table.column("s.Pump/v1.site").to_pylist() == [{"space": "s", "external_id": "oslo"}, None]
+
+    def test_edges_have_start_and_end_nodes(self) -> None:
+        raw_edge = {
+            **self._raw_node("e"),
+            "instanceType": "edge",
+            "startNode": {"space": "s", "externalId": "a"},
+            "endNode": {"space": "s", "externalId": "b"},
+        }
+        table = EdgeList._load([raw_edge]).to_arrow()
+        assert table.column("start_node").to_pylist() == [{"space": "s", "external_id": "a"}]
+        assert table.column("end_node").to_pylist() == [{"space": "s", "external_id": "b"}]
+        assert table.column("instance_type").to_pylist() == ["edge"]
+
+
 class TestTypeInformation:
     @pytest.mark.dsl
     def test_to_pandas(self) -> None:
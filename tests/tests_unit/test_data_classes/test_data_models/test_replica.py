@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from cognite.client.data_classes import filters as f
+from cognite.client.data_classes.data_modeling.ids import NodeId, ViewId
+from cognite.client.data_classes.data_modeling.replica import InstanceReplica
+
+VIEW = ViewId("s", "Pump", "v1")
+
+
+def make_node(xid: str, **properties: Any) -> dict[str, Any]:
+    return {
+        "instanceType": "node",
+        "space": "s",
+        "externalId": xid,
+        "version": 1,
+        "createdTime": 0,
+        "lastUpdatedTime": 0,
+        "properties": {"s": {"Pump/v1": properties}} if properties else {},
+    }
+
+
+def make_edge(xid: str, start: str, end: str) -> dict[str, Any]:
+    return {
+        "instanceType": "edge",
+        "space": "s",
+        "externalId": xid,
+        "version": 1,
+        "createdTime": 0,
+        "lastUpdatedTime": 0,
+        "type": {"space": "s", "externalId": "flows_to"},
+        "startNode": {"space": "s", "externalId": start},
+        "endNode": {"space": "s", "externalId": end},
+        "properties": {},
+    }
+
+
+@pytest.fixture
+def pumps() -> InstanceReplica:
+    return InstanceReplica(
+        [
+            make_node("p1", name="alpha", pressure=1.5, tags=["a", "b"], site={"space": "s", "externalId": "oslo"}),
+            make_node("p2", name="beta", pressure=3.0, tags=["b"]),
+            make_node("p3", name="alphabet"),
+            make_node("no-props"),
+        ]
+    )
+
+
+def xids(instances: Any) -> list[str]:
+    return sorted(inst.external_id for inst in instances)
+
+
+class TestInstanceReplica:
+    @pytest.mark.parametrize(
+        "flt, expected",
+        [
+            (f.Equals(VIEW.as_property_ref("name"), "beta"), ["p2"]),
+            (f.Equals(["node", "externalId"], "p3"), ["p3"]),
+            (f.Equals(VIEW.as_property_ref("site"), {"space": "s", "externalId": "oslo"}), ["p1"]),
+            (f.Equals(VIEW.as_property_ref("site"), NodeId("s", "oslo")), ["p1"]),
+            (f.In(VIEW.as_property_ref("name"), ["alpha", "beta", "gamma"]), ["p1", "p2"]),
+            (f.Range(VIEW.as_property_ref("pressure"), gt=1, lte=3.0), ["p1", "p2"]),
+            (f.Range(VIEW.as_property_ref("pressure"), gt=1.5), ["p2"]),
+            (f.Prefix(VIEW.as_property_ref("name"), "alpha"), ["p1", "p3"]),
+            (f.Exists(VIEW.as_property_ref("pressure")), ["p1", "p2"]),
+            (f.ContainsAny(VIEW.as_property_ref("tags"), ["a", "c"]), ["p1"]),
+            (f.ContainsAll(VIEW.as_property_ref("tags"), ["b"]), ["p1", "p2"]),
+            (f.HasData(views=[VIEW]), ["p1", "p2", "p3"]),
+            (f.Not(f.HasData(views=[VIEW])), ["no-props"]),
+            (f.Prefix(VIEW.as_property_ref("name"), "alpha") & f.Exists(VIEW.as_property_ref("pressure")), ["p1"]),
+            (f.Equals(VIEW.as_property_ref("name"), "beta") | f.Equals(["node", "externalId"], "p3"), ["p2", "p3"]),
+            (f.SpaceFilter("s"), ["no-props", "p1", "p2", "p3"]),
+            (f.Equals(["edge", "externalId"], "p1"), []),
+        ],
+    )
+    @pytest.mark.parametrize("with_index", [False, True])
+    def test_filter(self, pumps: InstanceReplica, flt: f.Filter, expected: list[str], with_index: bool) -> None:
+        if with_index:
+            pumps.create_index(VIEW.as_property_ref("name"))
+            pumps.create_index(VIEW.as_property_ref("site"))
+        assert xids(pumps.filter(flt)) == expected
+
+    def test_indexes_are_updated(self, pumps: InstanceReplica) -> None:
+        pumps.create_index(VIEW.as_property_ref("name"))
+        is_gamma = f.Equals(VIEW.as_property_ref("name"), "gamma")
+
+        pumps["s", "p2"] = make_node("p2", name="gamma")
+        assert xids(pumps.filter(is_gamma)) == ["p2"]
+        assert xids(pumps.filter(f.Equals(VIEW.as_property_ref("name"), "beta"))) == []
+
+        del pumps["s", "p2"]
+        assert xids(pumps.filter(is_gamma)) == []
+        assert len(pumps) == 3
+
+    def test_edges_from_and_to(self) -> None:
+        edges = InstanceReplica([make_edge("e1", "a", "b"), make_edge("e2", "a", "c"), make_edge("e3", "c", "b")])
+        assert xids(edges.edges_from(NodeId("s", "a"))) == ["e1", "e2"]
+        assert xids(edges.edges_to(("s", "b"))) == ["e1", "e3"]
+
+        edges["s", "e1"] = make_edge("e1", "c", "a")
+        assert xids(edges.edges_from(("s", "a"))) == ["e2"]
+        assert xids(edges.edges_from(("s", "c"))) == ["e1", "e3"]
+        assert xids(edges.edges_to(("s", "b"))) == ["e3"]
+
+    @pytest.mark.parametrize(
+        "flt, match",
+        [
+            (f.Equals(VIEW.as_property_ref("name"), f.ParameterValue("name")), "parameters"),
+            (f.HasData(containers=[("s", "Pump")]), "containers"),
+            (f.Equals("name", "alpha"), "property reference"),
+            (f.Nested(["node", "site"], f.MatchAll()), "nested"),
+        ],
+    )
+    def test_unsupported_filters_raise(self, pumps: InstanceReplica, flt: f.Filter, match: str) -> None:
+        with pytest.raises(ValueError, match=match):
+            pumps.filter(flt)
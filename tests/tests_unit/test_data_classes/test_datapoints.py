@@ -115,3 +115,79 @@ class TestToPandas:
         )
         exp_df.columns = pd.Index([123, "foo", NodeId(space="s", external_id="x")], name="identifier")
         pd.testing.assert_frame_equal(df, exp_df)
+
+
+@pytest.mark.dsl
+class TestToArrow:
+    @staticmethod
+    def _make_dps(timestamps_ms: list[int], **kwargs: object) -> DatapointsArray:
+        import numpy as np
+
+        return DatapointsArray(
+            timestamp=np.array(timestamps_ms, dtype="datetime64[ms]").astype("datetime64[ns]"),
+            is_step=False,
+            **kwargs,  # type: ignore [arg-type]
+        )
+
+    def test_string_values_and_missing_values(self) -> None:
+        np = pytest.importorskip("numpy")
+        pytest.importorskip("pyarrow")
+
+        numeric = self._make_dps(
+            [1, 2, 3],
+            id=1,
+            is_string=False,
+            type="numeric",
+            value=np.array([1.0, math.nan, math.nan]),
+            null_timestamps={3},
+        )
+        table = numeric.to_arrow()
+        assert table.column_names == ["timestamp", "value"]
+        assert table["value"].null_count == 1
+        assert table["value"].to_pylist()[2] is None
+
+        string = self._make_dps(
+            [1, 2],
+            id=2,
+            is_string=True,
+            type="string",
+            value=np.array(["a", "b"], dtype=np.object_),
+            status_code=np.array([0, 0], dtype=np.uint32),
+            status_symbol=np.array(["Good", "Good"], dtype=np.object_),
+        )
+        table = string.to_arrow()
+        assert table.column_names == ["timestamp", "value", "status_code", "status_symbol"]
+        assert str(table.schema.field("value").type) == "large_string"
+        assert table["value"].to_pylist() == ["a", "b"]
+        assert string.to_arrow(include_status=False).column_names == ["timestamp", "value"]
+
+    def test_long_and_wide_layout(self) -> None:
+        np = pytest.importorskip("numpy")
+        pytest.importorskip("pyarrow")
+
+        dps_lst = DatapointsArrayList(
+            [
+                self._make_dps(
+                    [1, 2, 3], id=1, external_id="foo", is_string=False, type="numeric", average=np.array([1.0, 2, 3])
+                ),
+                self._make_dps(
+                    [2, 4],
+                    id=2,
+                    instance_id=NodeId("s", "x"),
+                    is_string=False,
+                    type="numeric",
+                    count=np.array([5, 6], dtype=np.int64),
+                ),
+            ]
+        )
+        long = dps_lst.to_arrow(layout="long")
+        assert long.column_names == ["id", "external_id", "instance_id", "timestamp", "average", "count"]
+        assert long["id"].to_pylist() == [1, 1, 1, 2, 2]
+        assert long["instance_id"].to_pylist()[-1] == {"space": "s", "external_id": "x"}
+        assert long["count"].to_pylist() == [None, None, None, 5, 6]
+
+        wide = dps_lst.to_arrow(layout="wide")
+        assert wide.column_names == ["timestamp", "foo|average", "s:x|count"]
+        assert wide["timestamp"].cast("int64").to_pylist() == [1_000_000, 2_000_000, 3_000_000, 4_000_000]
+        assert wide["foo|average"].to_pylist() == [1.0, 2.0, 3.0, None]
+        assert wide["s:x|count"].to_pylist() == [None, 5, None, 6]
@@ -27,6 +27,7 @@ from cognite.client.data_classes.data_modeling.instances import (
     NodeListWithCursor,
     TypeInformation,
 )
+from cognite.client.data_classes.data_modeling.records import SyncRecordPartitionList
 from cognite.client.data_classes.datapoints import Datapoint, DatapointsArrayList, DatapointsList
 from cognite.client.data_classes.datapoints_subscriptions import SubscriptionDatapoints
 from cognite.client.data_classes.geospatial import FeatureListCore
@@ -171,6 +172,8 @@ def list_classes_without_resource() -> set[type]:
         # Cursor-bearing wrappers that inherit _RESOURCE from their parent:
         NodeListWithCursor,
         EdgeListWithCursor,
+        # Partition-bearing wrapper that inherits _RESOURCE from SyncRecordList:
+        SyncRecordPartitionList,
         # Internal adapter used only within the IAM groups API client:
         _GroupListAdapter,
         # Internal DM adapter over both node/edge apply result types. Intentionally does not
@@ -6,7 +6,14 @@ import pytest
 
 from cognite.client.data_classes.data_modeling import ViewId
 from cognite.client.data_classes.data_modeling.cdm.v1 import CogniteFile
-from cognite.client.utils._data_modeling import resolve_source
+from cognite.client.data_classes.data_modeling.query import (
+    EdgeResultSetExpression,
+    Intersection,
+    NodeResultSetExpression,
+    Query,
+    Union,
+)
+from cognite.client.utils._data_modeling import find_dependent_result_sets, resolve_source, split_key_range
 from tests.tests_unit.test_api.test_data_modeling.conftest import make_test_view
 
 CANONICAL_VIEW_ID = CogniteFile.get_source()
@@ -32,3 +39,51 @@ class TestResolveSource:
     def test_invalid_source_raises_type_error(self) -> None:
         with pytest.raises(TypeError, match="Expected View, ViewId"):
             resolve_source("not-a-valid-source", CANONICAL_VIEW_ID)  # type: ignore[arg-type]
+
+
+class TestFindDependentResultSets:
+    def test_from_and_set_operations(self) -> None:
+        query = Query(
+            with_={
+                "a": NodeResultSetExpression(),
+                "a_edges": EdgeResultSetExpression(from_="a"),
+                "b": NodeResultSetExpression(from_="a_edges"),
+                "c": NodeResultSetExpression(),
+                "d": Union(union=["c", Intersection(intersection=["b", "c"])], except_=["a"]),
+            },
+            select={},
+        )
+        assert find_dependent_result_sets(query) == {
+            "a": {"a", "a_edges", "b", "d"},
+            "a_edges": {"a_edges", "b", "d"},
+            "b": {"b", "d"},
+            "c": {"c", "d"},
+            "d": {"d"},
+        }
+
+
+class TestSplitKeyRange:
+    @pytest.mark.parametrize(
+        "lowest, highest, n",
+        [("pump-0000", "pump-9999", 4), ("a", "b", 3), ("", "zzz", 10), ("a", "a0", 4)],
+    )
+    def test_boundaries_are_increasing_and_within_range(self, lowest: str, highest: str, n: int) -> None:
+        boundaries = split_key_range(lowest, highest, n)
+        assert len(boundaries) == n - 1
+        assert [lowest, *boundaries] == sorted(set([lowest, *boundaries]))
+        assert boundaries[-1] <= highest
+
+    def test_evenly_spread_keys_are_balanced(self) -> None:
+        keys = [f"pump-{i:02d}" for i in range(100)]
+        boundaries = split_key_range(keys[0], keys[-1], 4)
+        sizes = [
+            sum(low <= key < high for key in keys) for low, high in zip(["", *boundaries], [*boundaries, "\U0010ffff"])
+        ]
+        assert sum(sizes) == 100
+        assert all(20 <= size <= 30 for size in sizes)
+
+    def test_single_key_or_non_ascii_keys_give_fewer_ranges(self) -> None:
+        assert split_key_range("x", "x", 5) == []
+        # Characters outside printable ASCII can't be told apart, but boundaries are still valid:
+        assert split_key_range("æøå", "ü", 3) == []
+        assert all("aæ" < key <= "bü" for key in split_key_range("aæ", "bü", 3))
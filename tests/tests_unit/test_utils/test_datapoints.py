@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from collections import defaultdict
+
+import pytest
+
+from cognite.client.utils._datapoints import (
+    _DataContainer,
+    create_aggregates_arrays_from_dps_container,
+    create_array_from_dps_container,
+)
+from cognite.client.utils._importing import local_import
+
+
+@pytest.mark.dsl
+class TestCreateArraysFromDpsContainer:
+    def test_array_is_ordered_by_subtask_idx_and_container_is_emptied(self) -> None:
+        np = local_import("numpy")
+        container: _DataContainer = defaultdict(list)
+        container[(2,)].append(np.array([5, 6], dtype=np.int64))
+        container[(1, 1)].append(np.array([3, 4], dtype=np.int64))
+        container[(0,)].extend([np.array([0], dtype=np.int64), np.array([1, 2], dtype=np.int64)])
+        container[(1,)].append(np.array([], dtype=np.int64))
+
+        arr = create_array_from_dps_container(container)
+        assert arr.dtype == np.int64
+        assert arr.tolist() == [0, 1, 2, 3, 4, 5, 6]
+        assert not container
+
+    def test_object_array(self) -> None:
+        np = local_import("numpy")
+        container: _DataContainer = defaultdict(list)
+        container[(1,)].append(np.array(["b", None], dtype=np.object_))
+        container[(0,)].append(np.array(["a"], dtype=np.object_))
+
+        arr = create_array_from_dps_container(container)
+        assert arr.dtype == np.object_
+        assert arr.tolist() == ["a", "b", None]
+
+    def test_aggregates_arrays(self) -> None:
+        np = local_import("numpy")
+        container: _DataContainer = defaultdict(list)
+        container[(1,)].append(np.array([[3.0, 30.0]]))
+        container[(0,)].append(np.array([[1.0, 10.0], [2.0, 20.0]]))
+
+        first, second = create_aggregates_arrays_from_dps_container(container, 2)
+        assert first.tolist() == [1.0, 2.0, 3.0]
+        assert second.tolist() == [10.0, 20.0, 30.0]
+        assert first.flags.c_contiguous and second.flags.c_contiguous
+        assert not container
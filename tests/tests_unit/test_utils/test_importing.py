@@ -1,7 +1,14 @@
 from __future__ import annotations
 
+import ast
+import importlib
+from pathlib import Path
+from types import ModuleType
+
 import pytest
 
+from cognite.client import data_classes
+from cognite.client.data_classes import data_modeling
 from cognite.client.exceptions import CogniteImportError
 from cognite.client.utils._importing import local_import
 
@@ -34,3 +41,32 @@ class TestLocalImport:
         for dep in ["geopandas", "pandas", "shapely", "sympy", "numpy"]:
             with pytest.raises(CogniteImportError, match=dep):
                 local_import(dep)
+
+
+class TestLazyModuleGetattr:
+    @pytest.mark.parametrize("package", [data_classes, data_modeling])
+    def test_lazy_imports_match_type_checking_imports(self, package: ModuleType) -> None:
+        # The imports under 'if TYPE_CHECKING:' are for static analysis only, and must be kept in sync:
+        type_checking_block = next(
+            node for node in ast.parse(Path(package.__file__).read_text()).body if isinstance(node, ast.If)
+        )
+        imported = {
+            alias.name: node.module
+            for node in type_checking_block.body
+            if isinstance(node, ast.ImportFrom)
+            for alias in node.names
+        }
+        assert set(package._LAZY_IMPORTS) == set(imported) == set(package.__all__)
+        for name, module_name in imported.items():
+            assert getattr(package, name) is getattr(importlib.import_module(module_name), name)
+
+    def test_submodules_and_missing_attributes(self) -> None:
+        assert data_classes.data_sets is importlib.import_module("cognite.client.data_classes.data_sets")
+        assert data_modeling.query is importlib.import_module("cognite.client.data_classes.data_modeling.query")
+        with pytest.raises(AttributeError, match="has no attribute 'NotADataClass'"):
+            data_classes.NotADataClass
+
+    @pytest.mark.parametrize("package", [data_classes, data_modeling])
+    def test_dir_lists_names_not_yet_imported(self, package: ModuleType) -> None:
+        assert set(package.__all__) <= set(dir(package))
+        assert {"__name__", "_LAZY_IMPORTS"} <= set(dir(package))
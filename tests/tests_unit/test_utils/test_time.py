@@ -22,6 +22,7 @@ from cognite.client.utils._time import (
     parse_str_timezone,
     parse_str_timezone_offset,
     split_time_range,
+    split_time_range_by_density,
     timestamp_to_ms,
 )
 from tests.utils import tmp_set_envvar
@@ -366,6 +367,17 @@ class TestSplitTimeDomain:
         assert expected == single_diff
         assert all(val % gran_ms == 0 for val in res)
 
+    def test_split_time_range_by_density(self) -> None:
+        # All datapoints are in the last half, and twice as dense in the last quarter:
+        profile = [(0, 50, 0), (50, 75, 100), (75, 100, 200)]
+        assert [0, 81, 100] == split_time_range_by_density(0, 100, 2, profile)
+        assert [0, 75, 87, 100] == split_time_range_by_density(0, 100, 3, profile)
+        # Counts of buckets only partly inside the time range are scaled down:
+        assert [60, 84, 100] == split_time_range_by_density(60, 100, 2, profile)
+
+    def test_split_time_range_by_density__no_counts(self) -> None:
+        assert [0, 100] == split_time_range_by_density(0, 100, 5, [(0, 100, 0)])
+
 
 def call_time_tzset() -> None:
     # This is a workaround to call time.tzset() that stops MyPy
@@ -76,6 +76,7 @@ from cognite.client.data_classes.workflows import (
 from cognite.client.testing import AsyncCogniteClientMock
 from cognite.client.utils import _json_extended as _json
 from cognite.client.utils._concurrency import CRUDConcurrency
+from cognite.client.utils._importing import create_lazy_apis
 from cognite.client.utils._text import random_string
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
@@ -156,6 +157,7 @@ def all_mock_children(mock_obj: MagicMock, parent_path: str = "") -> dict[str, t
 
 def get_api_class_by_attribute(cls_: object, parent_name: tuple[str, ...] = ()) -> dict[str, type[APIClient]]:
     available_apis: dict[str, type[APIClient]] = {}
+    create_lazy_apis(cls_)
     for attr, obj in cls_.__dict__.items():
         if attr.startswith("_") or not isinstance(obj, APIClient):
             continue